@@ -0,0 +1,15 @@
+"""End-to-end orchestrator benchmarks.
+
+Runs the full ``Orchestrator.run`` pipeline against synthetic git repos with
+a deterministic fake backend (or a fake ``claude`` executable), so the
+numbers measure LevelUp's own overhead: git, state DB, detection, journal
+and context serialization.
+
+Usage::
+
+    python -m benchmarks                              # default scenarios
+    python -m benchmarks --sizes 10,200 --concurrency 1,4 --repeat 3
+    python -m benchmarks --backend claude             # subprocess path
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks --baseline benchmarks/baseline.json   # exit 1 on regression
+"""
@@ -0,0 +1,78 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if _SRC.is_dir() and str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+from benchmarks.harness import (  # noqa: E402
+    PHASES,
+    Scenario,
+    find_regressions,
+    load_baseline,
+    run_all,
+    save_baseline,
+)
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--sizes", type=_ints, default=[10, 200], help="Repo sizes (files)")
+    parser.add_argument("--concurrency", type=_ints, default=[1, 4], help="Parallel runs")
+    parser.add_argument("--repeat", type=int, default=1, help="Rounds per scenario (median)")
+    parser.add_argument("--backend", choices=["fake", "claude"], default="fake")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated model seconds")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline JSON")
+    parser.add_argument("--save-baseline", type=Path, help="Write results as a new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown")
+    parser.add_argument("--slack-ms", type=float, default=25.0, help="Allowed absolute slowdown")
+    parser.add_argument("--json", type=Path, help="Write full results to this file")
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        Scenario(files=size, concurrency=c, backend=args.backend, latency=args.latency)
+        for size in args.sizes
+        for c in args.concurrency
+    ]
+    results = run_all(scenarios, repeat=args.repeat)
+
+    header = f"{'scenario':<24}" + "".join(f"{p:>15}" for p in PHASES)
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        row = "".join(f"{result.phases_ms[p]:>13.1f}ms" for p in PHASES)
+        print(f"{result.scenario.name:<24}{row}")
+        failed = [s for s in result.statuses if s != "completed"]
+        if failed:
+            print(f"  warning: {len(failed)} run(s) ended as {', '.join(sorted(set(failed)))}")
+
+    if args.json:
+        args.json.write_text(json.dumps([r.to_dict() for r in results], indent=2) + "\n")
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"Baseline written to {args.save_baseline}")
+    if args.baseline:
+        problems = find_regressions(
+            results, load_baseline(args.baseline), args.tolerance, args.slack_ms
+        )
+        if problems:
+            print("\nRegressions:")
+            for problem in problems:
+                print(f"  {problem}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Deterministic in-process ``Backend`` for benchmarking the orchestrator."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from benchmarks.responses import COST_USD, INPUT_TOKENS, OUTPUT_TOKENS, identify_agent, respond
+from levelup.agents.backend import AgentResult
+
+
+class FakeBackend:
+    """Answers every agent with a canned reply after an optional fixed latency.
+
+    ``elapsed_ms`` accumulates the time spent inside ``run_agent`` so the
+    harness can subtract it and report orchestrator overhead alone.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self._latency = latency
+        self.calls: list[str] = []
+        self.elapsed_ms = 0.0
+
+    def run_agent(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        allowed_tools: list[str],
+        working_directory: str,
+        *,
+        thinking_budget: int | None = None,
+    ) -> AgentResult:
+        started = time.perf_counter()
+        agent = identify_agent(system_prompt)
+        self.calls.append(agent)
+        if self._latency:
+            time.sleep(self._latency)
+        text = respond(agent, Path(working_directory))
+        duration_ms = (time.perf_counter() - started) * 1000
+        self.elapsed_ms += duration_ms
+        return AgentResult(
+            text=text,
+            cost_usd=COST_USD,
+            input_tokens=INPUT_TOKENS,
+            output_tokens=OUTPUT_TOKENS,
+            duration_ms=duration_ms,
+            num_turns=1,
+        )
@@ -0,0 +1,60 @@
+"""Stand-in for the ``claude`` executable that emits canned ``-p`` JSON.
+
+Invoked through a launcher script (see ``benchmarks.harness.install_fake_claude``)
+with the same arguments ``ClaudeCodeClient`` passes to the real CLI.  Set
+``LEVELUP_FAKE_CLAUDE_LATENCY`` (seconds) to simulate model latency.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.responses import (  # noqa: E402
+    COST_USD,
+    INPUT_TOKENS,
+    OUTPUT_TOKENS,
+    identify_agent,
+    respond,
+)
+
+
+def main(argv: list[str]) -> int:
+    if "--version" in argv:
+        print("0.0.0 (LevelUp benchmark fake)")
+        return 0
+
+    started = time.perf_counter()
+    system_prompt = ""
+    if "--system-prompt" in argv:
+        system_prompt = argv[argv.index("--system-prompt") + 1]
+    stdin = sys.stdin.read()
+    if not system_prompt and stdin.startswith("<system-instructions>"):
+        system_prompt = stdin[len("<system-instructions>"):].lstrip()
+
+    latency = float(os.environ.get("LEVELUP_FAKE_CLAUDE_LATENCY", "0") or 0)
+    if latency:
+        time.sleep(latency)
+
+    text = respond(identify_agent(system_prompt), Path.cwd())
+    print(json.dumps({
+        "type": "result",
+        "result": text,
+        "session_id": "benchmark",
+        "cost_usd": COST_USD,
+        "input_tokens": INPUT_TOKENS,
+        "output_tokens": OUTPUT_TOKENS,
+        "duration_ms": (time.perf_counter() - started) * 1000,
+        "num_turns": 1,
+        "is_error": False,
+    }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
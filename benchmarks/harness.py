@@ -0,0 +1,284 @@
+"""Drive full ``Orchestrator.run`` pipelines and attribute their time to phases.
+
+Each pipeline runs in its own process (as real ``levelup run`` instances
+do), against its own synthetic repo, sharing one state DB.  Phase times come
+from the orchestrator's tracing spans plus timers the worker installs around
+the journal, state-DB and serialization entry points:
+
+- ``git``: worktree creation, per-step and journal commits
+- ``db``: run registration and state persistence (includes serialization)
+- ``serialization``: ``PipelineContext.model_dump_json``
+- ``detection``: project detection
+- ``journal``: run journal and event log writes
+- ``backend``: time inside the fake backend / fake ``claude`` process
+- ``agent_overhead``: agent spans minus backend time (prompting, parsing, test runs)
+- ``overhead``: total wall time minus backend time
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import statistics
+import stat
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable
+
+PHASES = (
+    "git",
+    "db",
+    "serialization",
+    "detection",
+    "journal",
+    "backend",
+    "agent_overhead",
+    "overhead",
+    "total",
+)
+
+_BENCH_ENV = {
+    "GIT_AUTHOR_NAME": "LevelUp Bench",
+    "GIT_AUTHOR_EMAIL": "bench@levelup.invalid",
+    "GIT_COMMITTER_NAME": "LevelUp Bench",
+    "GIT_COMMITTER_EMAIL": "bench@levelup.invalid",
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark configuration."""
+
+    files: int
+    concurrency: int = 1
+    backend: str = "fake"  # "fake" (in-process) or "claude" (fake executable)
+    latency: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return f"{self.backend}-files{self.files}-c{self.concurrency}"
+
+
+@dataclass
+class ScenarioResult:
+    scenario: Scenario
+    runs: int
+    wall_ms: float
+    phases_ms: dict[str, float] = field(default_factory=dict)  # median per run
+    statuses: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["name"] = self.scenario.name
+        return data
+
+
+def install_fake_claude(bin_dir: Path) -> Path:
+    """Write a ``claude`` launcher for ``fake_claude.py`` and return its path."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    script = Path(__file__).with_name("fake_claude.py")
+    if os.name == "nt":
+        launcher = bin_dir / "claude.cmd"
+        launcher.write_text(f'@"{sys.executable}" "{script}" %*\r\n', encoding="utf-8")
+    else:
+        launcher = bin_dir / "claude"
+        launcher.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n', encoding="utf-8"
+        )
+        launcher.chmod(launcher.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return launcher
+
+
+class _Timers:
+    """Accumulates wall time of wrapped callables per phase."""
+
+    def __init__(self) -> None:
+        self.totals: dict[str, float] = defaultdict(float)
+
+    def wrap(self, owner: Any, attr: str, phase: str) -> None:
+        original: Callable[..., Any] = getattr(owner, attr)
+
+        @functools.wraps(original)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.totals[phase] += (time.perf_counter() - started) * 1000
+
+        setattr(owner, attr, timed)
+
+
+def _run_pipeline(scenario: Scenario, repo: Path, db_path: Path, claude: str) -> dict[str, Any]:
+    """Worker: run one pipeline and return its phase breakdown (in ms)."""
+    from benchmarks.fake_backend import FakeBackend
+    from benchmarks.repos import fake_test_command
+    from levelup.agents.claude_code_client import ClaudeCodeClient
+    from levelup.config.settings import (
+        LevelUpSettings,
+        LLMSettings,
+        PipelineSettings,
+        ProjectSettings,
+    )
+    from levelup.core.context import PipelineContext, TaskInput
+    from levelup.core.journal import RunJournal
+    from levelup.core.orchestrator import Orchestrator
+    from levelup.state.manager import StateManager
+
+    timers = _Timers()
+    for method in (
+        "write_header", "log_step_start", "log_step", "log_span",
+        "log_checkpoint", "log_outcome", "close",
+    ):
+        timers.wrap(RunJournal, method, "journal")
+    timers.wrap(PipelineContext, "model_dump_json", "serialization")
+    timers.wrap(StateManager, "register_run", "db")
+    timers.wrap(Orchestrator, "_create_git_branch", "git")
+    timers.wrap(Orchestrator, "_git_journal_commit", "git")
+    timers.wrap(ClaudeCodeClient, "run", "backend")
+
+    fake = FakeBackend(latency=scenario.latency)
+
+    class BenchOrchestrator(Orchestrator):
+        def _create_backend(self, project_path, ctx=None, **kwargs):  # type: ignore[no-untyped-def]
+            if scenario.backend == "fake":
+                return fake
+            return super()._create_backend(project_path, ctx, **kwargs)
+
+    settings = LevelUpSettings(
+        llm=LLMSettings(backend="claude_code", claude_executable=claude),
+        project=ProjectSettings(path=repo, test_command=fake_test_command()),
+        pipeline=PipelineSettings(require_checkpoints=False, create_git_branch=True),
+    )
+    orchestrator = BenchOrchestrator(
+        settings=settings, state_manager=StateManager(db_path), headless=True
+    )
+
+    started = time.perf_counter()
+    ctx = orchestrator.run(TaskInput(title="Benchmark feature", description="Add bench_feature"))
+    total = (time.perf_counter() - started) * 1000
+
+    spans: dict[str, float] = defaultdict(float)
+    for span in orchestrator._tracer.spans:
+        spans[span.name] += span.duration_ms
+
+    phases = dict(timers.totals)
+    if scenario.backend == "fake":
+        phases["backend"] = fake.elapsed_ms
+    backend = phases.get("backend", 0.0)
+    phases["git"] = phases.get("git", 0.0) + spans["git_commit"]
+    phases["db"] = phases.get("db", 0.0) + spans["persist_state"]
+    phases["detection"] = spans["detection"]
+    phases["agent_overhead"] = max(spans["agent"] + spans["agent_revision"] - backend, 0.0)
+    phases["total"] = total
+    phases["overhead"] = total - backend
+    return {"status": ctx.status.value, "phases": {p: phases.get(p, 0.0) for p in PHASES}}
+
+
+def run_scenario(scenario: Scenario, workdir: Path, repeat: int = 1) -> ScenarioResult:
+    """Run *scenario* ``repeat`` times; each round starts ``concurrency`` pipelines at once."""
+    from benchmarks.repos import make_repo
+    from levelup.state.manager import StateManager
+
+    workdir.mkdir(parents=True, exist_ok=True)
+    home = workdir / "home"
+    home.mkdir(exist_ok=True)
+    claude = str(install_fake_claude(workdir / "bin"))
+    db_path = workdir / "state.db"
+    # Migrate the schema up front: concurrent first opens race on ALTER TABLE
+    StateManager(db_path)
+
+    jobs = []
+    for round_ in range(repeat):
+        for i in range(scenario.concurrency):
+            repo = make_repo(workdir / f"repo-{round_}-{i}", scenario.files)
+            jobs.append((round_, repo))
+
+    env = {
+        **_BENCH_ENV,
+        "HOME": str(home),
+        "USERPROFILE": str(home),
+        "LEVELUP_FAKE_CLAUDE_LATENCY": str(scenario.latency),
+    }
+    saved = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    results: list[dict[str, Any]] = []
+    started = time.perf_counter()
+    try:
+        # Spawned workers import levelup fresh, so ~/.levelup resolves under *home*
+        with ProcessPoolExecutor(scenario.concurrency, mp_context=get_context("spawn")) as pool:
+            for round_ in range(repeat):
+                futures = [
+                    pool.submit(_run_pipeline, scenario, repo, db_path, claude)
+                    for r, repo in jobs
+                    if r == round_
+                ]
+                results.extend(f.result() for f in futures)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    wall = (time.perf_counter() - started) * 1000
+
+    phases = {p: statistics.median(r["phases"][p] for r in results) for p in PHASES}
+    return ScenarioResult(
+        scenario=scenario,
+        runs=len(results),
+        wall_ms=wall,
+        phases_ms=phases,
+        statuses=[r["status"] for r in results],
+    )
+
+
+def run_all(
+    scenarios: list[Scenario], repeat: int = 1, workdir: Path | None = None
+) -> list[ScenarioResult]:
+    with tempfile.TemporaryDirectory(prefix="levelup-bench-") as tmp:
+        root = workdir or Path(tmp)
+        return [run_scenario(s, root / s.name, repeat) for s in scenarios]
+
+
+def find_regressions(
+    results: list[ScenarioResult],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = 0.5,
+    slack_ms: float = 25.0,
+) -> list[str]:
+    """Phases slower than ``baseline * (1 + tolerance) + slack_ms``.
+
+    The backend phase is excluded: it measures the stand-in, not LevelUp.
+    """
+    problems = []
+    for result in results:
+        reference = baseline.get(result.scenario.name)
+        if not reference:
+            continue
+        for phase, value in result.phases_ms.items():
+            if phase == "backend" or phase not in reference:
+                continue
+            limit = reference[phase] * (1 + tolerance) + slack_ms
+            if value > limit:
+                problems.append(
+                    f"{result.scenario.name}: {phase} {value:.1f}ms > {limit:.1f}ms "
+                    f"(baseline {reference[phase]:.1f}ms)"
+                )
+    return problems
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {name: entry["phases_ms"] for name, entry in data.items()}
+
+
+def save_baseline(path: Path, results: list[ScenarioResult]) -> None:
+    data = {r.scenario.name: {"phases_ms": r.phases_ms} for r in results}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
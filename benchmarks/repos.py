@@ -0,0 +1,53 @@
+"""Synthetic git repositories for benchmark runs."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+_GIT_IDENTITY = ["-c", "user.name=LevelUp Bench", "-c", "user.email=bench@levelup.invalid"]
+
+# Stands in for the project's test suite: reports a failure (TDD red phase)
+# without the cost of collecting real tests, so runs time orchestration only.
+_FAKE_TESTS = 'print("1 failed, 0 passed")\nraise SystemExit(1)\n'
+
+
+def fake_test_command() -> str:
+    return f'"{sys.executable}" scripts/fake_tests.py'
+
+
+def make_repo(path: Path, n_files: int) -> Path:
+    """Create a committed Python project with *n_files* modules and matching tests."""
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "pyproject.toml").write_text(
+        '[project]\nname = "benchpkg"\ndependencies = []\n\n'
+        '[tool.pytest.ini_options]\ntestpaths = ["tests"]\n',
+        encoding="utf-8",
+    )
+    pkg = path / "src" / "benchpkg"
+    tests = path / "tests"
+    scripts = path / "scripts"
+    for directory in (pkg, tests, scripts):
+        directory.mkdir(parents=True, exist_ok=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (scripts / "fake_tests.py").write_text(_FAKE_TESTS, encoding="utf-8")
+
+    for i in range(n_files):
+        (pkg / f"module_{i}.py").write_text(
+            f"def func_{i}(x):\n    return x + {i}\n", encoding="utf-8"
+        )
+        (tests / f"test_module_{i}.py").write_text(
+            f"from benchpkg.module_{i} import func_{i}\n\n\n"
+            f"def test_func_{i}():\n    assert func_{i}(0) == {i}\n",
+            encoding="utf-8",
+        )
+
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "add", "-A")
+    _git(path, *_GIT_IDENTITY, "commit", "-q", "-m", "Initial commit")
+    return path
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
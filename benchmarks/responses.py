@@ -0,0 +1,91 @@
+"""Canned agent responses shared by the fake backend and the fake ``claude``.
+
+Agents are told apart by their system prompt.  Agents that edit code
+(test writer, coder) also write deterministic files into the working
+directory, so git commits and file read-back see realistic changes.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+# Lower-cased system prompt fragment -> agent name
+_AGENT_MARKERS = {
+    "requirements analyst": "requirements",
+    "design an implementation plan": "planning",
+    "test engineer practicing tdd": "test_writer",
+    "implement code that makes the tests pass": "coder",
+    "security expert": "security",
+    "senior code reviewer": "reviewer",
+}
+
+FEATURE_TEST = "tests/test_bench_feature.py"
+FEATURE_MODULE = "src/benchpkg/bench_feature.py"
+
+# Deterministic usage reported for every call
+INPUT_TOKENS = 1200
+OUTPUT_TOKENS = 300
+COST_USD = 0.0081
+
+
+def identify_agent(system_prompt: str) -> str:
+    """Name of the agent that produced *system_prompt* (``unknown`` if none match)."""
+    head = system_prompt[:400].lower()
+    for marker, agent in _AGENT_MARKERS.items():
+        if marker in head:
+            return agent
+    return "unknown"
+
+
+def respond(agent: str, working_directory: Path) -> str:
+    """Perform the agent's file edits under *working_directory* and return its reply."""
+    if agent == "requirements":
+        return json.dumps({
+            "summary": "Add a benchmark feature",
+            "requirements": [
+                {"description": "Add bench_feature()", "acceptance_criteria": ["Returns 42"]}
+            ],
+            "assumptions": [],
+            "out_of_scope": [],
+            "clarifications": [],
+        })
+    if agent == "planning":
+        return json.dumps({
+            "approach": "Add a new module",
+            "steps": [
+                {
+                    "order": 1,
+                    "description": "Create the module",
+                    "files_to_modify": [],
+                    "files_to_create": [FEATURE_MODULE],
+                }
+            ],
+            "affected_files": [FEATURE_MODULE],
+            "risks": [],
+        })
+    if agent == "test_writer":
+        _write(
+            working_directory / FEATURE_TEST,
+            "from benchpkg.bench_feature import bench_feature\n\n\n"
+            "def test_bench_feature():\n    assert bench_feature() == 42\n",
+        )
+        return json.dumps({"test_files": [{"path": FEATURE_TEST, "description": "feature"}]})
+    if agent == "coder":
+        _write(working_directory / FEATURE_MODULE, "def bench_feature():\n    return 42\n")
+        return json.dumps({"files_written": [FEATURE_MODULE], "iterations": 1})
+    if agent == "security":
+        return json.dumps({
+            "findings": [],
+            "patches_applied": 0,
+            "requires_coding_rework": False,
+            "feedback_for_coder": "",
+        })
+    if agent == "reviewer":
+        return json.dumps({"findings": [], "overall_assessment": "Looks good"})
+    return "{}"
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
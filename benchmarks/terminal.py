@@ -0,0 +1,142 @@
+"""Frames/sec of ``TerminalEmulatorWidget`` under heavy PTY output.
+
+Feeds synthetic agent output straight into the widget (no shell) and lets Qt
+paint after every chunk, so one chunk is one frame.  Each workload runs
+twice: ``dirty`` is the normal path (only rows pyte marked dirty are
+repainted) and ``full`` forces a whole-widget repaint per chunk for
+comparison.
+
+Usage::
+
+    python -m benchmarks.terminal                     # 200x60, all workloads
+    python -m benchmarks.terminal --cols 120 --rows 40 --frames 500
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.terminal --json fps.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+_SRC = Path(__file__).resolve().parent.parent / "src"
+if _SRC.is_dir() and str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+_COLORS = ("31", "32", "33", "34", "36", "1;37")
+
+
+def _log_lines() -> Iterator[bytes]:
+    """Colored, timestamped log lines: every chunk scrolls the screen."""
+    for n in itertools.count():
+        color = _COLORS[n % len(_COLORS)]
+        yield (
+            f"\x1b[2m12:00:{n % 60:02d}\x1b[0m \x1b[{color}mINFO\x1b[0m "
+            f"agent.step[{n}] tool_use read_file path=src/module_{n % 97}.py "
+            f"bytes={n * 37 % 9000} ✔\r\n"
+        ).encode()
+
+
+def _progress() -> Iterator[bytes]:
+    """In-place progress bar on the last row: one dirty row per chunk."""
+    for n in itertools.count():
+        done = n % 51
+        bar = "█" * done + " " * (50 - done)
+        yield f"\r\x1b[36m[{bar}]\x1b[0m {done * 2:3d}% tests".encode()
+
+
+WORKLOADS: dict[str, tuple[Callable[[], Iterator[bytes]], int]] = {
+    # name -> (chunk source, source items per chunk)
+    "log": (_log_lines, 8),
+    "progress": (_progress, 1),
+}
+
+
+@dataclass
+class FrameResult:
+    workload: str
+    mode: str  # "dirty" | "full"
+    frames: int
+    seconds: float
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds else 0.0
+
+    @property
+    def ms_per_frame(self) -> float:
+        return self.seconds * 1000 / self.frames if self.frames else 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        return {**asdict(self), "fps": self.fps, "ms_per_frame": self.ms_per_frame}
+
+
+def _make_widget(cols: int, rows: int):  # type: ignore[no-untyped-def]
+    from PyQt6.QtWidgets import QApplication
+
+    from levelup.gui.terminal_emulator import TerminalEmulatorWidget
+
+    app = QApplication.instance() or QApplication([])
+    widget = TerminalEmulatorWidget()
+    widget.resize(int(widget._cell_width * cols) + 1, int(widget._cell_height * rows) + 1)
+    widget.show()
+    app.processEvents()
+    return app, widget
+
+
+def measure(workload: str, mode: str, cols: int, rows: int, frames: int) -> FrameResult:
+    """Feed *frames* chunks of *workload* and paint after each one."""
+    source, per_chunk = WORKLOADS[workload]
+    lines = source()
+    chunks = [b"".join(next(lines) for _ in range(per_chunk)) for _ in range(frames)]
+    app, widget = _make_widget(cols, rows)
+    try:
+        started = time.perf_counter()
+        for chunk in chunks:
+            if mode == "full":
+                widget._full_repaint = True
+            widget._state.feed_pty(chunk)
+            widget._take_snapshot()
+            app.processEvents()
+        elapsed = time.perf_counter() - started
+    finally:
+        widget.close()
+        widget.deleteLater()
+        app.processEvents()
+    return FrameResult(workload=workload, mode=mode, frames=frames, seconds=elapsed)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.terminal", description=__doc__)
+    parser.add_argument("--cols", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=60)
+    parser.add_argument("--frames", type=int, default=300, help="Chunks fed per measurement")
+    parser.add_argument(
+        "--workloads", default=",".join(WORKLOADS), help="Comma-separated: " + ", ".join(WORKLOADS)
+    )
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    results = [
+        measure(name, mode, args.cols, args.rows, args.frames)
+        for name in args.workloads.split(",")
+        for mode in ("dirty", "full")
+    ]
+
+    print(f"{'workload':<12}{'mode':<8}{'frames':>8}{'fps':>10}{'ms/frame':>10}")
+    for r in results:
+        print(f"{r.workload:<12}{r.mode:<8}{r.frames:>8}{r.fps:>10.1f}{r.ms_per_frame:>10.2f}")
+    if args.json:
+        args.json.write_text(json.dumps([r.to_dict() for r in results], indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
 
 from levelup.agents.claude_code_client import ClaudeCodeClient
 from levelup.agents.llm_client import LLMClient
@@ -117,10 +117,24 @@ class ClaudeCodeBackend:
 class AnthropicSDKBackend:
     """Backend that wraps the existing LLMClient + ToolRegistry."""
 
-    def __init__(self, llm_client: LLMClient, tool_registry: ToolRegistry, *, thinking_budget: int | None = None) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        tool_registry: ToolRegistry,
+        *,
+        thinking_budget: int | None = None,
+        on_tool_event: Callable[[dict[str, Any]], None] | None = None,
+        on_text_delta: Callable[[str], None] | None = None,
+        on_tool_use_start: Callable[[str, str], None] | None = None,
+        on_turn: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
         self._llm_client = llm_client
         self._tool_registry = tool_registry
         self._thinking_budget = thinking_budget
+        self._on_tool_event = on_tool_event
+        self._on_text_delta = on_text_delta
+        self._on_tool_use_start = on_tool_use_start
+        self._on_turn = on_turn
 
     @property
     def llm_client(self) -> LLMClient:
@@ -130,6 +144,10 @@ class AnthropicSDKBackend:
     def tool_registry(self) -> ToolRegistry:
         return self._tool_registry
 
+    def cancel(self) -> None:
+        """Stop the agent's API call in progress (see ``LLMClient.cancel``)."""
+        self._llm_client.cancel()
+
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost in USD based on token usage.
 
@@ -177,6 +195,10 @@ class AnthropicSDKBackend:
             tools=tools,
             tool_registry=self._tool_registry,
             thinking_budget=effective,
+            on_tool_event=self._on_tool_event,
+            on_text_delta=self._on_text_delta,
+            on_tool_use_start=self._on_tool_use_start,
+            on_turn=self._on_turn,
         )
 
         # Calculate cost from token usage
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import json
 import logging
-import subprocess
 from pathlib import Path
 
 from levelup.agents.base import BaseAgent
 from levelup.core.context import FileChange, PipelineContext, TestResult
+from levelup.core.test_cache import TestResultCache, run_test_command
+from levelup.core.test_selection import scoped_test_command
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +30,9 @@ Your workflow:
 1. Read the test files to understand what's expected
 2. Read existing source files to understand the codebase
 3. Implement the code using the Write tool
-4. Run the tests using `{test_command}` via Bash
+4. Run the tests using `{iteration_command}` via Bash
 5. If tests fail, read the error output, fix the code, and run tests again
-6. Repeat until ALL tests pass
+6. Repeat until ALL tests pass{full_suite_step}
 
 Write clean, idiomatic code following the project's existing patterns.
 
@@ -42,7 +43,10 @@ After all tests pass, produce a final JSON summary:
   "all_tests_passing": true
 }}
 
-IMPORTANT: Keep iterating until tests pass. Write files using the Write tool and run tests using `{test_command}` via Bash."""
+IMPORTANT: Keep iterating until tests pass. Write files using the Write tool and run tests using `{iteration_command}` via Bash."""
+
+FULL_SUITE_STEP = """
+7. Once they pass, run the full suite with `{test_command}` once to confirm nothing else broke"""
 
 MAX_CODE_ITERATIONS = 5
 
@@ -51,9 +55,18 @@ class CodeAgent(BaseAgent):
     name = "coder"
     description = "Implement code until tests pass (TDD green phase)"
 
-    def __init__(self, *args, max_iterations: int = MAX_CODE_ITERATIONS, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        max_iterations: int = MAX_CODE_ITERATIONS,
+        test_selection: bool = False,
+        test_cache: TestResultCache | None = None,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         self._max_iterations = max_iterations
+        self._test_selection = test_selection
+        self._test_cache = test_cache
 
     def get_system_prompt(self, ctx: PipelineContext) -> str:
         req_text = ""
@@ -72,8 +85,18 @@ class CodeAgent(BaseAgent):
         for tf in ctx.test_files:
             test_text += f"\n--- {tf.path} ---\n{tf.content}\n"
 
+        test_command = ctx.test_command or "unknown"
+        iteration_command = test_command
+        if self._test_selection and ctx.test_command:
+            iteration_command = scoped_test_command(ctx, self.project_path) or test_command
+
+        full_suite_step = ""
+        if iteration_command != test_command:
+            full_suite_step = FULL_SUITE_STEP.format(test_command=test_command)
+
         return SYSTEM_PROMPT_TEMPLATE.format(
-            test_command=ctx.test_command or "unknown",
+            iteration_command=iteration_command,
+            full_suite_step=full_suite_step,
             requirements=req_text or "No structured requirements.",
             plan=plan_text or "No implementation plan.",
             test_files=test_text or "No test files.",
@@ -119,13 +142,11 @@ class CodeAgent(BaseAgent):
         # Run final test to get structured result
         if ctx.test_command:
             try:
-                proc = subprocess.run(
+                proc = run_test_command(
                     ctx.test_command,
-                    shell=True,
-                    cwd=str(self.project_path),
-                    capture_output=True,
-                    text=True,
+                    self.project_path,
                     timeout=120,
+                    cache=self._test_cache,
                 )
                 output = proc.stdout
                 if proc.stderr:
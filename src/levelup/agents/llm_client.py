@@ -1,19 +1,29 @@
-"""Anthropic API wrapper with tool-use loop support."""
+"""Anthropic API wrapper with tool-use loop support.
+
+Every API call is streamed (``messages.stream``): callers can watch text
+and tool calls arrive as they are generated, another thread can stop a
+call mid-response with ``LLMClient.cancel()``, and the time to first token
+of each turn is recorded.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
-from typing import Any
-
-import anthropic
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
 from levelup.tools.base import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
 
+class LLMCancelled(Exception):
+    """Raised by an LLMClient call stopped with ``LLMClient.cancel()``."""
+
+
 @dataclass
 class ToolLoopResult:
     """Result from a tool-use loop, including token usage."""
@@ -22,10 +32,15 @@ class ToolLoopResult:
     input_tokens: int = 0
     output_tokens: int = 0
     num_turns: int = 0
+    ttft_ms: list[float] = field(default_factory=list)  # time to first token, per turn
 
 DEFAULT_MAX_TOKENS = 8192
 MAX_TOOL_ITERATIONS = 50
 
+# Seconds without any data from the API (headers or stream events) before a
+# call fails; the API sends pings while a response is being generated.
+STREAM_IDLE_TIMEOUT = 120.0
+
 
 class LLMClient:
     """Thin wrapper around the Anthropic SDK."""
@@ -38,6 +53,8 @@ class LLMClient:
         max_tokens: int = DEFAULT_MAX_TOKENS,
         temperature: float = 0.0,
     ) -> None:
+        import anthropic  # the SDK takes ~1s to import; only SDK-backed runs need it
+
         self._client = anthropic.Anthropic(
             api_key=api_key or None,
             auth_token=auth_token or None,
@@ -45,14 +62,34 @@ class LLMClient:
         self._model = model
         self._max_tokens = max_tokens
         self._temperature = temperature
+        self._cancel = threading.Event()
+        self._stream_lock = threading.Lock()
+        self._stream: Any = None  # the MessageStream being read, if any
+
+    def cancel(self) -> None:
+        """Stop the call in progress; it raises ``LLMCancelled``.
+
+        Safe to call from any thread.  A response that is streaming is cut
+        off immediately; a tool loop also stops before its next tool or turn.
+        """
+        self._cancel.set()
+        with self._stream_lock:
+            stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                logger.debug("Closing the response stream failed", exc_info=True)
 
     def structured_call(
         self,
         system: str,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None = None,
+        on_text_delta: Callable[[str], None] | None = None,
     ) -> str:
         """Make a single API call and return the text response."""
+        self._cancel.clear()
         kwargs: dict[str, Any] = {
             "model": self._model,
             "max_tokens": self._max_tokens,
@@ -63,7 +100,7 @@ class LLMClient:
         if tools:
             kwargs["tools"] = tools
 
-        response = self._client.messages.create(**kwargs)
+        response, _ttft_ms = self._stream_turn(kwargs, on_text_delta, None)
 
         # Extract text blocks
         text_parts: list[str] = []
@@ -81,6 +118,10 @@ class LLMClient:
         tool_registry: ToolRegistry,
         on_tool_call: Any | None = None,
         thinking_budget: int | None = None,
+        on_tool_event: Callable[[dict[str, Any]], None] | None = None,
+        on_text_delta: Callable[[str], None] | None = None,
+        on_tool_use_start: Callable[[str, str], None] | None = None,
+        on_turn: Callable[[dict[str, Any]], None] | None = None,
     ) -> ToolLoopResult:
         """Run a tool-use conversation loop until the model produces a final text response.
 
@@ -90,14 +131,26 @@ class LLMClient:
             tools: Anthropic tool schemas.
             tool_registry: Registry to execute tool calls.
             on_tool_call: Optional callback(tool_name, tool_input, result) for progress display.
+            on_tool_event: Optional callback receiving a dict per tool execution
+                (tool, input, duration_ms, result_chars, error) for event logging.
+            on_text_delta: Optional callback(text) for each chunk of streamed text.
+            on_tool_use_start: Optional callback(tool_name, tool_use_id) when the
+                model starts writing a tool call, before its input has arrived.
+            on_turn: Optional callback receiving a dict per API call (turn,
+                ttft_ms, duration_ms, input_tokens, output_tokens, stop_reason).
 
         Returns:
             ToolLoopResult with final text and accumulated token usage.
+
+        Raises:
+            LLMCancelled: If ``cancel()`` was called while the loop ran.
         """
+        self._cancel.clear()
         conversation = list(messages)
         total_input_tokens = 0
         total_output_tokens = 0
         num_turns = 0
+        ttft: list[float] = []
 
         # Build base kwargs for the API call
         base_kwargs: dict[str, Any] = {
@@ -112,17 +165,28 @@ class LLMClient:
             base_kwargs["temperature"] = 1.0  # Required by Anthropic API for extended thinking
 
         for _iteration in range(MAX_TOOL_ITERATIONS):
-            response = self._client.messages.create(
-                **base_kwargs,
-                messages=conversation,
+            started = time.perf_counter()
+            response, ttft_ms = self._stream_turn(
+                {**base_kwargs, "messages": conversation}, on_text_delta, on_tool_use_start
             )
             num_turns += 1
+            if ttft_ms is not None:
+                ttft.append(ttft_ms)
 
             # Accumulate token usage
             usage = getattr(response, "usage", None)
             if usage:
                 total_input_tokens += getattr(usage, "input_tokens", 0)
                 total_output_tokens += getattr(usage, "output_tokens", 0)
+            if on_turn:
+                on_turn({
+                    "turn": num_turns,
+                    "ttft_ms": ttft_ms,
+                    "duration_ms": (time.perf_counter() - started) * 1000,
+                    "input_tokens": getattr(usage, "input_tokens", 0) if usage else 0,
+                    "output_tokens": getattr(usage, "output_tokens", 0) if usage else 0,
+                    "stop_reason": getattr(response, "stop_reason", None),
+                })
 
             # Check if the response contains tool use
             has_tool_use = any(block.type == "tool_use" for block in response.content)
@@ -135,6 +199,7 @@ class LLMClient:
                     input_tokens=total_input_tokens,
                     output_tokens=total_output_tokens,
                     num_turns=num_turns,
+                    ttft_ms=ttft,
                 )
 
             # Process tool calls
@@ -152,17 +217,32 @@ class LLMClient:
                         "input": block.input,
                     })
 
+                    if self._cancel.is_set():
+                        raise LLMCancelled(f"Cancelled before running tool {block.name}")
+
                     # Execute the tool
+                    started = time.perf_counter()
+                    failed = False
                     try:
                         tool = tool_registry.get(block.name)
                         result = tool.execute(**block.input)
                     except KeyError:
                         result = f"Error: unknown tool '{block.name}'"
+                        failed = True
                     except Exception as e:
                         result = f"Error executing {block.name}: {e}"
+                        failed = True
 
                     if on_tool_call:
                         on_tool_call(block.name, block.input, result)
+                    if on_tool_event:
+                        on_tool_event({
+                            "tool": block.name,
+                            "input": block.input,
+                            "duration_ms": (time.perf_counter() - started) * 1000,
+                            "result_chars": len(str(result)),
+                            "error": failed,
+                        })
 
                     tool_results.append({
                         "type": "tool_result",
@@ -179,4 +259,50 @@ class LLMClient:
             input_tokens=total_input_tokens,
             output_tokens=total_output_tokens,
             num_turns=num_turns,
+            ttft_ms=ttft,
         )
+
+    def _stream_turn(
+        self,
+        kwargs: dict[str, Any],
+        on_text_delta: Callable[[str], None] | None,
+        on_tool_use_start: Callable[[str, str], None] | None,
+    ) -> tuple[Any, float | None]:
+        """Stream one API call; returns the final message and its time to first token (ms)."""
+        if self._cancel.is_set():
+            raise LLMCancelled("Cancelled before the request was sent")
+        started = time.perf_counter()
+        ttft_ms: float | None = None
+        try:
+            with self._client.messages.stream(**kwargs, timeout=STREAM_IDLE_TIMEOUT) as stream:
+                with self._stream_lock:
+                    self._stream = stream
+                try:
+                    # cancel() may have run before the stream was registered
+                    if self._cancel.is_set():
+                        raise LLMCancelled("Cancelled while the request was sent")
+                    for event in stream:
+                        if event.type == "content_block_start":
+                            if ttft_ms is None:
+                                ttft_ms = (time.perf_counter() - started) * 1000
+                            block = event.content_block
+                            if block.type == "tool_use" and on_tool_use_start:
+                                on_tool_use_start(block.name, block.id)
+                        elif event.type == "content_block_delta":
+                            if ttft_ms is None:
+                                ttft_ms = (time.perf_counter() - started) * 1000
+                            if event.delta.type == "text_delta" and on_text_delta:
+                                on_text_delta(event.delta.text)
+                    if self._cancel.is_set():
+                        raise LLMCancelled("Cancelled while the response was streaming")
+                    return stream.get_final_message(), ttft_ms
+                finally:
+                    with self._stream_lock:
+                        self._stream = None
+        except LLMCancelled:
+            raise
+        except Exception as exc:
+            # Closing the stream from cancel() surfaces as a read error here
+            if self._cancel.is_set():
+                raise LLMCancelled("Cancelled while the response was streaming") from exc
+            raise
@@ -10,6 +10,8 @@ from pathlib import Path
 from levelup.agents.base import BaseAgent
 from levelup.agents.backend import AgentResult
 from levelup.core.context import PipelineContext, PipelineStatus
+from levelup.core.test_cache import TestResultCache, run_test_command
+from levelup.core.test_selection import scoped_test_command
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,17 @@ class TestVerifierAgent(BaseAgent):
     name = "test_verifier"
     description = "Verify tests fail before implementation"
 
+    def __init__(
+        self,
+        *args,
+        test_selection: bool = False,
+        test_cache: TestResultCache | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._test_selection = test_selection
+        self._test_cache = test_cache
+
     def get_system_prompt(self, ctx: PipelineContext) -> str:
         return SYSTEM_PROMPT.format(
             test_command=ctx.test_command or "unknown",
@@ -62,15 +75,17 @@ class TestVerifierAgent(BaseAgent):
         # Convert test_command to string (defensive for test mocks)
         test_cmd = str(ctx.test_command)
 
+        # Only the newly written tests need to fail; scope the run to them
+        if self._test_selection:
+            test_cmd = scoped_test_command(ctx, self.project_path) or test_cmd
+
         # Run the tests
         try:
-            result = subprocess.run(
+            result = run_test_command(
                 test_cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_path),
+                self.project_path,
                 timeout=300,  # 5 minute timeout
+                cache=self._test_cache,
             )
 
             stdout = str(result.stdout) if result.stdout else ""
@@ -1,4 +1,4 @@
-"""Typer CLI commands: run, detect, config, gui, status, version, self-update."""
+"""Typer CLI commands: run, detect, config, gui, status, trace, metrics, version, self-update."""
 
 from __future__ import annotations
 
@@ -6,7 +6,7 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
@@ -18,6 +18,11 @@ from levelup.cli.display import (
     print_project_info,
 )
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
+    from levelup.state.watch import RunWatcher
+
 app = typer.Typer(
     name="levelup",
     help="AI-Powered TDD Development Tool",
@@ -27,6 +32,9 @@ app = typer.Typer(
 jira_app = typer.Typer(name="jira", help="Jira integration commands.", no_args_is_help=True)
 app.add_typer(jira_app)
 
+metrics_app = typer.Typer(name="metrics", help="Pipeline fleet metrics.", no_args_is_help=True)
+app.add_typer(metrics_app)
+
 
 def _version_callback(value: bool) -> None:
     if value:
@@ -80,6 +88,12 @@ def run(
     effort: Optional[str] = typer.Option(
         None, "--effort", "-e", help="Thinking effort: low, medium, high"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-run project detection instead of using the cache"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Profile the run with cProfile and summarize hot spots"
+    ),
 ) -> None:
     """Run the LevelUp TDD pipeline on a task."""
     from levelup.cli.prompts import get_task_input
@@ -206,6 +220,8 @@ def run(
         cli_model_override=model is not None,
         cli_effort=effort,
         cli_skip_planning=skip_planning,
+        refresh_detection=refresh,
+        profile=profile,
     )
     ctx = orchestrator.run(task_input)
 
@@ -254,14 +270,24 @@ def run(
 @app.command()
 def detect(
     path: Path = typer.Option(Path.cwd(), "--path", "-p", help="Project path to analyze"),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore the cached result and re-run detection"
+    ),
 ) -> None:
     """Detect project language, framework, and test runner."""
+    from levelup.config.loader import load_settings
+    from levelup.detection.cache import DetectionCache
     from levelup.detection.detector import ProjectDetector
 
     print_banner()
-    detector = ProjectDetector()
-    info = detector.detect(path)
+    cache = DetectionCache() if load_settings(project_path=path).pipeline.detection_cache else None
+    if cache is not None:
+        info = cache.detect(path, ProjectDetector(), refresh=refresh)
+    else:
+        info = ProjectDetector().detect(path)
     print_project_info(info)
+    if cache is not None and cache.last_hit:
+        console.print("[dim]Using cached detection (manifests unchanged); pass --refresh to re-detect.[/dim]")
 
 
 @app.command()
@@ -434,69 +460,176 @@ def status(
     db_path: Optional[Path] = typer.Option(
         None, "--db-path", help="Override state DB path"
     ),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Keep running and update as runs change"
+    ),
+    interval: float = typer.Option(
+        2.0, "--interval", help="Seconds between database polls in --watch mode"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print runs as a JSON array"),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="One JSON object per line; with --watch, stream changes"
+    ),
+    limit: int = typer.Option(50, "--limit", help="Max runs to show (0 = all)"),
 ) -> None:
     """Show status of all LevelUp runs in the terminal."""
-    from rich.table import Table
+    import json
 
+    from levelup.cli.display import status_row, status_table
+    from levelup.state.db import DEFAULT_DB_PATH
     from levelup.state.manager import StateManager
+    from levelup.state.watch import RunWatcher
 
-    mgr_kwargs = {}
-    if db_path:
-        mgr_kwargs["db_path"] = db_path
-    mgr = StateManager(**mgr_kwargs)
+    if as_json and (watch or ndjson):
+        print_error("--json prints a single snapshot; use --ndjson to stream with --watch.")
+        raise typer.Exit(2)
+
+    db = db_path or DEFAULT_DB_PATH
+    mgr = StateManager(db)
 
     # Clean up dead processes
     mgr.mark_dead_runs()
 
-    runs = mgr.list_runs()
+    with RunWatcher(db, limit=limit or None, maintenance=mgr.mark_dead_runs) as watcher:
+        watcher.poll()
+        runs = watcher.rows
+        try:
+            if watch and ndjson:
+                _stream_status_changes(watcher, interval)
+            elif watch:
+                _live_status_table(watcher, interval)
+            elif as_json:
+                sys.stdout.write(json.dumps(runs, indent=2) + "\n")
+            elif ndjson:
+                sys.stdout.writelines(json.dumps(run) + "\n" for run in runs)
+            elif not runs:
+                console.print("[dim]No runs found.[/dim]")
+            else:
+                console.print(status_table([status_row(r) for r in runs]))
+                summary = _status_summary(runs)
+                if summary:
+                    console.print(f"\n{summary}")
+        except KeyboardInterrupt:
+            pass
 
-    if not runs:
-        console.print("[dim]No runs found.[/dim]")
-        return
 
-    table = Table(title="LevelUp Runs")
-    table.add_column("Run ID", style="cyan")
-    table.add_column("Task", max_width=40)
-    table.add_column("Project", max_width=30)
-    table.add_column("Status")
-    table.add_column("Step")
-    table.add_column("Cost", justify="right")
-    table.add_column("Started")
-
-    status_styles = {
-        "running": "blue",
-        "waiting_for_input": "yellow",
-        "paused": "yellow",
-        "completed": "green",
-        "failed": "red",
-        "aborted": "dim",
-        "pending": "dim",
-    }
-
-    for r in runs:
-        style = status_styles.get(r.status, "")
-        status_display = f"[{style}]{r.status}[/{style}]" if style else r.status
-        cost_display = f"${r.total_cost_usd:.4f}" if r.total_cost_usd else "-"
-        table.add_row(
-            r.run_id[:12],
-            r.task_title,
-            r.project_path,
-            status_display,
-            r.current_step or "",
-            cost_display,
-            r.started_at[:19],
-        )
+def _status_summary(runs: list[dict]) -> str | None:
+    active = sum(1 for r in runs if r["status"] in ("running", "pending"))
+    awaiting = sum(1 for r in runs if r["status"] == "waiting_for_input")
+    if not (active or awaiting):
+        return None
+    return f"[bold]{active} active[/bold], [yellow]{awaiting} awaiting input[/yellow]"
 
-    console.print(table)
 
-    # Summary
-    active = sum(1 for r in runs if r.status in ("running", "pending"))
-    awaiting = sum(1 for r in runs if r.status == "waiting_for_input")
-    if active or awaiting:
-        console.print(
-            f"\n[bold]{active} active[/bold], "
-            f"[yellow]{awaiting} awaiting input[/yellow]"
-        )
+def _stream_status_changes(watcher: RunWatcher, interval: float) -> None:
+    """``status --watch --ndjson``: the current runs as "added", then one line per change."""
+    import json
+
+    for run in watcher.rows:
+        sys.stdout.write(json.dumps({"event": "added", "run": run}) + "\n")
+    sys.stdout.flush()
+    while True:
+        for change in watcher.wait(interval):
+            sys.stdout.write(json.dumps(change.to_dict()) + "\n")
+        sys.stdout.flush()
+
+
+def _live_status_table(watcher: RunWatcher, interval: float) -> None:
+    """``status --watch``: repaint the table only when a poll reports changes.
+
+    Row cells are rendered once per run and rebuilt only for runs that changed.
+    """
+    from rich.live import Live
+
+    from levelup.cli.display import status_row, status_table
+
+    cells = {r["run_id"]: status_row(r) for r in watcher.rows}
+
+    def render() -> Table:
+        runs = watcher.rows
+        return status_table([cells[r["run_id"]] for r in runs], caption=_status_summary(runs))
+
+    with Live(render(), console=console, auto_refresh=False) as live:
+        while True:
+            changes = watcher.wait(interval)
+            if not changes:
+                continue
+            for change in changes:
+                if change.kind == "removed":
+                    cells.pop(change.run["run_id"], None)
+                else:
+                    cells[change.run["run_id"]] = status_row(change.run)
+            live.update(render(), refresh=True)
+
+
+@app.command()
+def trace(
+    run_id: str = typer.Argument(..., help="Run ID whose spans to show or export"),
+    fmt: str = typer.Option(
+        "summary", "--format", "-f", help="Output format: summary, chrome, or otel"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write the exported trace to this file (default: stdout)"
+    ),
+) -> None:
+    """Show per-span timings of a run, or export them as a Chrome/OpenTelemetry trace."""
+    import json
+
+    from levelup.core.events import events_path, read_events
+    from levelup.core.tracing import spans_from_events, to_chrome_trace, to_otel_json
+
+    if fmt not in ("summary", "chrome", "otel"):
+        print_error(f"Unknown format '{fmt}'. Use summary, chrome, or otel.")
+        raise typer.Exit(1)
+
+    path = events_path(run_id)
+    events, _ = read_events(path)
+    spans = spans_from_events(events)
+    if not spans:
+        print_error(f"No trace recorded for run '{run_id}' ({path}).")
+        raise typer.Exit(1)
+
+    if fmt == "summary":
+        from rich.table import Table
+
+        table = Table(title=f"Trace: {run_id}")
+        table.add_column("Span", style="cyan")
+        table.add_column("Calls", justify="right")
+        table.add_column("Wall", justify="right")
+        table.add_column("CPU", justify="right")
+        table.add_column("Child CPU", justify="right")
+        table.add_column("Peak RSS", justify="right")
+
+        totals: dict[str, list[float]] = {}
+        for span in spans:
+            label = span.name
+            if span.attributes.get("step") or span.attributes.get("agent_name"):
+                label += f" ({span.attributes.get('step') or span.attributes.get('agent_name')})"
+            row = totals.setdefault(label, [0, 0.0, 0.0, 0.0, 0])
+            row[0] += 1
+            row[1] += span.duration_ms
+            row[2] += span.cpu_ms
+            row[3] += span.child_cpu_ms or 0.0
+            row[4] = max(row[4], span.peak_rss_kb or 0)
+        for label, (calls, wall, cpu, child, rss) in totals.items():
+            table.add_row(
+                label,
+                str(int(calls)),
+                f"{wall / 1000:.2f}s",
+                f"{cpu / 1000:.2f}s",
+                f"{child / 1000:.2f}s",
+                f"{rss / 1024:.0f} MiB" if rss else "-",
+            )
+        console.print(table)
+        return
+
+    exporter = to_chrome_trace if fmt == "chrome" else to_otel_json
+    data = json.dumps(exporter(spans, run_id), indent=2)
+    if output is None:
+        typer.echo(data)
+    else:
+        output.write_text(data, encoding="utf-8")
+        console.print(f"[green]Wrote {fmt} trace ({len(spans)} spans) to {output}[/green]")
 
 
 @app.command()
@@ -509,6 +642,12 @@ def resume(
     db_path: Optional[Path] = typer.Option(
         None, "--db-path", help="Override state DB path"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-run project detection instead of using the cache"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Profile the run with cProfile and summarize hot spots"
+    ),
 ) -> None:
     """Resume a failed or aborted pipeline run."""
     from levelup.config.loader import load_settings
@@ -583,7 +722,12 @@ def resume(
             settings.llm.api_key = api_key
 
     # Resume
-    orchestrator = Orchestrator(settings=settings, state_manager=state_manager)
+    orchestrator = Orchestrator(
+        settings=settings,
+        state_manager=state_manager,
+        refresh_detection=refresh,
+        profile=profile,
+    )
     ctx = orchestrator.resume(ctx, from_step=from_step)
 
     if ctx.status.value == "failed":
@@ -1750,5 +1894,32 @@ def jira_configure(
         break
 
 
+@metrics_app.command("serve")
+def metrics_serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(9464, "--port", help="Port to listen on"),
+    db_path: Optional[Path] = typer.Option(
+        None, "--db-path", help="Override state DB path"
+    ),
+) -> None:
+    """Serve Prometheus metrics for all runs in the state DB at /metrics."""
+    from levelup.state.metrics import MetricsCollector, make_server
+
+    collector = MetricsCollector(db_path) if db_path else MetricsCollector()
+    try:
+        server = make_server(collector, host, port)
+    except OSError as exc:
+        print_error(f"Cannot listen on {host}:{port}: {exc}")
+        raise typer.Exit(1)
+
+    console.print(f"Serving metrics at [cyan]http://{host}:{port}/metrics[/cyan] (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 if __name__ == "__main__":
     app()
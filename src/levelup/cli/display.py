@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 
 from levelup import __version__
@@ -29,16 +30,14 @@ console = Console()
 def get_version_string() -> str:
     """Return a version string like 'levelup 0.1.0 (commit abc1234, clean)'."""
     base = f"levelup {__version__}"
+    project_root = Path(__file__).resolve().parents[3]
     try:
-        import git
-
-        project_root = Path(__file__).resolve().parents[3]
-        repo = git.Repo(project_root)
-        sha7 = repo.head.commit.hexsha[:7]
-        state = "dirty" if repo.is_dirty() else "clean"
-        return f"{base} (commit {sha7}, {state})"
-    except Exception:
+        sha7 = _git_output(project_root, "rev-parse", "--short=7", "HEAD")
+        dirty = _git_output(project_root, "status", "--porcelain", "--untracked-files=no")
+    except (OSError, subprocess.SubprocessError):
         return base
+    state = "dirty" if dirty else "clean"
+    return f"{base} (commit {sha7}, {state})"
 
 
 def print_banner() -> None:
@@ -64,6 +63,21 @@ def print_project_info(info: ProjectInfo) -> None:
     table.add_row("Test Command", info.test_command or "[dim]not detected[/dim]")
     console.print(table)
 
+    if info.packages:
+        packages = Table(title="Packages", border_style="blue")
+        packages.add_column("Path", style="bold")
+        packages.add_column("Language")
+        packages.add_column("Framework")
+        packages.add_column("Test Command")
+        for package in info.packages:
+            packages.add_row(
+                package.path,
+                package.language or "-",
+                package.framework or "-",
+                package.test_command or "[dim]not detected[/dim]",
+            )
+        console.print(packages)
+
 
 def print_requirements(requirements: Requirements) -> None:
     """Display structured requirements."""
@@ -92,6 +106,8 @@ def print_requirements(requirements: Requirements) -> None:
 
 def print_file_changes(changes: list[FileChange], title: str = "File Changes") -> None:
     """Display file changes with syntax highlighting."""
+    from rich.syntax import Syntax  # pulls in pygments; only needed here
+
     for change in changes:
         # Guess language from extension
         ext = change.path.rsplit(".", 1)[-1] if "." in change.path else ""
@@ -294,3 +310,87 @@ def print_error(message: str) -> None:
 def print_success(message: str) -> None:
     """Print a success message."""
     console.print(f"[bold green]{message}[/bold green]")
+
+
+def print_profile_summary(summary: dict[str, Any]) -> None:
+    """Display the ``--profile`` summary: time per area and top self-time functions."""
+    table = Table(
+        title=f"Profile ({summary['total_ms'] / 1000:.1f}s, top self time)", border_style="dim"
+    )
+    table.add_column("Function", style="bold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Self", justify="right")
+    table.add_column("Cumulative", justify="right")
+    for entry in summary["top"]:
+        table.add_row(
+            entry["function"],
+            str(entry["calls"]),
+            f"{entry['self_ms'] / 1000:.2f}s",
+            f"{entry['cumulative_ms'] / 1000:.2f}s",
+        )
+    console.print(table)
+    areas = summary["areas"]
+    by_area = ", ".join(f"{area} {ms / 1000:.1f}s" for area, ms in areas.items() if ms)
+    if by_area:
+        console.print(f"[dim]By area:[/dim] {by_area}")
+    if summary.get("path"):
+        console.print(f"[dim]Profile written to {summary['path']} (snakeviz/pstats)[/dim]")
+
+
+def _git_output(cwd: Path, *args: str) -> str:
+    """Stdout of a git command in *cwd* (plain git keeps GitPython off the startup path).
+
+    Git may not search above *cwd*, so an install inside another repository
+    (say, a venv in someone's project) doesn't report that repository's commit.
+    """
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        env={**os.environ, "GIT_CEILING_DIRECTORIES": str(cwd.parent)},
+        capture_output=True,
+        text=True,
+        timeout=5,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+STATUS_STYLES = {
+    "running": "blue",
+    "waiting_for_input": "yellow",
+    "paused": "yellow",
+    "completed": "green",
+    "failed": "red",
+    "aborted": "dim",
+    "pending": "dim",
+}
+
+
+def status_row(run: dict[str, Any]) -> tuple[str, ...]:
+    """Table cells for one run (a ``RunWatcher`` row)."""
+    status = run["status"]
+    style = STATUS_STYLES.get(status, "")
+    return (
+        run["run_id"][:12],
+        run["task_title"],
+        run["project_path"],
+        f"[{style}]{status}[/{style}]" if style else status,
+        run["current_step"] or "",
+        f"${run['total_cost_usd']:.4f}" if run["total_cost_usd"] else "-",
+        run["started_at"][:19],
+    )
+
+
+def status_table(rows: list[tuple[str, ...]], caption: str | None = None) -> Table:
+    """The ``levelup status`` runs table from pre-rendered ``status_row`` cells."""
+    table = Table(title="LevelUp Runs", caption=caption)
+    table.add_column("Run ID", style="cyan")
+    table.add_column("Task", max_width=40)
+    table.add_column("Project", max_width=30)
+    table.add_column("Status")
+    table.add_column("Step")
+    table.add_column("Cost", justify="right")
+    table.add_column("Started")
+    for cells in rows:
+        table.add_row(*cells)
+    return table
@@ -38,6 +38,12 @@ class PipelineSettings(BaseModel):
     require_checkpoints: bool = True
     create_git_branch: bool = True
     auto_approve: bool = False
+    test_selection: bool = True  # scope red/green iterations to affected tests
+    test_workers: int = 0  # parallel test workers; 0 = one per CPU core, 1 = serial
+    test_sharding: bool = False  # split pytest runs without xdist into per-file shards
+    test_cache: bool = True  # reuse test results when the worktree is unchanged
+    persistent_shell: bool = False  # anthropic_sdk: one bash session per run for shell tools
+    detection_cache: bool = True  # reuse project detection until a manifest file changes
 
 
 class HotkeySettings(BaseModel):
@@ -120,6 +126,8 @@ class GUISettings(BaseModel):
 
     theme: Literal["light", "dark", "system"] = "system"
     hotkeys: HotkeySettings = Field(default_factory=HotkeySettings)
+    terminal_history: int = Field(default=10000, ge=0)  # scrollback lines per run terminal
+    diff_cache: bool = False  # also keep generated diffs on disk (~/.levelup/diff_cache/)
 
     @field_validator("theme")
     @classmethod
@@ -132,6 +132,16 @@ class SecurityFinding(BaseModel):
     recommendation: str = ""
 
 
+class ProjectPackage(BaseModel):
+    """A sub-package of a monorepo with its own language and test command."""
+
+    path: str  # relative to the project root
+    language: str | None = None
+    framework: str | None = None
+    test_runner: str | None = None
+    test_command: str | None = None
+
+
 # --- Usage Tracking ---
 
 
@@ -143,6 +153,8 @@ class StepUsage(BaseModel):
     output_tokens: int = 0
     duration_ms: float = 0.0
     num_turns: int = 0
+    test_cache_hits: int = 0
+    test_cache_misses: int = 0
 
 
 # --- Pipeline Context ---
@@ -164,6 +176,7 @@ class PipelineContext(BaseModel):
     framework: str | None = None
     test_runner: str | None = None
     test_command: str | None = None
+    packages: list[ProjectPackage] = Field(default_factory=list)
     branch_naming: str | None = None
 
     # Agent outputs (populated sequentially)
@@ -0,0 +1,141 @@
+"""Append-only JSONL event log for a pipeline run.
+
+Each run writes one JSON object per line to
+``~/.levelup/runs/<run_id>/events.jsonl``: step start/end, tool calls,
+usage, checkpoint decisions and timings.  Writes go through a buffered file
+handle kept open for the whole run; it is flushed at most every
+``flush_interval`` seconds (and on every step boundary) and fsynced at most
+every ``fsync_interval`` seconds.  The Markdown run journal is rendered from
+these events (see ``levelup.core.journal``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUNS_DIR = Path.home() / ".levelup" / "runs"
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_FSYNC_INTERVAL = 2.0
+
+# Events that mark a boundary readers wait for; written through immediately
+_SYNC_EVENTS = {"run_start", "step_end", "checkpoint", "outcome"}
+
+# Bump when the meaning of existing event fields changes
+EVENT_SCHEMA_VERSION = 1
+
+
+def events_path(run_id: str, runs_dir: Path | None = None) -> Path:
+    """Location of the event log for *run_id*."""
+    return (runs_dir or DEFAULT_RUNS_DIR) / run_id / "events.jsonl"
+
+
+class EventLog:
+    """Buffered, thread-safe JSONL writer with periodic fsync."""
+
+    def __init__(
+        self,
+        path: Path,
+        run_id: str,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+    ) -> None:
+        self._path = path
+        self._run_id = run_id
+        self._flush_interval = flush_interval
+        self._fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._fh: IO[str] | None = None
+        self._last_flush = self._last_fsync = time.monotonic()
+        self._failed = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def emit(self, event_type: str, **fields: Any) -> dict[str, Any]:
+        """Append an event and return it (as written)."""
+        event: dict[str, Any] = {
+            "v": EVENT_SCHEMA_VERSION,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "run_id": self._run_id,
+            "type": event_type,
+            **fields,
+        }
+        line = json.dumps(event, default=str, ensure_ascii=False)
+        with self._lock:
+            if self._failed:
+                return event
+            try:
+                if self._fh is None:
+                    self._path.parent.mkdir(parents=True, exist_ok=True)
+                    self._fh = self._path.open("a", encoding="utf-8")
+                self._fh.write(line + "\n")
+                now = time.monotonic()
+                if event_type in _SYNC_EVENTS or now - self._last_fsync >= self._fsync_interval:
+                    self._fh.flush()
+                    self._fsync()
+                elif now - self._last_flush >= self._flush_interval:
+                    self._fh.flush()
+                    self._last_flush = now
+            except OSError as e:
+                # Never fail a pipeline run because its event log can't be written
+                logger.warning("Failed to write event log %s: %s", self._path, e)
+                self._failed = True
+        return event
+
+    def sync(self) -> None:
+        """Flush buffered events and force them to disk."""
+        with self._lock:
+            if self._fh is not None:
+                try:
+                    self._fh.flush()
+                    self._fsync()
+                except OSError as e:
+                    logger.warning("Failed to sync event log %s: %s", self._path, e)
+
+    def close(self) -> None:
+        self.sync()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def _fsync(self) -> None:
+        assert self._fh is not None
+        os.fsync(self._fh.fileno())
+        self._last_flush = self._last_fsync = time.monotonic()
+
+
+def read_events(path: Path, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+    """Read complete events from *path* starting at byte *offset*.
+
+    Returns the events and the offset to resume from, so callers can tail a
+    live log cheaply.  A trailing partial line (still being written) is left
+    for the next call; malformed lines are skipped.
+    """
+    try:
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return [], offset
+
+    end = data.rfind(b"\n") + 1
+    events: list[dict[str, Any]] = []
+    for raw in data[:end].splitlines():
+        if not raw.strip():
+            continue
+        try:
+            events.append(json.loads(raw))
+        except ValueError:
+            logger.debug("Skipping malformed event line in %s", path)
+    return events, offset + end
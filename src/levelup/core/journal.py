@@ -1,13 +1,17 @@
-"""Run journal — writes an incremental Markdown log of pipeline activity."""
+"""Run journal — a JSONL event log per run, rendered to an incremental Markdown log."""
 
 from __future__ import annotations
 
 import logging
 import re
-from datetime import datetime, timezone
+import time
+from datetime import datetime
 from pathlib import Path
+from typing import IO, Any, Callable
 
 from levelup.core.context import PipelineContext
+from levelup.core.events import EventLog, events_path
+from levelup.core.tracing import Span
 
 logger = logging.getLogger(__name__)
 
@@ -43,129 +47,324 @@ def _build_filename(ctx: PipelineContext) -> str:
 
 
 class RunJournal:
-    """Incremental Markdown log written during a pipeline run."""
+    """Run journal backed by a JSONL event log.
 
-    def __init__(self, ctx: PipelineContext, base_path: Path | None = None) -> None:
+    Every public ``log_*`` call appends a structured event to the run's
+    event log (see ``levelup.core.events``); events that belong in the
+    human-readable journal are rendered to Markdown and appended to it.
+    ``render_markdown`` reproduces the whole Markdown file from the events.
+    """
+
+    def __init__(
+        self,
+        ctx: PipelineContext,
+        base_path: Path | None = None,
+        events_dir: Path | None = None,
+    ) -> None:
         self._dir = (base_path or ctx.project_path) / "levelup"
         self._path = self._dir / _build_filename(ctx)
+        self._events = EventLog(events_path(ctx.run_id, events_dir), ctx.run_id)
+        self._md: IO[str] | None = None
+        self._current_step: str | None = None
+        self._step_started: float | None = None
 
     @property
     def path(self) -> Path:
         return self._path
 
+    @property
+    def events_path(self) -> Path:
+        return self._events.path
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def write_header(self, ctx: PipelineContext) -> None:
         """Create dir, write title + run metadata + task description."""
+        event = self._events.emit(
+            "run_start",
+            title=ctx.task.title,
+            source=ctx.task.source,
+            source_id=ctx.task.source_id,
+            description=ctx.task.description,
+            started_at=ctx.started_at.isoformat(),
+            project_path=str(ctx.project_path),
+        )
         try:
+            self._close_markdown()
             self._dir.mkdir(parents=True, exist_ok=True)
-
-            lines = [
-                f"# Run Journal: {ctx.task.title}",
-                "",
-                f"- **Run ID:** {ctx.run_id}",
-                f"- **Started:** {ctx.started_at.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                f"- **Task:** {ctx.task.title}",
-            ]
-
-            if ctx.task.source_id:
-                lines.append(f"- **Ticket:** {ctx.task.source_id} ({ctx.task.source})")
-
-            if ctx.task.description:
-                lines.extend(["", "## Task Description", "", ctx.task.description])
-
-            lines.append("")
-            self._path.write_text("\n".join(lines), encoding="utf-8")
+            self._path.write_text("\n".join(render_event(event) or []), encoding="utf-8")
         except OSError:
             logger.warning("Failed to write journal header: %s", self._path)
 
+    def log_step_start(self, step_name: str) -> None:
+        """Record that a pipeline step began (event log only)."""
+        self._current_step = step_name
+        self._step_started = time.monotonic()
+        self._events.emit("step_start", step=step_name)
+
     def log_step(self, step_name: str, ctx: PipelineContext) -> None:
         """Append a section for a completed pipeline step."""
-        try:
-            now = datetime.now(timezone.utc).strftime("%H:%M:%S")
-            lines = [f"## Step: {step_name}  ({now})", ""]
-
-            formatter = _STEP_FORMATTERS.get(step_name)
-            if formatter:
-                lines.extend(formatter(ctx))
-            else:
-                lines.append(f"Step `{step_name}` completed.")
-
-            # Append usage info if available
-            usage = ctx.step_usage.get(step_name)
-            if usage:
-                parts = []
-                if usage.cost_usd:
-                    parts.append(f"${usage.cost_usd:.4f}")
-                tokens = usage.input_tokens + usage.output_tokens
-                if tokens:
-                    parts.append(f"{tokens:,} tokens")
-                if usage.duration_ms:
-                    parts.append(f"{usage.duration_ms / 1000:.1f}s")
-                if parts:
-                    lines.append(f"- **Usage:** {' | '.join(parts)}")
-
-            lines.append("")
-            self._append(lines)
-        except OSError:
-            logger.warning("Failed to write journal step %s: %s", step_name, self._path)
+        formatter = _STEP_FORMATTERS.get(step_name)
+        summary = formatter(ctx) if formatter else [f"Step `{step_name}` completed."]
+        usage = ctx.step_usage.get(step_name)
+        duration_ms = None
+        if self._current_step == step_name and self._step_started is not None:
+            duration_ms = round((time.monotonic() - self._step_started) * 1000, 1)
+        self._log(
+            "step_end",
+            step=step_name,
+            summary=summary,
+            usage=usage.model_dump() if usage else None,
+            duration_ms=duration_ms,
+        )
+        self._current_step = None
+        self._step_started = None
+
+    def log_tool_call(
+        self,
+        tool: str,
+        tool_input: dict[str, Any],
+        *,
+        duration_ms: float,
+        result_chars: int,
+        error: bool = False,
+    ) -> None:
+        """Record one tool execution by an agent (event log only)."""
+        self._events.emit(
+            "tool_call",
+            step=self._current_step,
+            tool=tool,
+            input=_summarize_input(tool_input),
+            duration_ms=round(duration_ms, 1),
+            result_chars=result_chars,
+            error=error,
+        )
+
+    def log_llm_turn(
+        self,
+        turn: int,
+        *,
+        ttft_ms: float | None,
+        duration_ms: float,
+        input_tokens: int,
+        output_tokens: int,
+        stop_reason: str | None,
+    ) -> None:
+        """Record one streamed SDK API call of an agent (event log only)."""
+        self._events.emit(
+            "llm_turn",
+            step=self._current_step,
+            turn=turn,
+            ttft_ms=round(ttft_ms, 1) if ttft_ms is not None else None,
+            duration_ms=round(duration_ms, 1),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            stop_reason=stop_reason,
+        )
+
+    def log_span(self, span: Span) -> None:
+        """Record a finished tracing span (event log only)."""
+        self._events.emit("span", span=span.to_dict())
+
+    def log_profile(self, summary: dict[str, Any]) -> None:
+        """Append the ``--profile`` summary (see ``RunProfiler.summary``)."""
+        self._log("profile", **summary)
 
     def log_checkpoint(self, step_name: str, decision: str, feedback: str) -> None:
         """Append a checkpoint decision record."""
-        try:
-            lines = [
-                f"### Checkpoint: {step_name}",
-                "",
-                f"- **Decision:** {decision}",
-            ]
-            if feedback:
-                lines.append(f"- **Feedback:** {feedback}")
-            lines.append("")
-            self._append(lines)
-        except OSError:
-            logger.warning("Failed to write journal checkpoint: %s", self._path)
+        self._log("checkpoint", step=step_name, decision=decision, feedback=feedback)
 
     def log_instruct(self, instruction: str, agent_result: object | None = None) -> None:
         """Append an instruct entry (instruction text + optional review cost)."""
-        try:
-            lines = [
-                "### Instruct",
-                "",
-                f"- **Rule added:** {instruction}",
-            ]
-            if agent_result is not None:
-                from levelup.agents.backend import AgentResult
-
-                if isinstance(agent_result, AgentResult) and agent_result.cost_usd:
-                    lines.append(f"- **Review cost:** ${agent_result.cost_usd:.4f}")
-            lines.append("")
-            self._append(lines)
-        except OSError:
-            logger.warning("Failed to write journal instruct: %s", self._path)
+        review_cost = None
+        if agent_result is not None:
+            from levelup.agents.backend import AgentResult
+
+            if isinstance(agent_result, AgentResult) and agent_result.cost_usd:
+                review_cost = agent_result.cost_usd
+        self._log("instruct", instruction=instruction, review_cost_usd=review_cost)
+
+    def log_resume(self, step_name: str) -> None:
+        """Append a marker for a resumed run."""
+        self._log("resume", step=step_name)
 
     def log_outcome(self, ctx: PipelineContext) -> None:
         """Append final status (completed/failed/aborted + error if any)."""
-        try:
-            lines = ["## Outcome", "", f"- **Status:** {ctx.status.value}"]
-            if ctx.error_message:
-                lines.append(f"- **Error:** {ctx.error_message}")
-            if ctx.total_cost_usd:
-                lines.append(f"- **Total cost:** ${ctx.total_cost_usd:.4f}")
-            lines.append("")
-            self._append(lines)
-        except OSError:
-            logger.warning("Failed to write journal outcome: %s", self._path)
+        self._log(
+            "outcome",
+            status=ctx.status.value,
+            error=ctx.error_message,
+            total_cost_usd=ctx.total_cost_usd,
+        )
+
+    def close(self) -> None:
+        """Flush and close the event log and the Markdown file."""
+        self._events.close()
+        self._close_markdown()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _log(self, event_type: str, **fields: Any) -> None:
+        event = self._events.emit(event_type, **fields)
+        lines = render_event(event)
+        if lines is None:
+            return
+        try:
+            self._append(lines)
+        except OSError:
+            logger.warning("Failed to write journal %s: %s", event_type, self._path)
+
     def _append(self, lines: list[str]) -> None:
-        self._dir.mkdir(parents=True, exist_ok=True)
-        with self._path.open("a", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        if self._md is None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._md = self._path.open("a", encoding="utf-8")
+        self._md.write("\n".join(lines))
+        self._md.flush()
+
+    def _close_markdown(self) -> None:
+        if self._md is not None:
+            try:
+                self._md.close()
+            except OSError:
+                pass
+            self._md = None
+
+
+def _summarize_input(tool_input: dict[str, Any], limit: int = 200) -> dict[str, Any]:
+    """Keep tool inputs small in the event log (file contents are elided)."""
+    summary: dict[str, Any] = {}
+    for key, value in tool_input.items():
+        if isinstance(value, str) and len(value) > limit:
+            summary[key] = f"{value[:limit]}... ({len(value)} chars)"
+        else:
+            summary[key] = value
+    return summary
+
+
+# ------------------------------------------------------------------
+# Markdown rendering
+# ------------------------------------------------------------------
+
+
+def _render_run_start(event: dict[str, Any]) -> list[str]:
+    started = datetime.fromisoformat(event["started_at"])
+    lines = [
+        f"# Run Journal: {event['title']}",
+        "",
+        f"- **Run ID:** {event['run_id']}",
+        f"- **Started:** {started.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+        f"- **Task:** {event['title']}",
+    ]
+    if event.get("source_id"):
+        lines.append(f"- **Ticket:** {event['source_id']} ({event.get('source')})")
+    if event.get("description"):
+        lines.extend(["", "## Task Description", "", event["description"]])
+    lines.append("")
+    return lines
+
+
+def _render_step_end(event: dict[str, Any]) -> list[str]:
+    at = datetime.fromisoformat(event["ts"]).strftime("%H:%M:%S")
+    lines = [f"## Step: {event['step']}  ({at})", ""]
+    lines.extend(event.get("summary") or [])
+
+    usage = event.get("usage")
+    if usage:
+        parts = []
+        if usage.get("cost_usd"):
+            parts.append(f"${usage['cost_usd']:.4f}")
+        tokens = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        if tokens:
+            parts.append(f"{tokens:,} tokens")
+        if usage.get("duration_ms"):
+            parts.append(f"{usage['duration_ms'] / 1000:.1f}s")
+        hits, misses = usage.get("test_cache_hits", 0), usage.get("test_cache_misses", 0)
+        if hits or misses:
+            parts.append(f"test cache {hits} hit(s) / {misses} miss(es)")
+        if parts:
+            lines.append(f"- **Usage:** {' | '.join(parts)}")
+
+    lines.append("")
+    return lines
+
+
+def _render_checkpoint(event: dict[str, Any]) -> list[str]:
+    lines = [
+        f"### Checkpoint: {event['step']}",
+        "",
+        f"- **Decision:** {event['decision']}",
+    ]
+    if event.get("feedback"):
+        lines.append(f"- **Feedback:** {event['feedback']}")
+    lines.append("")
+    return lines
+
+
+def _render_instruct(event: dict[str, Any]) -> list[str]:
+    lines = ["### Instruct", "", f"- **Rule added:** {event['instruction']}"]
+    if event.get("review_cost_usd"):
+        lines.append(f"- **Review cost:** ${event['review_cost_usd']:.4f}")
+    lines.append("")
+    return lines
+
+
+def _render_resume(event: dict[str, Any]) -> list[str]:
+    return [f"\n## Resumed from step: {event['step']}", ""]
+
+
+def _render_profile(event: dict[str, Any]) -> list[str]:
+    lines = ["## Profile", "", f"- **Profiled:** {event['total_ms'] / 1000:.1f}s"]
+    if event.get("path"):
+        lines.append(f"- **Stats file:** `{event['path']}`")
+    areas = ", ".join(f"{area} {ms / 1000:.1f}s" for area, ms in event["areas"].items() if ms)
+    if areas:
+        lines.append(f"- **By area:** {areas}")
+    if event["top"]:
+        lines.extend(["", "| Function | Calls | Self | Cumulative |", "|---|---:|---:|---:|"])
+        for entry in event["top"]:
+            lines.append(
+                f"| `{entry['function']}` | {entry['calls']} | {entry['self_ms']:.0f}ms "
+                f"| {entry['cumulative_ms']:.0f}ms |"
+            )
+    lines.append("")
+    return lines
+
+
+def _render_outcome(event: dict[str, Any]) -> list[str]:
+    lines = ["## Outcome", "", f"- **Status:** {event['status']}"]
+    if event.get("error"):
+        lines.append(f"- **Error:** {event['error']}")
+    if event.get("total_cost_usd"):
+        lines.append(f"- **Total cost:** ${event['total_cost_usd']:.4f}")
+    lines.append("")
+    return lines
+
+
+_EVENT_RENDERERS: dict[str, Callable[[dict[str, Any]], list[str]]] = {
+    "run_start": _render_run_start,
+    "step_end": _render_step_end,
+    "checkpoint": _render_checkpoint,
+    "instruct": _render_instruct,
+    "resume": _render_resume,
+    "profile": _render_profile,
+    "outcome": _render_outcome,
+}
+
+
+def render_event(event: dict[str, Any]) -> list[str] | None:
+    """Markdown lines for *event*, or None if it is not shown in the journal."""
+    renderer = _EVENT_RENDERERS.get(event.get("type", ""))
+    return renderer(event) if renderer else None
+
+
+def render_markdown(events: list[dict[str, Any]]) -> str:
+    """Render a complete Markdown journal from a run's events."""
+    chunks = [render_event(e) for e in events]
+    return "".join("\n".join(lines) for lines in chunks if lines is not None)
 
 
 # ------------------------------------------------------------------
@@ -6,16 +6,22 @@ import json
 import logging
 import shutil
 import subprocess
+import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
+from rich.status import Status
 
 from levelup.agents.backend import AgentResult, AnthropicSDKBackend, Backend, ClaudeCodeBackend
 from levelup.agents.base import BaseAgent
 from levelup.agents.claude_code_client import ClaudeCodeClient, ClaudeCodeError
 from levelup.agents.coder import CodeAgent
-from levelup.agents.llm_client import LLMClient
+from levelup.agents.llm_client import LLMCancelled, LLMClient
 from levelup.agents.planning import PlanningAgent
 from levelup.agents.requirements import RequirementsAgent
 from levelup.agents.reviewer import ReviewAgent
@@ -25,6 +31,7 @@ from levelup.agents.test_verifier import TestVerifierAgent
 from levelup.cli.display import (
     print_error,
     print_pipeline_summary,
+    print_profile_summary,
     print_step_header,
     print_success,
 )
@@ -34,19 +41,26 @@ from levelup.core.context import (
     CheckpointDecision,
     PipelineContext,
     PipelineStatus,
+    ProjectPackage,
     StepUsage,
     TaskInput,
 )
 from levelup.core.instructions import add_instruction, build_instruct_review_prompt
+from levelup.core.events import events_path
 from levelup.core.journal import RunJournal
+from levelup.core.profiling import RunProfiler, profile_path
 from levelup.core.project_context import write_project_context_preserving
+from levelup.core.test_cache import TestResultCache
+from levelup.core.tracing import Tracer, traced
 from levelup.core.pipeline import DEFAULT_PIPELINE, StepType
+from levelup.detection.cache import DetectionCache
 from levelup.detection.detector import ProjectDetector
 from levelup.tools.base import ToolRegistry
 from levelup.tools.file_read import FileReadTool
 from levelup.tools.file_search import FileSearchTool
 from levelup.tools.file_write import FileWriteTool
 from levelup.tools.shell import ShellTool
+from levelup.tools.shell_session import ShellSession
 from levelup.tools.test_runner import TestRunnerTool
 
 logger = logging.getLogger(__name__)
@@ -71,6 +85,8 @@ class Orchestrator:
         cli_model_override: bool = False,
         cli_effort: str | None = None,
         cli_skip_planning: bool = False,
+        refresh_detection: bool = False,
+        profile: bool = False,
     ) -> None:
         self._settings = settings
         self._state_manager = state_manager
@@ -82,6 +98,22 @@ class Orchestrator:
         self._cli_model_override = cli_model_override
         self._cli_effort = cli_effort
         self._cli_skip_planning = cli_skip_planning
+        self._test_cache: TestResultCache | None = (
+            TestResultCache() if settings.pipeline.test_cache else None
+        )
+        self._shell_session: ShellSession | None = None
+        self._journal: RunJournal | None = None
+        # Console spinner of the agent being run, updated as its response streams
+        self._agent_status: tuple[Status, str] | None = None
+        self._streamed_chars = 0
+        self._tracer = Tracer()
+        self._profile = profile
+        self._profiler: RunProfiler | None = None
+        self._refresh_detection = refresh_detection
+        self._detected_packages: list[ProjectPackage] = []
+        self._detection_cache: DetectionCache | None = (
+            DetectionCache() if settings.pipeline.detection_cache else None
+        )
 
     def _should_auto_approve(self, ctx: PipelineContext) -> bool:
         """Determine if checkpoints should be auto-approved for this run.
@@ -170,8 +202,17 @@ class Orchestrator:
                 temperature=self._settings.llm.temperature,
             )
             tool_registry = self._create_tool_registry(project_path, ctx)
-            return AnthropicSDKBackend(llm_client, tool_registry, thinking_budget=thinking_budget)
+            return AnthropicSDKBackend(
+                llm_client,
+                tool_registry,
+                thinking_budget=thinking_budget,
+                on_tool_event=self._on_tool_event,
+                on_text_delta=self._on_llm_text_delta,
+                on_tool_use_start=self._on_llm_tool_use_start,
+                on_turn=self._on_llm_turn,
+            )
 
+    @traced("persist_state")
     def _persist_state(self, ctx: PipelineContext) -> None:
         """Persist current pipeline state to the DB if a state manager is present."""
         if self._state_manager is not None:
@@ -201,6 +242,7 @@ class Orchestrator:
             return True
         return False
 
+    @traced("checkpoint_wait", "step_name")
     def _wait_for_checkpoint_decision(
         self, step_name: str, ctx: PipelineContext
     ) -> tuple[CheckpointDecision, str]:
@@ -245,6 +287,14 @@ class Orchestrator:
 
     def run(self, task: TaskInput) -> PipelineContext:
         """Execute the full pipeline."""
+        try:
+            return self._run(task)
+        finally:
+            # Also on Ctrl+C or an error while wrapping up: never leak the PTY shell
+            self._close_shell_session()
+
+    def _run(self, task: TaskInput) -> PipelineContext:
+        self._start_profile()
         project_path = self._settings.project.path.resolve()
 
         ctx = PipelineContext(
@@ -275,7 +325,9 @@ class Orchestrator:
 
             # Create journal in the working directory
             journal = RunJournal(ctx, base_path=working_path)
+            self._journal = journal
             journal.write_header(ctx)
+            self._tracer.set_sink(journal.log_span)
 
             # Read ticket-level adaptive settings
             ticket_settings = self._read_ticket_settings(ctx)
@@ -327,6 +379,7 @@ class Orchestrator:
             if not self._quiet:
                 print_error(str(e))
 
+        self._finish_profile(ctx)
         working_path = ctx.worktree_path or project_path
         if "journal" in locals():
             journal.log_outcome(ctx)
@@ -346,6 +399,7 @@ class Orchestrator:
                     )
 
         self._persist_state(ctx)
+        self._close_journal()
         return ctx
 
     def resume(self, ctx: PipelineContext, from_step: str | None = None) -> PipelineContext:
@@ -358,6 +412,12 @@ class Orchestrator:
         Returns:
             Updated PipelineContext.
         """
+        try:
+            return self._resume(ctx, from_step)
+        finally:
+            self._close_shell_session()
+
+    def _resume(self, ctx: PipelineContext, from_step: str | None) -> PipelineContext:
         project_path = self._settings.project.path.resolve()
 
         # Determine which step to resume from
@@ -373,6 +433,7 @@ class Orchestrator:
         # Reset status
         ctx.status = PipelineStatus.RUNNING
         ctx.error_message = None
+        self._start_profile()
 
         try:
             # Re-create worktree if this run used one
@@ -405,7 +466,9 @@ class Orchestrator:
                 working_path = project_path
 
             journal = RunJournal(ctx, base_path=working_path)
-            journal._append([f"\n## Resumed from step: {target_step}", ""])
+            self._journal = journal
+            journal.log_resume(target_step)
+            self._tracer.set_sink(journal.log_span)
 
             # Create backend and register agents against the working path
             self._backend = self._create_backend(working_path, ctx)
@@ -436,6 +499,7 @@ class Orchestrator:
             if not self._quiet:
                 print_error(str(e))
 
+        self._finish_profile(ctx)
         working_path = ctx.worktree_path or project_path
         if "journal" in locals():
             journal.log_outcome(ctx)
@@ -455,6 +519,7 @@ class Orchestrator:
                     )
 
         self._persist_state(ctx)
+        self._close_journal()
         return ctx
 
     def _execute_steps(
@@ -473,125 +538,128 @@ class Orchestrator:
                     ctx.status = PipelineStatus.PAUSED
                 break
 
-            ctx.current_step = step.name
-            self._persist_state(ctx)
-
-            if not self._quiet:
-                print_step_header(step.name, step.description)
-
-            if step.step_type == StepType.DETECTION:
-                self._run_detection(project_path, ctx)
-                # Set default test_command if detection didn't provide one (for tests)
-                if not ctx.test_command:
-                    ctx.test_command = "pytest"
-                # Re-create backend/agents if SDK backend (needs updated test command)
-                if self._settings.llm.backend == "anthropic_sdk":
-                    self._backend = self._create_backend(project_path, ctx)
-                    self._register_agents(self._backend, project_path)
-
-            elif step.step_type == StepType.AGENT:
-                if step.agent_name not in self._agents:
-                    logger.error("Agent not found: %s", step.agent_name)
-                    continue
-
-                ctx = self._run_agent_with_retry(step.agent_name, ctx)
-                # Defensive: handle if mock accidentally returns tuple instead of just ctx
-                if isinstance(ctx, tuple):
-                    ctx = ctx[0]
-
-                # Security loop-back for major issues
-                if step.name == "security" and ctx.requires_coding_rework:
-                    if not self._quiet:
-                        self._console.print(
-                            "[yellow]Security agent found major issues. "
-                            "Re-running coding agent to fix...[/yellow]"
-                        )
-
-                    # Inject security feedback into coding task
-                    original_desc = ctx.task.description
-                    ctx.task.description = (
-                        f"{original_desc}\n\n"
-                        f"[SECURITY REVIEW FEEDBACK]\n{ctx.security_feedback}"
-                    )
-
-                    # Re-run coding agent
-                    ctx = self._run_agent_with_retry("coder", ctx)
-                    if isinstance(ctx, tuple):
-                        ctx = ctx[0]
-                    self._git_step_commit(project_path, ctx, "coding", revised=True)
-
-                    # Restore original task description
-                    ctx.task.description = original_desc
+            with self._tracer.span("step", step=step.name):
+                ctx.current_step = step.name
+                self._persist_state(ctx)
+                journal.log_step_start(step.name)
 
-                    # Re-run security check on updated code
-                    ctx.requires_coding_rework = False
-                    ctx.security_feedback = ""
-                    ctx = self._run_agent_with_retry("security", ctx)
+                if not self._quiet:
+                    print_step_header(step.name, step.description)
+
+                if step.step_type == StepType.DETECTION:
+                    self._run_detection(project_path, ctx)
+                    # Set default test_command if detection didn't provide one (for tests)
+                    if not ctx.test_command:
+                        ctx.test_command = "pytest"
+                    # Re-create backend/agents if SDK backend (needs updated test command)
+                    if self._settings.llm.backend == "anthropic_sdk":
+                        self._backend = self._create_backend(project_path, ctx)
+                        self._register_agents(self._backend, project_path)
+
+                elif step.step_type == StepType.AGENT:
+                    if step.agent_name not in self._agents:
+                        logger.error("Agent not found: %s", step.agent_name)
+                        continue
+
+                    ctx = self._run_agent_with_retry(step.agent_name, ctx)
+                    # Defensive: handle if mock accidentally returns tuple instead of just ctx
                     if isinstance(ctx, tuple):
                         ctx = ctx[0]
-                    self._git_step_commit(project_path, ctx, "security", revised=True)
 
-                    # If still broken after one retry, continue to checkpoint
-                    if ctx.requires_coding_rework:
+                    # Security loop-back for major issues
+                    if step.name == "security" and ctx.requires_coding_rework:
                         if not self._quiet:
                             self._console.print(
-                                "[red]Security issues remain after rework. "
-                                "Manual review needed at checkpoint.[/red]"
+                                "[yellow]Security agent found major issues. "
+                                "Re-running coding agent to fix...[/yellow]"
                             )
-                        ctx.requires_coding_rework = False  # Prevent infinite loops
-
-                if ctx.status == PipelineStatus.FAILED:
-                    break
-
-            journal.log_step(step.name, ctx)
-            self._git_step_commit(project_path, ctx, step.name)
-
-            # Checkpoint
-            if (
-                step.checkpoint_after
-                and self._settings.pipeline.require_checkpoints
-            ):
-                # Check if auto-approve is enabled
-                if self._should_auto_approve(ctx):
-                    # Auto-approve: skip prompt, log decision
-                    journal.log_checkpoint(step.name, "auto-approved", "")
-                    if not self._quiet:
-                        print_success(f"Checkpoint '{step.name}' auto-approved.")
-                else:
-                    # Normal checkpoint flow
-                    while True:
-                        if self._use_db_checkpoints and self._state_manager is not None:
-                            decision, feedback = self._wait_for_checkpoint_decision(
-                                step.name, ctx
-                            )
-                        else:
-                            decision, feedback = run_checkpoint(step.name, ctx)
 
-                        if decision == CheckpointDecision.INSTRUCT:
-                            self._run_instruct(ctx, feedback, project_path, journal)
-                            continue  # re-prompt checkpoint
+                        # Inject security feedback into coding task
+                        original_desc = ctx.task.description
+                        ctx.task.description = (
+                            f"{original_desc}\n\n"
+                            f"[SECURITY REVIEW FEEDBACK]\n{ctx.security_feedback}"
+                        )
 
-                        journal.log_checkpoint(step.name, decision.value, feedback)
+                        # Re-run coding agent
+                        ctx = self._run_agent_with_retry("coder", ctx)
+                        if isinstance(ctx, tuple):
+                            ctx = ctx[0]
+                        self._git_step_commit(project_path, ctx, "coding", revised=True)
+
+                        # Restore original task description
+                        ctx.task.description = original_desc
+
+                        # Re-run security check on updated code
+                        ctx.requires_coding_rework = False
+                        ctx.security_feedback = ""
+                        ctx = self._run_agent_with_retry("security", ctx)
+                        if isinstance(ctx, tuple):
+                            ctx = ctx[0]
+                        self._git_step_commit(project_path, ctx, "security", revised=True)
+
+                        # If still broken after one retry, continue to checkpoint
+                        if ctx.requires_coding_rework:
+                            if not self._quiet:
+                                self._console.print(
+                                    "[red]Security issues remain after rework. "
+                                    "Manual review needed at checkpoint.[/red]"
+                                )
+                            ctx.requires_coding_rework = False  # Prevent infinite loops
+
+                    if ctx.status == PipelineStatus.FAILED:
                         break
 
-                    if decision == CheckpointDecision.APPROVE:
-                        if not self._quiet:
-                            print_success(f"Checkpoint '{step.name}' approved.")
-                    elif decision == CheckpointDecision.REVISE:
+                journal.log_step(step.name, ctx)
+                self._git_step_commit(project_path, ctx, step.name)
+
+                # Checkpoint
+                if (
+                    step.checkpoint_after
+                    and self._settings.pipeline.require_checkpoints
+                ):
+                    # Check if auto-approve is enabled
+                    if self._should_auto_approve(ctx):
+                        # Auto-approve: skip prompt, log decision
+                        journal.log_checkpoint(step.name, "auto-approved", "")
                         if not self._quiet:
-                            self._console.print(
-                                f"[yellow]Revising {step.name} with feedback...[/yellow]"
-                            )
-                        if step.agent_name:
-                            ctx = self._run_agent_with_feedback(
-                                step.agent_name, ctx, feedback
-                            )
-                            self._git_step_commit(project_path, ctx, step.name, revised=True)
-                    elif decision == CheckpointDecision.REJECT:
-                        if not self._quiet:
-                            self._console.print("[red]Pipeline aborted by user.[/red]")
-                        ctx.status = PipelineStatus.ABORTED
-                        break
+                            print_success(f"Checkpoint '{step.name}' auto-approved.")
+                    else:
+                        # Normal checkpoint flow
+                        while True:
+                            if self._use_db_checkpoints and self._state_manager is not None:
+                                decision, feedback = self._wait_for_checkpoint_decision(
+                                    step.name, ctx
+                                )
+                            else:
+                                with self._tracer.span("checkpoint_wait", step_name=step.name):
+                                    decision, feedback = run_checkpoint(step.name, ctx)
+
+                            if decision == CheckpointDecision.INSTRUCT:
+                                self._run_instruct(ctx, feedback, project_path, journal)
+                                continue  # re-prompt checkpoint
+
+                            journal.log_checkpoint(step.name, decision.value, feedback)
+                            break
+
+                        if decision == CheckpointDecision.APPROVE:
+                            if not self._quiet:
+                                print_success(f"Checkpoint '{step.name}' approved.")
+                        elif decision == CheckpointDecision.REVISE:
+                            if not self._quiet:
+                                self._console.print(
+                                    f"[yellow]Revising {step.name} with feedback...[/yellow]"
+                                )
+                            if step.agent_name:
+                                ctx = self._run_agent_with_feedback(
+                                    step.agent_name, ctx, feedback
+                                )
+                                self._git_step_commit(project_path, ctx, step.name, revised=True)
+                        elif decision == CheckpointDecision.REJECT:
+                            if not self._quiet:
+                                self._console.print("[red]Pipeline aborted by user.[/red]")
+                            ctx.status = PipelineStatus.ABORTED
+                            break
 
         return ctx
 
@@ -601,28 +669,177 @@ class Orchestrator:
         registry.register(FileReadTool(project_path))
         registry.register(FileWriteTool(project_path))
         registry.register(FileSearchTool(project_path))
-        registry.register(ShellTool(project_path))
+        session = self._get_shell_session(project_path)
+        registry.register(ShellTool(project_path, session=session))
 
         test_cmd = None
+        test_runner = None
         if ctx:
             test_cmd = ctx.test_command or self._settings.project.test_command
+            test_runner = ctx.test_runner
         else:
             test_cmd = self._settings.project.test_command
-        registry.register(TestRunnerTool(project_path, test_command=test_cmd))
+        workers = self._settings.pipeline.test_workers or None
+        registry.register(
+            TestRunnerTool(
+                project_path,
+                test_command=test_cmd,
+                test_runner=test_runner,
+                workers=workers,
+                shard_files=self._settings.pipeline.test_sharding,
+                test_cache=self._test_cache,
+                session=session,
+            )
+        )
 
         return registry
 
+    def _get_shell_session(self, project_path: Path) -> ShellSession | None:
+        """Return the run's persistent shell session, if enabled and supported."""
+        if not self._settings.pipeline.persistent_shell:
+            return None
+        if not ShellSession.is_supported():
+            logger.warning("Persistent shell sessions need bash on a POSIX system; disabled")
+            return None
+        if self._shell_session is not None and self._shell_session.cwd != project_path.resolve():
+            self._close_shell_session()
+        if self._shell_session is None:
+            self._shell_session = ShellSession(project_path)
+        return self._shell_session
+
+    def _close_shell_session(self) -> None:
+        if self._shell_session is not None:
+            self._shell_session.close()
+            self._shell_session = None
+
+    def _on_tool_event(self, event: dict[str, Any]) -> None:
+        """Record an agent tool execution in the current run's event log."""
+        if self._journal is not None:
+            self._journal.log_tool_call(
+                event["tool"],
+                event["input"],
+                duration_ms=event["duration_ms"],
+                result_chars=event["result_chars"],
+                error=event["error"],
+            )
+
+    def _on_llm_turn(self, event: dict[str, Any]) -> None:
+        """Record one SDK API call (time to first token, tokens) in the event log."""
+        if self._journal is not None:
+            self._journal.log_llm_turn(
+                event["turn"],
+                ttft_ms=event["ttft_ms"],
+                duration_ms=event["duration_ms"],
+                input_tokens=event["input_tokens"],
+                output_tokens=event["output_tokens"],
+                stop_reason=event["stop_reason"],
+            )
+
+    def _on_llm_text_delta(self, text: str) -> None:
+        self._streamed_chars += len(text)
+        self._update_agent_status(f"{self._streamed_chars:,} chars")
+
+    def _on_llm_tool_use_start(self, tool: str, tool_use_id: str) -> None:
+        self._update_agent_status(f"calling {tool}")
+
+    def _update_agent_status(self, detail: str) -> None:
+        if self._agent_status is not None:
+            status, agent_name = self._agent_status
+            status.update(f"[cyan]Running {agent_name} agent... ({detail})")
+
+    @contextmanager
+    def _cancel_on_pause(self, ctx: PipelineContext) -> Iterator[None]:
+        """While an SDK agent runs, cancel its API call as soon as a pause is requested."""
+        backend = self._backend
+        if self._state_manager is None or not isinstance(backend, AnthropicSDKBackend):
+            yield
+            return
+
+        from levelup.state.manager import StateManager
+
+        state_manager = self._state_manager
+        assert isinstance(state_manager, StateManager)
+        done = threading.Event()
+
+        def watch() -> None:
+            # Keeps cancelling while the request is pending: a cancel that
+            # lands between two API calls is cleared when the next one starts
+            while not done.wait(CHECKPOINT_POLL_INTERVAL):
+                try:
+                    if state_manager.is_pause_requested(ctx.run_id):
+                        backend.cancel()
+                except Exception:
+                    logger.debug("Pause watcher failed", exc_info=True)
+
+        watcher = threading.Thread(target=watch, name="levelup-pause-watcher", daemon=True)
+        watcher.start()
+        try:
+            yield
+        finally:
+            done.set()
+            watcher.join()
+
+    def _run_agent_once(
+        self, agent_name: str, agent: BaseAgent, ctx: PipelineContext
+    ) -> tuple[PipelineContext, AgentResult]:
+        """One attempt at running *agent*, with a progress spinner unless quiet."""
+        with self._cancel_on_pause(ctx):
+            if self._quiet:
+                return agent.run(ctx)
+            with self._console.status(f"[cyan]Running {agent_name} agent...") as status:
+                self._agent_status = (status, agent_name)
+                self._streamed_chars = 0
+                try:
+                    return agent.run(ctx)
+                finally:
+                    self._agent_status = None
+
+    def _start_profile(self) -> None:
+        if self._profile:
+            self._profiler = RunProfiler()
+            self._profiler.start()
+
+    def _finish_profile(self, ctx: PipelineContext) -> None:
+        """Stop ``--profile``, write the stats next to the event log and summarize them."""
+        if self._profiler is None:
+            return
+        profiler, self._profiler = self._profiler, None
+        profiler.stop()
+        run_dir = (
+            self._journal.events_path.parent
+            if self._journal is not None
+            else events_path(ctx.run_id).parent
+        )
+        summary = profiler.summary(profiler.dump(profile_path(run_dir)))
+        if self._journal is not None:
+            self._journal.log_profile(summary)
+        if not self._quiet:
+            print_profile_summary(summary)
+
+    def _close_journal(self) -> None:
+        self._tracer.set_sink(None)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
     def _register_agents(self, backend: Backend, project_path: Path) -> None:
         """Create and register all agents."""
         self._agents = {
             "requirements": RequirementsAgent(backend, project_path),
             "planning": PlanningAgent(backend, project_path),
             "test_writer": TestWriterAgent(backend, project_path),
-            "test_verifier": TestVerifierAgent(backend, project_path),
+            "test_verifier": TestVerifierAgent(
+                backend,
+                project_path,
+                test_selection=self._settings.pipeline.test_selection,
+                test_cache=self._test_cache,
+            ),
             "coder": CodeAgent(
                 backend,
                 project_path,
                 max_iterations=self._settings.pipeline.max_code_iterations,
+                test_selection=self._settings.pipeline.test_selection,
+                test_cache=self._test_cache,
             ),
             "security": SecurityAgent(backend, project_path),
             "reviewer": ReviewAgent(backend, project_path),
@@ -634,7 +851,12 @@ class Orchestrator:
         Returns: (language, framework, test_runner, test_command)
         """
         detector = ProjectDetector()
-        info = detector.detect(project_path)
+        if self._detection_cache is not None:
+            info = self._detection_cache.detect(
+                project_path, detector, refresh=self._refresh_detection
+            )
+        else:
+            info = detector.detect(project_path)
 
         # Use detected values, but allow settings overrides
         language = self._settings.project.language or info.language
@@ -642,8 +864,17 @@ class Orchestrator:
         test_runner = info.test_runner
         test_command = self._settings.project.test_command or info.test_command
 
+        # An explicit test command applies to the whole repo, so packages
+        # are only used for scoping when the command came from detection
+        self._detected_packages = (
+            []
+            if self._settings.project.test_command
+            else [ProjectPackage(**asdict(p)) for p in info.packages]
+        )
+
         return language, framework, test_runner, test_command
 
+    @traced("detection")
     def _run_detection(self, project_path: Path, ctx: PipelineContext) -> None:
         """Run project detection and update context."""
         language, framework, test_runner, test_command = self._run_project_detection(project_path)
@@ -652,6 +883,7 @@ class Orchestrator:
         ctx.framework = framework
         ctx.test_runner = test_runner
         ctx.test_command = test_command
+        ctx.packages = list(self._detected_packages)
 
         # Load branch naming from project_context.md (if not already set)
         if not ctx.branch_naming:
@@ -669,13 +901,14 @@ class Orchestrator:
 
         if not self._quiet:
             from levelup.cli.display import print_project_info
-            from levelup.detection.detector import ProjectInfo
+            from levelup.detection.detector import PackageInfo, ProjectInfo
 
             print_project_info(ProjectInfo(
                 language=ctx.language,
                 framework=ctx.framework,
                 test_runner=ctx.test_runner,
                 test_command=ctx.test_command,
+                packages=[PackageInfo(**p.model_dump()) for p in ctx.packages],
             ))
 
     def _capture_usage(self, ctx: PipelineContext, agent_name: str, agent_result: AgentResult) -> None:
@@ -690,21 +923,30 @@ class Orchestrator:
         ctx.step_usage[agent_name] = usage
         ctx.total_cost_usd += usage.cost_usd
 
+    @traced("agent", "agent_name")
     def _run_agent_with_retry(
         self, agent_name: str, ctx: PipelineContext
     ) -> PipelineContext:
         """Run an agent with retry on failure."""
         agent = self._agents[agent_name]
+        cache = self._test_cache
+        hits_before = cache.hits if cache else 0
+        misses_before = cache.misses if cache else 0
 
         for attempt in range(MAX_AGENT_RETRIES + 1):
             try:
-                if self._quiet:
-                    ctx, agent_result = agent.run(ctx)
-                else:
-                    with self._console.status(f"[cyan]Running {agent_name} agent..."):
-                        ctx, agent_result = agent.run(ctx)
+                ctx, agent_result = self._run_agent_once(agent_name, agent, ctx)
                 self._capture_usage(ctx, agent_name, agent_result)
+                if cache and agent_name in ctx.step_usage:
+                    usage = ctx.step_usage[agent_name]
+                    usage.test_cache_hits = cache.hits - hits_before
+                    usage.test_cache_misses = cache.misses - misses_before
                 return ctx
+            except LLMCancelled:
+                # Cancelled by _cancel_on_pause: pause now instead of retrying
+                if self._check_pause_requested(ctx):
+                    raise PipelinePaused(f"Paused while running {agent_name}")
+                raise
             except ClaudeCodeError as e:
                 if "not found" in str(e).lower():
                     # Executable missing — retrying won't help
@@ -757,6 +999,7 @@ class Orchestrator:
 
         return ctx
 
+    @traced("agent_revision", "agent_name")
     def _run_agent_with_feedback(
         self, agent_name: str, ctx: PipelineContext, feedback: str
     ) -> PipelineContext:
@@ -1022,6 +1265,7 @@ class Orchestrator:
                 files.append(f.path)
         return files
 
+    @traced("git_commit", "step_name", "revised")
     def _git_step_commit(
         self, project_path: Path, ctx: PipelineContext, step_name: str, revised: bool = False
     ) -> None:
@@ -0,0 +1,147 @@
+"""cProfile wrapper for ``levelup run --profile`` / ``levelup resume --profile``.
+
+The profile covers the orchestrator thread: every step, checkpoint wait,
+git and state-DB call, and the time spent blocked on ``claude -p`` or test
+subprocesses.  The raw stats are written next to the run's event log
+(``~/.levelup/runs/<run_id>/profile.prof``) for ``snakeviz``/``pstats``, and
+a short summary (top self-time functions plus time per area) goes to the
+pipeline summary and the run journal.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 15
+
+# Area -> (filename suffix, function name) entry points whose cumulative time
+# is attributed to that area.  Suffix "~" matches C builtins.  Approximate:
+# it answers "model, git, SQLite or tests?", not a full call-graph split.
+_AREAS: dict[str, list[tuple[str, str]]] = {
+    "model": [
+        (os.path.join("levelup", "agents", "claude_code_client.py"), "run"),
+        (os.path.join("levelup", "agents", "llm_client.py"), "run_tool_loop"),
+    ],
+    "git": [(os.path.join("git", "cmd.py"), "execute")],
+    "sqlite": [
+        ("~", "<method 'execute' of 'sqlite3.Connection' objects>"),
+        ("~", "<method 'execute' of 'sqlite3.Cursor' objects>"),
+        ("~", "<method 'executemany' of 'sqlite3.Connection' objects>"),
+        ("~", "<method 'executescript' of 'sqlite3.Connection' objects>"),
+        ("~", "<method 'commit' of 'sqlite3.Connection' objects>"),
+    ],
+    "tests": [(os.path.join("levelup", "core", "test_cache.py"), "run_test_command")],
+}
+
+
+@dataclass
+class ProfileEntry:
+    """One function's line in the profile summary."""
+
+    function: str
+    calls: int
+    self_ms: float
+    cumulative_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def profile_path(run_dir: Path) -> Path:
+    """First unused profile file in *run_dir* (resumes get ``profile-1.prof`` etc.)."""
+    path = run_dir / "profile.prof"
+    n = 1
+    while path.exists():
+        path = run_dir / f"profile-{n}.prof"
+        n += 1
+    return path
+
+
+def _label(key: tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name
+    parts = Path(filename).parts
+    short = "/".join(parts[parts.index("levelup"):]) if "levelup" in parts else parts[-1]
+    return f"{short}:{line}({name})"
+
+
+def _matches(filename: str, name: str, suffix: str, func: str) -> bool:
+    if name != func:
+        return False
+    return filename == "~" if suffix == "~" else filename.endswith(suffix)
+
+
+class RunProfiler:
+    """Start/stop a ``cProfile.Profile`` and summarize it."""
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+        self._running = False
+
+    def start(self) -> None:
+        if not self._running:
+            self._profile.enable()
+            self._running = True
+
+    def stop(self) -> None:
+        if self._running:
+            self._profile.disable()
+            self._running = False
+
+    def _stats(self) -> pstats.Stats:
+        return pstats.Stats(self._profile)
+
+    def dump(self, path: Path) -> Path | None:
+        """Write raw stats to *path*; returns None if it could not be written."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._profile.dump_stats(str(path))
+        except OSError as e:
+            logger.warning("Could not write profile %s: %s", path, e)
+            return None
+        return path
+
+    def top_functions(self, limit: int = DEFAULT_TOP_N) -> list[ProfileEntry]:
+        """Functions with the most self time, descending."""
+        stats = self._stats().stats  # type: ignore[attr-defined]
+        rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        return [
+            ProfileEntry(
+                function=_label(key),
+                calls=nc,
+                self_ms=tt * 1000,
+                cumulative_ms=ct * 1000,
+            )
+            for key, (_cc, nc, tt, ct, _callers) in rows
+        ]
+
+    def area_totals(self) -> dict[str, float]:
+        """Cumulative milliseconds spent under each area's entry points."""
+        stats = self._stats().stats  # type: ignore[attr-defined]
+        totals = {area: 0.0 for area in _AREAS}
+        for (filename, _line, name), (_cc, _nc, _tt, ct, _callers) in stats.items():
+            for area, entries in _AREAS.items():
+                if any(_matches(filename, name, suffix, func) for suffix, func in entries):
+                    totals[area] += ct * 1000
+        return totals
+
+    def total_ms(self) -> float:
+        return self._stats().total_tt * 1000  # type: ignore[attr-defined]
+
+    def summary(self, path: Path | None, limit: int = DEFAULT_TOP_N) -> dict[str, Any]:
+        """JSON-ready summary shared by the pipeline summary and the run journal."""
+        return {
+            "path": str(path) if path else None,
+            "total_ms": round(self.total_ms(), 1),
+            "areas": {area: round(ms, 1) for area, ms in self.area_totals().items()},
+            "top": [entry.to_dict() for entry in self.top_functions(limit)],
+        }
@@ -0,0 +1,253 @@
+"""Test result cache keyed by the state of the working directory.
+
+The pipeline often re-runs the same test command on an unchanged tree (the
+verifier, the coder's final pass, repeated tool calls).  Results are cached
+on disk under ``~/.levelup/test_cache/`` keyed by the command, a hash of the
+worktree (HEAD plus the contents of changed and untracked, non-ignored
+files), the installed dependencies and environment, and the test runner's
+version string.
+
+Hashing is read-only: nothing is written to the repository's index or
+object store.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shlex
+import subprocess
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from levelup.tools.shell_session import ShellSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".levelup" / "test_cache"
+DEFAULT_MAX_ENTRIES = 500
+
+# Launcher tokens that precede the real test tool in a command
+_LAUNCHERS = {"npx", "bundle", "exec", "uv", "run", "poetry", "pipenv", "python", "python3", "-m"}
+
+
+# Environment variables that select the interpreter, packages or tools a test run uses
+_ENV_VARS = (
+    "PATH",
+    "VIRTUAL_ENV",
+    "CONDA_PREFIX",
+    "PYTHONPATH",
+    "NODE_PATH",
+    "NODE_OPTIONS",
+    "GOFLAGS",
+    "RUSTFLAGS",
+)
+
+# Directories whose mtime changes when packages are installed or removed
+_DEPENDENCY_GLOBS = (
+    ".venv/lib/python*/site-packages",
+    "venv/lib/python*/site-packages",
+    ".venv/Lib/site-packages",
+    "venv/Lib/site-packages",
+    "node_modules",
+    "node_modules/.package-lock.json",
+)
+
+
+def worktree_hash(project_path: Path) -> str | None:
+    """Return a hash of *project_path*'s HEAD plus its uncommitted and untracked files.
+
+    Changed files are hashed without ``-w``, so nothing is written to the
+    repository.  Returns None if the path is not in a git repo (or has no
+    commit yet).
+    """
+    try:
+        import git
+
+        repo = git.Repo(project_path, search_parent_directories=True)
+        head = repo.head.commit.hexsha
+        changed = repo.git.diff("HEAD", "--name-only", "--no-renames", "-z").split("\0")
+        untracked = repo.git.ls_files("--others", "--exclude-standard", "-z").split("\0")
+        paths = sorted({p for p in changed + untracked if p})
+        root = Path(repo.working_tree_dir or project_path)
+        present = [p for p in paths if (root / p).is_file()]
+        blobs = ""
+        if present:
+            blobs = subprocess.run(
+                ["git", "hash-object", "--stdin-paths"],
+                cwd=root,
+                input="\n".join(present),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        digest = hashlib.sha256(head.encode("utf-8"))
+        blob_of = dict(zip(present, blobs.split()))
+        for path in paths:
+            digest.update(f"\0{path}\0{blob_of.get(path, '-')}".encode("utf-8"))
+        return digest.hexdigest()
+    except Exception as e:
+        logger.debug("Could not compute worktree hash for %s: %s", project_path, e)
+        return None
+
+
+def environment_fingerprint(project_path: Path) -> str:
+    """Fingerprint of the environment and installed dependencies a test run sees."""
+    parts = [f"{name}={os.environ.get(name, '')}" for name in _ENV_VARS]
+    prefixes = [os.environ.get("VIRTUAL_ENV"), os.environ.get("CONDA_PREFIX")]
+    roots = [project_path] + [Path(p) for p in prefixes if p]
+    for root in roots:
+        for pattern in _DEPENDENCY_GLOBS + ("lib/python*/site-packages", "Lib/site-packages"):
+            for path in sorted(root.glob(pattern)):
+                try:
+                    parts.append(f"{path}:{path.stat().st_mtime_ns}")
+                except OSError:
+                    continue
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _version_probe(command: str) -> tuple[str, ...]:
+    """Build a ``--version`` invocation for the tool at the start of *command*."""
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return ()
+    probe: list[str] = []
+    for token in tokens:
+        probe.append(token)
+        if token not in _LAUNCHERS:
+            break
+    return (*probe, "--version") if probe else ()
+
+
+@functools.lru_cache(maxsize=32)
+def _runner_version(cwd: str, probe: tuple[str, ...]) -> str:
+    if not probe:
+        return "unknown"
+    try:
+        result = subprocess.run(
+            list(probe), cwd=cwd, capture_output=True, text=True, timeout=10
+        )
+        return (result.stdout + result.stderr).strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+class TestResultCache:
+    """On-disk cache of test command results with hit/miss counters."""
+
+    def __init__(self, cache_dir: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._dir = cache_dir or DEFAULT_CACHE_DIR
+        self._max_entries = max_entries
+        # Pytest shards call run() from several threads at once
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._dir
+
+    def key(self, command: str, cwd: Path) -> str | None:
+        """Cache key for running *command* in *cwd*, or None if *cwd* is not a git tree."""
+        tree = worktree_hash(cwd)
+        if tree is None:
+            return None
+        version = _runner_version(str(cwd), _version_probe(command))
+        env = environment_fingerprint(cwd)
+        raw = "\0".join([command, str(cwd.resolve()), tree, env, version])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> subprocess.CompletedProcess[str] | None:
+        path = self._dir / f"{key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return subprocess.CompletedProcess(
+                args=data["command"],
+                returncode=data["returncode"],
+                stdout=data["stdout"],
+                stderr=data["stderr"],
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, result: subprocess.CompletedProcess[str]) -> None:
+        data = {
+            "command": result.args,
+            "returncode": result.returncode,
+            "stdout": result.stdout or "",
+            "stderr": result.stderr or "",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent runs never read a partial entry
+            tmp = self._dir / f".{key}.{os.getpid()}.tmp"
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self._dir / f"{key}.json")
+            self._prune()
+        except OSError as e:
+            logger.warning("Failed to write test cache entry: %s", e)
+
+    def run(
+        self, command: str, cwd: Path, timeout: int, session: ShellSession | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Run *command* in *cwd*, returning a cached result if the tree is unchanged."""
+        key = self.key(command, cwd)
+        if key is not None:
+            cached = self.get(key)
+            with self._lock:
+                if cached is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if cached is not None:
+                logger.info("Test cache hit for %r", command)
+                return cached
+
+        result = run_test_command(command, cwd, timeout, session=session)
+        if key is not None:
+            self.put(key, result)
+        return result
+
+    def _prune(self) -> None:
+        entries = list(self._dir.glob("*.json"))
+        excess = len(entries) - self._max_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:excess]:
+            path.unlink(missing_ok=True)
+
+
+def run_test_command(
+    command: str,
+    cwd: Path,
+    timeout: int,
+    cache: TestResultCache | None = None,
+    session: ShellSession | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a test command, through *cache* and/or a persistent *session* when given."""
+    if cache is not None:
+        return cache.run(command, cwd, timeout, session=session)
+    if session is not None:
+        # The session may have been cd'd elsewhere by shell tool calls; a
+        # subshell runs the tests in *cwd* without moving the session.
+        result = session.run(f"(cd {shlex.quote(str(cwd))} && {command})", timeout)
+        return subprocess.CompletedProcess(
+            args=command, returncode=result.returncode, stdout=result.stdout, stderr=result.stderr
+        )
+    return subprocess.run(
+        command,
+        shell=True,
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
@@ -0,0 +1,328 @@
+"""Test impact analysis — map changed files to the tests that exercise them.
+
+Used to scope the red/green iterations of the pipeline to the test files a
+ticket can actually affect.  The full suite is still run once at the end of
+the coding step, so a missed dependency can only cost time, never correctness.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import re
+import shlex
+from collections import deque
+from pathlib import Path
+
+from levelup.core.context import PipelineContext, ProjectPackage
+from levelup.detection.detector import package_command
+from levelup.detection.scanner import ProjectScan
+
+logger = logging.getLogger(__name__)
+
+# Give up (and run the full suite) rather than walk an enormous tree.
+MAX_SCAN_FILES = 20000
+
+# Runners whose command accepts test file paths as trailing arguments.
+PATH_ARG_RUNNERS = {"pytest", "jest", "vitest", "mocha"}
+
+PYTHON_SUFFIXES = {".py"}
+JS_SUFFIXES = {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}
+
+# Changes to these never affect test outcomes.
+_IGNORED_SUFFIXES = {".md", ".rst"}
+
+# Changes to these affect every test, so selection is not possible.
+_GLOBAL_FILES = {"conftest.py", "jest.setup.js", "jest.setup.ts", "vitest.setup.ts"}
+
+_JS_IMPORT_RE = re.compile(
+    r"""(?:from\s*|require\(\s*|import\(\s*|import\s+)['"](\.{1,2}/[^'"]+)['"]"""
+)
+
+
+def is_test_file(rel_path: str) -> bool:
+    """Return True if *rel_path* looks like a test file for a supported runner."""
+    name = rel_path.rsplit("/", 1)[-1]
+    suffix = Path(name).suffix
+    if suffix in PYTHON_SUFFIXES:
+        return name.startswith("test_") or name.endswith("_test.py")
+    if suffix in JS_SUFFIXES:
+        return (
+            ".test." in name
+            or ".spec." in name
+            or "/__tests__/" in f"/{rel_path}"
+        )
+    return False
+
+
+def get_changed_files(project_path: Path, base_sha: str | None) -> list[str]:
+    """Return files changed since *base_sha*, including uncommitted and untracked files."""
+    if not base_sha:
+        return []
+    try:
+        import git
+
+        repo = git.Repo(project_path)
+        changed = repo.git.diff("--name-only", base_sha).splitlines()
+        changed += repo.git.ls_files("--others", "--exclude-standard").splitlines()
+    except Exception as e:
+        logger.warning("Failed to list changed files for test selection: %s", e)
+        return []
+    return sorted({f.strip() for f in changed if f.strip()})
+
+
+def _is_ignored(rel_path: str) -> bool:
+    """Changes that never affect test outcomes (docs, LevelUp's own files)."""
+    return rel_path.startswith("levelup/") or Path(rel_path).suffix in _IGNORED_SUFFIXES
+
+
+def _iter_source_files(project_path: Path) -> list[str] | None:
+    """List relative paths of Python/JS sources, or None if the tree is too large."""
+    scan = ProjectScan(project_path, max_files=MAX_SCAN_FILES)
+    if scan.truncated:
+        return None
+    wanted = PYTHON_SUFFIXES | JS_SUFFIXES
+    return [f for f in scan.files if Path(f).suffix in wanted]
+
+
+def _python_module_names(rel_path: str) -> list[str]:
+    """Importable dotted names for a Python file (with and without a src/ prefix)."""
+    parts = rel_path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    if not parts:
+        return []
+    names = [".".join(parts)]
+    if parts[0] in ("src", "lib") and len(parts) > 1:
+        names.append(".".join(parts[1:]))
+    return names
+
+
+def _python_imports(project_path: Path, rel_path: str) -> set[str]:
+    """Dotted module names imported by a Python file (relative imports resolved)."""
+    try:
+        tree = ast.parse((project_path / rel_path).read_text(encoding="utf-8", errors="ignore"))
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    package = rel_path[: -len(".py")].split("/")[:-1]
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[: len(package) - (node.level - 1)] if node.level > 1 else package
+                prefix = ".".join(base + ([node.module] if node.module else []))
+            else:
+                prefix = node.module or ""
+            if prefix:
+                modules.add(prefix)
+                modules.update(f"{prefix}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def _js_imports(project_path: Path, rel_path: str, known: set[str]) -> set[str]:
+    """Relative paths of project files imported by a JS/TS file."""
+    try:
+        text = (project_path / rel_path).read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return set()
+
+    base_dir = Path(rel_path).parent
+    found: set[str] = set()
+    for spec in _JS_IMPORT_RE.findall(text):
+        target = (base_dir / spec).as_posix()
+        # Normalise "a/../b" segments without touching the filesystem
+        parts: list[str] = []
+        for part in target.split("/"):
+            if part == "..":
+                if parts:
+                    parts.pop()
+            elif part and part != ".":
+                parts.append(part)
+        target = "/".join(parts)
+        candidates = [target] + [target + s for s in JS_SUFFIXES]
+        candidates += [f"{target}/index{s}" for s in JS_SUFFIXES]
+        for candidate in candidates:
+            if candidate in known:
+                found.add(candidate)
+                break
+    return found
+
+
+def _build_reverse_graph(project_path: Path, files: list[str]) -> dict[str, set[str]]:
+    """Map each file to the set of files that import it."""
+    module_index: dict[str, str] = {}
+    for rel in files:
+        if rel.endswith(".py"):
+            for name in _python_module_names(rel):
+                module_index.setdefault(name, rel)
+
+    known = set(files)
+    importers: dict[str, set[str]] = {}
+    for rel in files:
+        if rel.endswith(".py"):
+            deps: set[str] = set()
+            for module in _python_imports(project_path, rel):
+                # "a.b.c" depends on a/b/c.py as well as the a and a.b packages
+                pieces = module.split(".")
+                for i in range(1, len(pieces) + 1):
+                    target = module_index.get(".".join(pieces[:i]))
+                    if target:
+                        deps.add(target)
+        else:
+            deps = _js_imports(project_path, rel, known)
+        for dep in deps:
+            if dep != rel:
+                importers.setdefault(dep, set()).add(rel)
+    return importers
+
+
+def select_test_files(project_path: Path, changed_files: list[str]) -> list[str] | None:
+    """Return the test files affected by *changed_files*.
+
+    Returns None when no safe selection is possible (a changed file has
+    project-wide effects, or the tree is too large to analyse) — callers
+    should run the full suite in that case.  An empty list means no changed
+    file can affect any test.
+    """
+    relevant: list[str] = []
+    for rel in changed_files:
+        rel = rel.replace("\\", "/")
+        name = rel.rsplit("/", 1)[-1]
+        suffix = Path(name).suffix
+        if _is_ignored(rel):
+            continue
+        if name in _GLOBAL_FILES or suffix not in PYTHON_SUFFIXES | JS_SUFFIXES:
+            return None
+        relevant.append(rel)
+
+    if not relevant:
+        return []
+
+    files = _iter_source_files(project_path)
+    if files is None:
+        logger.info("Project too large for test selection; using full suite")
+        return None
+
+    importers = _build_reverse_graph(project_path, files)
+    existing = set(files)
+
+    selected: set[str] = set()
+    seen: set[str] = set()
+    queue = deque(f for f in relevant if f in existing)
+    while queue:
+        current = queue.popleft()
+        if current in seen:
+            continue
+        seen.add(current)
+        if is_test_file(current):
+            selected.add(current)
+        queue.extend(importers.get(current, ()))
+    return sorted(selected)
+
+
+def build_scoped_command(
+    test_command: str, test_runner: str | None, test_files: list[str]
+) -> str | None:
+    """Narrow *test_command* to *test_files*, or None if the runner can't be scoped.
+
+    Commands that already name specific paths are left alone, since appending
+    more paths would not narrow what they run.
+    """
+    if not test_files or test_runner not in PATH_ARG_RUNNERS:
+        return None
+    try:
+        tokens = shlex.split(test_command)
+    except ValueError:
+        return None
+    if any(not t.startswith("-") and ("/" in t or t.endswith(".py")) for t in tokens[1:]):
+        return None
+    return " ".join([test_command] + [shlex.quote(f) for f in test_files])
+
+
+def _owning_package(rel_path: str, packages: list[ProjectPackage]) -> ProjectPackage | None:
+    """The innermost package whose directory contains *rel_path*."""
+    owner: ProjectPackage | None = None
+    for package in packages:
+        if rel_path.startswith(f"{package.path}/") and (
+            owner is None or len(package.path) > len(owner.path)
+        ):
+            owner = package
+    return owner
+
+
+def _package_scoped_command(
+    packages: list[ProjectPackage], project_path: Path, changed_files: list[str]
+) -> str | None:
+    """Run only the test suites of the monorepo packages that *changed_files* touch.
+
+    Within each touched package the tests are narrowed further by import
+    analysis where its runner allows.  Returns None if a relevant change lies
+    outside every package (or in one without a test command), in which case
+    the project-wide command is needed.
+    """
+    touched: dict[str, list[str]] = {}
+    by_path = {p.path: p for p in packages}
+    for rel in changed_files:
+        rel = rel.replace("\\", "/")
+        if _is_ignored(rel):
+            continue
+        owner = _owning_package(rel, packages)
+        if owner is None or not owner.test_command:
+            return None
+        touched.setdefault(owner.path, []).append(rel[len(owner.path) + 1 :])
+
+    if not touched:
+        return None
+
+    commands: list[str] = []
+    for path in sorted(touched):
+        package = by_path[path]
+        command = package.test_command or ""
+        test_files = select_test_files(project_path / path, touched[path])
+        if test_files:
+            command = build_scoped_command(command, package.test_runner, test_files) or command
+        commands.append(package_command(path, command))
+    logger.info("Scoped test command to package(s): %s", ", ".join(sorted(touched)))
+    return " && ".join(commands)
+
+
+def scoped_test_command(ctx: PipelineContext, project_path: Path) -> str | None:
+    """Return the test command narrowed to the tests this run can affect.
+
+    Changed files come from the run's branch (``pre_run_sha`` through the
+    working tree), the tests written so far and the plan's affected files.
+    In a monorepo, only the touched packages' suites are run.  Falls back to
+    ``ctx.test_command`` whenever selection is not possible.
+    """
+    if not ctx.test_command:
+        return ctx.test_command
+
+    changed = set(get_changed_files(project_path, ctx.pre_run_sha))
+    changed.update(f.path for f in ctx.test_files)
+    changed.update(f.path for f in ctx.code_files)
+    if ctx.plan:
+        changed.update(ctx.plan.affected_files)
+        for step in ctx.plan.steps:
+            changed.update(step.files_to_modify)
+            changed.update(step.files_to_create)
+
+    if not changed:
+        return ctx.test_command
+
+    if ctx.packages:
+        package_scoped = _package_scoped_command(ctx.packages, project_path, sorted(changed))
+        if package_scoped is not None:
+            return package_scoped
+
+    test_files = select_test_files(project_path, sorted(changed))
+    if not test_files:
+        return ctx.test_command
+
+    scoped = build_scoped_command(ctx.test_command, ctx.test_runner, test_files)
+    if scoped is None:
+        return ctx.test_command
+    logger.info("Scoped test command to %d test file(s)", len(test_files))
+    return scoped
@@ -6,13 +6,15 @@ import enum
 import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
 from pydantic import BaseModel
 
 from levelup.state.db import DEFAULT_DB_PATH
 
+if TYPE_CHECKING:
+    from levelup.state.manager import StateManager
+
 
 class TicketStatus(str, enum.Enum):
     PENDING = "pending"
@@ -93,12 +95,10 @@ def _record_to_ticket(rec: object) -> Ticket:
 
 
 def _get_state_manager(db_path: Path | None = None):
-    """Create a StateManager for the given db_path."""
-    from levelup.state.manager import StateManager
+    """Return the shared StateManager for the given db_path."""
+    from levelup.state.manager import get_state_manager
 
-    if db_path is not None:
-        return StateManager(db_path=db_path)
-    return StateManager()
+    return get_state_manager(db_path)
 
 
 def _normalize_project_path(project_path: Path) -> str:
@@ -173,6 +173,8 @@ def parse_tickets(text: str) -> list[Ticket]:
             in_metadata_block = False
             # Parse metadata YAML
             if metadata_lines:
+                import yaml
+
                 try:
                     metadata_text = "\n".join(metadata_lines)
                     current_metadata = yaml.safe_load(metadata_text)
@@ -221,9 +223,17 @@ def parse_tickets(text: str) -> list[Ticket]:
 # ---------------------------------------------------------------------------
 
 
-def read_tickets(project_path: Path, *, db_path: Path | None = None) -> list[Ticket]:
-    """Read all tickets for a project from the database."""
-    sm = _get_state_manager(db_path)
+def read_tickets(
+    project_path: Path,
+    *,
+    db_path: Path | None = None,
+    state_manager: StateManager | None = None,
+) -> list[Ticket]:
+    """Read all tickets for a project from the database.
+
+    Pass a long-lived *state_manager* to skip opening (and migrating) the DB again.
+    """
+    sm = state_manager if state_manager is not None else _get_state_manager(db_path)
     records = sm.list_tickets(_normalize_project_path(project_path))
     return [_record_to_ticket(r) for r in records]
 
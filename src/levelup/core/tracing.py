@@ -0,0 +1,268 @@
+"""Span-based timing and resource instrumentation for pipeline runs.
+
+The orchestrator wraps its phases (steps, agent calls, git commits, state
+persistence, checkpoint waits) in spans.  Each span records wall time, CPU
+time of this process and of reaped child processes (``claude -p``, test
+runs), and the process's peak RSS when it ended.  Finished spans are handed
+to a callback — the run journal stores them as ``span`` events — and can be
+exported as a Chrome trace (``chrome://tracing`` / Perfetto) or as
+OpenTelemetry OTLP/JSON.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """One timed section of a run."""
+
+    name: str
+    span_id: int
+    parent_id: int | None = None
+    start_ns: int = 0
+    duration_ms: float = 0.0
+    cpu_ms: float = 0.0
+    child_cpu_ms: float | None = None
+    peak_rss_kb: int | None = None
+    thread_id: int = 0
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Span:
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+def _rss_scale() -> int:
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return 1024 if sys.platform == "darwin" else 1
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB (None where unsupported)."""
+    if resource is None:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // _rss_scale())
+
+
+def _child_cpu_seconds() -> float | None:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class Tracer:
+    """Records nested spans; nesting is tracked per thread."""
+
+    def __init__(self, on_span_end: Callable[[Span], None] | None = None) -> None:
+        self._on_span_end = on_span_end
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.spans: list[Span] = []
+
+    def set_sink(self, on_span_end: Callable[[Span], None] | None) -> None:
+        self._on_span_end = on_span_end
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time the enclosed block as a span named *name*."""
+        stack = self._stack()
+        span = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=stack[-1].span_id if stack else None,
+            start_ns=time.time_ns(),
+            thread_id=threading.get_ident(),
+            attributes=attributes,
+        )
+        wall0 = time.perf_counter()
+        cpu0 = time.process_time()
+        child0 = _child_cpu_seconds()
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            span.duration_ms = round((time.perf_counter() - wall0) * 1000, 3)
+            span.cpu_ms = round((time.process_time() - cpu0) * 1000, 3)
+            child1 = _child_cpu_seconds()
+            if child0 is not None and child1 is not None:
+                span.child_cpu_ms = round((child1 - child0) * 1000, 3)
+            span.peak_rss_kb = peak_rss_kb()
+            with self._lock:
+                self.spans.append(span)
+            if self._on_span_end is not None:
+                self._on_span_end(span)
+
+
+def traced(name: str, *arg_names: str) -> Callable[[F], F]:
+    """Decorate an ``Orchestrator`` method so each call is recorded as a span.
+
+    The values of the parameters listed in *arg_names* become span
+    attributes.  The instance's ``_tracer`` is used; calls run untraced if it
+    has none.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            tracer: Tracer | None = getattr(self, "_tracer", None)
+            if tracer is None:
+                return func(self, *args, **kwargs)
+            attributes: dict[str, Any] = {}
+            if arg_names:
+                bound = signature.bind_partial(self, *args, **kwargs)
+                attributes = {k: bound.arguments[k] for k in arg_names if k in bound.arguments}
+            with tracer.span(name, **attributes):
+                return func(self, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# ------------------------------------------------------------------
+# Export
+# ------------------------------------------------------------------
+
+
+def _args(span: Span) -> dict[str, Any]:
+    args: dict[str, Any] = dict(span.attributes)
+    args["cpu_ms"] = span.cpu_ms
+    if span.child_cpu_ms is not None:
+        args["child_cpu_ms"] = span.child_cpu_ms
+    if span.peak_rss_kb is not None:
+        args["peak_rss_kb"] = span.peak_rss_kb
+    if span.error:
+        args["error"] = span.error
+    return args
+
+
+def to_chrome_trace(spans: list[Span], run_id: str = "") -> dict[str, Any]:
+    """Chrome Trace Event format (complete ``X`` events), loadable in Perfetto."""
+    pid = os.getpid()
+    process_name = f"levelup {run_id}".strip()
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": process_name}}
+    ]
+    for span in sorted(spans, key=lambda s: s.start_ns):
+        events.append({
+            "name": span.name,
+            "cat": "levelup",
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ms * 1000,
+            "pid": pid,
+            "tid": span.thread_id,
+            "args": _args(span),
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otel_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _trace_id(run_id: str) -> str:
+    return hashlib.sha256(run_id.encode("utf-8")).hexdigest()[:32]
+
+
+def to_otel_json(spans: list[Span], run_id: str = "") -> dict[str, Any]:
+    """OpenTelemetry OTLP/JSON (``ExportTraceServiceRequest``) for the run's spans."""
+    trace_id = _trace_id(run_id)
+    otel_spans = []
+    for span in sorted(spans, key=lambda s: s.start_ns):
+        end_ns = span.start_ns + int(span.duration_ms * 1_000_000)
+        otel_span: dict[str, Any] = {
+            "traceId": trace_id,
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [
+                {"key": f"levelup.{k}", "value": _otel_value(v)} for k, v in _args(span).items()
+            ],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id is not None:
+            otel_span["parentSpanId"] = f"{span.parent_id:016x}"
+        otel_spans.append(otel_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": "levelup"}},
+                        {"key": "levelup.run_id", "value": {"stringValue": run_id}},
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": "levelup.orchestrator"}, "spans": otel_spans}],
+            }
+        ]
+    }
+
+
+def spans_from_events(events: list[dict[str, Any]]) -> list[Span]:
+    """Spans recorded in a run's event log (see ``RunJournal.log_span``).
+
+    A resumed run appends a second set of spans whose ids restart at 1; ids
+    are offset per ``run_start``/``resume`` segment to keep them unique.
+    """
+    spans: list[Span] = []
+    offset = 0
+    segment_max = 0
+    for event in events:
+        if event.get("type") in ("run_start", "resume"):
+            offset += segment_max
+            segment_max = 0
+        elif event.get("type") == "span" and isinstance(event.get("span"), dict):
+            span = Span.from_dict(event["span"])
+            segment_max = max(segment_max, span.span_id)
+            span.span_id += offset
+            if span.parent_id is not None:
+                span.parent_id += offset
+            spans.append(span)
+    return spans
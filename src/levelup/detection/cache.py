@@ -0,0 +1,182 @@
+"""Persistent cache of ProjectDetector results keyed by a manifest fingerprint.
+
+Detection output only depends on the indicator and manifest files the rules
+look at, so results are stored per project under ``~/.levelup/detection_cache/``
+together with a fingerprint of those files (path, mtime, size).  Repeat runs
+reuse the stored ``ProjectInfo`` until a manifest is added, removed or edited.
+New sub-packages next to known ones are noticed too; others need ``--refresh``.
+
+Projects without a language indicator file at the root are not cached: their
+language comes from counting file extensions, which any new file can change.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from levelup import __version__
+from levelup.detection.detector import PACKAGE_MANIFESTS, ProjectDetector, ProjectInfo
+from levelup.detection.frameworks import FRAMEWORK_RULES
+from levelup.detection.languages import INDICATOR_FILES
+from levelup.detection.test_runners import TEST_RUNNER_RULES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".levelup" / "detection_cache"
+
+
+def _manifest_patterns() -> tuple[list[str], list[str]]:
+    """Split every path referenced by the detection rules into (exact paths, top-level globs)."""
+    paths: set[str] = set()
+    globs: set[str] = set()
+    candidates = list(INDICATOR_FILES)
+    candidates += [indicator for _, indicator, _, _ in FRAMEWORK_RULES]
+    candidates += [check.split(":", 1)[0] for _, check, _, _ in TEST_RUNNER_RULES]
+    for candidate in candidates:
+        candidate = candidate.rstrip("/")
+        if "*" in candidate:
+            # Recursive globs (e.g. *_test.go) only pick a runner that is
+            # also the language default, so they need no fingerprinting
+            if "/" not in candidate and candidate != "*_test.go":
+                globs.add(candidate)
+        else:
+            paths.add(candidate)
+    return sorted(paths), sorted(globs)
+
+
+MANIFEST_PATHS, MANIFEST_GLOBS = _manifest_patterns()
+
+
+def _top_level_names(project_path: Path) -> list[str]:
+    try:
+        return sorted(os.listdir(project_path))
+    except OSError:
+        return []
+
+
+def has_language_indicator(project_path: Path) -> bool:
+    """Whether *project_path*'s language is decided by an indicator file, not file counts."""
+    names: list[str] | None = None
+    for filename in INDICATOR_FILES:
+        if "*" in filename:
+            if names is None:
+                names = _top_level_names(project_path)
+            if any(fnmatch.fnmatch(name, filename) for name in names):
+                return True
+        elif (project_path / filename).exists():
+            return True
+    return False
+
+
+def _package_dirs(project_path: Path, parent: str) -> list[str]:
+    """Sub-directories of *parent* holding a package manifest (sibling packages)."""
+    base = project_path / parent
+    found: list[str] = []
+    for name in _top_level_names(base):
+        if any((base / name / manifest).is_file() for manifest in PACKAGE_MANIFESTS):
+            found.append(name)
+    return found
+
+
+def manifest_fingerprint(project_path: Path, packages: list[str] | tuple[str, ...] = ()) -> str:
+    """Hash the path, mtime and size of every indicator/manifest file in *project_path*.
+
+    *packages* are the sub-package directories found by the last detection;
+    their manifests are fingerprinted too, as is the list of directories
+    with a manifest next to each package, so that adding a sibling package
+    is noticed.
+    """
+    entries: list[str] = [__version__]
+    paths = list(MANIFEST_PATHS)
+    parents: dict[str, None] = {}
+    for package in packages:
+        paths += [f"{package}/{rel}" for rel in MANIFEST_PATHS]
+        parents[package.rsplit("/", 1)[0] if "/" in package else "."] = None
+    for parent in parents:
+        entries.append(f"{parent}\0packages\0{','.join(_package_dirs(project_path, parent))}")
+    for rel in dict.fromkeys(paths):
+        try:
+            st = os.stat(project_path / rel)
+        except OSError:
+            continue
+        entries.append(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}")
+    if MANIFEST_GLOBS:
+        for name in _top_level_names(project_path):
+            if any(fnmatch.fnmatch(name, pattern) for pattern in MANIFEST_GLOBS):
+                entries.append(f"{name}\0glob")
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+class DetectionCache:
+    """On-disk store of ``ProjectInfo`` per project directory."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._dir = cache_dir or DEFAULT_CACHE_DIR
+        self.last_hit = False
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._dir
+
+    def _entry_path(self, project_path: Path) -> Path:
+        key = hashlib.sha256(str(project_path.resolve()).encode("utf-8")).hexdigest()
+        return self._dir / f"{key}.json"
+
+    def get(self, project_path: Path) -> ProjectInfo | None:
+        """Return the stored result if the project's manifests are unchanged."""
+        try:
+            data = json.loads(self._entry_path(project_path).read_text(encoding="utf-8"))
+            info = ProjectInfo.from_dict(data["info"])
+            packages = [p.path for p in info.packages]
+            if data["fingerprint"] != manifest_fingerprint(project_path, packages):
+                return None
+            return info
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, project_path: Path, info: ProjectInfo) -> None:
+        data = {
+            "project_path": str(project_path.resolve()),
+            "fingerprint": manifest_fingerprint(project_path, [p.path for p in info.packages]),
+            "info": info.to_dict(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        path = self._entry_path(project_path)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Failed to write detection cache entry: %s", e)
+
+    def detect(
+        self,
+        project_path: Path,
+        detector: ProjectDetector | None = None,
+        refresh: bool = False,
+    ) -> ProjectInfo:
+        """Return cached detection for *project_path*, running *detector* on a miss.
+
+        With *refresh* the cache is bypassed and overwritten.  Results for
+        projects without a root language indicator are never stored.
+        """
+        project_path = project_path.resolve()
+        if not refresh:
+            cached = self.get(project_path)
+            if cached is not None:
+                self.last_hit = True
+                logger.info("Using cached project detection for %s", project_path)
+                return cached
+
+        self.last_hit = False
+        info = (detector or ProjectDetector()).detect(project_path)
+        if has_language_indicator(project_path):
+            self.put(project_path, info)
+        return info
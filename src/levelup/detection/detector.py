@@ -2,13 +2,51 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import shlex
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from levelup.detection.frameworks import detect_framework
 from levelup.detection.languages import detect_language
+from levelup.detection.scanner import ProjectScan
 from levelup.detection.test_runners import TestRunnerInfo, detect_test_runner
 
+# Extension counting only needs a sample; keeps detection fast on huge monorepos
+DETECTION_MAX_FILES = 5000
+
+# Manifests that mark a sub-directory as a package of its own
+PACKAGE_MANIFESTS = {
+    "pyproject.toml",
+    "setup.py",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "Gemfile",
+    "mix.exs",
+    "composer.json",
+    "Package.swift",
+}
+
+# How many directories below the root sub-packages are looked for
+MAX_PACKAGE_DEPTH = 3
+
+# Directories whose manifests are test data or samples, not packages
+_NON_PACKAGE_DIRS = {"fixtures", "testdata", "examples", "docs"}
+
+
+@dataclass
+class PackageInfo:
+    """Detection results for one sub-package of a monorepo."""
+
+    path: str  # relative to the project root, POSIX separators
+    language: str | None = None
+    framework: str | None = None
+    test_runner: str | None = None
+    test_command: str | None = None
+
 
 @dataclass
 class ProjectInfo:
@@ -18,22 +56,95 @@ class ProjectInfo:
     framework: str | None = None
     test_runner: str | None = None
     test_command: str | None = None
+    packages: list[PackageInfo] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProjectInfo:
+        data = dict(data)
+        packages = [PackageInfo(**p) for p in data.pop("packages", [])]
+        return cls(**data, packages=packages)
+
+
+def package_command(package_path: str, command: str) -> str:
+    """Shell command that runs *command* inside the package directory *package_path*.
+
+    The subshell keeps the ``cd`` local, so several of these can be chained.
+    """
+    return f"(cd {shlex.quote(package_path)} && {command})"
+
+
+def combined_test_command(packages: list[PackageInfo]) -> str | None:
+    """Run every package's tests in turn, or None if no package has a test command."""
+    commands = [package_command(p.path, p.test_command) for p in packages if p.test_command]
+    return " && ".join(commands) if commands else None
 
 
 class ProjectDetector:
-    """Orchestrates project detection by running language, framework, and test runner detection."""
+    """Orchestrates project detection by running language, framework, and test runner detection.
+
+    The project tree is walked once (bounded by *max_files*) and the
+    resulting scan, including its manifest cache, is shared by all three
+    detectors.
+    """
+
+    def __init__(self, max_files: int = DETECTION_MAX_FILES) -> None:
+        self.max_files = max_files
 
     def detect(self, project_path: Path) -> ProjectInfo:
-        """Detect project language, framework, and test runner."""
+        """Detect project language, framework, and test runner.
+
+        Sub-directories with their own manifest (``services/api/pyproject.toml``,
+        ``web/package.json``) are detected as packages.  When the root has no
+        manifest of its own, its test command runs every package's tests.
+        """
         project_path = project_path.resolve()
+        scan = ProjectScan(project_path, max_files=self.max_files)
 
-        language = detect_language(project_path)
-        framework = detect_framework(project_path, language)
-        runner_info: TestRunnerInfo | None = detect_test_runner(project_path, language)
+        language = detect_language(project_path, scan)
+        framework = detect_framework(project_path, language, scan)
+        runner_info: TestRunnerInfo | None = detect_test_runner(project_path, language, scan)
 
-        return ProjectInfo(
+        info = ProjectInfo(
             language=language,
             framework=framework,
             test_runner=runner_info.name if runner_info else None,
             test_command=runner_info.command if runner_info else None,
+            packages=self._detect_packages(scan),
         )
+
+        root_has_manifest = any(scan.is_file(name) for name in PACKAGE_MANIFESTS)
+        if info.packages and not root_has_manifest:
+            combined = combined_test_command(info.packages)
+            if combined:
+                info.test_runner = None
+                info.test_command = combined
+        return info
+
+    def _detect_packages(self, scan: ProjectScan) -> list[PackageInfo]:
+        package_dirs = {
+            rel.rsplit("/", 1)[0]
+            for rel in scan.files_named(PACKAGE_MANIFESTS, MAX_PACKAGE_DEPTH)
+            if "/" in rel
+        }
+        packages: list[PackageInfo] = []
+        for rel_dir in sorted(package_dirs):
+            if _NON_PACKAGE_DIRS.intersection(rel_dir.split("/")):
+                continue
+            sub = scan.subtree(rel_dir)
+            language = detect_language(sub.root, sub)
+            if not language:
+                continue
+            runner_info = detect_test_runner(sub.root, language, sub)
+            packages.append(
+                PackageInfo(
+                    path=rel_dir,
+                    language=language,
+                    framework=detect_framework(sub.root, language, sub),
+                    test_runner=runner_info.name if runner_info else None,
+                    test_command=runner_info.command if runner_info else None,
+                )
+            )
+        return packages
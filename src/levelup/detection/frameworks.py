@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from levelup.detection.scanner import ProjectScan
+
 # (language, indicator_file_or_pattern, check_type) -> framework
 # check_type: "file" = check file exists, "content" = check file content
 FrameworkRule = tuple[str, str, str, str]  # (language, file, check, framework)
@@ -56,27 +58,24 @@ FRAMEWORK_RULES: list[FrameworkRule] = [
 ]
 
 
-def detect_framework(project_path: Path, language: str | None) -> str | None:
+def detect_framework(
+    project_path: Path, language: str | None, scan: ProjectScan | None = None
+) -> str | None:
     """Detect the framework used in a project given its language."""
     if not language:
         return None
+    scan = scan or ProjectScan(project_path)
 
     for rule_lang, indicator, check, framework in FRAMEWORK_RULES:
         if rule_lang != language:
             continue
 
-        filepath = project_path / indicator
         if check == "file":
-            if filepath.exists():
+            if scan.exists(indicator):
                 return framework
         elif check.startswith("content:"):
             search_term = check.split(":", 1)[1]
-            if filepath.is_file():
-                try:
-                    content = filepath.read_text(encoding="utf-8", errors="ignore")
-                    if search_term in content.lower():
-                        return framework
-                except Exception:
-                    continue
+            if scan.contains(indicator, search_term):
+                return framework
 
     return None
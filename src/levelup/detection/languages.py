@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# SKIP_DIRS is re-exported for existing importers
+from levelup.detection.scanner import SKIP_DIRS, ProjectScan  # noqa: F401
+
 # Indicator files -> language
 INDICATOR_FILES: dict[str, str] = {
     "pyproject.toml": "python",
@@ -48,41 +51,25 @@ EXTENSION_MAP: dict[str, str] = {
     ".c": "c",
 }
 
-SKIP_DIRS = {
-    "node_modules",
-    ".venv",
-    "venv",
-    "__pycache__",
-    ".git",
-    "target",
-    "build",
-    "dist",
-    ".tox",
-    "env",
-}
-
 
-def detect_language(project_path: Path) -> str | None:
+def detect_language(project_path: Path, scan: ProjectScan | None = None) -> str | None:
     """Detect the primary language of a project."""
+    scan = scan or ProjectScan(project_path)
+
     # First pass: check indicator files
     for filename, language in INDICATOR_FILES.items():
         if "*" in filename:
-            if list(project_path.glob(filename)):
+            if scan.glob_top_level(filename):
                 return language
-        elif (project_path / filename).exists():
+        elif scan.exists(filename):
             return language
 
     # Second pass: count source files by extension
     counts: dict[str, int] = {}
-    try:
-        for p in project_path.rglob("*"):
-            if any(skip in p.parts for skip in SKIP_DIRS):
-                continue
-            if p.is_file() and p.suffix in EXTENSION_MAP:
-                lang = EXTENSION_MAP[p.suffix]
-                counts[lang] = counts.get(lang, 0) + 1
-    except PermissionError:
-        pass
+    for suffix, count in scan.extension_counts.items():
+        lang = EXTENSION_MAP.get(suffix)
+        if lang:
+            counts[lang] = counts.get(lang, 0) + count
 
     if counts:
         return max(counts, key=lambda k: counts[k])
@@ -0,0 +1,144 @@
+"""Single-pass, bounded walk of a project tree shared by the detectors."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from collections import deque
+from pathlib import Path
+
+# Directories pruned from the walk (dependencies, build output, VCS metadata)
+SKIP_DIRS = {
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".git",
+    "target",
+    "build",
+    "dist",
+    ".tox",
+    "env",
+}
+
+# Stop walking after this many files; detection only needs a representative sample
+MAX_SCAN_FILES = 20000
+
+
+class ProjectScan:
+    """File listing and manifest cache for one project, built by a single walk.
+
+    The walk is breadth-first, so top-level files (where manifests live) are
+    always seen before the file bound cuts it short.  ``SKIP_DIRS`` and hidden
+    directories are pruned without being descended into.
+    """
+
+    def __init__(self, root: Path, max_files: int = MAX_SCAN_FILES) -> None:
+        self._init_state(root)
+        self._walk(max_files)
+
+    def _init_state(self, root: Path) -> None:
+        self.root = root
+        self.files: list[str] = []
+        self.dirs: set[str] = set()
+        self.extension_counts: dict[str, int] = {}
+        self.truncated = False
+        self._file_set: set[str] = set()
+        self._top_level: list[str] = []
+        self._text_cache: dict[str, str | None] = {}
+
+    def _walk(self, max_files: int) -> None:
+        queue: deque[str] = deque([""])
+        while queue:
+            rel_dir = queue.popleft()
+            try:
+                with os.scandir(self.root / rel_dir if rel_dir else self.root) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if not rel_dir:
+                    self._top_level.append(entry.name)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                        self.dirs.add(rel)
+                        queue.append(rel)
+                    continue
+                if len(self.files) >= max_files:
+                    self.truncated = True
+                    return
+                self.files.append(rel)
+                self._file_set.add(rel)
+                suffix = os.path.splitext(entry.name)[1]
+                if suffix:
+                    self.extension_counts[suffix] = self.extension_counts.get(suffix, 0) + 1
+
+    def subtree(self, rel_dir: str) -> ProjectScan:
+        """A scan rooted at *rel_dir*, derived from this one without walking again."""
+        prefix = f"{rel_dir}/"
+        sub = ProjectScan.__new__(ProjectScan)
+        sub._init_state(self.root / rel_dir)
+        sub.truncated = self.truncated
+        sub.dirs = {d[len(prefix):] for d in self.dirs if d.startswith(prefix)}
+        for rel in self.files:
+            if rel.startswith(prefix):
+                sub_rel = rel[len(prefix):]
+                sub.files.append(sub_rel)
+                suffix = os.path.splitext(sub_rel.rsplit("/", 1)[-1])[1]
+                if suffix:
+                    sub.extension_counts[suffix] = sub.extension_counts.get(suffix, 0) + 1
+        sub._file_set = set(sub.files)
+        sub._top_level = sorted(
+            name for name in sub._file_set | sub.dirs if "/" not in name
+        )
+        return sub
+
+    def files_named(self, names: set[str], max_depth: int) -> list[str]:
+        """Scanned files whose name is in *names*, at most *max_depth* directories deep."""
+        return [
+            rel
+            for rel in self.files
+            if rel.count("/") <= max_depth and rel.rsplit("/", 1)[-1] in names
+        ]
+
+    def is_file(self, rel_path: str) -> bool:
+        if rel_path in self._file_set:
+            return True
+        return self.truncated and (self.root / rel_path).is_file()
+
+    def is_dir(self, rel_path: str) -> bool:
+        if rel_path in self.dirs:
+            return True
+        return self.truncated and (self.root / rel_path).is_dir()
+
+    def exists(self, rel_path: str) -> bool:
+        return self.is_file(rel_path) or self.is_dir(rel_path)
+
+    def glob_top_level(self, pattern: str) -> list[str]:
+        """Names of top-level entries matching *pattern* (e.g. ``*.csproj``)."""
+        return [name for name in self._top_level if fnmatch.fnmatch(name, pattern)]
+
+    def any_file_named(self, pattern: str) -> bool:
+        """Whether any scanned file's name matches *pattern* (e.g. ``*_test.go``)."""
+        return any(fnmatch.fnmatch(rel.rsplit("/", 1)[-1], pattern) for rel in self.files)
+
+    def contains(self, rel_path: str, term: str) -> bool:
+        """Case-insensitive check that the file at *rel_path* contains *term*.
+
+        Each file is read at most once per scan.
+        """
+        if rel_path not in self._text_cache:
+            text: str | None = None
+            if self.is_file(rel_path):
+                try:
+                    text = (self.root / rel_path).read_text(encoding="utf-8", errors="ignore").lower()
+                except OSError:
+                    text = None
+            self._text_cache[rel_path] = text
+        text = self._text_cache[rel_path]
+        return text is not None and term in text
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from levelup.detection.scanner import ProjectScan
+
 
 @dataclass
 class TestRunnerInfo:
@@ -64,10 +66,13 @@ DEFAULT_COMMANDS: dict[str, tuple[str, str]] = {
 }
 
 
-def detect_test_runner(project_path: Path, language: str | None) -> TestRunnerInfo | None:
+def detect_test_runner(
+    project_path: Path, language: str | None, scan: ProjectScan | None = None
+) -> TestRunnerInfo | None:
     """Detect the test runner used in a project given its language."""
     if not language:
         return None
+    scan = scan or ProjectScan(project_path)
 
     for rule_lang, check, runner_name, command in TEST_RUNNER_RULES:
         if rule_lang != language:
@@ -76,25 +81,19 @@ def detect_test_runner(project_path: Path, language: str | None) -> TestRunnerIn
         if ":" in check:
             # Check file contains content
             filename, search_term = check.split(":", 1)
-            filepath = project_path / filename
-            if filepath.is_file():
-                try:
-                    content = filepath.read_text(encoding="utf-8", errors="ignore")
-                    if search_term in content.lower():
-                        return TestRunnerInfo(name=runner_name, command=command)
-                except Exception:
-                    continue
+            if scan.contains(filename, search_term):
+                return TestRunnerInfo(name=runner_name, command=command)
         elif "*" in check:
-            # Glob check
-            if list(project_path.rglob(check)):
+            # Glob check against every scanned file name
+            if scan.any_file_named(check):
                 return TestRunnerInfo(name=runner_name, command=command)
         elif check.endswith("/"):
             # Directory check
-            if (project_path / check.rstrip("/")).is_dir():
+            if scan.is_dir(check.rstrip("/")):
                 return TestRunnerInfo(name=runner_name, command=command)
         else:
             # File existence check
-            if (project_path / check).exists():
+            if scan.exists(check):
                 return TestRunnerInfo(name=runner_name, command=command)
 
     # Fall back to default for language
@@ -0,0 +1,159 @@
+"""Off-thread DB polling for the dashboard's periodic refresh.
+
+``DashboardPoller`` does what one refresh tick needs from the database:
+``mark_dead_runs``, the run list, the project's tickets and the pending
+checkpoints.  Like ``levelup.state.watch.RunWatcher`` it checks
+``PRAGMA data_version`` first, so an idle database costs one pragma per
+tick, and it compares results with the previous poll so that only the
+parts that changed are handed to the widgets.
+
+``DashboardRefreshThread`` runs a poller on its own ``QThread``; the GUI
+thread only calls ``request()`` and applies the ``DashboardDelta``s it
+emits.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from levelup.core.tickets import Ticket, read_tickets
+from levelup.state.db import get_connection
+from levelup.state.manager import StateManager, get_state_manager
+from levelup.state.models import CheckpointRequestRecord, RunRecord
+
+
+@dataclass(frozen=True)
+class DashboardDelta:
+    """What changed since the previous poll; ``None`` fields are unchanged."""
+
+    project_path: Path | None
+    runs: tuple[RunRecord, ...] | None = None
+    tickets: tuple[Ticket, ...] | None = None
+    pending_checkpoints: tuple[CheckpointRequestRecord, ...] = ()
+
+
+class DashboardPoller:
+    """Polls the state DB for the dashboard over one long-lived connection."""
+
+    def __init__(self, db_path: Path | str, state_manager: StateManager | None = None) -> None:
+        self._state_manager = state_manager or get_state_manager(db_path)
+        self._conn: sqlite3.Connection = get_connection(db_path)
+        self._data_version: int | None = None
+        self._project_path: Path | None = None
+        self._runs: tuple[RunRecord, ...] | None = None
+        self._tickets: tuple[Ticket, ...] | None = None
+        self._pending: tuple[CheckpointRequestRecord, ...] = ()
+
+    def poll(self, project_path: Path | None) -> DashboardDelta | None:
+        """One refresh tick; None when there is nothing for the GUI to do.
+
+        While checkpoints are pending a delta is returned even if nothing
+        changed, so the GUI can still auto-open them for runs it spawned.
+        """
+        sm = self._state_manager
+        sm.mark_dead_runs()
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version and project_path == self._project_path:
+            if self._pending:
+                return DashboardDelta(project_path, pending_checkpoints=self._pending)
+            return None
+
+        runs = tuple(sm.list_runs())
+        tickets: tuple[Ticket, ...] = ()
+        if project_path is not None:
+            tickets = tuple(read_tickets(project_path, state_manager=sm))
+        pending = tuple(sm.get_pending_checkpoints())
+        # Only now: if a query failed, the next poll must try this version again
+        self._data_version = version
+
+        project_changed = project_path != self._project_path
+        delta = DashboardDelta(
+            project_path,
+            runs=runs if runs != self._runs else None,
+            tickets=tickets if project_changed or tickets != self._tickets else None,
+            pending_checkpoints=pending,
+        )
+        self._project_path = project_path
+        self._runs = runs
+        self._tickets = tickets
+        self._pending = pending
+        if delta.runs is None and delta.tickets is None and not pending:
+            return None
+        return delta
+
+    def invalidate(self) -> None:
+        """Report everything as changed on the next poll."""
+        self._data_version = None
+        self._runs = None
+        self._tickets = None
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class DashboardRefreshThread(QThread):
+    """Runs a ``DashboardPoller`` for every ``request()``, off the GUI thread.
+
+    Requests made while a poll is in flight collapse into one follow-up poll
+    for the most recently requested project.
+    """
+
+    delta_ready = pyqtSignal(object)  # DashboardDelta
+    poll_failed = pyqtSignal(str)
+
+    def __init__(self, db_path: Path | str, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._db_path = db_path
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._project_path: Path | None = None
+        self._invalidate = False
+        self._stopping = False
+
+    def request(self, project_path: Path | None) -> None:
+        with self._lock:
+            self._project_path = project_path
+        self._wake.set()
+
+    def invalidate(self) -> None:
+        """Make the next poll report runs and tickets even if unchanged."""
+        with self._lock:
+            self._invalidate = True
+
+    def stop(self, timeout_ms: int = 3000) -> None:
+        self._stopping = True
+        self._wake.set()
+        self.wait(timeout_ms)
+
+    def run(self) -> None:
+        try:
+            # Created here so its SQLite connection belongs to this thread
+            poller = DashboardPoller(self._db_path)
+        except Exception as exc:
+            self.poll_failed.emit(str(exc))
+            return
+        try:
+            while True:
+                self._wake.wait()
+                self._wake.clear()
+                if self._stopping:
+                    break
+                with self._lock:
+                    project_path = self._project_path
+                    invalidate, self._invalidate = self._invalidate, False
+                if invalidate:
+                    poller.invalidate()
+                try:
+                    delta = poller.poll(project_path)
+                except Exception as exc:
+                    self.poll_failed.emit(str(exc))
+                    continue
+                if delta is not None:
+                    self.delta_ready.emit(delta)
+        finally:
+            poller.close()
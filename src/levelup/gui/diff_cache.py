@@ -0,0 +1,232 @@
+"""Cache of diffs between two commits for the diff view.
+
+A diff between two commit SHAs never changes, so ``DiffCache`` keeps the
+parsed diff, the ``--numstat`` totals and the commit info of recently
+viewed commits in an in-memory LRU keyed by ``(repo, from_sha, to_sha)``.
+With a cache directory (``gui.diff_cache``, ``~/.levelup/diff_cache/``)
+diffs and stats are also kept on disk so they survive GUI restarts.  Only
+full 40-character SHAs are cached: branch names and ``HEAD`` move.
+
+``open_repo()`` hands out one ``git.Repo`` per path, so the helpers in
+``levelup.gui.diff_view_widget`` don't re-open the repository on every call.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import git
+
+from levelup.gui.diff_model import DiffFile, parse_diff
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIFF_CACHE_DIR = Path.home() / ".levelup" / "diff_cache"
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_DISK_ENTRIES = 500
+
+# Diffs longer than this (in lines) are not kept in memory
+_MAX_MEMORY_LINES = 200_000
+
+_FULL_SHA = re.compile(r"[0-9a-f]{40}")
+
+
+def is_full_sha(sha: str | None) -> bool:
+    """True for a full hex commit SHA (the only kind of key that never moves)."""
+    return sha is not None and _FULL_SHA.fullmatch(sha) is not None
+
+
+@functools.lru_cache(maxsize=8)
+def open_repo(project_path: str) -> git.Repo:
+    """Shared ``git.Repo`` for *project_path*; only use it from the GUI thread."""
+    return git.Repo(project_path)
+
+
+class DiffCache:
+    """LRU cache of parsed diffs, diff stats and commit info, with hit/miss counters.
+
+    Safe to use from the diff loader threads as well as the GUI thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_dir: Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_disk_entries = max_disk_entries
+        self._dir = cache_dir
+        self._entries: OrderedDict[tuple[str, ...], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        return self._dir
+
+    def set_cache_dir(self, cache_dir: Path | None) -> None:
+        """Keep diffs on disk under *cache_dir* too (None: memory only)."""
+        self._dir = cache_dir
+
+    def clear(self) -> None:
+        """Forget everything held in memory (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    # -- Diffs ----------------------------------------------------------------
+
+    def get_files(
+        self, project_path: str, from_sha: str, to_sha: str, disk: bool = True
+    ) -> list[DiffFile] | None:
+        """Parsed diff of *from_sha*..*to_sha*; with *disk* also look on disk."""
+        key = self._key("files", project_path, from_sha, to_sha)
+        if key is None:
+            return None
+        files = self._get(key)
+        if files is None and disk and self._dir is not None:
+            text = self._read(key, ".diff")
+            if text is not None:
+                files = parse_diff(text)
+                self._put(key, files)
+        self._count(files is not None)
+        return files
+
+    def put_files(
+        self, project_path: str, from_sha: str, to_sha: str, files: list[DiffFile]
+    ) -> None:
+        key = self._key("files", project_path, from_sha, to_sha)
+        if key is None:
+            return
+        if sum(len(f.lines) for f in files) <= _MAX_MEMORY_LINES:
+            self._put(key, files)
+        if self._dir is not None:
+            text = "".join(line + "\n" for f in files for line in f.lines)
+            self._write(key, ".diff", text)
+
+    # -- Stats ----------------------------------------------------------------
+
+    def get_stats(self, project_path: str, from_sha: str, to_sha: str) -> dict[str, int] | None:
+        """``get_diff_stats`` result for *from_sha*..*to_sha*."""
+        key = self._key("stats", project_path, from_sha, to_sha)
+        if key is None:
+            return None
+        stats = self._get(key)
+        if stats is None and self._dir is not None:
+            text = self._read(key, ".json")
+            try:
+                stats = json.loads(text) if text is not None else None
+            except ValueError:
+                stats = None
+            if stats is not None:
+                self._put(key, stats)
+        self._count(stats is not None)
+        return dict(stats) if stats is not None else None
+
+    def put_stats(
+        self, project_path: str, from_sha: str, to_sha: str, stats: dict[str, int]
+    ) -> None:
+        key = self._key("stats", project_path, from_sha, to_sha)
+        if key is None:
+            return
+        self._put(key, dict(stats))
+        if self._dir is not None:
+            self._write(key, ".json", json.dumps(stats))
+
+    # -- Commit info ----------------------------------------------------------
+
+    def get_commit(self, project_path: str, sha: str) -> dict[str, str] | None:
+        """``get_commit_info`` result for *sha* (memory only)."""
+        key = self._key("commit", project_path, sha)
+        info = self._get(key) if key is not None else None
+        if key is not None:
+            self._count(info is not None)
+        return dict(info) if info is not None else None
+
+    def put_commit(self, project_path: str, sha: str, info: dict[str, str]) -> None:
+        key = self._key("commit", project_path, sha)
+        if key is not None:
+            self._put(key, dict(info))
+
+    # -- Internal -------------------------------------------------------------
+
+    @staticmethod
+    def _key(kind: str, project_path: str, *shas: str) -> tuple[str, ...] | None:
+        if not all(is_full_sha(sha) for sha in shas):
+            return None
+        return (kind, str(Path(project_path).resolve()), *shas)
+
+    def _get(self, key: tuple[str, ...]) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _put(self, key: tuple[str, ...], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _path(self, key: tuple[str, ...], suffix: str) -> Path:
+        assert self._dir is not None
+        digest = hashlib.sha256("\0".join(key[1:]).encode("utf-8")).hexdigest()
+        return self._dir / f"{digest}{suffix}"
+
+    def _read(self, key: tuple[str, ...], suffix: str) -> str | None:
+        try:
+            # newline="": keep the "\r"s of a cached diff as git wrote them
+            with self._path(key, suffix).open(encoding="utf-8", newline="") as f:
+                return f.read()
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: tuple[str, ...], suffix: str, text: str) -> None:
+        assert self._dir is not None
+        path = self._path(key, suffix)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent GUI never reads a partial entry
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(text, encoding="utf-8", newline="")
+            os.replace(tmp, path)
+            self._prune()
+        except OSError as e:
+            logger.warning("Failed to write diff cache entry: %s", e)
+
+    def _prune(self) -> None:
+        assert self._dir is not None
+        entries = [p for p in self._dir.iterdir() if p.suffix in (".diff", ".json")]
+        excess = len(entries) - self._max_disk_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:excess]:
+            path.unlink(missing_ok=True)
+
+
+_default_cache = DiffCache()
+
+
+def get_diff_cache() -> DiffCache:
+    """The process-wide cache used by the diff view."""
+    return _default_cache
@@ -0,0 +1,446 @@
+"""Parsed unified diffs and the list model behind the virtualized diff view.
+
+``DiffLoadThread`` streams ``git diff`` output through a ``DiffParser`` on
+a worker thread and hands over each file's section as soon as it is
+complete, so a large branch diff shows up progressively instead of
+freezing the GUI.  ``DiffModel`` flattens the files into one row per
+displayed line; the list view only asks for the rows on screen, and colors
+are looked up per row as they are painted rather than by formatting the
+whole diff up front.  Each file is a collapsible section, and files with
+more than ``LARGE_FILE_LINES`` lines start collapsed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import git
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QFont
+
+if TYPE_CHECKING:
+    from levelup.gui.diff_cache import DiffCache
+
+# Line colors by theme
+DIFF_COLORS: dict[str, dict[str, str]] = {
+    "dark": {
+        "file": "#F9E2AF",
+        "file_bg": "#313244",
+        "hunk": "#89DCEB",
+        "add": "#A6E3A1",
+        "add_bg": "#1e3a1e",
+        "del": "#F38BA8",
+        "del_bg": "#3a1e1e",
+        "context": "#BAC2DE",
+    },
+    "light": {
+        "file": "#D08770",
+        "file_bg": "#E5E9F0",
+        "hunk": "#5E81AC",
+        "add": "#2E7D32",
+        "add_bg": "#e8f5e9",
+        "del": "#C62828",
+        "del_bg": "#ffebee",
+        "context": "#2E3440",
+    },
+}
+
+# Files with more lines than this start collapsed
+LARGE_FILE_LINES = 1000
+
+# Role returning a row's kind: "header", "file", "hunk", "add", "del" or "context"
+KIND_ROLE = Qt.ItemDataRole.UserRole
+
+# The loader emits parsed files at most this often (seconds)
+_BATCH_INTERVAL = 0.1
+
+
+@dataclass
+class DiffFile:
+    """One file's section of a unified diff."""
+
+    path: str  # "" for text before the first "diff --git" line
+    lines: list[str]  # the section, starting with its "diff --git" line
+    hunks_start: int  # index of the first "@@" line, len(lines) if none
+    insertions: int = 0
+    deletions: int = 0
+    binary: bool = False
+
+    def kind(self, index: int) -> str:
+        """Kind of ``lines[index]``, for coloring."""
+        line = self.lines[index]
+        if index < self.hunks_start:
+            return "file"
+        if line.startswith("@@"):
+            return "hunk"
+        if line.startswith("+"):
+            return "add"
+        if line.startswith("-"):
+            return "del"
+        return "context"
+
+
+class DiffParser:
+    """Splits unified diff text, fed line by line, into ``DiffFile``s."""
+
+    def __init__(self) -> None:
+        self._current: DiffFile | None = None
+        self._old_path = ""
+
+    def feed(self, line: str) -> DiffFile | None:
+        """Add one line; returns the previous file once a new one starts.
+
+        Only the ``"\n"`` terminator is removed, so a file's lines joined with
+        ``"\n"`` give back git's output, ``"\r"`` and all.
+        """
+        line = line.removesuffix("\n")
+        done = None
+        if self._current is None or line.startswith("diff --git "):
+            done = self._close()
+            self._current = DiffFile(path=_path_from_git_header(line), lines=[], hunks_start=0)
+            if line.startswith("diff --git "):
+                self._current.hunks_start = -1  # header lines until the first "@@"
+            self._old_path = ""
+        current = self._current
+        current.lines.append(line)
+        if current.hunks_start < 0:
+            self._header_line(current, line)
+        elif line.startswith("+"):
+            current.insertions += 1
+        elif line.startswith("-"):
+            current.deletions += 1
+        return done
+
+    def finish(self) -> DiffFile | None:
+        """The last file, once the input is exhausted."""
+        return self._close()
+
+    def _header_line(self, current: DiffFile, line: str) -> None:
+        if line.startswith("@@"):
+            current.hunks_start = len(current.lines) - 1
+        elif line.startswith("--- a/"):
+            self._old_path = line[6:]
+        elif line.startswith("+++ b/"):
+            current.path = line[6:]
+        elif line.startswith("+++ /dev/null"):
+            current.path = self._old_path or current.path  # deleted file
+        elif line.startswith("Binary files "):
+            current.binary = True
+
+    def _close(self) -> DiffFile | None:
+        done, self._current = self._current, None
+        if done is not None and done.hunks_start < 0:
+            done.hunks_start = len(done.lines)  # no hunks: binary, mode change, ...
+        return done
+
+
+def parse_diff(text: str) -> list[DiffFile]:
+    """Parse a whole unified diff into files."""
+    parser = DiffParser()
+    # Not splitlines(): that also splits on "\r", "\x0c", "\u2028", ...
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()  # the final newline ends the last line
+    files = [f for f in map(parser.feed, lines) if f is not None]
+    last = parser.finish()
+    if last is not None:
+        files.append(last)
+    return files
+
+
+def diff_totals(files: Iterable[DiffFile]) -> dict[str, int]:
+    """``get_diff_stats``-style totals for parsed files."""
+    files = list(files)
+    return {
+        "files_changed": sum(1 for f in files if f.path),
+        "insertions": sum(f.insertions for f in files),
+        "deletions": sum(f.deletions for f in files),
+    }
+
+
+def _path_from_git_header(line: str) -> str:
+    """Best-effort path from a "diff --git a/x b/x" line (refined by the +++ line)."""
+    if not line.startswith("diff --git "):
+        return ""
+    _, sep, path = line.rpartition(" b/")
+    return path if sep else line[len("diff --git "):]
+
+
+class DiffModel(QAbstractListModel):
+    """Diff lines, one per row, grouped into collapsible per-file sections.
+
+    Each file has a header row (its path and +/- counts) followed, when
+    expanded, by the lines of its section after the "diff --git" line.
+    """
+
+    def __init__(self, theme: str = "dark", parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._files: list[DiffFile] = []
+        self._expanded: list[bool] = []
+        self._starts: list[int] = []  # first row of each file
+        self._row_count = 0
+        self._theme = theme
+        self._brushes = _brushes(theme)
+        self._max_columns = 0
+        # path -> expanded, kept across reloads until forget_folds()
+        self._user_toggled: dict[str, bool] = {}
+
+    # -- Public API ---------------------------------------------------------
+
+    @property
+    def files(self) -> list[DiffFile]:
+        return self._files
+
+    @property
+    def max_columns(self) -> int:
+        """Length of the longest line, for the view's horizontal extent."""
+        return self._max_columns
+
+    def clear(self) -> None:
+        if not self._files:
+            return
+        self.beginResetModel()
+        self._files = []
+        self._expanded = []
+        self._starts = []
+        self._row_count = 0
+        self._max_columns = 0
+        self.endResetModel()
+
+    def set_files(self, files: list[DiffFile]) -> None:
+        self.clear()
+        self.append_files(files)
+
+    def append_files(self, files: list[DiffFile]) -> None:
+        if not files:
+            return
+        first = self._row_count
+        rows = 0
+        starts: list[int] = []
+        expanded: list[bool] = []
+        for f in files:
+            starts.append(first + rows)
+            expanded.append(self._user_toggled.get(f.path, len(f.lines) <= LARGE_FILE_LINES))
+            rows += self._file_rows(f, expanded[-1])
+        # Views may query the model in beginInsertRows: it must still hold the old rows
+        self.beginInsertRows(QModelIndex(), first, first + rows - 1)
+        self._files.extend(files)
+        self._expanded.extend(expanded)
+        self._starts.extend(starts)
+        self._row_count += rows
+        self.endInsertRows()
+        longest = max((len(line) for f in files for line in f.lines), default=0)
+        self._max_columns = max(self._max_columns, longest + 2)
+
+    def forget_folds(self) -> None:
+        """Drop the user's folds, for a diff of other commits: paths repeat across diffs."""
+        self._user_toggled.clear()
+
+    def file_row(self, file_index: int) -> int:
+        """Row of a file's header (its first line for text outside any file)."""
+        return self._starts[file_index]
+
+    def is_expanded(self, file_index: int) -> bool:
+        return self._expanded[file_index]
+
+    def is_header(self, row: int) -> bool:
+        file_index, offset = self._locate(row)
+        return offset == 0 and bool(self._files[file_index].path)
+
+    def toggle(self, row: int) -> None:
+        """Expand or collapse the file whose header is at *row*."""
+        if not self.is_header(row):
+            return
+        file_index, _ = self._locate(row)
+        self.set_expanded(file_index, not self._expanded[file_index])
+
+    def set_expanded(self, file_index: int, expanded: bool) -> None:
+        f = self._files[file_index]
+        self._user_toggled[f.path] = expanded
+        if self._expanded[file_index] == expanded:
+            return
+        header = self._starts[file_index]
+        body = len(f.lines) - 1
+        if body > 0:
+            if expanded:
+                self.beginInsertRows(QModelIndex(), header + 1, header + body)
+            else:
+                self.beginRemoveRows(QModelIndex(), header + 1, header + body)
+        delta = body if expanded else -body
+        for i in range(file_index + 1, len(self._starts)):
+            self._starts[i] += delta
+        self._row_count += delta
+        if body > 0:
+            if expanded:
+                self.endInsertRows()
+            else:
+                self.endRemoveRows()
+        # The header's arrow changes separately from the rows below it
+        self._expanded[file_index] = expanded
+        index = self.index(header)
+        self.dataChanged.emit(index, index)
+
+    def set_theme(self, theme: str) -> None:
+        if theme == self._theme:
+            return
+        self._theme = theme
+        self._brushes = _brushes(theme)
+        if self._row_count:
+            self.dataChanged.emit(
+                self.index(0),
+                self.index(self._row_count - 1),
+                [Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.BackgroundRole],
+            )
+
+    # -- QAbstractListModel -------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < self._row_count:
+            return None
+        file_index, offset = self._locate(index.row())
+        f = self._files[file_index]
+        if f.path:
+            kind = "header" if offset == 0 else f.kind(offset)
+        else:
+            kind = f.kind(offset)
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kind == "header":
+                return self._header_text(f, self._expanded[file_index])
+            return f.lines[offset].removesuffix("\r").expandtabs(4)
+        if role == KIND_ROLE:
+            return kind
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brushes[kind][0]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._brushes[kind][1]
+        if role == Qt.ItemDataRole.FontRole and kind == "header":
+            font = QFont()
+            font.setBold(True)
+            return font
+        return None
+
+    # -- Internal -----------------------------------------------------------
+
+    @staticmethod
+    def _file_rows(f: DiffFile, expanded: bool) -> int:
+        if not f.path:
+            return len(f.lines)
+        return len(f.lines) if expanded else 1
+
+    def _locate(self, row: int) -> tuple[int, int]:
+        """(file index, offset into its lines) for *row*."""
+        file_index = bisect.bisect_right(self._starts, row) - 1
+        return file_index, row - self._starts[file_index]
+
+    @staticmethod
+    def _header_text(f: DiffFile, expanded: bool) -> str:
+        arrow = "▾" if expanded else "▸"
+        if f.binary:
+            counts = "binary"
+        else:
+            counts = f"+{f.insertions} -{f.deletions}"
+        hidden = "" if expanded else f"  ({len(f.lines) - 1} lines, click to expand)"
+        return f"{arrow} {f.path}  {counts}{hidden}"
+
+
+def _brushes(theme: str) -> dict[str, tuple[QBrush | None, QBrush | None]]:
+    colors = DIFF_COLORS.get(theme, DIFF_COLORS["dark"])
+
+    def brush(key: str) -> QBrush:
+        return QBrush(QColor(colors[key]))
+
+    return {
+        "header": (brush("file"), brush("file_bg")),
+        "file": (brush("file"), None),
+        "hunk": (brush("hunk"), None),
+        "add": (brush("add"), brush("add_bg")),
+        "del": (brush("del"), brush("del_bg")),
+        "context": (brush("context"), None),
+    }
+
+
+class DiffLoadThread(QThread):
+    """Streams ``git diff from_sha to_sha`` and emits the parsed files in batches.
+
+    With a *cache*, a diff already in it is emitted in one batch without
+    running git, and a completed diff is added to it.
+    """
+
+    files_loaded = pyqtSignal(list)  # list[DiffFile], in diff order
+    load_finished = pyqtSignal()
+    load_failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        project_path: str,
+        from_sha: str,
+        to_sha: str,
+        cache: DiffCache | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._project_path = project_path
+        self._from_sha = from_sha
+        self._to_sha = to_sha
+        self._cache = cache
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def run(self) -> None:
+        cache = self._cache
+        if cache is not None:
+            cached = cache.get_files(self._project_path, self._from_sha, self._to_sha)
+            if cached is not None:
+                self.files_loaded.emit(cached)
+                self.load_finished.emit()
+                return
+        try:
+            repo = git.Repo(self._project_path)
+            proc = repo.git.diff(self._from_sha, self._to_sha, as_process=True)
+        except Exception as exc:
+            self.load_failed.emit(str(exc))
+            return
+        parser = DiffParser()
+        loaded: list[DiffFile] = []
+        batch: list[DiffFile] = []
+        last_emit = 0.0
+        try:
+            for raw in proc.stdout:
+                if self._cancel.is_set():
+                    proc.proc.kill()
+                    break
+                done = parser.feed(raw.decode("utf-8", errors="replace"))
+                if done is not None:
+                    loaded.append(done)
+                    batch.append(done)
+                    now = time.monotonic()
+                    if now - last_emit >= _BATCH_INTERVAL:
+                        self.files_loaded.emit(batch)
+                        batch = []
+                        last_emit = now
+            if self._cancel.is_set():
+                proc.proc.wait()
+                return
+            last = parser.finish()
+            if last is not None:
+                loaded.append(last)
+                batch.append(last)
+            proc.wait()  # raises GitCommandError on a non-zero exit
+        except Exception as exc:
+            self.load_failed.emit(str(exc))
+            return
+        if cache is not None:
+            cache.put_files(self._project_path, self._from_sha, self._to_sha, loaded)
+        if batch:
+            self.files_loaded.emit(batch)
+        self.load_finished.emit()
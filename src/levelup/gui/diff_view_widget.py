@@ -1,4 +1,10 @@
-"""Diff view widget for displaying git changes from pipeline runs."""
+"""Diff view widget for displaying git changes from pipeline runs.
+
+The diff itself is generated on a worker thread and shown in a virtualized
+``DiffListView`` (see ``levelup.gui.diff_model``); the ``QTextBrowser``
+above it only holds the header: title, commit info, stats and a linked
+list of the changed files.
+"""
 
 from __future__ import annotations
 
@@ -6,20 +12,43 @@ import html
 from pathlib import Path
 
 import git
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QModelIndex, QSize, Qt, QUrl, pyqtSignal
+from PyQt6.QtGui import QFont, QKeyEvent, QKeySequence
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QComboBox,
     QHBoxLayout,
     QLabel,
+    QListView,
     QPushButton,
+    QSplitter,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextBrowser,
     QVBoxLayout,
     QWidget,
 )
 
 from levelup.core.context import PipelineContext, PipelineStatus
+from levelup.gui.diff_cache import get_diff_cache, open_repo
+from levelup.gui.diff_model import (
+    DIFF_COLORS,
+    DiffLoadThread,
+    DiffModel,
+    diff_totals,
+    parse_diff,
+)
+from levelup.gui.styles import MONOSPACE_FONT, MONOSPACE_FONT_SIZE
 from levelup.state.manager import StateManager
 
+# Files listed (and linked) in the header; the rest are summarized
+_MAX_LISTED_FILES = 100
+
+# Loader threads still running; kept here so that closing a diff view
+# mid-load doesn't destroy a running QThread
+_live_threads: set[DiffLoadThread] = set()
+
 
 # Theme CSS for diff display
 _DARK_CSS = """
@@ -46,25 +75,6 @@ h2, h3 {
     margin-bottom: 16px;
     font-weight: bold;
 }
-.diff-file {
-    color: #F9E2AF;
-    font-weight: bold;
-    margin-top: 16px;
-}
-.diff-hunk {
-    color: #89DCEB;
-}
-.diff-add {
-    color: #A6E3A1;
-    background: #1e3a1e;
-}
-.diff-del {
-    color: #F38BA8;
-    background: #3a1e1e;
-}
-.diff-context {
-    color: #BAC2DE;
-}
 .error-message {
     color: #F38BA8;
     background: #3a1e1e;
@@ -105,25 +115,6 @@ h2, h3 {
     margin-bottom: 16px;
     font-weight: bold;
 }
-.diff-file {
-    color: #D08770;
-    font-weight: bold;
-    margin-top: 16px;
-}
-.diff-hunk {
-    color: #5E81AC;
-}
-.diff-add {
-    color: #2E7D32;
-    background: #e8f5e9;
-}
-.diff-del {
-    color: #C62828;
-    background: #ffebee;
-}
-.diff-context {
-    color: #2E3440;
-}
 .error-message {
     color: #C62828;
     background: #ffebee;
@@ -161,44 +152,15 @@ def generate_diff(project_path: str, from_sha: str, to_sha: str) -> str:
         git.exc.GitCommandError: If git command fails
         git.exc.InvalidGitRepositoryError: If not a git repo
     """
-    try:
-        repo = git.Repo(project_path)
-        # Generate unified diff
-        diff_output = repo.git.diff(from_sha, to_sha)
-        return diff_output
-    except Exception as e:
-        raise
-
-
-def generate_step_diff(project_path: str, step_sha: str, parent_sha: str) -> str:
-    """Generate diff for a specific pipeline step.
-
-    Args:
-        project_path: Path to git repository
-        step_sha: Commit SHA for the step
-        parent_sha: Parent commit SHA (previous step or pre_run_sha)
-
-    Returns:
-        Unified diff output as string
-    """
-    return generate_diff(project_path, parent_sha, step_sha)
-
-
-def generate_branch_diff(project_path: str, pre_run_sha: str, to_sha: str | None = None) -> str:
-    """Generate diff for entire branch from pre_run_sha to HEAD or specified commit.
-
-    Args:
-        project_path: Path to git repository
-        pre_run_sha: Starting commit SHA (before run began)
-        to_sha: Optional ending commit SHA (defaults to HEAD)
-
-    Returns:
-        Unified diff output as string
-    """
-    if to_sha is None:
-        repo = git.Repo(project_path)
-        to_sha = repo.head.commit.hexsha
-    return generate_diff(project_path, pre_run_sha, to_sha)
+    cache = get_diff_cache()
+    cached = cache.get_files(project_path, from_sha, to_sha)
+    if cached is not None:
+        return "\n".join(line for f in cached for line in f.lines)
+    repo = open_repo(project_path)
+    # Generate unified diff
+    diff_output = repo.git.diff(from_sha, to_sha)
+    cache.put_files(project_path, from_sha, to_sha, parse_diff(diff_output))
+    return diff_output
 
 
 def get_commit_info(project_path: str, sha: str) -> dict[str, str]:
@@ -214,10 +176,13 @@ def get_commit_info(project_path: str, sha: str) -> dict[str, str]:
     Raises:
         ValueError: If commit SHA is invalid
     """
+    cache = get_diff_cache()
+    info = cache.get_commit(project_path, sha)
+    if info is not None:
+        return info
     try:
-        repo = git.Repo(project_path)
-        commit = repo.commit(sha)
-        return {
+        commit = open_repo(project_path).commit(sha)
+        info = {
             "sha": sha,
             "message": commit.message.strip(),
             "author": str(commit.author),
@@ -225,6 +190,8 @@ def get_commit_info(project_path: str, sha: str) -> dict[str, str]:
         }
     except Exception as e:
         raise ValueError(f"Invalid commit SHA: {sha}") from e
+    cache.put_commit(project_path, sha, info)
+    return info
 
 
 def get_parent_sha(project_path: str, sha: str) -> str | None:
@@ -237,8 +204,7 @@ def get_parent_sha(project_path: str, sha: str) -> str | None:
     Returns:
         Parent commit SHA or None if no parent (first commit)
     """
-    repo = git.Repo(project_path)
-    commit = repo.commit(sha)
+    commit = open_repo(project_path).commit(sha)
     if commit.parents:
         return commit.parents[0].hexsha
     return None
@@ -256,7 +222,7 @@ def get_diff_stats(project_path: str, from_sha: str, to_sha: str | None = None)
         Dict with stats: files_changed, insertions, deletions
     """
     try:
-        repo = git.Repo(project_path)
+        repo = open_repo(project_path)
         if to_sha is None:
             to_sha = repo.head.commit.hexsha
 
@@ -265,14 +231,15 @@ def get_diff_stats(project_path: str, from_sha: str, to_sha: str | None = None)
     except Exception:
         return {"files_changed": 0, "insertions": 0, "deletions": 0}
 
+    cache = get_diff_cache()
+    cached = cache.get_stats(project_path, from_sha, to_sha)
+    if cached is not None:
+        return cached
+
     try:
-        repo = git.Repo(project_path)
         # Get stats using --numstat format
         stats_output = repo.git.diff(from_sha, to_sha, numstat=True)
 
-        if not stats_output:
-            return {"files_changed": 0, "insertions": 0, "deletions": 0}
-
         files_changed = 0
         insertions = 0
         deletions = 0
@@ -290,13 +257,15 @@ def get_diff_stats(project_path: str, from_sha: str, to_sha: str | None = None)
                     except ValueError:
                         pass
 
-        return {
+        stats = {
             "files_changed": files_changed,
             "insertions": insertions,
             "deletions": deletions,
         }
     except Exception:
         return {"files_changed": 0, "insertions": 0, "deletions": 0}
+    cache.put_stats(project_path, from_sha, to_sha, stats)
+    return stats
 
 
 def find_step_parent(step_name: str, step_commits: dict[str, str], pre_run_sha: str) -> str:
@@ -350,8 +319,7 @@ def is_valid_sha(project_path: str, sha: str) -> bool:
         True if SHA is valid, False otherwise
     """
     try:
-        repo = git.Repo(project_path)
-        repo.commit(sha)
+        open_repo(project_path).commit(sha)
         return True
     except Exception:
         return False
@@ -367,72 +335,59 @@ def get_branch_head(project_path: str, branch_name: str) -> str:
     Returns:
         HEAD commit SHA of the branch
     """
-    repo = git.Repo(project_path)
-    branch = repo.heads[branch_name]
+    branch = open_repo(project_path).heads[branch_name]
     return branch.commit.hexsha
 
 
-def format_diff_html(diff_text: str, theme: str = "dark") -> str:
-    """Format diff text as HTML with syntax highlighting.
+def _wrap_html(body: str, theme: str = "dark") -> str:
+    """Wrap HTML body with theme CSS."""
+    css = _DARK_CSS if theme == "dark" else _LIGHT_CSS
+    return f"<!DOCTYPE html><html><head><style>{css}</style></head><body>{body}</body></html>"
 
-    Args:
-        diff_text: Raw diff output
-        theme: Color theme ("dark" or "light")
 
-    Returns:
-        HTML-formatted diff
-    """
-    if not diff_text:
-        return '<div class="info-message">No changes to display.</div>'
-
-    # Define colors based on theme
-    if theme == "dark":
-        colors = {
-            "file": "#F9E2AF",
-            "hunk": "#89DCEB",
-            "add": "#A6E3A1",
-            "add_bg": "#1e3a1e",
-            "del": "#F38BA8",
-            "del_bg": "#3a1e1e",
-            "context": "#BAC2DE",
-        }
-    else:  # light
-        colors = {
-            "file": "#D08770",
-            "hunk": "#5E81AC",
-            "add": "#2E7D32",
-            "add_bg": "#e8f5e9",
-            "del": "#C62828",
-            "del_bg": "#ffebee",
-            "context": "#2E3440",
-        }
+# ============================================================================
+# DiffListView
+# ============================================================================
 
-    lines = diff_text.splitlines()
-    html_lines = []
-
-    for line in lines:
-        escaped = html.escape(line)
-
-        if line.startswith('+++') or line.startswith('---'):
-            html_lines.append(f'<div class="diff-file" style="color: {colors["file"]}; font-weight: bold;">{escaped}</div>')
-        elif line.startswith('@@'):
-            html_lines.append(f'<div class="diff-hunk" style="color: {colors["hunk"]};">{escaped}</div>')
-        elif line.startswith('+'):
-            html_lines.append(f'<div class="diff-add" style="color: {colors["add"]}; background: {colors["add_bg"]};">{escaped}</div>')
-        elif line.startswith('-'):
-            html_lines.append(f'<div class="diff-del" style="color: {colors["del"]}; background: {colors["del_bg"]};">{escaped}</div>')
-        elif line.startswith('diff --git'):
-            html_lines.append(f'<div class="diff-file" style="color: {colors["file"]}; font-weight: bold;">{escaped}</div>')
-        else:
-            html_lines.append(f'<div class="diff-context" style="color: {colors["context"]};">{escaped}</div>')
 
-    return '<pre style="margin: 0; white-space: pre-wrap; word-wrap: break-word;">' + '\n'.join(html_lines) + '</pre>'
+class _DiffLineDelegate(QStyledItemDelegate):
+    """Sizes every row to the longest line, so long lines scroll horizontally."""
 
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        model = index.model()
+        columns = model.max_columns if isinstance(model, DiffModel) else 0
+        fm = option.fontMetrics
+        return QSize(fm.horizontalAdvance("M") * max(columns, 1), fm.height() + 2)
 
-def _wrap_html(body: str, theme: str = "dark") -> str:
-    """Wrap HTML body with theme CSS."""
-    css = _DARK_CSS if theme == "dark" else _LIGHT_CSS
-    return f"<!DOCTYPE html><html><head><style>{css}</style></head><body>{body}</body></html>"
+
+class DiffListView(QListView):
+    """Virtualized diff lines; click (or Enter on) a file header to fold it."""
+
+    def __init__(self, model: DiffModel, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("diffLines")
+        self.setModel(model)
+        # Every row has the same size, so only the rows on screen are laid out
+        self.setUniformItemSizes(True)
+        self.setItemDelegate(_DiffLineDelegate(self))
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setTextElideMode(Qt.TextElideMode.ElideNone)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        font = QFont(MONOSPACE_FONT, MONOSPACE_FONT_SIZE)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+        self.clicked.connect(lambda index: model.toggle(index.row()))
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        model = self.model()
+        if event.matches(QKeySequence.StandardKey.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            QApplication.clipboard().setText("\n".join(model.data(model.index(r)) for r in rows))
+            return
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and self.currentIndex().isValid():
+            model.toggle(self.currentIndex().row())
+            return
+        super().keyPressEvent(event)
 
 
 # ============================================================================
@@ -466,6 +421,17 @@ class DiffViewWidget(QWidget):
         self._last_diff_text: str = ""
         self._last_diff_title: str = "Diff"
 
+        # Diff lines, filled by _load_thread; _diff_key is what they are a diff of
+        self._model = DiffModel(theme, self)
+        self._load_thread: DiffLoadThread | None = None
+        self._diff_key: tuple[str | None, str, str] | None = None
+        # What the model's folds were made on; survives reloads of that diff
+        self._folds_key: tuple[str | None, str, str] | None = None
+        # Header shown above the lines, or the message shown instead of a diff
+        self._header_parts: list[str] | None = None
+        self._empty_message = "No changes to display."
+        self._message: tuple[str, str] | None = None
+
         self._build_ui()
 
         # Load context and display diff if run_id provided
@@ -508,11 +474,32 @@ class DiffViewWidget(QWidget):
 
         layout.addLayout(top_bar)
 
-        # Diff display browser
+        # Header (or message) browser above the diff lines
+        self._splitter = QSplitter(Qt.Orientation.Vertical)
         self._browser = QTextBrowser()
         self._browser.setObjectName("diffBrowser")
         self._browser.setOpenExternalLinks(False)
-        layout.addWidget(self._browser)
+        self._browser.setOpenLinks(False)
+        self._browser.anchorClicked.connect(self._on_anchor_clicked)
+        self._splitter.addWidget(self._browser)
+
+        self._view = DiffListView(self._model)
+        self._view.hide()
+        self._splitter.addWidget(self._view)
+        self._splitter.setStretchFactor(1, 1)
+        self._splitter.setSizes([160, 600])
+        layout.addWidget(self._splitter)
+
+    @property
+    def is_loading(self) -> bool:
+        """True while the diff is still being generated."""
+        return self._load_thread is not None
+
+    def stop_loading(self) -> None:
+        """Cancel a diff that is still being generated."""
+        if self._load_thread is not None:
+            self._stop_load()
+            self._diff_key = None  # only partly loaded: load it again next time
 
     def _load_context(self) -> None:
         """Load PipelineContext from state manager."""
@@ -601,7 +588,7 @@ class DiffViewWidget(QWidget):
         try:
             # Check if project path is a valid git repo
             try:
-                repo = git.Repo(self._project_path)
+                open_repo(self._project_path)
             except git.exc.InvalidGitRepositoryError:
                 self._show_error("Project path is not a git repository")
                 return
@@ -628,10 +615,7 @@ class DiffViewWidget(QWidget):
 
         # Get step commit SHA
         if self._step_name not in self._context.step_commits:
-            # Show error message for missing step
-            html_content = f'<div class="error-message"><strong>Error:</strong> No commit found for step: {html.escape(self._step_name)}</div>'
-            full_html = _wrap_html(html_content, self._theme)
-            self._browser.setHtml(full_html)
+            self._show_error(f"No commit found for step: {self._step_name}")
             return
 
         step_sha = self._context.step_commits[self._step_name]
@@ -652,31 +636,20 @@ class DiffViewWidget(QWidget):
             self._show_error(f"Parent commit not found: {parent_sha}")
             return
 
-        # Generate diff
         try:
-            diff_text = generate_step_diff(self._project_path, step_sha, parent_sha)  # type: ignore
-
-            # Get commit info
             commit_info = get_commit_info(self._project_path, step_sha)  # type: ignore
-
-            # Build HTML
-            html_parts = []
-            html_parts.append(f"<h2>{step_title}</h2>")
-            html_parts.append('<div class="commit-info">')
-            html_parts.append(f"<strong>Commit:</strong> {commit_info['sha'][:8]}<br>")
-            html_parts.append(f"<strong>Message:</strong> {html.escape(commit_info['message'])}<br>")
-            html_parts.append("</div>")
-
-            if diff_text:
-                html_parts.append(format_diff_html(diff_text, self._theme))
-            else:
-                html_parts.append('<div class="info-message">No changes in this step.</div>')
-
-            full_html = _wrap_html('\n'.join(html_parts), self._theme)
-            self._browser.setHtml(full_html)
-
         except Exception as e:
             self._show_error(f"Error generating step diff: {e}")
+            return
+
+        # Header; the diff itself is generated in the background
+        html_parts = []
+        html_parts.append(f"<h2>{step_title}</h2>")
+        html_parts.append('<div class="commit-info">')
+        html_parts.append(f"<strong>Commit:</strong> {commit_info['sha'][:8]}<br>")
+        html_parts.append(f"<strong>Message:</strong> {html.escape(commit_info['message'])}<br>")
+        html_parts.append("</div>")
+        self._start_load(parent_sha, step_sha, html_parts, "No changes in this step.")
 
     def _display_branch_diff(self) -> None:
         """Display diff for entire branch."""
@@ -688,7 +661,7 @@ class DiffViewWidget(QWidget):
 
         try:
             # Get current HEAD
-            repo = git.Repo(self._project_path)
+            repo = open_repo(self._project_path)  # type: ignore[arg-type]
 
             # Try to find the run's branch if it still exists
             branch_name = f"levelup/{self._run_id}"
@@ -698,44 +671,153 @@ class DiffViewWidget(QWidget):
             except (IndexError, AttributeError):
                 # Branch might not exist, use current HEAD
                 to_sha = repo.head.commit.hexsha
+        except Exception as e:
+            self._show_error(f"Error generating branch diff: {e}")
+            return
 
-            # Generate diff
-            diff_text = generate_branch_diff(self._project_path, self._pre_run_sha, to_sha)  # type: ignore
-
-            # Get stats
-            stats = get_diff_stats(self._project_path, self._pre_run_sha, to_sha)  # type: ignore
+        self._start_load(
+            self._pre_run_sha, to_sha, ["<h2>All Changes</h2>"], "No changes to display."
+        )
 
-            # Build HTML
-            html_parts = []
-            html_parts.append("<h2>All Changes</h2>")
-            html_parts.append('<div class="diff-stats">')
-            html_parts.append(f"{stats['files_changed']} file(s) changed, ")
-            html_parts.append(f"{stats['insertions']} insertion(s)(+), ")
-            html_parts.append(f"{stats['deletions']} deletion(s)(-)")
-            html_parts.append("</div>")
+    # -- Background diff loading ----------------------------------------------
 
-            if diff_text:
-                html_parts.append(format_diff_html(diff_text, self._theme))
-            else:
-                html_parts.append('<div class="info-message">No changes to display.</div>')
+    def _start_load(
+        self, from_sha: str, to_sha: str, header_parts: list[str], empty_message: str
+    ) -> None:
+        """Show *header_parts* and generate the diff of *from_sha*..*to_sha* in a thread."""
+        header_changed = (header_parts, empty_message) != (self._header_parts, self._empty_message)
+        self._header_parts = header_parts
+        self._empty_message = empty_message
+        self._message = None
+        key = (self._project_path, from_sha, to_sha)
+        if key == self._diff_key:
+            # Same commits, same diff: keep the lines, scroll position and folds
+            if header_changed:
+                self._render_header()
+            return
 
-            full_html = _wrap_html('\n'.join(html_parts), self._theme)
-            self._browser.setHtml(full_html)
+        self._stop_load()
+        self._diff_key = key
+        if key != self._folds_key:
+            self._model.forget_folds()
+            self._folds_key = key
+        cache = get_diff_cache()
+        cached = cache.get_files(self._project_path or "", from_sha, to_sha, disk=False)
+        if cached is not None:
+            self._model.set_files(cached)
+            self._render_header()
+            return
 
-        except Exception as e:
-            self._show_error(f"Error generating branch diff: {e}")
+        self._model.clear()
+        thread = DiffLoadThread(self._project_path or "", from_sha, to_sha, cache)
+        thread.files_loaded.connect(self._on_files_loaded)
+        thread.load_finished.connect(self._on_load_finished)
+        thread.load_failed.connect(self._on_load_failed)
+        _live_threads.add(thread)
+        thread.finished.connect(lambda: _live_threads.discard(thread))
+        thread.finished.connect(thread.deleteLater)
+        self._load_thread = thread
+        self._render_header()
+        thread.start()
+
+    def _stop_load(self) -> None:
+        thread, self._load_thread = self._load_thread, None
+        if thread is not None:
+            thread.files_loaded.disconnect()
+            thread.load_finished.disconnect()
+            thread.load_failed.disconnect()
+            thread.cancel()  # kills git; the thread then ends on its own
+
+    def _on_files_loaded(self, files: list) -> None:
+        self._model.append_files(files)
+        self._render_header()
+
+    def _on_load_finished(self) -> None:
+        self._load_thread = None
+        self._render_header()
+
+    def _on_load_failed(self, message: str) -> None:
+        self._load_thread = None
+        self._show_error(f"Error generating diff: {message}")
+
+    def _render_header(self) -> None:
+        """Show the header: stats and changed files so far, or the empty message."""
+        parts = list(self._header_parts or [])
+        files = self._model.files
+        if files or self.is_loading:
+            colors = DIFF_COLORS["dark" if self._theme == "dark" else "light"]
+            stats = diff_totals(files)
+            parts.append('<div class="diff-stats">')
+            parts.append(f"{stats['files_changed']} file(s) changed, ")
+            parts.append(
+                f'<span style="color: {colors["add"]};">{stats["insertions"]} insertion(s)(+)</span>, '
+            )
+            parts.append(
+                f'<span style="color: {colors["del"]};">{stats["deletions"]} deletion(s)(-)</span>'
+            )
+            if self.is_loading:
+                parts.append(" (loading...)")
+            parts.append("</div>")
+            parts.append(self._file_list_html(colors))
+            self._view.show()
+        else:
+            parts.append(f'<div class="info-message">{html.escape(self._empty_message)}</div>')
+            self._view.hide()
+        self._browser.setHtml(_wrap_html("\n".join(parts), self._theme))
+
+    def _file_list_html(self, colors: dict[str, str]) -> str:
+        """Changed files, each linking to its section in the diff lines."""
+        named = [(i, f) for i, f in enumerate(self._model.files) if f.path]
+        items = []
+        for i, f in named[:_MAX_LISTED_FILES]:
+            if f.binary:
+                counts = "binary"
+            else:
+                counts = (
+                    f'<span style="color: {colors["add"]};">+{f.insertions}</span> '
+                    f'<span style="color: {colors["del"]};">-{f.deletions}</span>'
+                )
+            items.append(f'<a href="diff-file:{i}">{html.escape(f.path)}</a> {counts}')
+        if len(named) > _MAX_LISTED_FILES:
+            items.append(f"... and {len(named) - _MAX_LISTED_FILES} more file(s)")
+        return '<div class="diff-files">' + "<br>".join(items) + "</div>"
+
+    def _on_anchor_clicked(self, url: QUrl) -> None:
+        """Jump to (and unfold) the file a header link points at."""
+        if url.scheme() != "diff-file":
+            return
+        try:
+            file_index = int(url.path())
+        except ValueError:
+            return
+        if not 0 <= file_index < len(self._model.files):
+            return
+        self._model.set_expanded(file_index, True)
+        index = self._model.index(self._model.file_row(file_index))
+        self._view.setCurrentIndex(index)
+        self._view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtTop)
 
     def _show_error(self, message: str) -> None:
         """Show an error message in the browser."""
-        html_content = f'<div class="error-message"><strong>Error:</strong> {html.escape(message)}</div>'
-        full_html = _wrap_html(html_content, self._theme)
-        self._browser.setHtml(full_html)
+        self._show_message("error", message)
 
     def _show_info(self, message: str) -> None:
         """Show an info message in the browser."""
-        html_content = f'<div class="info-message">{html.escape(message)}</div>'
-        full_html = _wrap_html(html_content, self._theme)
-        self._browser.setHtml(full_html)
+        self._show_message("info", message)
+
+    def _show_message(self, kind: str, message: str) -> None:
+        """Show a message instead of a diff."""
+        self._stop_load()
+        self._model.clear()
+        self._diff_key = None
+        self._header_parts = None
+        self._message = (kind, message)
+        self._view.hide()
+        if kind == "error":
+            html_content = f'<div class="error-message"><strong>Error:</strong> {html.escape(message)}</div>'
+        else:
+            html_content = f'<div class="info-message">{html.escape(message)}</div>'
+        self._browser.setHtml(_wrap_html(html_content, self._theme))
 
     def set_diff_content(self, diff_text: str, title: str = "Diff") -> None:
         """Set raw diff content for display (for testing)."""
@@ -743,31 +825,61 @@ class DiffViewWidget(QWidget):
         self._last_diff_text = diff_text
         self._last_diff_title = title
 
-        html_parts = []
-        html_parts.append(f"<h2>{html.escape(title)}</h2>")
-        if diff_text:
-            html_parts.append(format_diff_html(diff_text, self._theme))
-        else:
-            html_parts.append('<div class="info-message">No changes to display.</div>')
-
-        full_html = _wrap_html('\n'.join(html_parts), self._theme)
-        self._browser.setHtml(full_html)
+        self._stop_load()
+        self._diff_key = None
+        self._folds_key = None
+        self._message = None
+        self._model.forget_folds()
+        self._model.set_files(parse_diff(diff_text))
+        self._header_parts = [f"<h2>{html.escape(title)}</h2>"]
+        self._empty_message = "No changes to display."
+        self._render_header()
 
     def update_theme(self, theme: str) -> None:
         """Update the widget theme."""
         self._theme = theme
-        # Re-display current diff with new theme
-        if self._context:
-            self._display_diff()
-        elif hasattr(self, '_last_diff_text'):
-            # Re-display raw diff content with new theme
+        self._model.set_theme(theme)
+        # Re-display the current header or message with the new theme
+        if self._header_parts is not None:
+            self._render_header()
+        elif self._message is not None:
+            self._show_message(*self._message)
+        else:
             self.set_diff_content(self._last_diff_text, self._last_diff_title)
 
     def refresh(self) -> None:
-        """Refresh the diff view (reload context and redisplay)."""
-        if self._run_id and self._state_manager:
-            self._load_context()
-            self._display_diff()
+        """Refresh the diff view (reload context and redisplay).
+
+        Step diffs can only change when a step commit is added, so while the
+        run's ``step_commits`` are unchanged this just re-checks the branch
+        head for the "All Changes" view.
+        """
+        if not (self._run_id and self._state_manager):
+            return
+        if self._context is not None and self._header_parts is not None:
+            context = self._read_context()
+            if (
+                context is not None
+                and context.run_id == self._context.run_id
+                and context.pre_run_sha == self._pre_run_sha
+                and context.step_commits == self._context.step_commits
+            ):
+                self._context = context
+                if self._step_name is None:
+                    self._display_branch_diff()
+                return
+        self._load_context()
+        self._display_diff()
+
+    def _read_context(self) -> PipelineContext | None:
+        """The run's current context from the state DB, or None if unavailable."""
+        try:
+            record = self._state_manager.get_run(self._run_id)  # type: ignore[union-attr]
+            if record is None or not record.context_json:
+                return None
+            return PipelineContext.model_validate_json(record.context_json)
+        except Exception:
+            return None
 
     def update_diff(self) -> None:
         """Alias for refresh() for compatibility."""
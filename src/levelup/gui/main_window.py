@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from PyQt6.QtCore import QThread, QTimer, Qt
-from PyQt6.QtGui import QAction, QColor, QShortcut, QKeySequence
+from PyQt6.QtGui import QAction, QShortcut, QKeySequence
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -20,8 +20,7 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QStackedWidget,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QHBoxLayout,
     QWidget,
@@ -32,11 +31,14 @@ from levelup.config.settings import HotkeySettings
 from levelup.config.loader import load_settings, save_settings
 from levelup.gui.checkpoint_dialog import CheckpointDialog
 from levelup.gui.completed_tickets_widget import CompletedTicketsWidget
+from levelup.gui.dashboard_data import DashboardDelta, DashboardRefreshThread
+from levelup.gui.diff_cache import DEFAULT_DIFF_CACHE_DIR, get_diff_cache
 from levelup.gui.diff_view_widget import DiffViewWidget
 from levelup.gui.docs_widget import DocsWidget
 from levelup.gui.hotkey_settings_dialog import HotkeySettingsDialog
 from levelup.gui.keyboard_shortcuts_help import KeyboardShortcutsHelp
-from levelup.gui.resources import STATUS_COLORS, STATUS_LABELS, get_status_color, status_display
+from levelup.gui.resources import STATUS_COLORS, STATUS_LABELS
+from levelup.gui.run_table_model import RunTableModel
 from levelup.gui.ticket_detail import TicketDetailWidget
 from levelup.gui.ticket_sidebar import TicketSidebarWidget
 from levelup.gui.theme_manager import get_current_theme, apply_theme, set_theme_preference, get_theme_preference
@@ -44,7 +46,6 @@ from levelup.state.manager import StateManager
 from levelup.state.models import RunRecord
 
 REFRESH_INTERVAL_MS = 2000
-COLUMNS = ["Run ID", "Task", "Project", "Status", "Tokens", "Step", "Started"]
 
 JIRA_IMPORT_JQL = "assignee = currentUser() AND statusCategory != Done"
 
@@ -175,6 +176,7 @@ class MainWindow(QMainWindow):
         self._cached_tickets: list = []
         self._shortcuts: list[QShortcut] = []
         self._jira_import_thread: _JiraImportThread | None = None
+        self._refresh_thread: DashboardRefreshThread | None = None
 
         # Load settings including hotkeys
         self._hotkey_settings = HotkeySettings()
@@ -183,6 +185,8 @@ class MainWindow(QMainWindow):
                 settings = load_settings(project_path=project_path)
                 self._tickets_file = settings.project.tickets_file
                 self._hotkey_settings = settings.gui.hotkeys
+                if settings.gui.diff_cache:
+                    get_diff_cache().set_cache_dir(DEFAULT_DIFF_CACHE_DIR)
             except Exception:
                 pass
 
@@ -300,9 +304,9 @@ class MainWindow(QMainWindow):
         self._stack = QStackedWidget()
 
         # Page 0: runs table
-        self._table = QTableWidget()
-        self._table.setColumnCount(len(COLUMNS))
-        self._table.setHorizontalHeaderLabels(COLUMNS)
+        self._run_model = RunTableModel(theme=self._current_theme, parent=self)
+        self._table = QTableView()
+        self._table.setModel(self._run_model)
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self._table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -433,18 +437,61 @@ class MainWindow(QMainWindow):
 
     def _start_refresh_timer(self) -> None:
         self._timer = QTimer(self)
-        self._timer.timeout.connect(self._refresh)
+        self._timer.timeout.connect(self._request_refresh)
         self._timer.start(REFRESH_INTERVAL_MS)
 
+    def _request_refresh(self) -> None:
+        """Periodic refresh: the DB is polled on a background thread.
+
+        Only what changed comes back, through ``_on_dashboard_delta``.
+        """
+        if self._refresh_thread is None or self._refresh_thread.isFinished():
+            # A thread that could not open the DB has exited; start a new one
+            if self._refresh_thread is not None:
+                self._refresh_thread.deleteLater()
+            self._refresh_thread = DashboardRefreshThread(self._db_path, parent=self)
+            self._refresh_thread.delta_ready.connect(self._on_dashboard_delta)
+            self._refresh_thread.poll_failed.connect(self._on_refresh_failed)
+            self._refresh_thread.start()
+        self._refresh_thread.request(self._project_path)
+        self._refresh_diff_view()
+
+    def _on_refresh_failed(self, message: str) -> None:
+        self._status_bar.showMessage(f"Refresh failed: {message}")
+
     def _refresh(self) -> None:
-        """Reload runs from DB and update the table + ticket list."""
+        """Reload runs from DB and update the table + ticket list right away.
+
+        Runs on the GUI thread; used after user actions that change the DB.
+        """
         self._state_manager.mark_dead_runs()
         self._runs = self._state_manager.list_runs()
         self._update_table()
         self._refresh_tickets()
         self._update_status_bar()
         self._check_gui_run_checkpoints()
+        self._refresh_diff_view()
+
+    def _on_dashboard_delta(self, delta: DashboardDelta) -> None:
+        """Apply the changes the background refresh found since its previous poll."""
+        if delta.project_path != self._project_path:
+            return  # polled before a project switch
+        if delta.runs is not None:
+            self._runs = list(delta.runs)
+            self._update_table()
+        if (delta.runs is not None or delta.tickets is not None) and self._project_path:
+            if self._detail.is_dirty:
+                # Keep the user's edits; have the next poll send the tickets again
+                if self._refresh_thread is not None:
+                    self._refresh_thread.invalidate()
+            else:
+                tickets = self._cached_tickets if delta.tickets is None else list(delta.tickets)
+                self._show_tickets(tickets)
+        if delta.runs is not None or delta.tickets is not None:
+            self._update_status_bar()
+        self._check_gui_run_checkpoints(list(delta.pending_checkpoints))
 
+    def _refresh_diff_view(self) -> None:
         # Refresh diff view if it's currently displayed and viewing an active run
         if self._stack.currentIndex() == 4:
             if hasattr(self._diff_view, '_run_id') and self._diff_view._run_id:
@@ -465,7 +512,10 @@ class MainWindow(QMainWindow):
         from levelup.core.tickets import read_tickets
 
         tickets = read_tickets(self._project_path, db_path=Path(self._db_path))
+        self._show_tickets(tickets)
 
+    def _show_tickets(self, tickets: list) -> None:
+        """Show *tickets* in the sidebar, colored by the status of their active runs."""
         # Create run status mapping for active runs
         run_status_map: dict[int, str] = {}
         for run in self._runs:
@@ -487,29 +537,8 @@ class MainWindow(QMainWindow):
         else:
             self._visible_runs = list(self._runs)
 
-        self._table.setRowCount(len(self._visible_runs))
-
-        for row, run in enumerate(self._visible_runs):
-            self._table.setItem(row, 0, QTableWidgetItem(run.run_id[:12]))
-            self._table.setItem(row, 1, QTableWidgetItem(run.task_title))
-            self._table.setItem(row, 2, QTableWidgetItem(run.project_path))
-
-            # Status cell with color
-            status_item = QTableWidgetItem(status_display(run.status))
-            color = get_status_color(run.status, theme=self._current_theme)
-            status_item.setForeground(QColor(color))
-            self._table.setItem(row, 3, status_item)
-
-            # Tokens cell - format as "total (in / out)" or "N/A" if no tokens
-            total_tokens = run.input_tokens + run.output_tokens
-            if total_tokens > 0:
-                tokens_text = f"{total_tokens:,} ({run.input_tokens:,} / {run.output_tokens:,})"
-            else:
-                tokens_text = "N/A"
-            self._table.setItem(row, 4, QTableWidgetItem(tokens_text))
-
-            self._table.setItem(row, 5, QTableWidgetItem(run.current_step or ""))
-            self._table.setItem(row, 6, QTableWidgetItem(run.started_at[:19]))
+        # Only rows that were added, removed, moved or updated are signalled
+        self._run_model.set_runs(self._visible_runs)
 
     def _update_status_bar(self) -> None:
         active = sum(1 for r in self._runs if r.status in ("running", "pending"))
@@ -577,8 +606,8 @@ class MainWindow(QMainWindow):
             self._completed.update_theme(actual_theme)
             self._diff_view.update_theme(actual_theme)
 
-            # Re-render the runs table with correct status colors
-            self._update_table()
+            # Re-color the runs table's status column
+            self._run_model.set_theme(self._current_theme)
         except Exception:
             # Handle errors gracefully - theme may fail to save or apply
             # but we shouldn't crash the app
@@ -786,12 +815,16 @@ class MainWindow(QMainWindow):
             # Process finished — remove all PIDs that are no longer alive
             self._active_run_pids.discard(pid)
 
-    def _check_gui_run_checkpoints(self) -> None:
-        """Auto-open checkpoint dialogs for GUI-spawned runs."""
+    def _check_gui_run_checkpoints(self, pending: list | None = None) -> None:
+        """Auto-open checkpoint dialogs for GUI-spawned runs.
+
+        *pending* comes from the background refresh; None queries the DB.
+        """
         if not self._active_run_pids or self._checkpoint_dialog_open:
             return
 
-        pending = self._state_manager.get_pending_checkpoints()
+        if pending is None:
+            pending = self._state_manager.get_pending_checkpoints()
         for cp in pending:
             # Find the matching run to check its PID
             for run in self._runs:
@@ -940,6 +973,9 @@ class MainWindow(QMainWindow):
         """Clean up all PTY shells and background threads before closing."""
         if self._jira_import_thread is not None and self._jira_import_thread.isRunning():
             self._jira_import_thread.wait(3000)
+        if self._refresh_thread is not None:
+            self._refresh_thread.stop()
+        self._diff_view.stop_loading()
         self._detail.cleanup_all_terminals()
         super().closeEvent(event)  # type: ignore[arg-type]
 
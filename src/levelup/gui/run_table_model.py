@@ -0,0 +1,155 @@
+"""Table model for the dashboard's runs table.
+
+``RunTableModel.set_runs()`` diffs the new run list against the rows it
+already holds, keyed by ``run_id``, and emits row-level insert/remove/move
+signals plus ``dataChanged`` only for runs whose ``updated_at`` changed.
+A refresh where nothing changed emits nothing, so the view keeps its
+selection and scroll position and does no relayout.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+from PyQt6.QtGui import QColor
+
+from levelup.gui.resources import get_status_color, status_display
+from levelup.state.models import RunRecord
+
+COLUMNS = ["Run ID", "Task", "Project", "Status", "Tokens", "Step", "Started"]
+STATUS_COLUMN = COLUMNS.index("Status")
+
+
+def format_tokens(run: RunRecord) -> str:
+    """``"total (in / out)"``, or ``"N/A"`` before any tokens were used."""
+    total_tokens = run.input_tokens + run.output_tokens
+    if total_tokens > 0:
+        return f"{total_tokens:,} ({run.input_tokens:,} / {run.output_tokens:,})"
+    return "N/A"
+
+
+class RunTableModel(QAbstractTableModel):
+    """Runs, one per row, in the order last passed to ``set_runs()``."""
+
+    def __init__(self, theme: str = "dark", parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._runs: list[RunRecord] = []
+        self._rows: dict[str, int] = {}  # run_id -> row
+        self._theme = theme
+
+    # -- Public API ---------------------------------------------------------
+
+    def run_at(self, row: int) -> RunRecord | None:
+        if 0 <= row < len(self._runs):
+            return self._runs[row]
+        return None
+
+    def row_of(self, run_id: str) -> int | None:
+        return self._rows.get(run_id)
+
+    def set_runs(self, runs: list[RunRecord]) -> None:
+        """Make the model show *runs*, signalling only the rows that differ."""
+        if not self._runs or not runs:
+            if self._runs or runs:
+                self.beginResetModel()
+                self._runs = list(runs)
+                self._reindex()
+                self.endResetModel()
+            return
+
+        wanted = {run.run_id for run in runs}
+        # Drop runs that are gone, bottom-up so earlier row numbers stay valid
+        for row in range(len(self._runs) - 1, -1, -1):
+            if self._runs[row].run_id not in wanted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._runs[row]
+                self.endRemoveRows()
+        self._reindex()
+
+        # Rows above *row* already match *runs*: move/insert/update this one
+        last_column = len(COLUMNS) - 1
+        for row, run in enumerate(runs):
+            current = self._rows.get(run.run_id)
+            if current is None:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._runs.insert(row, run)
+                self.endInsertRows()
+                self._reindex(row)
+                continue
+            if current != row:
+                # current > row: everything above row is already in place
+                self.beginMoveRows(QModelIndex(), current, current, QModelIndex(), row)
+                self._runs.insert(row, self._runs.pop(current))
+                self.endMoveRows()
+                self._reindex(row)
+            if self._runs[row].updated_at != run.updated_at:
+                self._runs[row] = run
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+    def set_theme(self, theme: str) -> None:
+        """Recolor the status column for *theme*."""
+        if theme == self._theme:
+            return
+        self._theme = theme
+        if self._runs:
+            self.dataChanged.emit(
+                self.index(0, STATUS_COLUMN),
+                self.index(len(self._runs) - 1, STATUS_COLUMN),
+                [Qt.ItemDataRole.ForegroundRole],
+            )
+
+    # -- QAbstractTableModel ------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._runs)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._runs):
+            return None
+        run = self._runs[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(run, column)
+        if role == Qt.ItemDataRole.ForegroundRole and column == STATUS_COLUMN:
+            return QColor(get_status_color(run.status, theme=self._theme))
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section] if 0 <= section < len(COLUMNS) else None
+        return str(section + 1)
+
+    # -- Internal -----------------------------------------------------------
+
+    def _reindex(self, start: int = 0) -> None:
+        if start == 0:
+            self._rows = {}
+        for row in range(start, len(self._runs)):
+            self._rows[self._runs[row].run_id] = row
+
+    @staticmethod
+    def _display(run: RunRecord, column: int) -> str:
+        if column == 0:
+            return run.run_id[:12]
+        if column == 1:
+            return run.task_title
+        if column == 2:
+            return run.project_path
+        if column == 3:
+            return status_display(run.status)
+        if column == 4:
+            return format_tokens(run)
+        if column == 5:
+            return run.current_step or ""
+        return run.started_at[:19]
@@ -30,6 +30,9 @@ from levelup.gui.terminal_emulator import (
     CatppuccinMochaColors,
     LightTerminalColors,
 )
+from levelup.gui.terminal_log import TerminalLog, terminal_log_path
+from levelup.gui.terminal_search import TerminalSearchBar
+from levelup.gui.terminal_state import DEFAULT_HISTORY_LINES
 
 logger = logging.getLogger(__name__)
 
@@ -94,7 +97,12 @@ class RunTerminalWidget(QWidget):
     run_paused = pyqtSignal()       # emitted when pause is confirmed via DB
     merge_finished = pyqtSignal()   # emitted when merge operation completes successfully
 
-    def __init__(self, parent: QWidget | None = None, theme: str = "dark") -> None:
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        theme: str = "dark",
+        history: int = DEFAULT_HISTORY_LINES,
+    ) -> None:
         super().__init__(parent)
         self._command_running = False
         self._shell_started = False
@@ -176,8 +184,13 @@ class RunTerminalWidget(QWidget):
         normalized_theme = (theme or "dark").strip().lower()
         color_scheme = LightTerminalColors if normalized_theme == "light" else CatppuccinMochaColors
 
-        self._terminal = TerminalEmulatorWidget(color_scheme=color_scheme)
+        self._terminal = TerminalEmulatorWidget(color_scheme=color_scheme, history=history)
         self._terminal.shell_exited.connect(self._on_shell_exited)
+
+        # Ctrl+F search over the on-disk terminal log
+        self._search_bar = TerminalSearchBar(self._terminal)
+        self._terminal.search_requested.connect(self._search_bar.open_bar)
+        layout.addWidget(self._search_bar)
         layout.addWidget(self._terminal)
 
         # Pending run parameters (set via set_context / start_run)
@@ -304,9 +317,21 @@ class RunTerminalWidget(QWidget):
         if self._shell_started:
             return
         cwd = self._project_path
+        if self._terminal.log is None and self._project_path:
+            self._terminal.set_log(self._open_log())
         self._terminal.start_shell(cwd=cwd)
         self._shell_started = True
 
+    def _open_log(self) -> TerminalLog | None:
+        """Open the on-disk log for this ticket's terminal, appending to earlier sessions."""
+        assert self._project_path is not None
+        path = terminal_log_path(self._project_path, self._ticket_number)
+        try:
+            return TerminalLog(path)
+        except OSError:
+            logger.warning("Could not open terminal log %s", path, exc_info=True)
+            return None
+
     def _set_running_state(self, running: bool) -> None:
         self._command_running = running
         # Only enable run button if not running AND no resumable run exists
@@ -7,7 +7,7 @@ QMainWindow, QDialog {
     background-color: #1E1E2E;
     color: #CDD6F4;
 }
-QTableWidget {
+QTableWidget, QTableView {
     background-color: #181825;
     color: #CDD6F4;
     gridline-color: #313244;
@@ -15,7 +15,7 @@ QTableWidget {
     selection-background-color: #45475A;
     selection-color: #CDD6F4;
 }
-QTableWidget::item {
+QTableWidget::item, QTableView::item {
     padding: 6px;
 }
 QHeaderView::section {
@@ -331,6 +331,12 @@ QTextBrowser#docsBrowser {
     font-family: -apple-system, "Segoe UI", sans-serif;
     font-size: 14px;
 }
+QListView#diffLines {
+    background-color: #181825;
+    color: #BAC2DE;
+    border: 1px solid #313244;
+    selection-background-color: #45475A;
+}
 QComboBox#projectSelector {
     min-width: 250px;
 }
@@ -377,7 +383,7 @@ QMainWindow, QDialog {
     background-color: #F5F5F5;
     color: #2E3440;
 }
-QTableWidget {
+QTableWidget, QTableView {
     background-color: #FFFFFF;
     color: #2E3440;
     gridline-color: #D8DEE9;
@@ -385,7 +391,7 @@ QTableWidget {
     selection-background-color: #88C0D0;
     selection-color: #2E3440;
 }
-QTableWidget::item {
+QTableWidget::item, QTableView::item {
     padding: 6px;
 }
 QHeaderView::section {
@@ -701,6 +707,12 @@ QTextBrowser#docsBrowser {
     font-family: -apple-system, "Segoe UI", sans-serif;
     font-size: 14px;
 }
+QListView#diffLines {
+    background-color: #FFFFFF;
+    color: #2E3440;
+    border: 1px solid #D8DEE9;
+    selection-background-color: #88C0D0;
+}
 QComboBox#projectSelector {
     min-width: 250px;
 }
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from typing import TYPE_CHECKING
 
-import pyte
+from pyte.screens import Char
 from PyQt6.QtCore import QObject, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QClipboard, QColor, QFont, QFontMetricsF, QKeyEvent, QPainter, QPen
 from PyQt6.QtWidgets import QApplication, QScrollBar, QVBoxLayout, QWidget
 
+from levelup.gui.terminal_state import DEFAULT_HISTORY_LINES, ScreenSnapshot, TerminalState
+
 if TYPE_CHECKING:
-    from PyQt6.QtGui import QPaintEvent, QResizeEvent, QMouseEvent, QWheelEvent
+    from PyQt6.QtGui import QPaintEvent, QResizeEvent, QMouseEvent, QShowEvent, QWheelEvent
+
+    from levelup.gui.terminal_log import TerminalLog
 
 
 # ---------------------------------------------------------------------------
@@ -216,16 +221,22 @@ def qt_key_to_bytes(event: QKeyEvent) -> bytes | None:
 # ---------------------------------------------------------------------------
 
 class _PtyReaderThread(QThread):
-    """Blocking reader for PTY output, running in a separate thread."""
+    """Blocking reader for PTY output, running in a separate thread.
+
+    Each read is parsed straight into the ``TerminalState`` on this thread.
+    ``data_ready`` is only emitted for the first read after the GUI took a
+    snapshot, so a burst of thousands of reads queues one signal.
+    """
 
-    data_received = pyqtSignal(bytes)
+    data_ready = pyqtSignal()
     finished_signal = pyqtSignal()
 
-    def __init__(self, parent: QObject | None = None) -> None:
+    def __init__(self, state: TerminalState, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._pty: object = None
         self._running = False
         self._is_windows = sys.platform == "win32"
+        self._state = state
 
     def set_pty(self, pty: object) -> None:
         self._pty = pty
@@ -246,18 +257,17 @@ class _PtyReaderThread(QThread):
     def stop(self) -> None:
         self._running = False
 
+    def _push(self, data: bytes | str) -> None:
+        if self._state.feed_pty(data):
+            self.data_ready.emit()
+
     def _read_windows(self) -> None:
         """Read from pywinpty PTY (returns str)."""
-        import time
-
         while self._running:
             try:
                 data = self._pty.read(blocking=False)  # type: ignore[union-attr]
                 if data:
-                    if isinstance(data, str):
-                        self.data_received.emit(data.encode("utf-8"))
-                    else:
-                        self.data_received.emit(data)
+                    self._push(data)
                 else:
                     time.sleep(0.01)  # 10ms poll interval when no data
             except Exception:
@@ -269,12 +279,9 @@ class _PtyReaderThread(QThread):
         """Read from ptyprocess PTY (returns bytes)."""
         while self._running:
             try:
-                data = self._pty.read(4096)  # type: ignore[union-attr]
+                data = self._pty.read(65536)  # type: ignore[union-attr]
                 if data:
-                    if isinstance(data, str):
-                        self.data_received.emit(data.encode("utf-8"))
-                    else:
-                        self.data_received.emit(data)
+                    self._push(data)
                 elif data == b"":
                     break
             except EOFError:
@@ -285,13 +292,14 @@ class _PtyReaderThread(QThread):
 
 
 class PtyBackend(QObject):
-    """Cross-platform pseudo-terminal backend."""
+    """Cross-platform pseudo-terminal backend whose output is parsed into *state*."""
 
-    data_received = pyqtSignal(bytes)
+    data_ready = pyqtSignal()
     process_exited = pyqtSignal(int)
 
-    def __init__(self, parent: QObject | None = None) -> None:
+    def __init__(self, state: TerminalState, parent: QObject | None = None) -> None:
         super().__init__(parent)
+        self._state = state
         self._pty: object = None
         self._reader: _PtyReaderThread | None = None
         self._is_windows = sys.platform == "win32"
@@ -309,9 +317,9 @@ class PtyBackend(QObject):
         else:
             self._start_unix(cols, rows, cwd, spawn_env)
 
-        self._reader = _PtyReaderThread(self)
+        self._reader = _PtyReaderThread(self._state, self)
         self._reader.set_pty(self._pty)
-        self._reader.data_received.connect(self.data_received)
+        self._reader.data_ready.connect(self.data_ready)
         self._reader.finished_signal.connect(self._on_reader_done)
         self._reader.start()
 
@@ -402,16 +410,23 @@ class PtyBackend(QObject):
 # Terminal emulator widget
 # ---------------------------------------------------------------------------
 
+# Visible terminals take at most one screen snapshot (and one repaint) per
+# frame (~60 fps), however fast the reader thread parses output.
+FRAME_INTERVAL_MS = 16
+
+
 class TerminalEmulatorWidget(QWidget):
     """Full VT100 terminal emulator using pyte for screen state and QPainter for rendering."""
 
     shell_started = pyqtSignal()
     shell_exited = pyqtSignal(int)
+    search_requested = pyqtSignal()  # Ctrl+F, only while a log is attached
 
     def __init__(
         self,
         parent: QWidget | None = None,
-        color_scheme: type[CatppuccinMochaColors] | type[LightTerminalColors] = CatppuccinMochaColors
+        color_scheme: type[CatppuccinMochaColors] | type[LightTerminalColors] = CatppuccinMochaColors,
+        history: int = DEFAULT_HISTORY_LINES,
     ) -> None:
         super().__init__(parent)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -423,6 +438,7 @@ class TerminalEmulatorWidget(QWidget):
         # Font setup
         self._font = QFont("Consolas", 13)
         self._font.setStyleHint(QFont.StyleHint.Monospace)
+        self._font.setKerning(False)  # runs of cells are drawn as one string
         fm = QFontMetricsF(self._font)
         self._cell_width = fm.horizontalAdvance("M")
         self._cell_height = fm.height()
@@ -432,16 +448,25 @@ class TerminalEmulatorWidget(QWidget):
         self._cols = 80
         self._rows = 24
 
-        # pyte terminal state
-        self._screen = pyte.HistoryScreen(self._cols, self._rows, history=10000)
-        self._stream = pyte.Stream(self._screen)
+        # pyte terminal state, fed on the PTY reader thread.  The widget paints
+        # from _snapshot; direct _screen reads must hold _state.lock.
+        self._state = TerminalState(self._cols, self._rows, history=history)
+        self._screen = self._state.screen
+        self._stream = self._state.stream
+        self._snapshot: ScreenSnapshot = self._state.snapshot()
 
         # PTY backend
-        self._pty = PtyBackend(self)
-        self._pty.data_received.connect(self._on_pty_data)
+        self._pty = PtyBackend(self._state, self)
+        self._pty.data_ready.connect(self._on_pty_ready)
         self._pty.process_exited.connect(self._on_pty_exited)
         self._shell_running = False
 
+        # Frame pacing for PTY output (see FRAME_INTERVAL_MS)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._take_snapshot)
+        self._last_flush = 0.0
+
         # Cursor blink timer
         self._cursor_visible = True
         self._cursor_timer = QTimer(self)
@@ -460,10 +485,14 @@ class TerminalEmulatorWidget(QWidget):
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
 
-        # Dirty tracking
+        # Dirty tracking: screen rows waiting to be repainted
         self._dirty_lines: set[int] = set()
         self._full_repaint = True
 
+        # (fg, bg, bold, reverse, selected) -> resolved (fg, bg) for _color_scheme
+        self._style_cache: dict[tuple[str, str, bool, bool, bool], tuple[QColor, QColor]] = {}
+        self._style_scheme: type[CatppuccinMochaColors] | type[LightTerminalColors] | None = None
+
     # -- Public API ---------------------------------------------------------
 
     def start_shell(self, cwd: str | None = None, env: dict[str, str] | None = None) -> None:
@@ -492,19 +521,79 @@ class TerminalEmulatorWidget(QWidget):
             self.send_command(cmd)
 
     def close_shell(self) -> None:
-        """Shut down the shell and PTY."""
+        """Shut down the shell and PTY (and close the attached log)."""
         self._shell_running = False
         self._pty.close()
+        log, self._state.log = self._state.log, None
+        if log is not None:
+            log.close()
 
     @property
     def is_shell_running(self) -> bool:
         return self._shell_running
 
+    @property
+    def log(self) -> TerminalLog | None:
+        return self._state.log
+
+    def set_log(self, log: TerminalLog | None) -> None:
+        """Tee all further output to *log* (written on the PTY reader thread)."""
+        self._state.log = log
+
+    def reveal_line(
+        self, text: str, rows_from_bottom: int = 0, column: int = 0, length: int = 0
+    ) -> bool:
+        """Scroll to the row showing log line *text* and select ``column..+length``.
+
+        Identical rows are disambiguated by picking the one closest to
+        *rows_from_bottom*.  Returns False if no row in the scrollback or on
+        screen shows *text* (e.g. it scrolled out of the history).
+        """
+        needle = text.expandtabs()[: self._cols].rstrip()
+        if not needle:
+            return False
+        best: tuple[int, int] | None = None  # (distance, row index over history + screen)
+        with self._state.lock:
+            screen = self._screen
+            history = screen.history.top
+            history_len = len(history)
+            total = history_len + screen.lines
+            for index in range(total):
+                if index < history_len:
+                    row_text = history.text(index)
+                else:
+                    line = screen.buffer.get(index - history_len)
+                    if line is None:
+                        continue
+                    row_text = "".join(line[col].data for col in range(screen.columns))
+                if row_text.rstrip() != needle:
+                    continue
+                distance = abs(total - 1 - index - rows_from_bottom)
+                if best is None or distance < best[0]:
+                    best = (distance, index)
+        if best is None:
+            return False
+
+        index = best[1]
+        if index >= history_len:
+            self._scroll_offset = 0
+        else:
+            self._scroll_offset = min(history_len, history_len - index + self._rows // 2)
+        row = index - history_len + self._scroll_offset
+        start = min(column, self._cols - 1)
+        end = min(column + max(length, 1) - 1, self._cols - 1)
+        self._selection_start = (start, row)
+        self._selection_end = (end, row)
+        self._full_repaint = True
+        self.update()
+        return True
+
     def set_color_scheme(
         self, color_scheme: type[CatppuccinMochaColors] | type[LightTerminalColors]
     ) -> None:
         """Change the color scheme and trigger a repaint."""
         self._color_scheme = color_scheme
+        self._style_cache.clear()
         self._full_repaint = True
         self.update()
 
@@ -515,87 +604,60 @@ class TerminalEmulatorWidget(QWidget):
         painter.setFont(self._font)
 
         colors = self._color_scheme
+        if self._style_scheme is not colors:
+            self._style_cache.clear()
+            self._style_scheme = colors
         cw = self._cell_width
         ch = self._cell_height
         ascent = self._font_ascent
 
-        # Fill background
-        painter.fillRect(self.rect(), colors.BG)
-
-        screen = self._screen
+        # Only the exposed cells: _take_snapshot schedules just the changed rows
+        # and the cursor blink a single cell (WA_OpaquePaintEvent keeps the rest)
+        rect = event.rect()
+        painter.fillRect(rect, colors.BG)
+        first_row = max(0, int(rect.top() / ch))
+        last_row = min(self._rows - 1, int(rect.bottom() / ch))
+        first_col = max(0, int(rect.left() / cw))
+        last_col = min(self._cols - 1, int(rect.right() / cw))
+
+        snap = self._snapshot
+        if self._scroll_offset > 0:
+            # Scrollback view mixes history and buffer lines: read them under the lock
+            with self._state.lock:
+                lines = [self._display_line(row) for row in range(first_row, last_row + 1)]
+        else:
+            lines = list(snap.lines[first_row:last_row + 1])
 
         # Determine selection range in normalized form
         sel_start, sel_end = self._normalized_selection()
 
-        # Get history length for scrollback calculations
-        history_len = len(screen.history.top)
-        scroll_offset = self._scroll_offset
-
-        for row in range(self._rows):
+        pen: QColor | None = None
+        for row, line in enumerate(lines, start=first_row):
             y = row * ch
-
-            # Determine which line to display based on scroll offset
-            if scroll_offset > 0 and row < scroll_offset:
-                # Display from history
-                history_idx = history_len - scroll_offset + row
-                if 0 <= history_idx < history_len:
-                    line = screen.history.top[history_idx]
-                else:
-                    # Out of bounds - use empty line
-                    line = screen.buffer[0]  # Fallback to avoid errors
-            else:
-                # Display from current buffer
-                buffer_row = row - scroll_offset
-                if 0 <= buffer_row < len(screen.buffer):
-                    line = screen.buffer[buffer_row]
-                else:
-                    # Out of bounds - use last buffer line as fallback
-                    line = screen.buffer[-1]
-
-            for col in range(self._cols):
-                x = col * cw
-
-                char = line[col]
-                ch_data = char.data if char.data else " "
-                fg = colors.resolve(char.fg, is_fg=True) if char.fg else colors.FG
-                bg = colors.resolve(char.bg, is_fg=False) if char.bg else colors.BG
-
-                # Reverse video
-                if char.reverse:
-                    fg, bg = bg, fg
-
-                # Bold brightens fg
-                if char.bold and fg == colors.FG:
-                    fg = colors.BOLD
-
-                # Selection highlight
-                if sel_start is not None and sel_end is not None:
-                    if self._cell_in_selection(col, row, sel_start, sel_end):
-                        bg = colors.SELECTION
-                        fg = colors.FG
-
-                # Draw cell background
+            runs = self._line_runs(line, row, first_col, last_col, sel_start, sel_end)
+            for start, text, fg, bg in runs:
+                x = int(start * cw)
                 if bg != colors.BG:
-                    painter.fillRect(int(x), int(y), int(cw) + 1, int(ch) + 1, bg)
-
-                # Draw character
-                if ch_data != " ":
-                    painter.setPen(QPen(fg))
-                    painter.drawText(int(x), int(y + ascent), ch_data)
+                    width = int((start + len(text)) * cw) - x
+                    painter.fillRect(x, int(y), width + 1, int(ch) + 1, bg)
+                text = text.rstrip(" ")
+                if text:
+                    if fg != pen:
+                        painter.setPen(fg)
+                        pen = fg
+                    painter.drawText(x, int(y + ascent), text)
 
         # Draw cursor
         if self._cursor_visible and self._scroll_offset == 0:
-            cx = screen.cursor.x
-            cy = screen.cursor.y
-            if 0 <= cx < self._cols and 0 <= cy < self._rows:
+            cx, cy = snap.cursor
+            if 0 <= cx < snap.cols and 0 <= cy < snap.rows:
                 painter.fillRect(
                     int(cx * cw), int(cy * ch),
                     int(cw), int(ch),
                     colors.CURSOR,
                 )
                 # Draw the character under cursor in bg color
-                line = screen.buffer[cy]
-                char = line[cx]
+                char = snap.lines[cy][cx]
                 ch_data = char.data if char.data else " "
                 if ch_data != " ":
                     painter.setPen(QPen(colors.BG))
@@ -605,6 +667,14 @@ class TerminalEmulatorWidget(QWidget):
         self._full_repaint = False
         self._dirty_lines.clear()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        # Hidden terminals skip snapshots (see _on_pty_ready); catch up now
+        if self._state.changed:
+            self._take_snapshot()
+        self._full_repaint = True
+        self.update()
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
         self._recalculate_grid()
@@ -632,6 +702,15 @@ class TerminalEmulatorWidget(QWidget):
             self._paste_clipboard()
             return
 
+        # Ctrl+F = search the log (without one, Ctrl+F still reaches the shell)
+        if (
+            mods == Qt.KeyboardModifier.ControlModifier
+            and event.key() == Qt.Key.Key_F
+            and self._state.log is not None
+        ):
+            self.search_requested.emit()
+            return
+
         data = qt_key_to_bytes(event)
         if data is not None:
             # Clear selection on typing
@@ -695,32 +774,68 @@ class TerminalEmulatorWidget(QWidget):
         if new_cols != self._cols or new_rows != self._rows:
             self._cols = new_cols
             self._rows = new_rows
-            self._screen.resize(self._rows, self._cols)
+            self._state.resize(self._cols, self._rows)
+            self._snapshot = self._state.snapshot()
             if self._shell_running:
                 self._pty.resize(self._cols, self._rows)
             self._full_repaint = True
             self.update()
 
-    def _on_pty_data(self, data: bytes) -> None:
-        """Feed PTY output into pyte and trigger repaint."""
-        try:
-            text = data.decode("utf-8", errors="replace")
-        except Exception:
-            text = data.decode("latin-1", errors="replace")
-        self._stream.feed(text)
-        self._full_repaint = True
-        self.update()
+    def _on_pty_ready(self) -> None:
+        """The reader parsed new output: take a snapshot on the next frame.
+
+        Hidden terminals (e.g. non-current pages of a QStackedWidget) do
+        nothing here; the reader keeps parsing, but emits no further signals
+        until ``showEvent`` takes a snapshot.
+        """
+        if self._frame_timer.isActive() or not self.isVisible():
+            return
+        elapsed_ms = (time.monotonic() - self._last_flush) * 1000
+        # Idle terminal (e.g. echoing a keystroke): snapshot right away
+        self._frame_timer.start(max(0, int(FRAME_INTERVAL_MS - elapsed_ms)))
+
+    def _take_snapshot(self) -> None:
+        """Swap in the latest screen snapshot and queue repaints for its dirty rows."""
+        self._last_flush = time.monotonic()
+        self._snapshot = self._state.snapshot()
+        self._dirty_lines.update(self._snapshot.dirty)
+        self._schedule_repaint()
+
+    def _schedule_repaint(self) -> None:
+        """Queue repaints for ``_dirty_lines`` (everything if ``_full_repaint``)."""
+        if self._scroll_offset > 0:
+            # Scrolled into history: every new line shifts the whole view
+            self._full_repaint = True
+        if self._full_repaint:
+            self.update()
+            return
+        # One update() per block of adjacent rows; Qt merges them into one paint
+        start = end = -1
+        for row in sorted(r for r in self._dirty_lines if 0 <= r < self._rows):
+            if row == end + 1 and start >= 0:
+                end = row
+                continue
+            if start >= 0:
+                self._update_rows(start, end)
+            start = end = row
+        if start >= 0:
+            self._update_rows(start, end)
+
+    def _update_rows(self, first: int, last: int) -> None:
+        ch = self._cell_height
+        self.update(0, int(first * ch), self.width(), int((last - first + 1) * ch) + 1)
 
     def _on_pty_exited(self, exit_code: int) -> None:
         self._shell_running = False
+        if self._state.log is not None:
+            self._state.log.flush()
         self.shell_exited.emit(exit_code)
 
     def _toggle_cursor(self) -> None:
         self._cursor_visible = not self._cursor_visible
         if self._scroll_offset == 0:
             # Only repaint cursor area
-            cx = self._screen.cursor.x
-            cy = self._screen.cursor.y
+            cx, cy = self._snapshot.cursor
             self.update(
                 int(cx * self._cell_width),
                 int(cy * self._cell_height),
@@ -728,6 +843,89 @@ class TerminalEmulatorWidget(QWidget):
                 int(self._cell_height) + 1,
             )
 
+    def _display_line(self, row: int) -> dict[int, Char]:
+        """The pyte line shown at screen *row*, accounting for the scroll offset."""
+        screen = self._screen
+        scroll_offset = self._scroll_offset
+        if scroll_offset > 0 and row < scroll_offset:
+            # Display from history
+            history_len = len(screen.history.top)
+            history_idx = history_len - scroll_offset + row
+            if 0 <= history_idx < history_len:
+                return screen.history.top[history_idx]
+            # Out of bounds - use first buffer line as fallback
+            return screen.buffer[0]
+        # Display from current buffer (a defaultdict: untouched rows are blank)
+        buffer_row = row - scroll_offset
+        if 0 <= buffer_row < screen.lines:
+            return screen.buffer[buffer_row]
+        # Out of bounds - use last buffer line as fallback
+        return screen.buffer[screen.lines - 1]
+
+    def _style_colors(self, key: tuple[str, str, bool, bool, bool]) -> tuple[QColor, QColor]:
+        """Resolve a cell style key to its (fg, bg) colors, cached per color scheme."""
+        cached = self._style_cache.get(key)
+        if cached is not None:
+            return cached
+        colors = self._color_scheme
+        fg_name, bg_name, bold, reverse, selected = key
+        if selected:
+            cached = (colors.FG, colors.SELECTION)
+        else:
+            fg = colors.resolve(fg_name, is_fg=True) if fg_name else colors.FG
+            bg = colors.resolve(bg_name, is_fg=False) if bg_name else colors.BG
+            # Reverse video
+            if reverse:
+                fg, bg = bg, fg
+            # Bold brightens fg
+            if bold and fg == colors.FG:
+                fg = colors.BOLD
+            cached = (fg, bg)
+        self._style_cache[key] = cached
+        return cached
+
+    def _line_runs(
+        self,
+        line: dict[int, Char] | tuple[Char, ...],
+        row: int,
+        first_col: int,
+        last_col: int,
+        sel_start: tuple[int, int] | None,
+        sel_end: tuple[int, int] | None,
+    ) -> list[tuple[int, str, QColor, QColor]]:
+        """Split columns *first_col*..*last_col* of *line* into same-style runs.
+
+        Returns ``(start_col, text, fg, bg)`` tuples.  Consecutive ASCII cells
+        sharing a style become one run (one ``fillRect`` + one ``drawText``);
+        any other character gets a run of its own so a fallback font's advance
+        width cannot push the following cells off the grid.
+        """
+        selecting = sel_start is not None and sel_end is not None
+        runs: list[tuple[int, str, QColor, QColor]] = []
+        chars: list[str] = []
+        run_key = ("", "", False, False, False)
+        run_start = first_col
+        single = False
+        for col in range(first_col, last_col + 1):
+            char = line[col]
+            data = char.data or " "
+            selected = selecting and self._cell_in_selection(
+                col, row, sel_start, sel_end  # type: ignore[arg-type]
+            )
+            key = (char.fg, char.bg, char.bold, char.reverse, selected)
+            wide = not data.isascii()
+            if key != run_key or wide or single:
+                if chars:
+                    runs.append((run_start, "".join(chars), *self._style_colors(run_key)))
+                chars = []
+                run_key = key
+                run_start = col
+            chars.append(data)
+            single = wide
+        if chars:
+            runs.append((run_start, "".join(chars), *self._style_colors(run_key)))
+        return runs
+
     def _normalized_selection(self) -> tuple[tuple[int, int] | None, tuple[int, int] | None]:
         """Return selection start/end in top-left to bottom-right order."""
         if self._selection_start is None or self._selection_end is None:
@@ -804,7 +1002,8 @@ class TerminalEmulatorWidget(QWidget):
         return "\n".join(lines)
 
     def _copy_selection(self) -> None:
-        text = self._get_selected_text()
+        with self._state.lock:
+            text = self._get_selected_text()
         if text:
             clipboard = QApplication.clipboard()
             if clipboard:
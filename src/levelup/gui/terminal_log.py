@@ -0,0 +1,318 @@
+"""On-disk, searchable copy of a terminal's output.
+
+The PTY reader thread tees everything it parses into a ``TerminalLog``:
+plain text (escape sequences stripped, ``\\r`` overwrites resolved), one
+line per terminal line, so it outlives the in-memory scrollback and GUI
+restarts.  Each log file has an ``.idx`` sidecar holding the byte offset of
+every line (8 bytes each), so any line can be read with one seek.
+
+Logs rotate at ``max_bytes``: ``ticket-3.log`` becomes ``ticket-3.log.1``
+(and so on up to ``backups``) along with its index.  ``search_log()``
+streams the segments line by line and never loads a whole file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import shutil
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+DEFAULT_TERMINAL_LOG_DIR = Path.home() / ".levelup" / "terminal_logs"
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+# Longest unterminated line kept in memory (e.g. a progress bar that only
+# ever rewrites itself with \r); beyond this only the text after the last
+# \r is kept.
+_MAX_PARTIAL = 64 * 1024
+
+_ANSI = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]"  # CSI
+    r"|\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC
+    r"|[PX^_][^\x1b]*\x1b\\"  # DCS/SOS/PM/APC
+    r"|[ -/]*[0-~])"  # two/three-byte escapes
+)
+_CONTROL = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+
+
+def terminal_log_path(
+    project_path: str | Path, ticket_number: int | None, log_dir: Path | None = None
+) -> Path:
+    """Log file for a ticket's terminal, in a directory per project."""
+    project = Path(project_path).resolve()
+    digest = hashlib.sha1(str(project).encode("utf-8")).hexdigest()[:8]
+    name = f"ticket-{ticket_number}.log" if ticket_number is not None else "shell.log"
+    return (log_dir or DEFAULT_TERMINAL_LOG_DIR) / f"{project.name}-{digest}" / name
+
+
+def plain_line(raw: str) -> str:
+    """Printable text of one raw terminal line (without its ``\\n``)."""
+    text = _ANSI.sub("", raw).rstrip("\r")
+    if "\r" in text:
+        # Carriage returns redraw the line in place: keep the final version
+        text = text.rsplit("\r", 1)[1]
+    return _CONTROL.sub("", text).rstrip()
+
+
+def index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def log_segments(path: Path) -> list[Path]:
+    """Existing files of the log at *path*, oldest first."""
+    backups = []
+    for candidate in path.parent.glob(path.name + ".*"):
+        suffix = candidate.name[len(path.name) + 1:]
+        if suffix.isdigit():
+            backups.append((int(suffix), candidate))
+    segments = [p for _, p in sorted(backups, reverse=True)]
+    if path.exists():
+        segments.append(path)
+    return segments
+
+
+def _load_index(log_path: Path) -> array:
+    offsets = array("Q")
+    try:
+        offsets.frombytes(index_path(log_path).read_bytes())
+    except (OSError, ValueError):
+        return _build_index(log_path)
+    size = log_path.stat().st_size if log_path.exists() else 0
+    if not offsets:
+        return _build_index(log_path) if size else offsets
+    if offsets[-1] >= size:
+        return _build_index(log_path)
+    with open(log_path, "rb") as f:
+        f.seek(offsets[-1])
+        f.readline()
+        if f.tell() != size:
+            # Index out of step with its log (e.g. a crash between the two writes)
+            return _build_index(log_path)
+    return offsets
+
+
+def _build_index(log_path: Path) -> array:
+    """Line offsets of *log_path*, scanned from the file itself."""
+    offsets = array("Q")
+    if not log_path.exists():
+        return offsets
+    position = 0
+    with open(log_path, "rb") as f:
+        for line in f:
+            offsets.append(position)
+            position += len(line)
+    index_path(log_path).write_bytes(offsets.tobytes())
+    return offsets
+
+
+def line_count(log_path: Path) -> int:
+    """Lines in one log file, from the size of its index."""
+    try:
+        return index_path(log_path).stat().st_size // array("Q").itemsize
+    except OSError:
+        return len(_load_index(log_path))
+
+
+def export_log(path: Path, destination: Path) -> None:
+    """Concatenate every segment of the log at *path* into *destination*."""
+    with open(destination, "wb") as out:
+        for segment in log_segments(path):
+            try:
+                with open(segment, "rb") as f:
+                    shutil.copyfileobj(f, out)
+            except FileNotFoundError:
+                continue
+
+
+def read_lines(log_path: Path, first: int, count: int) -> list[str]:
+    """Lines ``first .. first+count-1`` of one log file, found through its index."""
+    first = max(0, first)
+    if count <= 0:
+        return []
+    entry = array("Q")
+    try:
+        with open(index_path(log_path), "rb") as f:
+            f.seek(first * entry.itemsize)
+            entry.frombytes(f.read(entry.itemsize))
+    except (OSError, ValueError):
+        pass
+    if not entry:
+        offsets = _load_index(log_path)
+        if first >= len(offsets):
+            return []
+        entry.append(offsets[first])
+    with open(log_path, "rb") as f:
+        f.seek(entry[0])
+        lines = []
+        for raw in f:
+            lines.append(raw.decode("utf-8", errors="replace").rstrip("\n"))
+            if len(lines) == count:
+                break
+    return lines
+
+
+@dataclass(frozen=True)
+class LogMatch:
+    """One line of a terminal log that matched a search."""
+
+    segment: Path
+    segment_line: int  # line number within *segment*
+    line: int  # line number across all segments searched, 0 = oldest
+    column: int
+    length: int
+    text: str
+
+
+def search_log(
+    path: Path,
+    query: str,
+    *,
+    regex: bool = False,
+    case_sensitive: bool = False,
+    cancel: threading.Event | None = None,
+) -> Iterator[LogMatch]:
+    """Matches of *query* in the log at *path* (all segments), oldest first.
+
+    Reads each segment sequentially; stops early once *cancel* is set.
+    An invalid *regex* raises ``re.error`` before anything is read.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    pattern = re.compile(query if regex else re.escape(query), flags)
+    line_base = 0
+    for segment in log_segments(path):
+        try:
+            f = open(segment, "rb")
+        except OSError:
+            continue  # rotated away since log_segments() listed it
+        with f:
+            number = -1
+            for number, raw in enumerate(f):
+                if cancel is not None and cancel.is_set():
+                    return
+                text = raw.decode("utf-8", errors="replace").rstrip("\n")
+                found = pattern.search(text)
+                if found and found.end() > found.start():
+                    yield LogMatch(
+                        segment=segment,
+                        segment_line=number,
+                        line=line_base + number,
+                        column=found.start(),
+                        length=found.end() - found.start(),
+                        text=text,
+                    )
+        line_base += number + 1
+
+
+class TerminalLog:
+    """Appends terminal output to a rotating plain-text log with a line index.
+
+    ``write()`` takes decoded terminal output in arbitrary chunks; only
+    complete lines reach the file, so escape sequences split across chunks
+    are stripped correctly.  Thread-safe; reads go through the module-level
+    functions, which only need the files.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._partial = ""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+    @property
+    def line_count(self) -> int:
+        """Complete lines in the current segment."""
+        return self._lines
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            if self._log is None:
+                return
+            data = self._partial + text
+            *lines, self._partial = data.split("\n")
+            if len(self._partial) > _MAX_PARTIAL:
+                self._partial = self._partial.rsplit("\r", 1)[-1][-_MAX_PARTIAL:]
+            if lines:
+                self._append([plain_line(line) for line in lines])
+
+    def flush(self) -> None:
+        """Write out an unterminated last line as well."""
+        with self._lock:
+            if self._log is not None and self._partial:
+                line = plain_line(self._partial)
+                self._partial = ""
+                if line:
+                    self._append([line])
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._index.close()
+                self._log = None
+
+    def segments(self) -> list[Path]:
+        return log_segments(self.path)
+
+    def _open(self) -> None:
+        offsets = _load_index(self.path)
+        self._lines = len(offsets)
+        self._log = open(self.path, "ab")
+        self._size = self._log.tell()
+        self._index = open(index_path(self.path), "ab")
+
+    def _append(self, lines: list[str]) -> None:
+        offsets = array("Q")
+        chunks = []
+        for line in lines:
+            data = (line + "\n").encode("utf-8", errors="replace")
+            offsets.append(self._size)
+            chunks.append(data)
+            self._size += len(data)
+            if self._size >= self.max_bytes:
+                self._write(chunks, offsets)
+                self._rotate()
+                offsets, chunks = array("Q"), []
+        if chunks:
+            self._write(chunks, offsets)
+
+    def _write(self, chunks: list[bytes], offsets: array) -> None:
+        self._log.write(b"".join(chunks))
+        self._log.flush()
+        self._index.write(offsets.tobytes())
+        self._index.flush()
+        self._lines += len(offsets)
+
+    def _rotate(self) -> None:
+        self._log.close()
+        self._index.close()
+        try:
+            for n in range(self.backups, 0, -1):
+                source = self.path if n == 1 else self.path.with_name(f"{self.path.name}.{n - 1}")
+                target = self.path.with_name(f"{self.path.name}.{n}")
+                if not source.exists():
+                    continue
+                source.replace(target)
+                if index_path(source).exists():
+                    index_path(source).replace(index_path(target))
+            if self.backups <= 0:
+                self.path.unlink(missing_ok=True)
+                index_path(self.path).unlink(missing_ok=True)
+        except OSError:
+            pass  # e.g. a search still has a segment open on Windows: retry next time
+        self._open()
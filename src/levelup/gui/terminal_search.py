@@ -0,0 +1,307 @@
+"""Ctrl+F search bar for a terminal's on-disk log.
+
+The search runs in a ``LogSearchThread`` over the log files (see
+``levelup.gui.terminal_log``), so it covers output long gone from the
+scrollback without loading the log into memory or blocking the GUI.
+Matches still on screen or in the scrollback are scrolled to and selected;
+older ones are shown in the status label, with surrounding lines read
+through the log's line index.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QWidget,
+)
+
+from levelup.gui.terminal_emulator import TerminalEmulatorWidget
+from levelup.gui.terminal_log import (
+    LogMatch,
+    export_log,
+    line_count,
+    log_segments,
+    read_lines,
+    search_log,
+)
+
+# Stop collecting matches past this many
+MAX_MATCHES = 10000
+
+# Matches are handed to the GUI in batches of this many
+_BATCH = 200
+
+# Lines of context shown around a match that is no longer in the scrollback
+_CONTEXT = 2
+
+
+class LogSearchThread(QThread):
+    """Scans a terminal log for *query* and emits the matches in batches."""
+
+    matches_found = pyqtSignal(list)  # list[LogMatch], oldest first
+    search_done = pyqtSignal(bool)  # True if MAX_MATCHES cut the search short
+    search_failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        path: Path,
+        query: str,
+        *,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._path = path
+        self._query = query
+        self._regex = regex
+        self._case_sensitive = case_sensitive
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def run(self) -> None:
+        batch: list[LogMatch] = []
+        count = 0
+        try:
+            for match in search_log(
+                self._path,
+                self._query,
+                regex=self._regex,
+                case_sensitive=self._case_sensitive,
+                cancel=self._cancel,
+            ):
+                batch.append(match)
+                count += 1
+                if len(batch) >= _BATCH:
+                    self.matches_found.emit(batch)
+                    batch = []
+                if count >= MAX_MATCHES:
+                    break
+        except re.error as exc:
+            self.search_failed.emit(f"Invalid pattern: {exc}")
+            return
+        except OSError as exc:
+            self.search_failed.emit(str(exc))
+            return
+        if batch:
+            self.matches_found.emit(batch)
+        if not self._cancel.is_set():
+            self.search_done.emit(count >= MAX_MATCHES)
+
+
+class TerminalSearchBar(QWidget):
+    """Find bar over the log of *terminal*; hidden until ``open_bar()``."""
+
+    def __init__(self, terminal: TerminalEmulatorWidget, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._terminal = terminal
+        self._thread: LogSearchThread | None = None
+        self._matches: list[LogMatch] = []
+        self._current = -1
+        self._truncated = False
+        self._searched: tuple[str, bool, bool] | None = None
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._query_edit = QLineEdit()
+        self._query_edit.setPlaceholderText("Search terminal log (Enter: older, Shift+Enter: newer)")
+        self._query_edit.installEventFilter(self)
+        layout.addWidget(self._query_edit, 1)
+
+        self._regex_checkbox = QCheckBox("Regex")
+        layout.addWidget(self._regex_checkbox)
+        self._case_checkbox = QCheckBox("Match case")
+        layout.addWidget(self._case_checkbox)
+
+        self._older_btn = QPushButton("▲")
+        self._older_btn.setToolTip("Older match")
+        self._older_btn.clicked.connect(lambda: self._step(-1))
+        layout.addWidget(self._older_btn)
+
+        self._newer_btn = QPushButton("▼")
+        self._newer_btn.setToolTip("Newer match")
+        self._newer_btn.clicked.connect(lambda: self._step(1))
+        layout.addWidget(self._newer_btn)
+
+        self._status_label = QLabel("")
+        self._status_label.setObjectName("terminalSearchStatus")
+        layout.addWidget(self._status_label, 2)
+
+        self._export_btn = QPushButton("Export...")
+        self._export_btn.setToolTip("Save the whole terminal log to a file")
+        self._export_btn.clicked.connect(self._on_export_clicked)
+        layout.addWidget(self._export_btn)
+
+        self._close_btn = QPushButton("✕")
+        self._close_btn.setToolTip("Close (Esc)")
+        self._close_btn.clicked.connect(self.close_bar)
+        layout.addWidget(self._close_btn)
+
+        self.hide()
+
+    # -- Public API ---------------------------------------------------------
+
+    @property
+    def matches(self) -> list[LogMatch]:
+        return self._matches
+
+    @property
+    def current_match(self) -> LogMatch | None:
+        if 0 <= self._current < len(self._matches):
+            return self._matches[self._current]
+        return None
+
+    def open_bar(self) -> None:
+        self.show()
+        self._query_edit.setFocus()
+        self._query_edit.selectAll()
+
+    def close_bar(self) -> None:
+        self._stop_search()
+        self.hide()
+        self._terminal.setFocus()
+
+    def search(self) -> None:
+        """Start searching the log for the query in the line edit."""
+        self._stop_search()
+        self._matches = []
+        self._current = -1
+        self._truncated = False
+        query = self._query_edit.text()
+        log = self._terminal.log
+        self._searched = None
+        if not query:
+            self._status_label.setText("")
+            return
+        if log is None:
+            self._status_label.setText("No log for this terminal")
+            return
+        regex = self._regex_checkbox.isChecked()
+        case_sensitive = self._case_checkbox.isChecked()
+        self._searched = (query, regex, case_sensitive)
+        thread = LogSearchThread(
+            log.path, query, regex=regex, case_sensitive=case_sensitive, parent=self
+        )
+        thread.matches_found.connect(self._on_matches_found)
+        thread.search_done.connect(self._on_search_done)
+        thread.search_failed.connect(self._status_label.setText)
+        thread.finished.connect(thread.deleteLater)
+        self._thread = thread
+        self._status_label.setText("Searching...")
+        thread.start()
+
+    # -- Qt event handlers --------------------------------------------------
+
+    def eventFilter(self, obj: QObject, event: object) -> bool:
+        if obj is self._query_edit and isinstance(event, QKeyEvent):
+            if event.type() == QKeyEvent.Type.ShortcutOverride and event.key() == Qt.Key.Key_Escape:
+                event.accept()  # Escape closes the bar rather than triggering "back to runs"
+                return True
+            if event.type() == QKeyEvent.Type.KeyPress:
+                if event.key() == Qt.Key.Key_Escape:
+                    self.close_bar()
+                    return True
+                if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                    shift = bool(event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
+                    self._on_enter(newer=shift)
+                    return True
+        return super().eventFilter(obj, event)
+
+    # -- Internal -----------------------------------------------------------
+
+    def _on_enter(self, newer: bool) -> None:
+        searched = (
+            self._query_edit.text(),
+            self._regex_checkbox.isChecked(),
+            self._case_checkbox.isChecked(),
+        )
+        if searched != self._searched:
+            self.search()
+        else:
+            self._step(1 if newer else -1)
+
+    def _stop_search(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.matches_found.disconnect()
+            thread.search_done.disconnect()
+            thread.search_failed.disconnect()
+            thread.cancel()
+            thread.wait()  # the scan checks for cancellation on every line
+
+    def _on_matches_found(self, matches: list[LogMatch]) -> None:
+        self._matches.extend(matches)
+        self._status_label.setText(f"Searching... {len(self._matches)} matches")
+
+    def _on_search_done(self, truncated: bool) -> None:
+        self._thread = None
+        if not self._matches:
+            self._status_label.setText("No matches")
+            return
+        self._truncated = truncated
+        # Start from the newest match, like scrolling up from the prompt
+        self._current = len(self._matches) - 1
+        self._show_current()
+
+    def _step(self, delta: int) -> None:
+        if not self._matches:
+            return
+        self._current = (self._current + delta) % len(self._matches)
+        self._show_current()
+
+    def _show_current(self) -> None:
+        match = self._matches[self._current]
+        log = self._terminal.log
+        total = sum(line_count(s) for s in log_segments(log.path)) if log is not None else 0
+        revealed = self._terminal.reveal_line(
+            match.text,
+            rows_from_bottom=max(0, total - 1 - match.line),
+            column=match.column,
+            length=match.length,
+        )
+        count = f"{len(self._matches)}{'+' if self._truncated else ''}"
+        status = f"{self._current + 1}/{count}"
+        tooltip = ""
+        if not revealed:
+            status += f" · line {match.line + 1} (older than the scrollback): {match.text.strip()}"
+            try:
+                context = read_lines(
+                    match.segment, match.segment_line - _CONTEXT, 2 * _CONTEXT + 1
+                )
+            except OSError:
+                context = []  # segment rotated away since the search
+            tooltip = "\n".join(context)
+        self._status_label.setText(status)
+        self._status_label.setToolTip(tooltip)
+
+    def _on_export_clicked(self) -> None:
+        log = self._terminal.log
+        if log is None:
+            self._status_label.setText("No log for this terminal")
+            return
+        destination, _ = QFileDialog.getSaveFileName(
+            self, "Export Terminal Log", log.path.name, "Log files (*.log);;All files (*)"
+        )
+        if not destination:
+            return
+        log.flush()
+        try:
+            export_log(log.path, Path(destination))
+        except OSError as exc:
+            self._status_label.setText(f"Export failed: {exc}")
+            return
+        self._status_label.setText(f"Exported to {destination}")
@@ -0,0 +1,242 @@
+"""Headless terminal state: a pyte screen fed off the GUI thread.
+
+``TerminalState`` owns the pyte ``HistoryScreen``/``Stream`` pair.  The PTY
+reader thread feeds it directly, so VT parsing never runs on the Qt main
+thread; the widget only takes ``ScreenSnapshot``s, at most once per frame
+and only while it is visible.
+
+Snapshots are immutable and share unchanged rows with the previous one, so
+taking a snapshot costs one row copy per row that changed.
+
+Scrollback lives in a ``CompactScrollback`` instead of pyte's deque of
+per-cell ``Char`` dicts: one string per line plus run-length style spans,
+a few percent of the memory, so long-lived terminals can keep far more history.
+
+With a ``TerminalLog`` attached, everything fed is also teed to disk on the
+same thread (see ``levelup.gui.terminal_log``).
+"""
+
+from __future__ import annotations
+
+import codecs
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+
+import pyte
+from pyte.screens import Char, StaticDefaultDict
+
+if TYPE_CHECKING:
+    from levelup.gui.terminal_log import TerminalLog
+
+Row = tuple[Char, ...]
+
+DEFAULT_HISTORY_LINES = 10000
+
+_DEFAULT_CHAR = Char(" ")
+
+# Packed line: text (one character per cell, or one string per cell when a
+# cell holds a wide/combining character) and flat (start_col, style_id)
+# pairs, None when the whole line has the default style.
+_PackedLine = tuple[Union[str, tuple[str, ...]], Union[array, None]]
+
+
+class CompactScrollback:
+    """Drop-in for ``HistoryScreen.history.top`` storing lines packed.
+
+    Supports what pyte and the widget use: ``append``/``extend``/``pop``/
+    ``clear``, ``len`` and indexing.  Indexing and ``pop`` return a fresh
+    pyte line (``StaticDefaultDict`` of ``Char``), so callers cannot tell the
+    difference.  Styles (every ``Char`` field but ``data``) are interned in a
+    table shared by all lines.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        self._lines: deque[_PackedLine] = deque(maxlen=maxlen)
+        self._styles: list[tuple[object, ...]] = [tuple(_DEFAULT_CHAR[1:])]
+        self._style_ids: dict[tuple[object, ...], int] = {self._styles[0]: 0}
+
+    @property
+    def maxlen(self) -> int | None:
+        return self._lines.maxlen
+
+    def append(self, line: dict[int, Char]) -> None:
+        self._lines.append(self._pack(line))
+
+    def extend(self, lines: Iterable[dict[int, Char]]) -> None:
+        for line in lines:
+            self.append(line)
+
+    def pop(self) -> StaticDefaultDict[int, Char]:
+        return self._unpack(self._lines.pop())
+
+    def clear(self) -> None:
+        self._lines.clear()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index: int) -> StaticDefaultDict[int, Char]:
+        return self._unpack(self._lines[index])
+
+    def __iter__(self) -> Iterator[StaticDefaultDict[int, Char]]:
+        for packed in list(self._lines):
+            yield self._unpack(packed)
+
+    def text(self, index: int) -> str:
+        """Plain text of line *index* without building ``Char`` objects."""
+        data = self._lines[index][0]
+        return data if isinstance(data, str) else "".join(data)
+
+    def _style_id(self, style: tuple[object, ...]) -> int:
+        style_id = self._style_ids.get(style)
+        if style_id is None:
+            style_id = len(self._styles)
+            self._styles.append(style)
+            self._style_ids[style] = style_id
+        return style_id
+
+    def _pack(self, line: dict[int, Char]) -> _PackedLine:
+        default = getattr(line, "default", _DEFAULT_CHAR)
+        # Trailing default cells are implied by the line default
+        width = max((col for col, char in line.items() if char != default), default=-1) + 1
+        cells = [line[col] for col in range(width)]
+        data = [char.data for char in cells]
+        text: str | tuple[str, ...] = (
+            "".join(data) if all(len(d) == 1 for d in data) else tuple(data)
+        )
+        spans = array("I")
+        previous = -1
+        for col, char in enumerate(cells):
+            style_id = self._style_id(tuple(char[1:]))
+            if style_id != previous:
+                spans.extend((col, style_id))
+                previous = style_id
+        if not spans or (len(spans) == 2 and spans[1] == 0):
+            return text, None
+        return text, spans
+
+    def _unpack(self, packed: _PackedLine) -> StaticDefaultDict[int, Char]:
+        text, spans = packed
+        line: StaticDefaultDict[int, Char] = StaticDefaultDict(_DEFAULT_CHAR)
+        width = len(text)
+        if spans is None:
+            bounds = [(0, width, self._styles[0])]
+        else:
+            starts = spans[0::2]
+            bounds = [
+                (start, starts[i + 1] if i + 1 < len(starts) else width, self._styles[style_id])
+                for i, (start, style_id) in enumerate(zip(starts, spans[1::2]))
+            ]
+        for start, end, style in bounds:
+            for col in range(start, end):
+                line[col] = Char(text[col], *style)
+        return line
+
+
+@dataclass(frozen=True)
+class ScreenSnapshot:
+    """The visible screen at one point in time."""
+
+    cols: int
+    rows: int
+    lines: tuple[Row, ...]
+    cursor: tuple[int, int]  # (x, y)
+    history_len: int = 0
+    dirty: frozenset[int] = field(default_factory=frozenset)  # rows changed since the last one
+
+
+def _copy_row(screen: pyte.Screen, row: int) -> Row:
+    # buffer is a defaultdict: .get() avoids materializing untouched rows,
+    # which would change how pyte's resize() shifts content
+    line = screen.buffer.get(row)
+    if line is None:
+        return (screen.default_char,) * screen.columns
+    return tuple(line[col] for col in range(screen.columns))
+
+
+class TerminalState:
+    """Thread-safe pyte screen; ``feed_pty()`` from any thread, ``snapshot()`` from the GUI."""
+
+    def __init__(
+        self, cols: int = 80, rows: int = 24, history: int = DEFAULT_HISTORY_LINES
+    ) -> None:
+        self.lock = threading.RLock()
+        self.screen = pyte.HistoryScreen(cols, rows, history=history)
+        self.screen.history = self.screen.history._replace(top=CompactScrollback(history))
+        self.stream = pyte.Stream(self.screen)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._changed = False
+        self._dirty: set[int] = set()
+        self._last_cursor = (0, 0)
+        self._snapshot: ScreenSnapshot | None = None
+        self.log: TerminalLog | None = None
+
+    def feed_pty(self, data: bytes | str) -> bool:
+        """Parse PTY output; True if this is the first change since the last snapshot.
+
+        Bytes go through an incremental UTF-8 decoder, so a multibyte
+        character split across two reads is decoded once both halves arrive.
+        """
+        text = data if isinstance(data, str) else self._decoder.decode(data)
+        if not text:
+            return False
+        log = self.log
+        if log is not None:
+            log.write(text)
+        with self.lock:
+            self.stream.feed(text)
+            self._collect_dirty()
+            first = not self._changed
+            self._changed = True
+        return first
+
+    @property
+    def changed(self) -> bool:
+        """Output arrived since the last ``snapshot()``."""
+        return self._changed
+
+    def resize(self, cols: int, rows: int) -> None:
+        with self.lock:
+            self.screen.resize(rows, cols)
+            self._snapshot = None
+
+    def snapshot(self) -> ScreenSnapshot:
+        """Current screen; ``dirty`` lists the rows changed since the previous call."""
+        with self.lock:
+            self._collect_dirty()
+            screen = self.screen
+            cols, rows = screen.columns, screen.lines
+            previous = self._snapshot
+            if previous is None or (previous.cols, previous.rows) != (cols, rows):
+                dirty = set(range(rows))
+                lines = [_copy_row(screen, row) for row in range(rows)]
+            else:
+                dirty = {row for row in self._dirty if 0 <= row < rows}
+                lines = list(previous.lines)
+                for row in dirty:
+                    lines[row] = _copy_row(screen, row)
+            snap = ScreenSnapshot(
+                cols=cols,
+                rows=rows,
+                lines=tuple(lines),
+                cursor=self._last_cursor,
+                history_len=len(screen.history.top),
+                dirty=frozenset(dirty),
+            )
+            self._snapshot = snap
+            self._dirty.clear()
+            self._changed = False
+            return snap
+
+    def _collect_dirty(self) -> None:
+        """Move pyte's dirty rows (plus rows the cursor left/entered) into ``_dirty``."""
+        screen = self.screen
+        self._dirty.update(screen.dirty)
+        screen.dirty.clear()
+        cursor = (screen.cursor.x, screen.cursor.y)
+        if cursor != self._last_cursor:
+            self._dirty.update((self._last_cursor[1], cursor[1]))
+            self._last_cursor = cursor
@@ -23,6 +23,7 @@ from PyQt6.QtWidgets import (
 from levelup.core.tickets import Ticket, TicketStatus
 from levelup.gui.resources import TICKET_STATUS_COLORS, TICKET_STATUS_ICONS, get_ticket_status_color
 from levelup.gui.run_terminal import RunTerminalWidget
+from levelup.gui.terminal_state import DEFAULT_HISTORY_LINES
 from levelup.gui.terminal_emulator import CatppuccinMochaColors, LightTerminalColors
 from levelup.gui.image_text_edit import ImageTextEdit
 from levelup.gui.image_asset_manager import cleanup_orphaned_images
@@ -46,6 +47,7 @@ class TicketDetailWidget(QWidget):
         self._db_path: str | None = None
         self._current_theme = theme
         self._auto_approve_default: bool = False  # Project's default auto_approve setting
+        self._terminal_history = DEFAULT_HISTORY_LINES  # gui.terminal_history
 
         # Load settings if project_path is provided
         if project_path:
@@ -189,7 +191,8 @@ class TicketDetailWidget(QWidget):
             return self._terminals[ticket_number]
         # Pass current theme to RunTerminalWidget constructor
         current_theme = getattr(self, "_current_theme", "dark")
-        terminal = RunTerminalWidget(theme=current_theme)
+        history = getattr(self, "_terminal_history", DEFAULT_HISTORY_LINES)
+        terminal = RunTerminalWidget(theme=current_theme, history=history)
         terminal.run_started.connect(self._on_run_started)
         terminal.run_finished.connect(self._on_run_finished)
         if self._project_path and self._db_path:
@@ -398,6 +401,7 @@ class TicketDetailWidget(QWidget):
             from levelup.config.loader import load_settings
             settings = load_settings(project_path=Path(self._project_path))
             self._auto_approve_default = settings.pipeline.auto_approve
+            self._terminal_history = settings.gui.terminal_history
         except Exception:
             # If settings loading fails (malformed config, etc.), use safe default
             self._auto_approve_default = False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 
 DEFAULT_DB_PATH = Path.home() / ".levelup" / "state.db"
@@ -172,3 +173,25 @@ def init_db(db_path: Path | str = DEFAULT_DB_PATH) -> None:
         _run_migrations(conn)
     finally:
         conn.close()
+
+
+# Databases whose schema this process has already initialized (resolved paths)
+_initialized: set[Path] = set()
+_initialized_lock = threading.Lock()
+
+
+def ensure_db(db_path: Path | str = DEFAULT_DB_PATH) -> None:
+    """Run ``init_db`` once per process for each database file.
+
+    Later calls only check that the file still exists, so the schema DDL and
+    the migration check stay off hot paths.  A deleted file is initialized
+    again.
+    """
+    path = Path(db_path).resolve()
+    if path in _initialized and path.exists():
+        return
+    with _initialized_lock:
+        if path in _initialized and path.exists():
+            return
+        init_db(path)
+        _initialized.add(path)
@@ -5,13 +5,13 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
-from levelup.state.db import DEFAULT_DB_PATH, get_connection, init_db
+from levelup.state.db import DEFAULT_DB_PATH, ensure_db, get_connection
 from levelup.state.models import CheckpointRequestRecord, RunRecord, TicketRecord
 
-
 _SENTINEL = object()
 
 
@@ -46,7 +46,7 @@ class StateManager:
 
     def __init__(self, db_path: Path | str = DEFAULT_DB_PATH) -> None:
         self._db_path = Path(db_path)
-        init_db(self._db_path)
+        ensure_db(self._db_path)
 
     def _conn(self) -> sqlite3.Connection:
         return get_connection(self._db_path)
@@ -534,3 +534,29 @@ class StateManager:
             return title
         finally:
             conn.close()
+
+
+# Shared StateManagers by resolved db path; see get_state_manager()
+_managers: dict[Path, StateManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_state_manager(db_path: Path | str | None = None) -> StateManager:
+    """Return the process-wide StateManager for *db_path* (default DB if None).
+
+    StateManager opens a connection per call, so one instance can be shared
+    by every caller and thread.
+    """
+    path = Path(db_path if db_path is not None else DEFAULT_DB_PATH).resolve()
+    with _managers_lock:
+        manager = _managers.get(path)
+        if manager is None:
+            manager = _managers[path] = StateManager(path)
+    ensure_db(path)  # recreates the schema if the file was deleted since
+    return manager
+
+
+def clear_state_managers() -> None:
+    """Forget the shared StateManagers (tests patch ``StateManager``)."""
+    with _managers_lock:
+        _managers.clear()
@@ -0,0 +1,262 @@
+"""Prometheus metrics for the pipeline fleet, aggregated from the state DB.
+
+``levelup metrics serve`` exposes ``/metrics`` in the Prometheus text
+exposition format on a local port.  Everything is derived from the shared
+SQLite DB on each scrape: run counts by status, tokens, cost, step
+durations (from each run's ``step_usage``), checkpoint wait times and
+decisions, and the ticket queue.  Counters are totals over the runs still
+in the DB, so ``rate()`` gives throughput and cost per hour.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from levelup.state.db import DEFAULT_DB_PATH, get_connection, init_db
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_PORT = 9464
+
+STEP_DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+CHECKPOINT_WAIT_BUCKETS = (5, 15, 30, 60, 300, 900, 1800, 3600, 4 * 3600, 24 * 3600)
+RUN_DURATION_BUCKETS = (60, 300, 600, 1200, 1800, 3600, 2 * 3600, 4 * 3600, 8 * 3600)
+
+_FINISHED = ("completed", "failed", "aborted")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape(str(v))}"' for k, v in sorted(labels.items()))
+    return "{" + inner + "}"
+
+
+def _fmt(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _seconds_between(start: str | None, end: str | None) -> float | None:
+    if not start or not end:
+        return None
+    try:
+        return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+    except ValueError:
+        return None
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.series: dict[tuple[tuple[str, str], ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        counts = self.series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        counts[-2] += 1  # count (== +Inf bucket)
+        counts[-1] += value  # sum
+
+    def render(self, name: str, help_text: str) -> list[str]:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for key, counts in sorted(self.series.items()):
+            labels = dict(key)
+            for bound, count in zip(self.buckets, counts):
+                bucket = _labels({**labels, "le": _fmt(bound)})
+                lines.append(f"{name}_bucket{bucket} {_fmt(count)}")
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {_fmt(counts[-2])}")
+            lines.append(f"{name}_count{_labels(labels)} {_fmt(counts[-2])}")
+            lines.append(f"{name}_sum{_labels(labels)} {_fmt(counts[-1])}")
+        return lines
+
+
+def _metric(
+    name: str, kind: str, help_text: str, samples: list[tuple[dict[str, str], float]]
+) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{_labels(labels)} {_fmt(value)}" for labels, value in samples)
+    return lines
+
+
+class MetricsCollector:
+    """Builds the exposition text from the state DB.
+
+    Parsed ``step_usage`` is cached per run and only re-read when the run's
+    ``updated_at`` changes, so a scrape of a large DB stays cheap.
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH) -> None:
+        self._db_path = Path(db_path)
+        init_db(self._db_path)
+        self._lock = threading.Lock()
+        self._step_cache: dict[str, tuple[str, list[tuple[str, float]]]] = {}
+
+    def collect(self) -> str:
+        with self._lock:
+            conn = get_connection(self._db_path)
+            try:
+                return "\n".join(self._collect(conn)) + "\n"
+            finally:
+                conn.close()
+
+    def _collect(self, conn: sqlite3.Connection) -> list[str]:
+        lines: list[str] = []
+
+        by_status = conn.execute(
+            "SELECT status, COUNT(*), COALESCE(SUM(total_cost_usd), 0),"
+            " COALESCE(SUM(input_tokens), 0), COALESCE(SUM(output_tokens), 0)"
+            " FROM runs GROUP BY status ORDER BY status"
+        ).fetchall()
+        lines += _metric(
+            "levelup_runs", "gauge", "Runs in the state DB by status.",
+            [({"status": r[0]}, r[1]) for r in by_status],
+        )
+        lines += _metric(
+            "levelup_runs_finished_total", "counter", "Runs that reached a final status.",
+            [({"status": r[0]}, r[1]) for r in by_status if r[0] in _FINISHED],
+        )
+        lines += _metric(
+            "levelup_cost_usd_total", "counter", "Total LLM cost of all runs in USD.",
+            [({}, sum(r[2] for r in by_status))],
+        )
+        lines += _metric(
+            "levelup_tokens_total", "counter", "Total LLM tokens of all runs.",
+            [
+                ({"direction": "input"}, sum(r[3] for r in by_status)),
+                ({"direction": "output"}, sum(r[4] for r in by_status)),
+            ],
+        )
+
+        tickets = conn.execute(
+            "SELECT status, COUNT(*) FROM tickets GROUP BY status ORDER BY status"
+        ).fetchall()
+        lines += _metric(
+            "levelup_tickets", "gauge", "Tickets by status (pending tickets are the queue).",
+            [({"status": r[0]}, r[1]) for r in tickets],
+        )
+
+        run_durations = _Histogram(RUN_DURATION_BUCKETS)
+        for status, started_at, updated_at in conn.execute(
+            "SELECT status, started_at, updated_at FROM runs WHERE status IN (?, ?, ?)",
+            _FINISHED,
+        ):
+            seconds = _seconds_between(started_at, updated_at)
+            if seconds is not None:
+                run_durations.observe(seconds, status=status)
+        lines += run_durations.render(
+            "levelup_run_duration_seconds", "Wall time of finished runs."
+        )
+
+        step_durations = _Histogram(STEP_DURATION_BUCKETS)
+        for step, seconds in self._step_durations(conn):
+            step_durations.observe(seconds, step=step)
+        lines += step_durations.render(
+            "levelup_step_duration_seconds", "Agent step duration reported by the backend."
+        )
+
+        checkpoints = conn.execute(
+            "SELECT step_name, status, decision, created_at, decided_at FROM checkpoint_requests"
+        ).fetchall()
+        waits = _Histogram(CHECKPOINT_WAIT_BUCKETS)
+        decisions: dict[tuple[str, str], int] = {}
+        pending = 0
+        for step, status, decision, created_at, decided_at in checkpoints:
+            if status == "pending":
+                pending += 1
+                continue
+            seconds = _seconds_between(created_at, decided_at)
+            if seconds is not None:
+                waits.observe(seconds, step=step)
+            if decision:
+                decisions[(step, decision)] = decisions.get((step, decision), 0) + 1
+        lines += _metric(
+            "levelup_checkpoints_pending", "gauge", "Checkpoints waiting for a decision.",
+            [({}, pending)],
+        )
+        lines += waits.render(
+            "levelup_checkpoint_wait_seconds", "Time from checkpoint request to decision."
+        )
+        lines += _metric(
+            "levelup_checkpoint_decisions_total", "counter",
+            "Checkpoint decisions by step (revise/reject rates show rework).",
+            [({"step": s, "decision": d}, n) for (s, d), n in sorted(decisions.items())],
+        )
+        return lines
+
+    def _step_durations(self, conn: sqlite3.Connection) -> list[tuple[str, float]]:
+        rows = conn.execute("SELECT run_id, updated_at FROM runs").fetchall()
+        current = {run_id: updated_at for run_id, updated_at in rows}
+        for run_id in list(self._step_cache):
+            if run_id not in current:
+                del self._step_cache[run_id]
+
+        stale = [
+            run_id for run_id, updated_at in current.items()
+            if self._step_cache.get(run_id, ("",))[0] != updated_at
+        ]
+        for run_id in stale:
+            row = conn.execute(
+                "SELECT context_json FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            durations = _parse_step_durations(row[0] if row else None)
+            self._step_cache[run_id] = (current[run_id], durations)
+
+        return [item for _, steps in self._step_cache.values() for item in steps]
+
+
+def _parse_step_durations(context_json: str | None) -> list[tuple[str, float]]:
+    if not context_json:
+        return []
+    try:
+        usage = json.loads(context_json).get("step_usage") or {}
+    except (ValueError, AttributeError):
+        return []
+    durations = []
+    for step, data in usage.items():
+        duration_ms = data.get("duration_ms") if isinstance(data, dict) else None
+        if duration_ms:
+            durations.append((step, duration_ms / 1000))
+    return durations
+
+
+def make_server(
+    collector: MetricsCollector, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """HTTP server answering ``GET /metrics`` with *collector*'s output."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            try:
+                body = collector.collect().encode("utf-8")
+            except sqlite3.Error as e:
+                logger.warning("Metrics collection failed: %s", e)
+                self.send_error(503, str(e))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            logger.debug("metrics: " + format, *args)
+
+    return ThreadingHTTPServer((host, port), Handler)
@@ -0,0 +1,126 @@
+"""Incremental view of the runs table for ``levelup status --watch``.
+
+A ``RunWatcher`` keeps one SQLite connection open and polls it.  Each poll
+first checks ``PRAGMA data_version``, which only changes when another
+connection commits, so an idle database costs one pragma per interval.
+When something did change it re-reads the narrow status columns (never
+``context_json``) and reports which runs were added, changed or removed.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from levelup.state.db import DEFAULT_DB_PATH, get_connection
+
+STATUS_COLUMNS = (
+    "run_id",
+    "task_title",
+    "project_path",
+    "status",
+    "current_step",
+    "total_cost_usd",
+    "input_tokens",
+    "output_tokens",
+    "ticket_number",
+    "pid",
+    "started_at",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True)
+class RunChange:
+    """One run that appeared, changed or disappeared since the last poll."""
+
+    kind: str  # "added" | "changed" | "removed"
+    run: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"event": self.kind, "run": self.run}
+
+
+class RunWatcher:
+    """Polls the runs table over a single long-lived connection."""
+
+    def __init__(
+        self,
+        db_path: Path | str = DEFAULT_DB_PATH,
+        *,
+        limit: int | None = None,
+        status_filter: str | None = None,
+        maintenance: Callable[[], object] | None = None,
+        maintenance_interval: float = 30.0,
+    ) -> None:
+        self._conn = get_connection(db_path)
+        self._limit = limit
+        self._status_filter = status_filter
+        self._maintenance = maintenance
+        self._maintenance_interval = maintenance_interval
+        self._last_maintenance = time.monotonic()
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._data_version: int | None = None
+
+    @property
+    def rows(self) -> list[dict[str, Any]]:
+        """Current runs, most recently updated first."""
+        return sorted(self._rows.values(), key=lambda r: r["updated_at"], reverse=True)
+
+    def poll(self) -> list[RunChange]:
+        """Re-read the runs table if another connection committed since the last poll."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return []
+        self._data_version = version
+
+        current = {row["run_id"]: row for row in self._query()}
+        changes = [
+            RunChange("removed", row) for run_id, row in self._rows.items() if run_id not in current
+        ]
+        for run_id, row in current.items():
+            previous = self._rows.get(run_id)
+            if previous is None:
+                changes.append(RunChange("added", row))
+            elif previous != row:
+                changes.append(RunChange("changed", row))
+        self._rows = current
+        return changes
+
+    def wait(self, interval: float) -> list[RunChange]:
+        """Sleep *interval* seconds, run ``maintenance`` when due, then ``poll()``.
+
+        ``maintenance`` (e.g. ``StateManager.mark_dead_runs``) writes through
+        its own connection, so its updates show up in the same poll.
+        """
+        time.sleep(interval)
+        now = time.monotonic()
+        if self._maintenance and now - self._last_maintenance >= self._maintenance_interval:
+            self._maintenance()
+            self._last_maintenance = now
+        return self.poll()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> RunWatcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _query(self) -> list[dict[str, Any]]:
+        sql = f"SELECT {', '.join(STATUS_COLUMNS)} FROM runs"
+        params: list[Any] = []
+        if self._status_filter:
+            sql += " WHERE status = ?"
+            params.append(self._status_filter)
+        sql += " ORDER BY updated_at DESC"
+        if self._limit:
+            sql += " LIMIT ?"
+            params.append(self._limit)
+        rows: list[sqlite3.Row] = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from levelup.tools.base import BaseTool
+from levelup.tools.shell_session import ShellSession
 
 DEFAULT_TIMEOUT = 60
 
@@ -15,9 +16,21 @@ class ShellTool(BaseTool):
     name = "shell"
     description = "Execute a shell command in the project directory. Commands run with a timeout."
 
-    def __init__(self, project_root: Path, timeout: int = DEFAULT_TIMEOUT) -> None:
+    def __init__(
+        self,
+        project_root: Path,
+        timeout: int = DEFAULT_TIMEOUT,
+        *,
+        session: ShellSession | None = None,
+    ) -> None:
         self._root = project_root.resolve()
         self._timeout = timeout
+        self._session = session
+        if session is not None:
+            self.description = (
+                f"{ShellTool.description} The shell session persists between calls, so "
+                "`cd`, exported variables and activated environments carry over."
+            )
 
     def get_input_schema(self) -> dict[str, Any]:
         return {
@@ -40,14 +53,17 @@ class ShellTool(BaseTool):
         timeout = kwargs.get("timeout", self._timeout)
 
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=str(self._root),
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            if self._session is not None:
+                result = self._session.run(command, timeout)
+            else:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    cwd=str(self._root),
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
 
             output_parts: list[str] = []
             if result.stdout:
@@ -0,0 +1,215 @@
+"""Persistent PTY-backed bash session shared by shell tools within a run.
+
+Each command is written to a long-lived ``bash`` process and followed by a
+sentinel line carrying its exit code, so ``cd``, exported variables and
+activated environments (virtualenvs, ``nvm``, ``cargo`` env) carry over
+between tool calls.  POSIX only; callers fall back to one subprocess per
+command elsewhere.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Cap on buffered stdout per command; tools truncate far below this anyway
+MAX_OUTPUT_BYTES = 1_000_000
+
+_SESSION_ENV = {
+    "PAGER": "cat",
+    "GIT_PAGER": "cat",
+    "TERM": "dumb",
+    "PS1": "",
+    "PS2": "",
+}
+
+
+class ShellSessionError(RuntimeError):
+    """Raised when the session's shell process dies or cannot be started."""
+
+
+class ShellSession:
+    """A bash process on a pseudo-terminal, reused across commands."""
+
+    def __init__(self, cwd: Path, shell: str = "bash") -> None:
+        self._cwd = cwd.resolve()
+        self._shell = shell
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._master_fd: int | None = None
+        self._stderr_path: Path | None = None
+        self._sentinel = ""
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Whether persistent sessions can run on this platform."""
+        return os.name == "posix" and shutil.which("bash") is not None
+
+    @property
+    def cwd(self) -> Path:
+        """Directory the shell starts in."""
+        return self._cwd
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def run(self, command: str, timeout: float) -> subprocess.CompletedProcess[str]:
+        """Run *command* in the session and return its output and exit code.
+
+        Raises ``subprocess.TimeoutExpired`` if the command does not finish in
+        time; the session is then discarded and the next call starts a fresh
+        shell (losing its state).
+        """
+        with self._lock:
+            if not self.alive:
+                self._start()
+            assert self._master_fd is not None and self._stderr_path is not None
+
+            # Brace group keeps `cd`/`export` in the session shell; stdin is
+            # detached so commands cannot consume the framing that follows.
+            script = (
+                f": > '{self._stderr_path}'\n"
+                f"{{\n{command}\n}} </dev/null\n"
+                f"printf '\\n{self._sentinel}:%d\\n' \"$?\"\n"
+            )
+            os.write(self._master_fd, script.encode("utf-8"))
+
+            try:
+                stdout, returncode = self._read_until_sentinel(timeout)
+            except subprocess.TimeoutExpired:
+                self._kill()
+                raise subprocess.TimeoutExpired(command, timeout) from None
+
+            try:
+                stderr = self._stderr_path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                stderr = ""
+
+        return subprocess.CompletedProcess(
+            args=command, returncode=returncode, stdout=stdout, stderr=stderr
+        )
+
+    def close(self) -> None:
+        """Terminate the shell and release the pseudo-terminal."""
+        with self._lock:
+            self._kill()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _start(self) -> None:
+        import pty
+        import termios
+
+        master_fd, slave_fd = pty.openpty()
+        attrs = termios.tcgetattr(slave_fd)
+        attrs[3] &= ~termios.ECHO  # don't echo our own commands back
+        termios.tcsetattr(slave_fd, termios.TCSANOW, attrs)
+
+        fd, stderr_name = tempfile.mkstemp(prefix="levelup-shell-", suffix=".err")
+        os.close(fd)
+
+        # stderr goes to a file (opened for append so per-command truncation
+        # works), which also keeps bash non-interactive: no prompts, job
+        # control or history expansion.
+        try:
+            with open(stderr_name, "ab") as stderr_file:
+                self._proc = subprocess.Popen(
+                    [self._shell, "--noprofile", "--norc"],
+                    stdin=slave_fd,
+                    stdout=slave_fd,
+                    stderr=stderr_file,
+                    cwd=str(self._cwd),
+                    env={**os.environ, **_SESSION_ENV},
+                    start_new_session=True,
+                )
+        except OSError as e:
+            os.close(master_fd)
+            Path(stderr_name).unlink(missing_ok=True)
+            raise ShellSessionError(f"Failed to start {self._shell}: {e}") from e
+        finally:
+            os.close(slave_fd)
+
+        self._master_fd = master_fd
+        self._stderr_path = Path(stderr_name)
+        self._sentinel = f"__LEVELUP_DONE_{uuid.uuid4().hex}__"
+        logger.debug("Started persistent shell (pid %s) in %s", self._proc.pid, self._cwd)
+
+    def _read_until_sentinel(self, timeout: float) -> tuple[str, int]:
+        assert self._master_fd is not None
+        marker = f"\n{self._sentinel}:".encode()
+        deadline = time.monotonic() + timeout
+        buf = bytearray()
+        search_from = 0
+
+        while True:
+            idx = buf.find(marker, search_from)
+            if idx >= 0:
+                end = buf.find(b"\n", idx + len(marker))
+                if end >= 0:
+                    code = buf[idx + len(marker):end].strip()
+                    text = bytes(buf[:idx]).decode("utf-8", errors="replace")
+                    return text, int(code or 1)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired("", timeout)
+            ready, _, _ = select.select([self._master_fd], [], [], min(remaining, 0.5))
+            if not ready:
+                if not self.alive:
+                    self._kill()
+                    raise ShellSessionError("Shell session exited unexpectedly")
+                continue
+            try:
+                chunk = os.read(self._master_fd, 65536)
+            except OSError:
+                chunk = b""
+            if not chunk:
+                self._kill()
+                raise ShellSessionError("Shell session exited unexpectedly")
+
+            # Resume the search where a marker may straddle the chunk boundary
+            search_from = idx if idx >= 0 else max(0, len(buf) - len(marker))
+            buf.extend(chunk)
+            # PTYs translate "\n" to "\r\n"; normalise so the marker matches
+            buf[search_from:] = buf[search_from:].replace(b"\r\n", b"\n")
+            if len(buf) > MAX_OUTPUT_BYTES:
+                # Keep the head (what tools show) and the tail (where the sentinel lands)
+                keep = MAX_OUTPUT_BYTES // 2
+                buf = buf[:keep] + b"\n... (output elided)\n" + buf[-keep:]
+                search_from = 0
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                try:
+                    os.killpg(self._proc.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+                try:
+                    self._proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+            self._proc = None
+        if self._master_fd is not None:
+            try:
+                os.close(self._master_fd)
+            except OSError:
+                pass
+            self._master_fd = None
+        if self._stderr_path is not None:
+            self._stderr_path.unlink(missing_ok=True)
+            self._stderr_path = None
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import os
+import re
+import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from levelup.core.context import TestResult
+from levelup.core.test_cache import TestResultCache, run_test_command
 from levelup.tools.base import BaseTool
+from levelup.tools.shell_session import ShellSession
 
 DEFAULT_TIMEOUT = 120
+PYTEST_NO_TESTS_COLLECTED = 5
+PYTEST_USAGE_ERROR = 4
 
 
 class TestRunnerTool(BaseTool):
@@ -17,11 +25,26 @@ class TestRunnerTool(BaseTool):
     description = "Run the project's test suite and return structured results."
 
     def __init__(
-        self, project_root: Path, test_command: str | None = None, timeout: int = DEFAULT_TIMEOUT
+        self,
+        project_root: Path,
+        test_command: str | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        *,
+        test_runner: str | None = None,
+        workers: int | None = None,
+        shard_files: bool = False,
+        test_cache: TestResultCache | None = None,
+        session: ShellSession | None = None,
     ) -> None:
         self._root = project_root.resolve()
         self._test_command = test_command
         self._timeout = timeout
+        self._test_runner = test_runner
+        self._workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._shard_files = shard_files
+        self._has_xdist: bool | None = None
+        self._test_cache = test_cache
+        self._session = session
 
     def get_input_schema(self) -> dict[str, Any]:
         return {
@@ -46,27 +69,13 @@ class TestRunnerTool(BaseTool):
         timeout = kwargs.get("timeout", self._timeout)
 
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=str(self._root),
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-
-            output = ""
-            if result.stdout:
-                output += result.stdout
-            if result.stderr:
-                output += f"\n{result.stderr}"
+            test_result = self._run_parallel(command, timeout)
 
+            output = test_result.output
             # Truncate very long output
             if len(output) > 10000:
                 output = output[:10000] + "\n... (truncated)"
 
-            test_result = _parse_test_output(output, result.returncode, command)
-
             # Return both structured summary and raw output
             summary = (
                 f"Tests {'PASSED' if test_result.passed else 'FAILED'}: "
@@ -87,21 +96,236 @@ class TestRunnerTool(BaseTool):
             return TestResult(passed=False, output="No test command configured", command="")
 
         try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                cwd=str(self._root),
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-            )
-            output = result.stdout + ("\n" + result.stderr if result.stderr else "")
-            return _parse_test_output(output, result.returncode, cmd)
+            return self._run_parallel(cmd, self._timeout)
         except subprocess.TimeoutExpired:
             return TestResult(passed=False, output=f"Timed out after {self._timeout}s", command=cmd)
         except Exception as e:
             return TestResult(passed=False, output=str(e), command=cmd)
 
+    # ------------------------------------------------------------------
+    # Parallel execution
+    # ------------------------------------------------------------------
+
+    def _run_parallel(self, command: str, timeout: int) -> TestResult:
+        """Run *command*, using runner parallelism or file shards when possible."""
+        shards = self._plan_commands(command)
+        if len(shards) == 1:
+            output, returncode = self._run_single(shards[0], timeout, self._session)
+            if shards[0] != command and _xdist_missing(output, returncode):
+                # The manifest lists pytest-xdist (say, as an extra) but it
+                # isn't installed: plan again without "-n"
+                self._has_xdist = False
+                return self._run_parallel(command, timeout)
+            return _parse_test_output(output, returncode, shards[0])
+
+        # Shards run concurrently, so they cannot share the session
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            runs = list(pool.map(lambda c: self._run_single(c, timeout, None), shards))
+        # A shard made only of helper-style test files collects nothing (pytest
+        # exit 5); that is fine as long as another shard did collect tests
+        collected = any(code != PYTEST_NO_TESTS_COLLECTED for _, code in runs)
+        results = [
+            _parse_test_output(
+                output, 0 if collected and code == PYTEST_NO_TESTS_COLLECTED else code, shard
+            )
+            for (output, code), shard in zip(runs, shards)
+        ]
+        return _merge_results(results, command)
+
+    def _run_single(
+        self, command: str, timeout: int, session: ShellSession | None
+    ) -> tuple[str, int]:
+        """Run one command; returns its combined output and exit code."""
+        result = run_test_command(
+            command, self._root, timeout, cache=self._test_cache, session=session
+        )
+        output = result.stdout or ""
+        if result.stderr:
+            output += f"\n{result.stderr}"
+        return output, result.returncode
+
+    def _plan_commands(self, command: str) -> list[str]:
+        """Return the command(s) to run: one with parallel flags, or several shards."""
+        workers = self._workers
+        runner = self._test_runner
+        if workers <= 1 or runner is None:
+            return [command]
+
+        if runner == "pytest":
+            if _has_any_flag(command, ("-n", "--numprocesses")):
+                return [command]
+            if self._project_has_xdist():
+                return [f"{command} -n {workers}"]
+            # Shards name the test files explicitly, bypassing the project's
+            # own collection settings, so they are opt-in and only used when
+            # the project doesn't configure collection
+            if self._shard_files and not _has_pytest_collection_config(self._root):
+                return self._shard_pytest(command, workers)
+            return [command]
+
+        add_flags = _PARALLEL_FLAGS.get(runner)
+        if add_flags is None:
+            return [command]
+        return [add_flags(command, workers)]
+
+    def _project_has_xdist(self) -> bool:
+        """Whether the project declares pytest-xdist in one of its manifests."""
+        if self._has_xdist is None:
+            self._has_xdist = False
+            for name in _XDIST_MANIFESTS:
+                path = self._root / name
+                try:
+                    if path.is_file() and "pytest-xdist" in path.read_text(
+                        encoding="utf-8", errors="ignore"
+                    ).lower():
+                        self._has_xdist = True
+                        break
+                except OSError:
+                    continue
+        return self._has_xdist
+
+    def _shard_pytest(self, command: str, workers: int) -> list[str]:
+        """Split the project's pytest files across *workers* subprocesses.
+
+        Commands that already name paths are not sharded, since the shards
+        would each run the named paths in full.
+        """
+        try:
+            tokens = shlex.split(command)
+        except ValueError:
+            return [command]
+        if any(not t.startswith("-") and ("/" in t or t.endswith(".py")) for t in tokens[1:]):
+            return [command]
+
+        files = _find_python_test_files(self._root)
+        if len(files) < 2:
+            return [command]
+
+        # Greedy balance by file size (a cheap proxy for test count)
+        count = min(workers, len(files))
+        shards: list[list[str]] = [[] for _ in range(count)]
+        loads = [0] * count
+        for rel, size in sorted(files, key=lambda f: f[1], reverse=True):
+            idx = loads.index(min(loads))
+            shards[idx].append(rel)
+            loads[idx] += size
+        return [" ".join([command] + [shlex.quote(f) for f in sorted(s)]) for s in shards]
+
+
+_XDIST_MANIFESTS = (
+    "pyproject.toml",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "setup.cfg",
+    "tox.ini",
+    "Pipfile",
+)
+
+
+_PYTEST_CONFIGS = ("pytest.ini", ".pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini")
+_COLLECTION_OPTION = re.compile(
+    r"^\s*(testpaths|python_files|norecursedirs)\s*=", re.MULTILINE
+)
+
+
+def _has_pytest_collection_config(root: Path) -> bool:
+    """Whether the project tells pytest where or which files to collect."""
+    for name in _PYTEST_CONFIGS:
+        try:
+            text = (root / name).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+        if _COLLECTION_OPTION.search(text):
+            return True
+    return False
+
+
+def _xdist_missing(output: str, returncode: int) -> bool:
+    """Whether pytest rejected ``-n`` because pytest-xdist isn't installed."""
+    return returncode == PYTEST_USAGE_ERROR and bool(
+        re.search(r"unrecognized arguments:.*(^|\s)-n\b", output, re.MULTILINE)
+    )
+
+
+def _has_any_flag(command: str, flags: tuple[str, ...]) -> bool:
+    """True if *command* already passes one of *flags* (``-x N`` or ``-x=N`` forms)."""
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return True
+    return any(t == f or t.startswith(f + "=") for t in tokens for f in flags)
+
+
+def _jest_flags(command: str, workers: int) -> str:
+    if _has_any_flag(command, ("--maxWorkers", "-w", "--runInBand", "-i")):
+        return command
+    return f"{command} --maxWorkers={workers}"
+
+
+def _mocha_flags(command: str, workers: int) -> str:
+    if _has_any_flag(command, ("--parallel", "-p")):
+        return command
+    return f"{command} --parallel --jobs {workers}"
+
+
+def _go_flags(command: str, workers: int) -> str:
+    if _has_any_flag(command, ("-p",)) or not command.startswith("go test"):
+        return command
+    return command.replace("go test", f"go test -p {workers}", 1)
+
+
+def _cargo_flags(command: str, workers: int) -> str:
+    if "--test-threads" in command:
+        return command
+    separator = " " if " -- " in f"{command} " else " -- "
+    return f"{command}{separator}--test-threads={workers}"
+
+
+_PARALLEL_FLAGS: dict[str, Callable[[str, int], str]] = {
+    "jest": _jest_flags,
+    "mocha": _mocha_flags,
+    "go_test": _go_flags,
+    "cargo_test": _cargo_flags,
+}
+
+
+def _find_python_test_files(root: Path) -> list[tuple[str, int]]:
+    """Return (relative path, size) for pytest-style test files under *root*.
+
+    Empty if the tree is too large to list completely.
+    """
+    from levelup.core.test_selection import is_test_file
+    from levelup.detection.scanner import ProjectScan
+
+    scan = ProjectScan(root)
+    if scan.truncated:
+        # A partial file list would silently skip tests; run the command unsharded
+        return []
+    found: list[tuple[str, int]] = []
+    for rel in scan.files:
+        if rel.endswith(".py") and is_test_file(rel):
+            try:
+                found.append((rel, (root / rel).stat().st_size))
+            except OSError:
+                continue
+    return found
+
+
+def _merge_results(results: list[TestResult], command: str) -> TestResult:
+    """Combine shard results into a single TestResult."""
+    sections = [
+        f"=== shard {i + 1}/{len(results)}: {r.command} ===\n{r.output}"
+        for i, r in enumerate(results)
+    ]
+    return TestResult(
+        passed=all(r.passed for r in results),
+        total=sum(r.total for r in results),
+        failures=sum(r.failures for r in results),
+        errors=sum(r.errors for r in results),
+        output="\n".join(sections),
+        command=command,
+    )
+
 
 def _extract_number_before(text: str, keyword: str) -> int | None:
     """Extract the integer immediately before a keyword in text.
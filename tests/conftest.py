@@ -1,6 +1,9 @@
 """Shared test fixtures."""
 
+import json
 import os
+from collections.abc import Callable, Iterator
+from typing import Any
 
 import pytest
 
@@ -15,3 +18,168 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
     for item in items:
         if not any(m.name == "regression" for m in item.iter_markers()):
             item.add_marker(smoke)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_runs_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep per-run event logs out of the real ~/.levelup/runs."""
+    monkeypatch.setattr(
+        "levelup.core.events.DEFAULT_RUNS_DIR", tmp_path_factory.mktemp("runs")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_test_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep cached test results out of the real ~/.levelup/test_cache."""
+    monkeypatch.setattr(
+        "levelup.core.test_cache.DEFAULT_CACHE_DIR", tmp_path_factory.mktemp("test_cache")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_detection_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep cached project detection out of the real ~/.levelup/detection_cache."""
+    monkeypatch.setattr(
+        "levelup.detection.cache.DEFAULT_CACHE_DIR", tmp_path_factory.mktemp("detection_cache")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolated_terminal_logs(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep GUI terminal logs out of the real ~/.levelup/terminal_logs."""
+    monkeypatch.setattr(
+        "levelup.gui.terminal_log.DEFAULT_TERMINAL_LOG_DIR",
+        tmp_path_factory.mktemp("terminal_logs"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state_managers() -> Iterator[None]:
+    """Don't let a test reuse another test's (possibly mocked) shared StateManager."""
+    from levelup.state.manager import clear_state_managers
+
+    clear_state_managers()
+    yield
+    clear_state_managers()
+
+
+class _SDKStream:
+    """Stands in for the ``MessageStream`` of ``messages.stream(...)``, built from SDK types.
+
+    Replays the events the SDK yields for *message*: ``message_start``, each
+    block's start, text or ``input_json_delta`` deltas (with the SDK's
+    ``text``/``input_json`` events after each) and stop, then ``message_delta``
+    with the stop reason and output tokens and ``message_stop``.  The API's
+    ``ping`` events never reach this iterator; the SDK drops them.
+    """
+
+    def __init__(self, message: Any) -> None:
+        self._message = message
+
+    def __enter__(self) -> "_SDKStream":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def __iter__(self) -> Iterator[Any]:
+        from anthropic.lib.streaming import InputJsonEvent, TextEvent
+        from anthropic.types import RawMessageStreamEvent
+        from pydantic import TypeAdapter
+
+        raw = TypeAdapter(RawMessageStreamEvent).validate_python
+        message = self._message
+        start = message.model_dump()
+        start.update(content=[], stop_reason=None)
+        start["usage"].update(output_tokens=1)
+        yield raw({"type": "message_start", "message": start})
+        for index, block in enumerate(message.content):
+            if block.type == "text":
+                first: dict[str, Any] = {"type": "text", "text": ""}
+                full, kind, key = block.text, "text_delta", "text"
+            else:
+                first = {"type": "tool_use", "id": block.id, "name": block.name, "input": {}}
+                full, kind, key = json.dumps(block.input), "input_json_delta", "partial_json"
+            yield raw({"type": "content_block_start", "index": index, "content_block": first})
+            half = len(full) // 2
+            for end, chunk in ((half, full[:half]), (len(full), full[half:])):
+                if not chunk:
+                    continue
+                yield raw({"type": "content_block_delta", "index": index, "delta": {"type": kind, key: chunk}})
+                if kind == "text_delta":
+                    yield TextEvent(type="text", text=chunk, snapshot=full[:end])
+                else:
+                    snapshot = block.input if end == len(full) else {}
+                    yield InputJsonEvent(type="input_json", partial_json=chunk, snapshot=snapshot)
+            yield raw({"type": "content_block_stop", "index": index})
+        yield raw(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": message.stop_reason, "stop_sequence": None},
+                "usage": {"output_tokens": message.usage.output_tokens},
+            }
+        )
+        yield raw({"type": "message_stop"})
+
+    def get_final_message(self) -> Any:
+        return self._message
+
+    def close(self) -> None:
+        pass
+
+
+class _SDKStreams:
+    """Builds SDK ``Message`` objects and ``messages.stream`` side effects that replay them."""
+
+    @staticmethod
+    def tool_use(name: str, input: dict[str, Any] | None = None, id: str = "toolu_1") -> Any:
+        from anthropic.types import ToolUseBlock
+
+        return ToolUseBlock(type="tool_use", id=id, name=name, input=input or {})
+
+    @staticmethod
+    def message(
+        *content: Any,
+        stop_reason: str | None = None,
+        input_tokens: int = 10,
+        output_tokens: int = 5,
+    ) -> Any:
+        """A ``Message``; plain strings in *content* become text blocks."""
+        from anthropic.types import Message, TextBlock, Usage
+
+        blocks = [TextBlock(type="text", text=c) if isinstance(c, str) else c for c in content]
+        if stop_reason is None:
+            has_tool_use = any(b.type == "tool_use" for b in blocks)
+            stop_reason = "tool_use" if has_tool_use else "end_turn"
+        return Message(
+            id="msg_test",
+            type="message",
+            role="assistant",
+            model="claude-test",
+            content=blocks,
+            stop_reason=stop_reason,
+            stop_sequence=None,
+            usage=Usage(input_tokens=input_tokens, output_tokens=output_tokens),
+        )
+
+    @staticmethod
+    def replay(*messages: Any) -> Callable[..., _SDKStream]:
+        """A ``messages.stream`` side effect: one message per call, the last one repeating."""
+        queue = list(messages)
+
+        def stream(**kwargs: Any) -> _SDKStream:
+            return _SDKStream(queue.pop(0) if len(queue) > 1 else queue[0])
+
+        return stream
+
+
+@pytest.fixture
+def sdk_stream() -> _SDKStreams:
+    """Canned Anthropic SDK messages and ``messages.stream`` side effects replaying them."""
+    return _SDKStreams()
@@ -54,29 +54,13 @@ def settings(sample_project):
     )
 
 
-def _make_mock_response(text: str, input_tokens: int = 100, output_tokens: int = 50):
-    """Create a mock Anthropic response with text content and usage info."""
-    mock_response = MagicMock()
-    mock_block = MagicMock()
-    mock_block.type = "text"
-    mock_block.text = text
-    mock_response.content = [mock_block]
-    mock_response.stop_reason = "end_turn"
-
-    # Add usage info
-    mock_usage = MagicMock()
-    mock_usage.input_tokens = input_tokens
-    mock_usage.output_tokens = output_tokens
-    mock_response.usage = mock_usage
-
-    return mock_response
-
-
 class TestCostBreakdownPipelineIntegration:
     """Integration tests for cost tracking through pipeline execution."""
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_cost_tracked_across_pipeline_steps(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_cost_tracked_across_pipeline_steps(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Cost should be calculated and accumulated across all pipeline steps."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -121,13 +105,13 @@ class TestCostBreakdownPipelineIntegration:
         })
 
         # Mock responses with varying token usage
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=10000, output_tokens=5000),
-            _make_mock_response(plan_json, input_tokens=8000, output_tokens=4000),
-            _make_mock_response(test_writer_json, input_tokens=12000, output_tokens=6000),
-            _make_mock_response("# Code implementation", input_tokens=15000, output_tokens=8000),
-            _make_mock_response(review_json, input_tokens=9000, output_tokens=4500),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=10000, output_tokens=5000),
+            sdk_stream.message(plan_json, input_tokens=8000, output_tokens=4000),
+            sdk_stream.message(test_writer_json, input_tokens=12000, output_tokens=6000),
+            sdk_stream.message("# Code implementation", input_tokens=15000, output_tokens=8000),
+            sdk_stream.message(review_json, input_tokens=9000, output_tokens=4500),
+        )
 
         orchestrator = Orchestrator(settings=settings)
         ctx = orchestrator.run(task_input=TaskInput(title="Add greeting function"))
@@ -161,8 +145,8 @@ class TestCostBreakdownPipelineIntegration:
         assert "review" in ctx.step_usage
         assert ctx.step_usage["review"].cost_usd == pytest.approx(0.0945, abs=0.001)
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_cost_varies_by_model(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_cost_varies_by_model(self, mock_anthropic_cls, settings, sdk_stream):
         """Cost should vary based on the model used (Sonnet vs Opus)."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -176,9 +160,9 @@ class TestCostBreakdownPipelineIntegration:
         })
 
         # Same token usage for both runs
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=100000, output_tokens=50000),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=100000, output_tokens=50000),
+        )
 
         # Run with Sonnet model
         settings.llm.model = "claude-sonnet-4-5-20250929"
@@ -191,9 +175,9 @@ class TestCostBreakdownPipelineIntegration:
 
         # Now test with Opus model
         settings.llm.model = "claude-opus-4-6"
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=100000, output_tokens=50000),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=100000, output_tokens=50000),
+        )
 
         orchestrator = Orchestrator(settings=settings)
         ctx = orchestrator.run(task_input=TaskInput(title="Test"))
@@ -205,8 +189,10 @@ class TestCostBreakdownPipelineIntegration:
         # Opus should cost more than Sonnet
         assert opus_cost > sonnet_cost
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_cost_breakdown_persists_to_state_manager(self, mock_anthropic_cls, settings, tmp_path):
+    @patch("anthropic.Anthropic")
+    def test_cost_breakdown_persists_to_state_manager(
+        self, mock_anthropic_cls, settings, tmp_path, sdk_stream
+    ):
         """Cost breakdown should be persisted to state database."""
         from levelup.state.manager import StateManager
 
@@ -221,9 +207,9 @@ class TestCostBreakdownPipelineIntegration:
             "clarifications": [],
         })
 
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=10000, output_tokens=5000),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=10000, output_tokens=5000),
+        )
 
         # Create state manager with test database
         db_path = tmp_path / "test.db"
@@ -244,8 +230,8 @@ class TestCostBreakdownPipelineIntegration:
         assert record.input_tokens == 10000
         assert record.output_tokens == 5000
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_zero_cost_when_no_tokens_used(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_zero_cost_when_no_tokens_used(self, mock_anthropic_cls, settings, sdk_stream):
         """Cost should be zero when no tokens are consumed."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -259,9 +245,9 @@ class TestCostBreakdownPipelineIntegration:
         })
 
         # Response with zero tokens
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=0, output_tokens=0),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=0, output_tokens=0),
+        )
 
         orchestrator = Orchestrator(settings=settings)
         ctx = orchestrator.run(task_input=TaskInput(title="Test"))
@@ -270,8 +256,8 @@ class TestCostBreakdownPipelineIntegration:
         assert ctx.step_usage["requirements"].cost_usd == 0.0
         assert ctx.total_cost_usd == 0.0
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_step_usage_includes_all_metrics(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_step_usage_includes_all_metrics(self, mock_anthropic_cls, settings, sdk_stream):
         """StepUsage should include cost, tokens, duration, and turns."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -284,9 +270,9 @@ class TestCostBreakdownPipelineIntegration:
             "clarifications": [],
         })
 
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=5000, output_tokens=2500),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=5000, output_tokens=2500),
+        )
 
         orchestrator = Orchestrator(settings=settings)
         ctx = orchestrator.run(task_input=TaskInput(title="Test"))
@@ -304,8 +290,10 @@ class TestCostBreakdownPipelineIntegration:
 class TestCostBreakdownDisplayOutput:
     """Tests for cost breakdown display in CLI output."""
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_cost_breakdown_appears_in_pipeline_summary(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_cost_breakdown_appears_in_pipeline_summary(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Cost breakdown table should appear in pipeline summary output."""
         from io import StringIO
 
@@ -322,9 +310,9 @@ class TestCostBreakdownDisplayOutput:
             "clarifications": [],
         })
 
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=10000, output_tokens=5000),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=10000, output_tokens=5000),
+        )
 
         orchestrator = Orchestrator(settings=settings)
         ctx = orchestrator.run(task_input=TaskInput(title="Test"))
@@ -358,8 +346,10 @@ class TestCostBreakdownDisplayOutput:
         finally:
             display_module.console = original_console
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_cost_breakdown_shows_all_pipeline_steps(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_cost_breakdown_shows_all_pipeline_steps(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Cost breakdown should show all steps that were executed."""
         from io import StringIO
 
@@ -388,13 +378,13 @@ class TestCostBreakdownDisplayOutput:
             "test_files": [{"path": "tests/test_it.py", "description": "Test"}]
         })
 
-        mock_client.messages.create.side_effect = [
-            _make_mock_response(requirements_json, input_tokens=1000, output_tokens=500),
-            _make_mock_response(plan_json, input_tokens=800, output_tokens=400),
-            _make_mock_response(test_writer_json, input_tokens=1200, output_tokens=600),
-            _make_mock_response("# Code", input_tokens=1500, output_tokens=750),
-            _make_mock_response(json.dumps({"approved": True, "summary": "OK", "issues": [], "suggestions": []}), input_tokens=900, output_tokens=450),
-        ]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(requirements_json, input_tokens=1000, output_tokens=500),
+            sdk_stream.message(plan_json, input_tokens=800, output_tokens=400),
+            sdk_stream.message(test_writer_json, input_tokens=1200, output_tokens=600),
+            sdk_stream.message("# Code", input_tokens=1500, output_tokens=750),
+            sdk_stream.message(json.dumps({"approved": True, "summary": "OK", "issues": [], "suggestions": []}), input_tokens=900, output_tokens=450),
+        )
 
         orchestrator = Orchestrator(settings=settings)
         ctx = orchestrator.run(task_input=TaskInput(title="Test"))
@@ -32,6 +32,16 @@ def _ensure_qapp():
     return QApplication.instance() or QApplication([])
 
 
+def _wait_for_diff(widget, timeout: float = 10.0) -> None:
+    """Process events until the widget's background diff generation is done."""
+    from PyQt6.QtWidgets import QApplication
+
+    deadline = time.monotonic() + timeout
+    while widget.is_loading and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
 def _make_state_manager(tmp_path: Path):
     """Create a StateManager with a test database."""
     from levelup.state.manager import StateManager
@@ -90,13 +100,13 @@ class TestDiffViewNavigationFromRunsTable:
         win._refresh()
 
         # Get the runs table
-        from PyQt6.QtWidgets import QTableWidget
-        table = win.findChild(QTableWidget)
-        assert table is not None
+        from PyQt6.QtWidgets import QTableView
+        table = win._table
+        assert isinstance(table, QTableView)
 
         # Right-click on first row should show context menu with "View Changes"
         # (Testing context menu programmatically is complex, so we test the action exists)
-        table.setCurrentCell(0, 0)
+        table.setCurrentIndex(table.model().index(0, 0))
 
     def test_view_changes_enabled_only_for_git_tracked_runs(self, tmp_path):
         """View Changes menu item should be enabled only for runs with git tracking."""
@@ -128,9 +138,8 @@ class TestDiffViewNavigationFromRunsTable:
         win._refresh()
 
         # Both runs should be in the table
-        from PyQt6.QtWidgets import QTableWidget
-        table = win.findChild(QTableWidget)
-        assert table.rowCount() == 2
+        table = win._table
+        assert table.model().rowCount() == 2
 
     def test_clicking_view_changes_navigates_to_diff_view(self, tmp_path):
         """Clicking 'View Changes' should navigate to diff view page."""
@@ -264,6 +273,7 @@ class TestDiffViewFullWorkflow:
         # Verify diff is displayed
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         assert "requirements.txt" in html or "pytest" in html
@@ -319,6 +329,7 @@ class TestDiffViewFullWorkflow:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show both files
@@ -377,6 +388,7 @@ class TestDiffViewFullWorkflow:
 
         if req_index >= 0:
             combo.setCurrentIndex(req_index)
+            _wait_for_diff(widget)
             html = browser.toHtml()
             assert "req.txt" in html or "requirements" in html
 
@@ -461,6 +473,7 @@ class TestDiffViewLiveUpdates:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show latest diff even though run is paused
@@ -650,6 +663,7 @@ class TestDiffViewGitOperations:
         # Verify diff was generated
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         assert "file.py" in html or "content" in html
@@ -692,6 +706,7 @@ class TestDiffViewGitOperations:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show diff
@@ -743,6 +758,7 @@ class TestDiffViewGitOperations:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show diff even though worktree is gone
@@ -50,20 +50,9 @@ def settings(sample_project):
     )
 
 
-def _make_mock_response(text: str):
-    """Create a mock Anthropic response with text content."""
-    mock_response = MagicMock()
-    mock_block = MagicMock()
-    mock_block.type = "text"
-    mock_block.text = text
-    mock_response.content = [mock_block]
-    mock_response.stop_reason = "end_turn"
-    return mock_response
-
-
 class TestFullPipeline:
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_pipeline_completes_with_mocked_llm(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_pipeline_completes_with_mocked_llm(self, mock_anthropic_cls, settings, sdk_stream):
         """Test that the pipeline runs through all steps with mocked LLM responses."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -120,14 +109,14 @@ class TestFullPipeline:
 
         # Each agent will get a text-only response (no tool use)
         responses = [
-            _make_mock_response(requirements_json),
-            _make_mock_response(plan_json),
-            _make_mock_response(test_writer_json),
-            _make_mock_response(coder_json),
-            _make_mock_response(security_json),
-            _make_mock_response(review_json),
+            sdk_stream.message(requirements_json),
+            sdk_stream.message(plan_json),
+            sdk_stream.message(test_writer_json),
+            sdk_stream.message(coder_json),
+            sdk_stream.message(security_json),
+            sdk_stream.message(review_json),
         ]
-        mock_client.messages.create.side_effect = responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Add greeting endpoint", description="Add GET /greet")
@@ -140,32 +129,32 @@ class TestFullPipeline:
         assert ctx.plan.approach == "Add a greet function to main.py"
         assert ctx.language == "python"
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_pipeline_detects_python_project(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_pipeline_detects_python_project(self, mock_anthropic_cls, settings, sdk_stream):
         """Test that detection correctly identifies the sample project."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
         # Just return empty JSON for each agent so pipeline completes
         empty_responses = [
-            _make_mock_response(json.dumps({
+            sdk_stream.message(json.dumps({
                 "summary": "s", "requirements": [], "assumptions": [],
                 "out_of_scope": [], "clarifications": [],
             })),
-            _make_mock_response(json.dumps({
+            sdk_stream.message(json.dumps({
                 "approach": "a", "steps": [], "affected_files": [], "risks": [],
             })),
-            _make_mock_response(json.dumps({"test_files": []})),
-            _make_mock_response(json.dumps({
+            sdk_stream.message(json.dumps({"test_files": []})),
+            sdk_stream.message(json.dumps({
                 "files_written": [], "iterations": 0, "all_tests_passing": True,
             })),
-            _make_mock_response(json.dumps({
+            sdk_stream.message(json.dumps({
                 "findings": [], "patches_applied": 0,
                 "requires_coding_rework": False, "feedback_for_coder": "",
             })),
-            _make_mock_response(json.dumps({"findings": [], "overall_assessment": "ok"})),
+            sdk_stream.message(json.dumps({"findings": [], "overall_assessment": "ok"})),
         ]
-        mock_client.messages.create.side_effect = empty_responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*empty_responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Test detection")
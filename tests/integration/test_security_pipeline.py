@@ -54,23 +54,11 @@ def settings(sample_project):
     )
 
 
-def _make_mock_response(text: str, usage_in: int = 100, usage_out: int = 50):
-    """Create a mock Anthropic response with text content and usage stats."""
-    mock_response = MagicMock()
-    mock_block = MagicMock()
-    mock_block.type = "text"
-    mock_block.text = text
-    mock_response.content = [mock_block]
-    mock_response.stop_reason = "end_turn"
-    mock_response.usage = MagicMock()
-    mock_response.usage.input_tokens = usage_in
-    mock_response.usage.output_tokens = usage_out
-    return mock_response
-
-
 class TestSecurityPipelineCleanCode:
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_pipeline_with_no_security_issues(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_pipeline_with_no_security_issues(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Test security step when no vulnerabilities are found."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -114,14 +102,14 @@ class TestSecurityPipelineCleanCode:
         })
 
         responses = [
-            _make_mock_response(requirements_json),
-            _make_mock_response(plan_json),
-            _make_mock_response(test_writer_json),
-            _make_mock_response(coder_json),
-            _make_mock_response(security_json),
-            _make_mock_response(review_json),
+            sdk_stream.message(requirements_json),
+            sdk_stream.message(plan_json),
+            sdk_stream.message(test_writer_json),
+            sdk_stream.message(coder_json),
+            sdk_stream.message(security_json),
+            sdk_stream.message(review_json),
         ]
-        mock_client.messages.create.side_effect = responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Add login", description="Implement login endpoint")
@@ -134,8 +122,10 @@ class TestSecurityPipelineCleanCode:
 
 
 class TestSecurityPipelineMinorIssues:
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_pipeline_with_auto_patched_issues(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_pipeline_with_auto_patched_issues(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Test security step when minor issues are auto-patched."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -204,14 +194,14 @@ class TestSecurityPipelineMinorIssues:
         })
 
         responses = [
-            _make_mock_response(requirements_json),
-            _make_mock_response(plan_json),
-            _make_mock_response(test_writer_json),
-            _make_mock_response(coder_json),
-            _make_mock_response(security_json),
-            _make_mock_response(review_json),
+            sdk_stream.message(requirements_json),
+            sdk_stream.message(plan_json),
+            sdk_stream.message(test_writer_json),
+            sdk_stream.message(coder_json),
+            sdk_stream.message(security_json),
+            sdk_stream.message(review_json),
         ]
-        mock_client.messages.create.side_effect = responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Add login", description="Login endpoint")
@@ -225,8 +215,10 @@ class TestSecurityPipelineMinorIssues:
 
 
 class TestSecurityPipelineLoopBack:
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_pipeline_loops_back_for_major_issues(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_pipeline_loops_back_for_major_issues(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Test that major security issues trigger coding agent re-run."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -299,16 +291,16 @@ class TestSecurityPipelineLoopBack:
         })
 
         responses = [
-            _make_mock_response(requirements_json),
-            _make_mock_response(plan_json),
-            _make_mock_response(test_writer_json),
-            _make_mock_response(coder_json_1),  # First coding
-            _make_mock_response(security_json_1),  # Security finds issue
-            _make_mock_response(coder_json_2),  # Loop-back coding
-            _make_mock_response(security_json_2),  # Security re-check (clean)
-            _make_mock_response(review_json),
+            sdk_stream.message(requirements_json),
+            sdk_stream.message(plan_json),
+            sdk_stream.message(test_writer_json),
+            sdk_stream.message(coder_json_1),  # First coding
+            sdk_stream.message(security_json_1),  # Security finds issue
+            sdk_stream.message(coder_json_2),  # Loop-back coding
+            sdk_stream.message(security_json_2),  # Security re-check (clean)
+            sdk_stream.message(review_json),
         ]
-        mock_client.messages.create.side_effect = responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Add login", description="Login endpoint")
@@ -319,10 +311,12 @@ class TestSecurityPipelineLoopBack:
         assert ctx.security_findings == []
         assert ctx.requires_coding_rework is False
         # Verify coding agent was called twice (initial + loop-back)
-        assert mock_client.messages.create.call_count == 8
+        assert mock_client.messages.stream.call_count == 8
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_pipeline_continues_after_failed_retry(self, mock_anthropic_cls, settings):
+    @patch("anthropic.Anthropic")
+    def test_pipeline_continues_after_failed_retry(
+        self, mock_anthropic_cls, settings, sdk_stream
+    ):
         """Test that pipeline continues to checkpoint if issue remains after retry."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
@@ -377,16 +371,16 @@ class TestSecurityPipelineLoopBack:
         })
 
         responses = [
-            _make_mock_response(requirements_json),
-            _make_mock_response(plan_json),
-            _make_mock_response(test_writer_json),
-            _make_mock_response(coder_json),  # First coding
-            _make_mock_response(security_json),  # Security finds issue
-            _make_mock_response(coder_json),  # Loop-back coding
-            _make_mock_response(security_json),  # Security still finds issue
-            _make_mock_response(review_json),
+            sdk_stream.message(requirements_json),
+            sdk_stream.message(plan_json),
+            sdk_stream.message(test_writer_json),
+            sdk_stream.message(coder_json),  # First coding
+            sdk_stream.message(security_json),  # Security finds issue
+            sdk_stream.message(coder_json),  # Loop-back coding
+            sdk_stream.message(security_json),  # Security still finds issue
+            sdk_stream.message(review_json),
         ]
-        mock_client.messages.create.side_effect = responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Add login", description="Login endpoint")
@@ -401,10 +395,10 @@ class TestSecurityPipelineLoopBack:
 
 
 class TestSecurityPipelineGitCommits:
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
+    @patch("anthropic.Anthropic")
     @patch("git.Repo")
     def test_security_loop_back_creates_revised_commits(
-        self, mock_repo_cls, mock_anthropic_cls, settings
+        self, mock_repo_cls, mock_anthropic_cls, settings, sdk_stream
     ):
         """Test that loop-back creates revised git commits."""
         # Enable git commits
@@ -469,16 +463,16 @@ class TestSecurityPipelineGitCommits:
         review_json = json.dumps({"findings": [], "overall_assessment": "OK"})
 
         responses = [
-            _make_mock_response(requirements_json),
-            _make_mock_response(plan_json),
-            _make_mock_response(test_writer_json),
-            _make_mock_response(coder_json),
-            _make_mock_response(security_json_bad),
-            _make_mock_response(coder_json),
-            _make_mock_response(security_json_good),
-            _make_mock_response(review_json),
+            sdk_stream.message(requirements_json),
+            sdk_stream.message(plan_json),
+            sdk_stream.message(test_writer_json),
+            sdk_stream.message(coder_json),
+            sdk_stream.message(security_json_bad),
+            sdk_stream.message(coder_json),
+            sdk_stream.message(security_json_good),
+            sdk_stream.message(review_json),
         ]
-        mock_client.messages.create.side_effect = responses
+        mock_client.messages.stream.side_effect = sdk_stream.replay(*responses)
 
         orchestrator = Orchestrator(settings=settings)
         task = TaskInput(title="Login", description="Login")
@@ -12,7 +12,7 @@ import pytest
 from levelup.agents.backend import AgentResult, AnthropicSDKBackend, Backend, ClaudeCodeBackend
 from levelup.agents.base import BaseAgent
 from levelup.agents.claude_code_client import ClaudeCodeClient
-from levelup.agents.llm_client import LLMClient, ToolLoopResult
+from levelup.agents.llm_client import STREAM_IDLE_TIMEOUT, LLMClient, ToolLoopResult
 from levelup.agents.requirements import RequirementsAgent
 from levelup.agents.planning import PlanningAgent
 from levelup.agents.test_writer import TestWriterAgent
@@ -131,17 +131,13 @@ def tool_registry() -> ToolRegistry:
 class TestLLMClient:
     """Tests for LLMClient with a mocked anthropic.Anthropic client."""
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_structured_call_returns_text(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_structured_call_returns_text(self, MockAnthropic: MagicMock, sdk_stream):
         # Arrange
         mock_client = MockAnthropic.return_value
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "Hello from the model"
-
-        mock_response = MagicMock()
-        mock_response.content = [text_block]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message("Hello from the model")
+        )
 
         llm = LLMClient(api_key="test-key", model="claude-test")
 
@@ -153,74 +149,53 @@ class TestLLMClient:
 
         # Assert
         assert result == "Hello from the model"
-        mock_client.messages.create.assert_called_once()
-        call_kwargs = mock_client.messages.create.call_args.kwargs
+        mock_client.messages.stream.assert_called_once()
+        call_kwargs = mock_client.messages.stream.call_args.kwargs
         assert call_kwargs["system"] == "You are helpful."
         assert call_kwargs["model"] == "claude-test"
+        assert call_kwargs["timeout"] == STREAM_IDLE_TIMEOUT
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_structured_call_passes_tools_when_provided(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_structured_call_passes_tools_when_provided(self, MockAnthropic: MagicMock, sdk_stream):
         mock_client = MockAnthropic.return_value
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "result"
-        mock_response = MagicMock()
-        mock_response.content = [text_block]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(sdk_stream.message("result"))
 
         llm = LLMClient(api_key="k")
         tools = [{"name": "t", "description": "d", "input_schema": {}}]
         llm.structured_call(system="s", messages=[{"role": "user", "content": "q"}], tools=tools)
 
-        call_kwargs = mock_client.messages.create.call_args.kwargs
+        call_kwargs = mock_client.messages.stream.call_args.kwargs
         assert call_kwargs["tools"] == tools
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_structured_call_omits_tools_when_none(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_structured_call_omits_tools_when_none(self, MockAnthropic: MagicMock, sdk_stream):
         mock_client = MockAnthropic.return_value
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "ok"
-        mock_response = MagicMock()
-        mock_response.content = [text_block]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(sdk_stream.message("ok"))
 
         llm = LLMClient(api_key="k")
         llm.structured_call(system="s", messages=[{"role": "user", "content": "q"}])
 
-        call_kwargs = mock_client.messages.create.call_args.kwargs
+        call_kwargs = mock_client.messages.stream.call_args.kwargs
         assert "tools" not in call_kwargs
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_structured_call_joins_multiple_text_blocks(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_structured_call_joins_multiple_text_blocks(self, MockAnthropic: MagicMock, sdk_stream):
         mock_client = MockAnthropic.return_value
-        block1 = MagicMock()
-        block1.type = "text"
-        block1.text = "part1"
-        block2 = MagicMock()
-        block2.type = "text"
-        block2.text = "part2"
-        mock_response = MagicMock()
-        mock_response.content = [block1, block2]
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message("part1", "part2")
+        )
 
         llm = LLMClient(api_key="k")
         result = llm.structured_call(system="s", messages=[{"role": "user", "content": "q"}])
         assert result == "part1\npart2"
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_run_tool_loop_no_tool_use(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_run_tool_loop_no_tool_use(self, MockAnthropic: MagicMock, sdk_stream):
         """When the model responds with only text (no tool_use), the loop should return immediately."""
         mock_client = MockAnthropic.return_value
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "Final answer"
-        mock_response = MagicMock()
-        mock_response.content = [text_block]
-        mock_response.usage = MagicMock()
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message("Final answer", input_tokens=100, output_tokens=50)
+        )
 
         llm = LLMClient(api_key="k")
         reg = ToolRegistry()
@@ -231,37 +206,24 @@ class TestLLMClient:
             tool_registry=reg,
         )
         assert result.text == "Final answer"
+        assert (result.input_tokens, result.output_tokens) == (100, 50)
         # Only one API call since there was no tool use
-        assert mock_client.messages.create.call_count == 1
+        assert mock_client.messages.stream.call_count == 1
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_run_tool_loop_one_tool_call(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_run_tool_loop_one_tool_call(self, MockAnthropic: MagicMock, sdk_stream):
         """Simulate: first response uses a tool, second response is final text."""
         mock_client = MockAnthropic.return_value
-
-        # First response: tool_use
-        tool_block = MagicMock()
-        tool_block.type = "tool_use"
-        tool_block.id = "call_1"
-        tool_block.name = "dummy"
-        tool_block.input = {"x": "1"}
-        resp1 = MagicMock()
-        resp1.content = [tool_block]
-        resp1.usage = MagicMock()
-        resp1.usage.input_tokens = 100
-        resp1.usage.output_tokens = 50
-
-        # Second response: text
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "Done"
-        resp2 = MagicMock()
-        resp2.content = [text_block]
-        resp2.usage = MagicMock()
-        resp2.usage.input_tokens = 100
-        resp2.usage.output_tokens = 50
-
-        mock_client.messages.create.side_effect = [resp1, resp2]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            # First response: tool_use
+            sdk_stream.message(
+                sdk_stream.tool_use("dummy", {"x": "1"}, "call_1"),
+                input_tokens=100,
+                output_tokens=50,
+            ),
+            # Second response: text
+            sdk_stream.message("Done", input_tokens=100, output_tokens=50),
+        )
 
         # Register a tool that the loop will execute
         reg = ToolRegistry()
@@ -278,35 +240,18 @@ class TestLLMClient:
             tool_registry=reg,
         )
         assert result.text == "Done"
-        assert mock_client.messages.create.call_count == 2
+        assert (result.input_tokens, result.output_tokens) == (200, 100)
+        assert mock_client.messages.stream.call_count == 2
         dummy_tool.execute.assert_called_once_with(x="1")
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_run_tool_loop_on_tool_call_callback(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_run_tool_loop_on_tool_call_callback(self, MockAnthropic: MagicMock, sdk_stream):
         """The on_tool_call callback receives (name, input, result)."""
         mock_client = MockAnthropic.return_value
-
-        tool_block = MagicMock()
-        tool_block.type = "tool_use"
-        tool_block.id = "c1"
-        tool_block.name = "my_tool"
-        tool_block.input = {"key": "val"}
-        resp1 = MagicMock()
-        resp1.content = [tool_block]
-        resp1.usage = MagicMock()
-        resp1.usage.input_tokens = 100
-        resp1.usage.output_tokens = 50
-
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "end"
-        resp2 = MagicMock()
-        resp2.content = [text_block]
-        resp2.usage = MagicMock()
-        resp2.usage.input_tokens = 100
-        resp2.usage.output_tokens = 50
-
-        mock_client.messages.create.side_effect = [resp1, resp2]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(sdk_stream.tool_use("my_tool", {"key": "val"}, "c1")),
+            sdk_stream.message("end"),
+        )
 
         reg = ToolRegistry()
         tool = MagicMock()
@@ -325,32 +270,14 @@ class TestLLMClient:
         )
         callback.assert_called_once_with("my_tool", {"key": "val"}, "got_it")
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_run_tool_loop_unknown_tool(self, MockAnthropic: MagicMock):
+    @patch("anthropic.Anthropic")
+    def test_run_tool_loop_unknown_tool(self, MockAnthropic: MagicMock, sdk_stream):
         """When the model calls a tool not in the registry, an error result is sent back."""
         mock_client = MockAnthropic.return_value
-
-        tool_block = MagicMock()
-        tool_block.type = "tool_use"
-        tool_block.id = "c1"
-        tool_block.name = "nonexistent_tool"
-        tool_block.input = {}
-        resp1 = MagicMock()
-        resp1.content = [tool_block]
-        resp1.usage = MagicMock()
-        resp1.usage.input_tokens = 100
-        resp1.usage.output_tokens = 50
-
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "fallback"
-        resp2 = MagicMock()
-        resp2.content = [text_block]
-        resp2.usage = MagicMock()
-        resp2.usage.input_tokens = 100
-        resp2.usage.output_tokens = 50
-
-        mock_client.messages.create.side_effect = [resp1, resp2]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(sdk_stream.tool_use("nonexistent_tool", {}, "c1")),
+            sdk_stream.message("fallback"),
+        )
 
         reg = ToolRegistry()
         llm = LLMClient(api_key="k")
@@ -362,7 +289,7 @@ class TestLLMClient:
         )
         assert result.text == "fallback"
         # The second call's messages should include the error tool_result
-        second_call_msgs = mock_client.messages.create.call_args_list[1].kwargs["messages"]
+        second_call_msgs = mock_client.messages.stream.call_args_list[1].kwargs["messages"]
         tool_result_content = second_call_msgs[-1]["content"]
         assert any("Error" in tr["content"] for tr in tool_result_content)
 
@@ -0,0 +1,114 @@
+"""Unit tests for the end-to-end benchmark harness (benchmarks/)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_backend import FakeBackend
+from benchmarks.harness import (
+    PHASES,
+    Scenario,
+    ScenarioResult,
+    find_regressions,
+    install_fake_claude,
+    load_baseline,
+    run_scenario,
+    save_baseline,
+)
+from benchmarks.repos import make_repo
+from benchmarks.responses import FEATURE_MODULE, FEATURE_TEST, identify_agent
+from levelup.agents.claude_code_client import ClaudeCodeClient
+from levelup.agents.coder import CodeAgent
+from levelup.agents.requirements import RequirementsAgent
+from levelup.core.context import PipelineContext, TaskInput
+
+
+def _result(name_files: int, **phases: float) -> ScenarioResult:
+    values = {p: 0.0 for p in PHASES}
+    values.update(phases)
+    return ScenarioResult(scenario=Scenario(files=name_files), runs=1, wall_ms=0, phases_ms=values)
+
+
+class TestResponses:
+    def test_identifies_real_agent_prompts(self, tmp_path: Path):
+        backend = FakeBackend()
+        ctx = PipelineContext(task=TaskInput(title="t"), project_path=tmp_path)
+        requirements = RequirementsAgent(backend, tmp_path).get_system_prompt(ctx)
+        coder = CodeAgent(backend, tmp_path).get_system_prompt(ctx)
+        assert identify_agent(requirements) == "requirements"
+        assert identify_agent(coder) == "coder"
+
+    def test_unknown_prompt(self):
+        assert identify_agent("You are a poet.") == "unknown"
+
+    def test_fake_backend_writes_files(self, tmp_path: Path):
+        backend = FakeBackend()
+        backend.run_agent("You are a test engineer practicing TDD", "", [], str(tmp_path))
+        backend.run_agent("Implement code that makes the tests pass", "", [], str(tmp_path))
+        assert (tmp_path / FEATURE_TEST).exists()
+        assert (tmp_path / FEATURE_MODULE).exists()
+        assert backend.calls == ["test_writer", "coder"]
+        assert backend.elapsed_ms > 0
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX launcher")
+def test_fake_claude_through_client(tmp_path: Path):
+    launcher = install_fake_claude(tmp_path / "bin")
+    client = ClaudeCodeClient(claude_executable=str(launcher))
+    result = client.run(
+        "go", system_prompt="You are a senior code reviewer.", working_directory=str(tmp_path)
+    )
+    assert not result.is_error
+    assert json.loads(result.text)["overall_assessment"] == "Looks good"
+    assert result.input_tokens > 0
+
+
+def test_make_repo(tmp_path: Path):
+    repo = make_repo(tmp_path / "repo", 3)
+    assert len(list((repo / "src" / "benchpkg").glob("module_*.py"))) == 3
+    assert (repo / ".git").is_dir()
+
+
+class TestRegressions:
+    def test_within_tolerance(self):
+        baseline = {"fake-files10-c1": {"git": 100.0, "total": 200.0}}
+        assert find_regressions([_result(10, git=140.0, total=250.0)], baseline) == []
+
+    def test_flags_slow_phase(self):
+        baseline = {"fake-files10-c1": {"git": 100.0}}
+        problems = find_regressions([_result(10, git=200.0)], baseline)
+        assert len(problems) == 1
+        assert "git" in problems[0]
+
+    def test_ignores_backend_and_unknown_scenarios(self):
+        baseline = {"fake-files10-c1": {"backend": 1.0}}
+        assert find_regressions([_result(10, backend=999.0), _result(5, git=999.0)], baseline) == []
+
+    def test_baseline_round_trip(self, tmp_path: Path):
+        path = tmp_path / "baseline.json"
+        save_baseline(path, [_result(10, git=12.5)])
+        assert load_baseline(path)["fake-files10-c1"]["git"] == 12.5
+
+
+def test_run_scenario_end_to_end(tmp_path: Path):
+    result = run_scenario(Scenario(files=2), tmp_path)
+    assert result.statuses == ["completed"]
+    assert set(result.phases_ms) == set(PHASES)
+    assert result.phases_ms["git"] > 0
+    assert result.phases_ms["total"] >= result.phases_ms["overhead"]
+    # Worktrees and caches stay under the scenario's private HOME
+    assert (tmp_path / "home" / ".levelup").is_dir()
+
+
+def test_terminal_frames_benchmark():
+    pytest.importorskip("PyQt6")
+    from benchmarks.terminal import WORKLOADS, measure
+
+    for workload in WORKLOADS:
+        result = measure(workload, "dirty", cols=40, rows=10, frames=5)
+        assert result.frames == 5
+        assert result.fps > 0
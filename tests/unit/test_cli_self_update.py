@@ -29,6 +29,13 @@ _OK_INSTALL = MagicMock(returncode=0, stdout="", stderr="")
 _OK_REMOTE = MagicMock(returncode=0, stdout="https://github.com/croxtonveryepic/LevelUp.git\n", stderr="")
 
 
+@pytest.fixture(autouse=True)
+def _fixed_version_string():
+    """Keep the version banner's git calls out of the mocked ``subprocess.run``."""
+    with patch("levelup.cli.app.get_version_string", return_value="levelup 1.2.4"):
+        yield
+
+
 def _make_repo(tmp_path: Path) -> Path:
     """Create a fake git repo with a pyproject.toml."""
     (tmp_path / ".git").mkdir()
@@ -0,0 +1,108 @@
+"""Startup cost of short CLI commands (``python -X importtime``).
+
+Each command runs in a fresh interpreter.  The test suite checks which
+modules get imported; the wall-clock budgets (everything imported from
+``levelup`` onwards, best of a few runs) are a benchmark, run with
+``LEVELUP_IMPORT_BENCHMARK=1``.  Set ``LEVELUP_IMPORT_BUDGET_SCALE`` (e.g.
+``2``) on slow machines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import levelup
+
+# Modules short commands must never load
+HEAVY_MODULES = {"anthropic", "git", "PyQt6", "pygments", "yaml", "httpx"}
+
+# Milliseconds.  DB-backed commands also pay for pydantic (the state records).
+BUDGETS_MS = {"version": 150, "status": 250, "tickets": 250}
+
+RUNS = 3
+
+_SRC = str(Path(levelup.__file__).resolve().parents[1])
+
+_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)")
+
+
+def _import_profile(args: list[str], home: Path) -> tuple[float, set[str]]:
+    """(ms spent importing from ``levelup`` onwards, all modules imported)."""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home), PYTHONPATH=_SRC)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # measure with cached bytecode, as installed
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "levelup", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=home,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    total_us = 0
+    started = False
+    modules = set()
+    for match in _LINE.finditer(result.stderr):
+        cumulative, indent, module = int(match.group(1)), match.group(2), match.group(3)
+        modules.add(module.split(".")[0])
+        modules.add(module)
+        if len(indent) == 1:
+            started = started or module == "levelup"
+            if started:
+                total_us += cumulative
+    return total_us / 1000, modules
+
+
+def _commands(home: Path) -> dict[str, list[str]]:
+    db = str(home / "state.db")
+    return {
+        "version": ["version"],
+        "status": ["status", "--db-path", db],
+        "tickets": ["tickets", "list", "--path", str(home), "--db-path", db],
+    }
+
+
+@pytest.fixture(scope="module")
+def profiles(tmp_path_factory: pytest.TempPathFactory) -> dict[str, tuple[float, set[str]]]:
+    home = tmp_path_factory.mktemp("home")
+    results = {}
+    for name, args in _commands(home).items():
+        runs = [_import_profile(args, home) for _ in range(RUNS)]
+        results[name] = (min(ms for ms, _ in runs), runs[0][1])
+    return results
+
+
+@pytest.mark.parametrize("command", sorted(BUDGETS_MS))
+def test_no_heavy_imports(profiles, command: str):
+    _ms, modules = profiles[command]
+    assert not HEAVY_MODULES & modules
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    not os.environ.get("LEVELUP_IMPORT_BENCHMARK"), reason="set LEVELUP_IMPORT_BENCHMARK=1"
+)
+@pytest.mark.parametrize("command", sorted(BUDGETS_MS))
+def test_import_budget(profiles, command: str):
+    scale = float(os.environ.get("LEVELUP_IMPORT_BUDGET_SCALE", "1"))
+    ms, _modules = profiles[command]
+    assert ms <= BUDGETS_MS[command] * scale, f"{command}: {ms:.0f}ms imports"
+
+
+def test_orchestrator_does_not_import_anthropic_sdk():
+    code = "import sys, levelup.core.orchestrator; print('anthropic' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=_SRC),
+        timeout=60,
+    )
+    assert result.stdout.strip() == "False", result.stderr
+
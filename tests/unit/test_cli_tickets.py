@@ -27,6 +27,13 @@ class TestTicketsCLI:
         assert "Task A" in result.output
         assert "Task B" in result.output
 
+    def test_list_shows_status(self, tmp_path: Path):
+        add_ticket(tmp_path, "Task A")
+        set_ticket_status(tmp_path, 1, TicketStatus.IN_PROGRESS)
+        result = runner.invoke(app, ["tickets", "list", "--path", str(tmp_path)])
+        assert result.exit_code == 0
+        assert "in progress" in result.output
+
     def test_default_action_is_list(self, tmp_path: Path):
         result = runner.invoke(app, ["tickets", "--path", str(tmp_path)])
         assert result.exit_code == 0
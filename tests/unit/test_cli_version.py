@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import shutil
+import subprocess
+from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
 from levelup import __version__
+from levelup.cli import display
 from levelup.cli.app import app
 from levelup.cli.display import get_version_string
 
@@ -20,41 +23,64 @@ class TestGetVersionString:
         assert __version__ in result
         assert result.startswith("levelup ")
 
-    @patch.dict("sys.modules", {"git": MagicMock()})
-    def test_clean_repo(self):
-        import sys
+    @staticmethod
+    def _fake_git(status_output: str):
+        def git_output(cwd, *args):
+            return "abc1234" if "rev-parse" in args else status_output
 
-        mock_git = sys.modules["git"]
-        mock_repo = MagicMock()
-        mock_repo.head.commit.hexsha = "abc1234def5678"
-        mock_repo.is_dirty.return_value = False
-        mock_git.Repo.return_value = mock_repo
+        return git_output
 
-        result = get_version_string()
+    def test_clean_repo(self):
+        with patch("levelup.cli.display._git_output", side_effect=self._fake_git("")):
+            result = get_version_string()
         assert "abc1234" in result
         assert "clean" in result
 
-    @patch.dict("sys.modules", {"git": MagicMock()})
     def test_dirty_repo(self):
-        import sys
-
-        mock_git = sys.modules["git"]
-        mock_repo = MagicMock()
-        mock_repo.head.commit.hexsha = "abc1234def5678"
-        mock_repo.is_dirty.return_value = True
-        mock_git.Repo.return_value = mock_repo
-
-        result = get_version_string()
+        with patch("levelup.cli.display._git_output", side_effect=self._fake_git("M src/x.py")):
+            result = get_version_string()
         assert "abc1234" in result
         assert "dirty" in result
 
     def test_no_git_fallback(self):
-        # Patch the import to raise ImportError
-        with patch.dict("sys.modules", {"git": None}):
+        with patch("levelup.cli.display.subprocess.run", side_effect=FileNotFoundError("git")):
             result = get_version_string()
         assert result == f"levelup {__version__}"
         assert "commit" not in result
 
+    def test_git_timeout_fallback(self):
+        error = subprocess.TimeoutExpired(["git", "status"], 5)
+        with patch("levelup.cli.display.subprocess.run", side_effect=error) as mock_run:
+            result = get_version_string()
+        assert result == f"levelup {__version__}"
+        assert mock_run.call_args.kwargs["timeout"] == 5
+
+    def test_not_a_repo_fallback(self):
+        error = subprocess.CalledProcessError(128, ["git", "rev-parse"])
+        with patch("levelup.cli.display._git_output", side_effect=error):
+            result = get_version_string()
+        assert result == f"levelup {__version__}"
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_installed_inside_another_repo(self, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q",
+             "--allow-empty", "-m", "host"],
+            cwd=tmp_path,
+            check=True,
+        )
+        package = tmp_path / ".venv" / "lib" / "python3" / "site-packages" / "levelup" / "cli"
+        package.mkdir(parents=True)
+        with patch.object(display, "__file__", str(package / "display.py")):
+            result = get_version_string()
+        assert result == f"levelup {__version__}"
+
+    def test_does_not_import_gitpython(self):
+        with patch.dict("sys.modules", {"git": None}):
+            result = get_version_string()
+        assert result.startswith(f"levelup {__version__}")
+
 
 class TestVersionCommand:
     def test_version_command_exits_ok(self):
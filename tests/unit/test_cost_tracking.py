@@ -324,36 +324,21 @@ class TestAnthropicSDKBackendTokenFields:
 class TestLLMClientTokenAccumulation:
     """LLMClient.run_tool_loop should sum input/output tokens across all API calls."""
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_accumulates_tokens_across_turns(self, mock_anthropic_cls):
+    @patch("anthropic.Anthropic")
+    def test_accumulates_tokens_across_turns(self, mock_anthropic_cls, sdk_stream):
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
 
-        # First response: tool_use (triggers another iteration)
-        tool_use_block = MagicMock()
-        tool_use_block.type = "tool_use"
-        tool_use_block.id = "tool_1"
-        tool_use_block.name = "file_read"
-        tool_use_block.input = {"path": "foo.py"}
-
-        response1 = MagicMock()
-        response1.content = [tool_use_block]
-        response1.usage = MagicMock()
-        response1.usage.input_tokens = 300
-        response1.usage.output_tokens = 100
-
-        # Second response: text (final response, ends the loop)
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "All done"
-
-        response2 = MagicMock()
-        response2.content = [text_block]
-        response2.usage = MagicMock()
-        response2.usage.input_tokens = 400
-        response2.usage.output_tokens = 150
-
-        mock_client.messages.create.side_effect = [response1, response2]
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            # First response: tool_use (triggers another iteration)
+            sdk_stream.message(
+                sdk_stream.tool_use("file_read", {"path": "foo.py"}, "tool_1"),
+                input_tokens=300,
+                output_tokens=100,
+            ),
+            # Second response: text (final response, ends the loop)
+            sdk_stream.message("All done", input_tokens=400, output_tokens=150),
+        )
 
         # Set up tool registry with a stub tool
         registry = ToolRegistry()
@@ -376,24 +361,16 @@ class TestLLMClientTokenAccumulation:
         assert result.output_tokens == 250  # 100 + 150
         assert result.num_turns == 2
         assert result.text == "All done"
+        assert mock_client.messages.stream.call_args.kwargs["tools"] == tools
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_single_turn_no_tools(self, mock_anthropic_cls):
+    @patch("anthropic.Anthropic")
+    def test_single_turn_no_tools(self, mock_anthropic_cls, sdk_stream):
         """When no tool use occurs, should still track tokens for the single turn."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
-
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "Immediate answer"
-
-        response = MagicMock()
-        response.content = [text_block]
-        response.usage = MagicMock()
-        response.usage.input_tokens = 200
-        response.usage.output_tokens = 80
-
-        mock_client.messages.create.return_value = response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message("Immediate answer", input_tokens=200, output_tokens=80)
+        )
 
         llm = LLMClient(api_key="test-key")
         registry = ToolRegistry()
@@ -410,20 +387,14 @@ class TestLLMClientTokenAccumulation:
         assert result.num_turns == 1
         assert result.text == "Immediate answer"
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
-    def test_handles_missing_usage(self, mock_anthropic_cls):
-        """When response has no usage attribute, tokens should remain zero."""
+    @patch("anthropic.Anthropic")
+    def test_handles_zero_usage(self, mock_anthropic_cls, sdk_stream):
+        """When the response reports no tokens, totals should remain zero."""
         mock_client = MagicMock()
         mock_anthropic_cls.return_value = mock_client
-
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "No usage info"
-
-        response = MagicMock(spec=[])  # empty spec means no attributes
-        response.content = [text_block]
-
-        mock_client.messages.create.return_value = response
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message("No usage info", input_tokens=0, output_tokens=0)
+        )
 
         llm = LLMClient(api_key="test-key")
         registry = ToolRegistry()
@@ -496,6 +467,8 @@ class TestStepUsage:
             "output_tokens",
             "duration_ms",
             "num_turns",
+            "test_cache_hits",
+            "test_cache_misses",
         }
 
 
@@ -0,0 +1,303 @@
+"""Tests for the dashboard's background DB polling (DashboardPoller / DashboardRefreshThread)."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from levelup.core.context import PipelineContext, PipelineStatus, TaskInput
+from levelup.core.tickets import add_ticket, read_tickets
+from levelup.state.manager import StateManager
+
+
+def _can_import_pyqt6() -> bool:
+    try:
+        import PyQt6  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _can_import_pyqt6(), reason="PyQt6 not available")
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "state.db"
+
+
+@pytest.fixture()
+def mgr(db_path: Path) -> StateManager:
+    return StateManager(db_path)
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    path = tmp_path / "proj"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture()
+def poller(db_path: Path, mgr: StateManager):
+    from levelup.gui.dashboard_data import DashboardPoller
+
+    poller = DashboardPoller(db_path, state_manager=mgr)
+    yield poller
+    poller.close()
+
+
+def _register(mgr: StateManager, project: Path, title: str = "Task") -> PipelineContext:
+    ctx = PipelineContext(task=TaskInput(title=title), project_path=project)
+    mgr.register_run(ctx)
+    return ctx
+
+
+class TestReadTicketsStateManager:
+    def test_uses_given_state_manager(self, mgr, db_path, project):
+        add_ticket(project, "First", db_path=db_path)
+        with patch("levelup.core.tickets._get_state_manager") as factory:
+            tickets = read_tickets(project, state_manager=mgr)
+        factory.assert_not_called()
+        assert [t.title for t in tickets] == ["First"]
+
+
+class TestDashboardPoller:
+    def test_first_poll_reports_everything(self, poller, mgr, db_path, project):
+        ctx = _register(mgr, project)
+        add_ticket(project, "First", db_path=db_path)
+
+        delta = poller.poll(project)
+
+        assert delta is not None
+        assert delta.project_path == project
+        assert [r.run_id for r in delta.runs] == [ctx.run_id]
+        assert [t.title for t in delta.tickets] == ["First"]
+        assert delta.pending_checkpoints == ()
+
+    def test_idle_poll_skips_queries(self, poller, mgr, project):
+        _register(mgr, project)
+        poller.poll(project)
+
+        with patch.object(mgr, "list_runs") as list_runs:
+            assert poller.poll(project) is None
+        list_runs.assert_not_called()
+
+    def test_run_update_reports_runs_only(self, poller, mgr, db_path, project):
+        ctx = _register(mgr, project)
+        add_ticket(project, "First", db_path=db_path)
+        poller.poll(project)
+
+        ctx.status = PipelineStatus.COMPLETED
+        mgr.update_run(ctx)
+        delta = poller.poll(project)
+
+        assert delta is not None
+        assert [r.status for r in delta.runs] == ["completed"]
+        assert delta.tickets is None
+
+    def test_ticket_change_reports_tickets_only(self, poller, mgr, db_path, project):
+        _register(mgr, project)
+        poller.poll(project)
+
+        add_ticket(project, "New", db_path=db_path)
+        delta = poller.poll(project)
+
+        assert delta is not None
+        assert delta.runs is None
+        assert [t.title for t in delta.tickets] == ["New"]
+
+    def test_unrelated_write_reports_nothing(self, poller, mgr, project, tmp_path):
+        _register(mgr, project)
+        poller.poll(project)
+
+        # Changes data_version but nothing the dashboard shows
+        mgr.add_ticket(str(tmp_path / "other"), "Elsewhere")
+        assert poller.poll(project) is None
+
+    def test_project_switch_reports_tickets(self, poller, db_path, project, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        add_ticket(other, "Other ticket", db_path=db_path)
+        poller.poll(project)
+
+        delta = poller.poll(other)
+
+        assert delta is not None
+        assert delta.project_path == other
+        assert [t.title for t in delta.tickets] == ["Other ticket"]
+
+    def test_no_project_has_no_tickets(self, poller, mgr, db_path, project):
+        add_ticket(project, "First", db_path=db_path)
+        _register(mgr, project)
+
+        delta = poller.poll(None)
+
+        assert delta is not None
+        assert delta.tickets == ()
+
+    def test_pending_checkpoints_repeat_while_idle(self, poller, mgr, project):
+        ctx = _register(mgr, project)
+        mgr.create_checkpoint_request(ctx.run_id, "requirements")
+        poller.poll(project)
+
+        delta = poller.poll(project)
+
+        assert delta is not None
+        assert delta.runs is None and delta.tickets is None
+        assert [c.step_name for c in delta.pending_checkpoints] == ["requirements"]
+
+    def test_invalidate_resends_unchanged_data(self, poller, mgr, db_path, project):
+        _register(mgr, project)
+        add_ticket(project, "First", db_path=db_path)
+        poller.poll(project)
+
+        poller.invalidate()
+        delta = poller.poll(project)
+
+        assert delta is not None
+        assert delta.runs is not None and delta.tickets is not None
+
+    def test_failed_poll_is_retried(self, poller, mgr, project):
+        _register(mgr, project)
+        poller.poll(project)
+        ctx = _register(mgr, project, title="Second")
+
+        locked = sqlite3.OperationalError("database is locked")
+        with patch.object(mgr, "list_runs", side_effect=locked), \
+             pytest.raises(sqlite3.OperationalError):
+            poller.poll(project)
+        delta = poller.poll(project)
+
+        assert delta is not None
+        assert ctx.run_id in [r.run_id for r in delta.runs]
+
+    def test_marks_dead_runs(self, poller, mgr, project):
+        ctx = _register(mgr, project)
+        with patch("levelup.state.manager._is_pid_alive", return_value=False):
+            delta = poller.poll(project)
+        assert delta is not None
+        assert mgr.get_run(ctx.run_id).status == "failed"
+        assert [r.status for r in delta.runs] == ["failed"]
+
+
+class TestDashboardRefreshThread:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _wait_for(self, received: list, count: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while len(received) < count and time.monotonic() < deadline:
+            self._app.processEvents()
+            time.sleep(0.01)
+
+    def test_request_emits_delta_on_gui_thread(self, mgr, db_path, project):
+        from PyQt6.QtCore import QThread
+
+        from levelup.gui.dashboard_data import DashboardRefreshThread
+
+        ctx = _register(mgr, project)
+        thread = DashboardRefreshThread(db_path)
+        received: list = []
+        threads: list = []
+
+        def on_delta(delta):
+            received.append(delta)
+            threads.append(QThread.currentThread())
+
+        thread.delta_ready.connect(on_delta)
+        thread.start()
+        try:
+            thread.request(project)
+            self._wait_for(received, 1)
+            thread.request(project)  # idle: nothing emitted
+            thread.invalidate()
+            thread.request(project)
+            self._wait_for(received, 2)
+        finally:
+            thread.stop()
+
+        assert not thread.isRunning()
+        assert len(received) == 2
+        assert [r.run_id for r in received[0].runs] == [ctx.run_id]
+        assert received[1].runs is not None
+        assert threads[0] is self._app.thread()
+
+    def test_stop_without_request(self, db_path):
+        from levelup.gui.dashboard_data import DashboardRefreshThread
+
+        thread = DashboardRefreshThread(db_path)
+        thread.start()
+        thread.stop()
+        assert not thread.isRunning()
+
+
+class TestMainWindowDelta:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _window(self, mgr: StateManager, project: Path):
+        from levelup.gui.main_window import MainWindow
+
+        with patch.object(MainWindow, "_start_refresh_timer"), \
+             patch.object(MainWindow, "_refresh"):
+            return MainWindow(mgr, project_path=project)
+
+    def test_applies_runs_and_tickets(self, poller, mgr, db_path, project):
+        ctx = _register(mgr, project)
+        add_ticket(project, "First", db_path=db_path)
+        win = self._window(mgr, project)
+
+        win._on_dashboard_delta(poller.poll(project))
+
+        assert win._run_model.row_of(ctx.run_id) == 0
+        assert [t.title for t in win._cached_tickets] == ["First"]
+
+    def test_ignores_delta_for_previous_project(self, poller, mgr, project, tmp_path):
+        _register(mgr, project)
+        win = self._window(mgr, project)
+        delta = poller.poll(tmp_path / "other")
+
+        win._on_dashboard_delta(delta)
+
+        assert win._run_model.rowCount() == 0
+
+    def test_keeps_tickets_while_detail_is_dirty(self, poller, mgr, db_path, project):
+        win = self._window(mgr, project)
+        add_ticket(project, "First", db_path=db_path)
+        win._refresh_thread = MagicMock()
+
+        with patch.object(type(win._detail), "is_dirty", True):
+            win._on_dashboard_delta(poller.poll(project))
+
+        assert win._cached_tickets == []
+        win._refresh_thread.invalidate.assert_called_once()
+        win._refresh_thread = None
+
+    def test_refresh_failure_is_shown_and_thread_restarted(self, mgr, project):
+        win = self._window(mgr, project)
+        locked = sqlite3.OperationalError("database is locked")
+
+        with patch("levelup.gui.dashboard_data.DashboardPoller", side_effect=locked):
+            win._request_refresh()
+            failed = win._refresh_thread
+            assert failed.wait(5000)
+        self._app.processEvents()
+        assert "database is locked" in win._status_bar.currentMessage()
+
+        win._request_refresh()
+        try:
+            assert win._refresh_thread is not failed
+            assert win._refresh_thread.isRunning()
+        finally:
+            win._refresh_thread.stop()
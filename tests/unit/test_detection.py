@@ -1,8 +1,10 @@
-"""Unit tests for src/levelup/detection/ (languages, frameworks, test_runners, detector)."""
+"""Unit tests for src/levelup/detection/ (languages, frameworks, test_runners, detector, scanner)."""
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +12,7 @@ from levelup.detection.languages import detect_language
 from levelup.detection.frameworks import detect_framework
 from levelup.detection.test_runners import TestRunnerInfo, detect_test_runner
 from levelup.detection.detector import ProjectDetector, ProjectInfo
+from levelup.detection.scanner import ProjectScan
 
 
 # ---------------------------------------------------------------------------
@@ -485,3 +488,76 @@ class TestProjectDetector:
         assert hasattr(info, "framework")
         assert hasattr(info, "test_runner")
         assert hasattr(info, "test_command")
+
+
+# ---------------------------------------------------------------------------
+# ProjectScan (single shared walk)
+# ---------------------------------------------------------------------------
+
+
+class TestProjectScan:
+    """Test the bounded single-pass scan shared by the detectors."""
+
+    def test_prunes_skip_dirs_and_hidden_dirs(self, tmp_path: Path):
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text("")
+        (tmp_path / ".cache").mkdir()
+        (tmp_path / ".cache" / "x.py").write_text("")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("")
+
+        scan = ProjectScan(tmp_path)
+
+        assert scan.files == ["src/app.py"]
+        assert "node_modules" not in scan.dirs
+        assert scan.extension_counts == {".py": 1}
+
+    def test_bounded_file_count_keeps_top_level(self, tmp_path: Path):
+        (tmp_path / "pkg").mkdir()
+        for i in range(20):
+            (tmp_path / "pkg" / f"m{i}.py").write_text("")
+        (tmp_path / "pyproject.toml").write_text("[project]\n")
+
+        scan = ProjectScan(tmp_path, max_files=5)
+
+        assert scan.truncated is True
+        assert len(scan.files) == 5
+        assert scan.is_file("pyproject.toml")
+        # Files past the bound still resolve through the filesystem
+        assert scan.is_file("pkg/m19.py")
+
+    def test_manifest_read_once(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text('dependencies = ["FastAPI", "pytest"]\n')
+        scan = ProjectScan(tmp_path)
+
+        reads: list[Path] = []
+        real_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return real_read_text(self, *args, **kwargs)
+
+        with patch.object(Path, "read_text", counting_read_text):
+            assert scan.contains("pyproject.toml", "fastapi")
+            assert scan.contains("pyproject.toml", "pytest")
+            assert not scan.contains("pyproject.toml", "django")
+            assert not scan.contains("missing.toml", "x")
+        assert len(reads) == 1
+
+    def test_detector_walks_tree_once(self, tmp_path: Path):
+        (tmp_path / "go.mod").write_text("module m\n\nrequire github.com/gin-gonic/gin v1\n")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "util_test.go").write_text("package pkg\n")
+
+        with patch("levelup.detection.scanner.os.scandir", wraps=os.scandir) as scandir:
+            info = ProjectDetector().detect(tmp_path)
+
+        assert (info.language, info.framework, info.test_runner) == ("go", "gin", "go_test")
+        assert scandir.call_count == 2  # root + pkg/
+
+    def test_go_tests_in_skipped_dirs_are_ignored(self, tmp_path: Path):
+        (tmp_path / "go.mod").write_text("module m\n")
+        (tmp_path / "vendor_tests" / "node_modules").mkdir(parents=True)
+        (tmp_path / "vendor_tests" / "node_modules" / "x_test.go").write_text("")
+        scan = ProjectScan(tmp_path)
+        assert not scan.any_file_named("*_test.go")
@@ -0,0 +1,203 @@
+"""Unit tests for cached project detection (src/levelup/detection/cache.py)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from levelup.detection.cache import DetectionCache, manifest_fingerprint
+from levelup.detection.detector import ProjectDetector, ProjectInfo
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    path = tmp_path / "proj"
+    path.mkdir()
+    (path / "pyproject.toml").write_text('[project]\ndependencies = ["flask"]\n')
+    (path / "app.py").write_text("x = 1\n")
+    return path
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> DetectionCache:
+    return DetectionCache(cache_dir=tmp_path / "cache")
+
+
+def _counting_detector() -> MagicMock:
+    detector = MagicMock(spec=ProjectDetector)
+    detector.detect.side_effect = lambda p: ProjectDetector().detect(p)
+    return detector
+
+
+class TestManifestFingerprint:
+    def test_stable(self, project):
+        assert manifest_fingerprint(project) == manifest_fingerprint(project)
+
+    def test_source_edits_do_not_change_it(self, project):
+        before = manifest_fingerprint(project)
+        (project / "app.py").write_text("x = 2\n")
+        (project / "other.py").write_text("")
+        assert manifest_fingerprint(project) == before
+
+    def test_manifest_edit_changes_it(self, project):
+        before = manifest_fingerprint(project)
+        (project / "pyproject.toml").write_text('[project]\ndependencies = ["fastapi"]\n')
+        assert manifest_fingerprint(project) != before
+
+    def test_mtime_change_changes_it(self, project):
+        before = manifest_fingerprint(project)
+        st = (project / "pyproject.toml").stat()
+        os.utime(project / "pyproject.toml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert manifest_fingerprint(project) != before
+
+    def test_new_manifest_changes_it(self, project):
+        before = manifest_fingerprint(project)
+        (project / "pytest.ini").write_text("[pytest]\n")
+        assert manifest_fingerprint(project) != before
+
+    def test_top_level_glob_manifest(self, tmp_path):
+        before = manifest_fingerprint(tmp_path)
+        (tmp_path / "App.csproj").write_text("<Project/>")
+        assert manifest_fingerprint(tmp_path) != before
+
+    def test_top_level_files_do_not_change_it_for_packages(self, project):
+        (project / "svc").mkdir()
+        (project / "svc" / "package.json").write_text("{}")
+        before = manifest_fingerprint(project, ["svc"])
+
+        (project / "notes.txt").write_text("x")
+        (project / "scratch").mkdir()
+
+        assert manifest_fingerprint(project, ["svc"]) == before
+
+    def test_sibling_package_changes_it(self, project):
+        (project / "svc").mkdir()
+        (project / "svc" / "package.json").write_text("{}")
+        before = manifest_fingerprint(project, ["svc"])
+
+        (project / "web").mkdir()
+        (project / "web" / "package.json").write_text("{}")
+
+        assert manifest_fingerprint(project, ["svc"]) != before
+
+
+class TestDetectionCache:
+    def test_repeat_detection_is_served_from_cache(self, project, cache):
+        detector = _counting_detector()
+        first = cache.detect(project, detector)
+        second = cache.detect(project, detector)
+
+        assert detector.detect.call_count == 1
+        assert cache.last_hit is True
+        assert second == first
+        assert second.framework == "flask"
+
+    def test_manifest_change_invalidates(self, project, cache):
+        detector = _counting_detector()
+        cache.detect(project, detector)
+        (project / "pyproject.toml").write_text('[project]\ndependencies = ["fastapi"]\n')
+
+        info = cache.detect(project, detector)
+
+        assert detector.detect.call_count == 2
+        assert cache.last_hit is False
+        assert info.framework == "fastapi"
+
+    def test_refresh_bypasses_cache(self, project, cache):
+        detector = _counting_detector()
+        cache.detect(project, detector)
+        cache.detect(project, detector, refresh=True)
+        assert detector.detect.call_count == 2
+
+    def test_entries_are_per_project(self, tmp_path, cache):
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        (a / "go.mod").write_text("module a\n")
+        (b / "Cargo.toml").write_text("[package]\n")
+        assert cache.detect(a).language == "go"
+        assert cache.detect(b).language == "rust"
+        assert cache.detect(a).language == "go"
+
+    def test_extension_counted_language_is_not_cached(self, tmp_path, cache):
+        (tmp_path / "main.py").write_text("x = 1\n")
+        detector = _counting_detector()
+
+        assert cache.detect(tmp_path, detector).language == "python"
+        (tmp_path / "a.go").write_text("package a\n")
+        (tmp_path / "b.go").write_text("package a\n")
+
+        assert cache.detect(tmp_path, detector).language == "go"
+        assert detector.detect.call_count == 2
+        assert list(cache.cache_dir.glob("*.json")) == []
+
+    def test_corrupt_entry_is_a_miss(self, project, cache):
+        cache.detect(project)
+        for entry in cache.cache_dir.glob("*.json"):
+            entry.write_text("{broken")
+        assert cache.get(project) is None
+        assert cache.detect(project).language == "python"
+
+
+class TestOrchestratorDetectionCache:
+    def _orchestrator(self, tmp_path: Path, **kwargs):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        orch = Orchestrator(LevelUpSettings(), headless=True, **kwargs)
+        orch._detection_cache = DetectionCache(cache_dir=tmp_path / "cache")
+        return orch
+
+    def test_uses_cache(self, project, tmp_path):
+        orch = self._orchestrator(tmp_path)
+        orch._detection_cache.put(project, ProjectInfo(language="cached", test_command="make test"))
+        language, _, _, test_command = orch._run_project_detection(project)
+        assert (language, test_command) == ("cached", "make test")
+
+    def test_refresh_detection(self, project, tmp_path):
+        orch = self._orchestrator(tmp_path, refresh_detection=True)
+        orch._detection_cache.put(project, ProjectInfo(language="cached"))
+        language, framework, _, _ = orch._run_project_detection(project)
+        assert (language, framework) == ("python", "flask")
+
+    def test_disabled_by_setting(self):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        orch = Orchestrator(LevelUpSettings(pipeline={"detection_cache": False}), headless=True)
+        assert orch._detection_cache is None
+
+
+def test_cli_detect_refresh(project, tmp_path):
+    from levelup.cli.app import app
+
+    cache = DetectionCache(cache_dir=tmp_path / "cache")
+    cache.put(project, ProjectInfo(language="cached"))
+
+    with patch("levelup.detection.cache.DEFAULT_CACHE_DIR", tmp_path / "cache"):
+        runner = CliRunner()
+        cached = runner.invoke(app, ["detect", "--path", str(project)])
+        fresh = runner.invoke(app, ["detect", "--path", str(project), "--refresh"])
+
+    assert cached.exit_code == 0, cached.output
+    assert "cached" in cached.output
+    assert fresh.exit_code == 0, fresh.output
+    assert "python" in fresh.output
+
+
+def test_cli_detect_honors_disabled_cache(project, tmp_path):
+    from levelup.cli.app import app
+
+    (project / "levelup.yaml").write_text("pipeline:\n  detection_cache: false\n")
+    DetectionCache(cache_dir=tmp_path / "cache").put(project, ProjectInfo(language="cached"))
+
+    with patch("levelup.detection.cache.DEFAULT_CACHE_DIR", tmp_path / "cache"):
+        result = CliRunner().invoke(app, ["detect", "--path", str(project)])
+
+    assert result.exit_code == 0, result.output
+    assert "python" in result.output
+    assert "cached" not in result.output
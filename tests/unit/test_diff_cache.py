@@ -0,0 +1,280 @@
+"""Tests for the diff cache and its use by the diff view helpers and widget."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from levelup.gui.diff_cache import DiffCache, get_diff_cache, is_full_sha, open_repo
+from levelup.gui.diff_model import parse_diff
+
+
+def _can_import_pyqt6() -> bool:
+    try:
+        import PyQt6  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _can_import_pyqt6(), reason="PyQt6 not available")
+
+
+A = "a" * 40
+B = "b" * 40
+C = "c" * 40
+
+DIFF = """\
+diff --git a/app.py b/app.py
+--- a/app.py
++++ b/app.py
+@@ -1 +1 @@
+-old
++new"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_default_cache():
+    cache = get_diff_cache()
+    cache.clear()
+    cache.set_cache_dir(None)
+    yield
+    cache.clear()
+    cache.set_cache_dir(None)
+
+
+def _init_git_repo(path: Path):
+    import git
+
+    repo = git.Repo.init(path)
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    (path / "init.txt").write_text("initial content")
+    repo.index.add(["init.txt"])
+    start = repo.index.commit("initial commit").hexsha
+    (path / "feature.py").write_text("x = 1\n")
+    repo.index.add(["feature.py"])
+    end = repo.index.commit("add feature").hexsha
+    return repo, start, end
+
+
+def _process_until(condition, timeout: float = 10.0) -> None:
+    from PyQt6.QtWidgets import QApplication
+
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
+class TestDiffCache:
+    def test_files_round_trip(self, tmp_path):
+        cache = DiffCache()
+        files = parse_diff(DIFF)
+
+        assert cache.get_files(str(tmp_path), A, B) is None
+        cache.put_files(str(tmp_path), A, B, files)
+
+        assert cache.get_files(str(tmp_path), A, B) is files
+        assert cache.get_files(str(tmp_path), B, A) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_only_full_shas_are_cached(self, tmp_path):
+        cache = DiffCache()
+
+        cache.put_files(str(tmp_path), "HEAD~1", "HEAD", parse_diff(DIFF))
+        cache.put_stats(str(tmp_path), A, "main", {"files_changed": 1})
+
+        assert cache.get_files(str(tmp_path), "HEAD~1", "HEAD") is None
+        assert cache.get_stats(str(tmp_path), A, "main") is None
+        assert not is_full_sha(A[:8])
+
+    def test_least_recently_used_is_evicted(self, tmp_path):
+        cache = DiffCache(max_entries=2)
+        repo = str(tmp_path)
+        cache.put_stats(repo, A, B, {"files_changed": 1})
+        cache.put_stats(repo, B, C, {"files_changed": 2})
+        cache.get_stats(repo, A, B)
+
+        cache.put_stats(repo, A, C, {"files_changed": 3})
+
+        assert cache.get_stats(repo, A, B) == {"files_changed": 1}
+        assert cache.get_stats(repo, B, C) is None
+
+    def test_disk_entries_survive_a_new_cache(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        DiffCache(cache_dir=cache_dir).put_files("repo", A, B, parse_diff(DIFF))
+        DiffCache(cache_dir=cache_dir).put_stats("repo", A, B, {"insertions": 1})
+
+        fresh = DiffCache(cache_dir=cache_dir)
+
+        assert fresh.get_files("repo", A, B, disk=False) is None
+        assert fresh.get_files("repo", A, B) == parse_diff(DIFF)
+        assert fresh.get_stats("repo", A, B) == {"insertions": 1}
+        assert DiffCache().get_files("repo", A, B) is None
+
+    def test_disk_entries_keep_carriage_returns(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        files = parse_diff(DIFF + "\r\n+x\x0cy\r")
+        DiffCache(cache_dir=cache_dir).put_files("repo", A, B, files)
+
+        assert DiffCache(cache_dir=cache_dir).get_files("repo", A, B) == files
+
+    def test_disk_entries_are_pruned(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = DiffCache(cache_dir=cache_dir, max_disk_entries=2)
+
+        for to_sha in (A, B, C):
+            cache.put_stats("repo", "d" * 40, to_sha, {"insertions": 1})
+
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_commit_info_is_memory_only(self, tmp_path):
+        cache = DiffCache(cache_dir=tmp_path / "cache")
+        cache.put_commit("repo", A, {"sha": A, "message": "msg"})
+
+        assert cache.get_commit("repo", A) == {"sha": A, "message": "msg"}
+        assert not (tmp_path / "cache").exists()
+
+
+class TestHelpersUseCache:
+    def test_open_repo_is_shared(self, tmp_path):
+        _init_git_repo(tmp_path)
+
+        assert open_repo(str(tmp_path)) is open_repo(str(tmp_path))
+
+    def test_diff_stats_run_git_once(self, tmp_path):
+        from levelup.gui.diff_view_widget import get_diff_stats
+
+        _, start, end = _init_git_repo(tmp_path)
+        first = get_diff_stats(str(tmp_path), start, end)
+
+        with patch("git.cmd.Git.execute", side_effect=AssertionError):
+            assert get_diff_stats(str(tmp_path), start, end) == first
+        assert first == {"files_changed": 1, "insertions": 1, "deletions": 0}
+
+    def test_commit_info_cached(self, tmp_path):
+        from levelup.gui.diff_view_widget import get_commit_info
+
+        _, _, end = _init_git_repo(tmp_path)
+        first = get_commit_info(str(tmp_path), end)
+
+        with patch("levelup.gui.diff_view_widget.open_repo", side_effect=AssertionError):
+            assert get_commit_info(str(tmp_path), end) == first
+
+    def test_generate_diff_shares_entries_with_loader(self, tmp_path):
+        from levelup.gui.diff_view_widget import generate_diff
+
+        _, start, end = _init_git_repo(tmp_path)
+        text = generate_diff(str(tmp_path), start, end)
+
+        files = get_diff_cache().get_files(str(tmp_path), start, end)
+        assert [f.path for f in files] == ["feature.py"]
+        with patch("git.cmd.Git.execute", side_effect=AssertionError):
+            assert generate_diff(str(tmp_path), start, end) == text
+
+
+    def test_cached_diff_matches_git_output(self, tmp_path):
+        from levelup.gui.diff_view_widget import generate_diff
+
+        repo, start, _ = _init_git_repo(tmp_path)
+        (tmp_path / "feature.py").write_bytes(b"x\x0cy\r\nz\n")
+        repo.index.add(["feature.py"])
+        end = repo.index.commit("form feed and CRLF").hexsha
+        text = generate_diff(str(tmp_path), start, end)
+
+        assert "x\x0cy\r" in text
+        assert generate_diff(str(tmp_path), start, end) == text
+        get_diff_cache().clear()
+        get_diff_cache().set_cache_dir(tmp_path / "cache")
+        generate_diff(str(tmp_path), start, end)
+        get_diff_cache().clear()
+        assert generate_diff(str(tmp_path), start, end) == text
+
+
+class TestLoaderAndWidget:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def test_loader_fills_and_reuses_cache(self, tmp_path):
+        from levelup.gui.diff_model import DiffLoadThread
+
+        _, start, end = _init_git_repo(tmp_path)
+        cache = DiffCache()
+
+        def load() -> list:
+            thread = DiffLoadThread(str(tmp_path), start, end, cache)
+            batches: list = []
+            finished: list = []
+            thread.files_loaded.connect(batches.append)
+            thread.load_finished.connect(lambda: finished.append(True))
+            thread.start()
+            _process_until(lambda: finished)
+            thread.wait(5000)
+            return [f for batch in batches for f in batch]
+
+        first = load()
+        with patch("levelup.gui.diff_model.git.Repo", side_effect=AssertionError):
+            second = load()
+
+        assert [f.path for f in first] == ["feature.py"]
+        assert second == first
+
+    def _widget(self, tmp_path: Path, step_name: str | None = None):
+        from levelup.core.context import PipelineContext, TaskInput
+        from levelup.gui.diff_view_widget import DiffViewWidget
+        from levelup.state.manager import StateManager
+
+        _, start, end = _init_git_repo(tmp_path)
+        sm = StateManager(db_path=tmp_path / "state.db")
+        ctx = PipelineContext(
+            run_id="run1",
+            task=TaskInput(title="Task"),
+            project_path=tmp_path,
+            pre_run_sha=start,
+            step_commits={"coding": end},
+        )
+        sm.register_run(ctx)
+        widget = DiffViewWidget(
+            run_id="run1", step_name=step_name, state_manager=sm, project_path=str(tmp_path)
+        )
+        _process_until(lambda: not widget.is_loading)
+        return widget, sm, ctx
+
+    def test_cached_diff_shows_without_loading(self, tmp_path):
+        widget, _, _ = self._widget(tmp_path)
+
+        widget._step_selector.setCurrentIndex(1)  # Coding
+        _process_until(lambda: not widget.is_loading)
+        widget._step_selector.setCurrentIndex(0)  # All Changes again
+
+        assert not widget.is_loading
+        assert [f.path for f in widget._model.files] == ["feature.py"]
+
+    def test_refresh_skips_unchanged_step_commits(self, tmp_path):
+        widget, sm, ctx = self._widget(tmp_path, step_name="coding")
+
+        ctx.current_step = "review"  # not a step commit
+        sm.update_run(ctx)
+        with patch.object(widget, "_populate_step_selector") as populate, \
+             patch("levelup.gui.diff_view_widget.is_valid_sha") as valid:
+            widget.refresh()
+
+        populate.assert_not_called()
+        valid.assert_not_called()
+
+    def test_refresh_reloads_on_new_step_commit(self, tmp_path):
+        widget, sm, ctx = self._widget(tmp_path, step_name="coding")
+
+        ctx.step_commits["review"] = ctx.step_commits["coding"]
+        sm.update_run(ctx)
+        widget.refresh()
+
+        items = [widget._step_selector.itemText(i) for i in range(widget._step_selector.count())]
+        assert items == ["All Changes", "Coding", "Review"]
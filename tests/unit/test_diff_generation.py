@@ -153,53 +153,6 @@ class TestGenerateDiffBetweenCommits:
 class TestGenerateDiffForStepCommit:
     """Test generating diff for a specific pipeline step."""
 
-    def test_generate_step_diff_uses_parent_commit(self, tmp_path):
-        """Step diff should compare with parent commit (previous step or pre_run_sha)."""
-        from levelup.gui.diff_view_widget import generate_step_diff
-
-        repo = _init_git_repo(tmp_path)
-        initial_sha = repo.head.commit.hexsha
-
-        # First step
-        (tmp_path / "req.txt").write_text("requirements")
-        repo.index.add(["req.txt"])
-        step1_sha = repo.index.commit("levelup(requirements): Reqs").hexsha
-
-        # Second step
-        (tmp_path / "plan.txt").write_text("plan")
-        repo.index.add(["plan.txt"])
-        step2_sha = repo.index.commit("levelup(planning): Plan").hexsha
-
-        # Diff for step2 should compare step1..step2
-        diff_output = generate_step_diff(
-            str(tmp_path),
-            step2_sha,
-            parent_sha=step1_sha,
-        )
-
-        assert "plan.txt" in diff_output
-        assert "req.txt" not in diff_output  # Not in this step
-
-    def test_generate_step_diff_first_step_uses_pre_run_sha(self, tmp_path):
-        """First step diff should compare with pre_run_sha."""
-        from levelup.gui.diff_view_widget import generate_step_diff
-
-        repo = _init_git_repo(tmp_path)
-        pre_run_sha = repo.head.commit.hexsha
-
-        # First step
-        (tmp_path / "req.txt").write_text("requirements")
-        repo.index.add(["req.txt"])
-        step_sha = repo.index.commit("levelup(requirements): Reqs").hexsha
-
-        diff_output = generate_step_diff(
-            str(tmp_path),
-            step_sha,
-            parent_sha=pre_run_sha,
-        )
-
-        assert "req.txt" in diff_output
-
     def test_generate_step_diff_extracts_commit_message(self, tmp_path):
         """Step diff should include commit message information."""
         from levelup.gui.diff_view_widget import get_commit_info
@@ -220,58 +173,6 @@ class TestGenerateDiffForStepCommit:
 class TestGenerateBranchDiff:
     """Test generating diff for entire branch."""
 
-    def test_generate_branch_diff_from_pre_run_sha(self, tmp_path):
-        """Branch diff should show all changes from pre_run_sha to HEAD."""
-        from levelup.gui.diff_view_widget import generate_branch_diff
-
-        repo = _init_git_repo(tmp_path)
-        pre_run_sha = repo.head.commit.hexsha
-
-        # Multiple commits
-        (tmp_path / "file1.py").write_text("content1")
-        repo.index.add(["file1.py"])
-        repo.index.commit("levelup(requirements): Add file1")
-
-        (tmp_path / "file2.py").write_text("content2")
-        repo.index.add(["file2.py"])
-        repo.index.commit("levelup(planning): Add file2")
-
-        (tmp_path / "file3.py").write_text("content3")
-        repo.index.add(["file3.py"])
-        repo.index.commit("levelup(coding): Add file3")
-
-        diff_output = generate_branch_diff(str(tmp_path), pre_run_sha)
-
-        # Should show all files
-        assert "file1.py" in diff_output
-        assert "file2.py" in diff_output
-        assert "file3.py" in diff_output
-
-    def test_generate_branch_diff_to_specific_commit(self, tmp_path):
-        """Branch diff should support specifying end commit."""
-        from levelup.gui.diff_view_widget import generate_branch_diff
-
-        repo = _init_git_repo(tmp_path)
-        pre_run_sha = repo.head.commit.hexsha
-
-        (tmp_path / "file1.py").write_text("content1")
-        repo.index.add(["file1.py"])
-        mid_sha = repo.index.commit("Add file1").hexsha
-
-        (tmp_path / "file2.py").write_text("content2")
-        repo.index.add(["file2.py"])
-        repo.index.commit("Add file2")
-
-        # Diff only to mid_sha
-        diff_output = generate_branch_diff(
-            str(tmp_path),
-            pre_run_sha,
-            to_sha=mid_sha,
-        )
-
-        assert "file1.py" in diff_output
-        assert "file2.py" not in diff_output
-
     def test_generate_branch_diff_statistics(self, tmp_path):
         """Branch diff should provide statistics (files changed, insertions, deletions)."""
         from levelup.gui.diff_view_widget import get_diff_stats
@@ -292,59 +193,6 @@ class TestGenerateBranchDiff:
         assert stats["deletions"] == 0
 
 
-class TestDiffFormatting:
-    """Test diff output formatting for display."""
-
-    def test_format_diff_for_html_escapes_special_chars(self):
-        """Diff formatter should escape HTML special characters."""
-        from levelup.gui.diff_view_widget import format_diff_html
-
-        diff_text = "<script>alert('xss')</script>"
-        html = format_diff_html(diff_text)
-
-        assert "&lt;script&gt;" in html or "<" not in html
-
-    def test_format_diff_for_html_adds_syntax_highlighting(self):
-        """Diff formatter should add syntax highlighting for +/- lines."""
-        from levelup.gui.diff_view_widget import format_diff_html
-
-        diff_text = "+added line\n-deleted line\n unchanged line"
-        html = format_diff_html(diff_text, theme="dark")
-
-        # Should have color styling
-        assert "color" in html.lower() or "style" in html.lower()
-
-    def test_format_diff_for_html_dark_theme(self):
-        """Dark theme should use appropriate colors."""
-        from levelup.gui.diff_view_widget import format_diff_html
-
-        diff_text = "+added\n-deleted"
-        html = format_diff_html(diff_text, theme="dark")
-
-        # Dark theme colors for additions/deletions
-        assert "#a6e3a1" in html.lower() or "#2ecc71" in html.lower() or "green" in html.lower()
-
-    def test_format_diff_for_html_light_theme(self):
-        """Light theme should use appropriate colors."""
-        from levelup.gui.diff_view_widget import format_diff_html
-
-        diff_text = "+added\n-deleted"
-        html = format_diff_html(diff_text, theme="light")
-
-        # Should have styling appropriate for light theme
-        assert "color" in html.lower() or "style" in html.lower()
-
-    def test_format_diff_preserves_whitespace(self):
-        """Diff formatter should preserve indentation and whitespace."""
-        from levelup.gui.diff_view_widget import format_diff_html
-
-        diff_text = "+    indented line\n+        more indented"
-        html = format_diff_html(diff_text)
-
-        # Should preserve spaces (via <pre> or &nbsp;)
-        assert "<pre>" in html or "&nbsp;" in html or "white-space" in html
-
-
 class TestDiffErrorHandling:
     """Test error handling in diff generation."""
 
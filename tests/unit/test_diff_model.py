@@ -0,0 +1,427 @@
+"""Tests for the virtualized diff view: parser, DiffModel, DiffLoadThread and widget wiring."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from levelup.gui.diff_model import LARGE_FILE_LINES, DiffParser, diff_totals, parse_diff
+
+
+def _can_import_pyqt6() -> bool:
+    try:
+        import PyQt6  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _can_import_pyqt6(), reason="PyQt6 not available")
+
+
+SAMPLE = """\
+diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -1,3 +1,3 @@
+ import os
+-print("old")
++print("new")
+++++counter
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+index 3333333..0000000
+--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+diff --git a/logo.png b/logo.png
+index 4444444..5555555 100644
+Binary files a/logo.png and b/logo.png differ
+"""
+
+
+def _big_file(name: str, lines: int) -> str:
+    body = "\n".join(f"+line {n}" for n in range(lines))
+    return (
+        f"diff --git a/{name} b/{name}\nnew file mode 100644\n--- /dev/null\n+++ b/{name}\n"
+        f"@@ -0,0 +1,{lines} @@\n{body}\n"
+    )
+
+
+def _init_git_repo(path: Path):
+    import git
+
+    repo = git.Repo.init(path)
+    repo.config_writer().set_value("user", "name", "Test User").release()
+    repo.config_writer().set_value("user", "email", "test@example.com").release()
+    (path / "init.txt").write_text("initial content")
+    repo.index.add(["init.txt"])
+    repo.index.commit("initial commit")
+    return repo
+
+
+def _process_until(condition, timeout: float = 10.0) -> None:
+    from PyQt6.QtWidgets import QApplication
+
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
+class TestParseDiff:
+    def test_files_paths_and_counts(self):
+        files = parse_diff(SAMPLE)
+
+        assert [f.path for f in files] == ["app.py", "gone.txt", "logo.png"]
+        assert [(f.insertions, f.deletions) for f in files] == [(2, 1), (0, 1), (0, 0)]
+        assert files[2].binary
+
+    def test_line_kinds(self):
+        app = parse_diff(SAMPLE)[0]
+
+        kinds = [app.kind(i) for i in range(len(app.lines))]
+
+        # "+++counter" is an added "++counter", not a file header
+        assert kinds == ["file"] * 4 + ["hunk", "context", "del", "add", "add"]
+
+    def test_text_outside_a_git_diff(self):
+        files = parse_diff("+new line added\n-old line")
+
+        assert [f.path for f in files] == [""]
+        assert files[0].kind(0) == "add"
+        assert diff_totals(files) == {"files_changed": 0, "insertions": 1, "deletions": 1}
+
+    def test_only_newline_ends_a_line(self):
+        text = "+x\x0cy\r\n+z\u2028w"
+
+        files = parse_diff(text)
+
+        assert files[0].lines == ["+x\x0cy\r", "+z\u2028w"]
+        assert "\n".join(files[0].lines) == text
+
+    def test_streaming_matches_whole_parse(self):
+        parser = DiffParser()
+        streamed = [f for f in map(parser.feed, SAMPLE.splitlines(keepends=True)) if f]
+        streamed.append(parser.finish())
+
+        assert streamed == parse_diff(SAMPLE)
+
+    def test_totals(self):
+        assert diff_totals(parse_diff(SAMPLE)) == {
+            "files_changed": 3,
+            "insertions": 2,
+            "deletions": 2,
+        }
+
+
+class TestDiffModel:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _model(self, text: str = SAMPLE):
+        from PyQt6.QtTest import QAbstractItemModelTester
+
+        from levelup.gui.diff_model import DiffModel
+
+        model = DiffModel()
+        self._tester = QAbstractItemModelTester(
+            model, QAbstractItemModelTester.FailureReportingMode.Fatal
+        )
+        model.set_files(parse_diff(text))
+        return model
+
+    def _texts(self, model) -> list[str]:
+        return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+    def test_one_row_per_line_with_file_headers(self):
+        from levelup.gui.diff_model import KIND_ROLE
+
+        model = self._model()
+
+        texts = self._texts(model)
+        assert model.rowCount() == len(SAMPLE.splitlines())
+        assert texts[0] == "▾ app.py  +2 -1"
+        assert texts[model.file_row(2)] == "▾ logo.png  binary"
+        assert model.data(model.index(6), KIND_ROLE) == "del"
+        assert model.is_header(model.file_row(1))
+        assert not model.is_header(1)
+
+    def test_colors_follow_theme(self):
+        from PyQt6.QtCore import Qt
+
+        from levelup.gui.diff_model import DIFF_COLORS
+
+        model = self._model()
+        add = model.index(7)
+        fg, bg = Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.BackgroundRole
+        assert model.data(add, fg).color().name() == DIFF_COLORS["dark"]["add"].lower()
+
+        changed: list[int] = []
+        model.dataChanged.connect(lambda tl, br, roles=None: changed.append(br.row()))
+        model.set_theme("light")
+
+        assert changed == [model.rowCount() - 1]
+        assert model.data(add, bg).color().name() == DIFF_COLORS["light"]["add_bg"].lower()
+        assert model.data(model.index(1), bg) is None  # header lines have no background
+
+    def test_toggle_collapses_and_expands_a_file(self):
+        model = self._model()
+        gone = model.file_row(1)
+
+        model.toggle(0)
+
+        assert model.rowCount() == len(SAMPLE.splitlines()) - 8
+        assert self._texts(model)[0].startswith("▸ app.py")
+        assert model.file_row(1) == 1 == gone - 8
+
+        model.toggle(0)
+        assert model.file_row(1) == gone
+
+    def test_toggle_ignores_non_header_rows(self):
+        model = self._model()
+        rows = model.rowCount()
+
+        model.toggle(3)
+
+        assert model.rowCount() == rows
+
+    def test_large_files_start_collapsed(self):
+        model = self._model(_big_file("big.txt", LARGE_FILE_LINES + 1) + SAMPLE)
+
+        assert not model.is_expanded(0)
+        assert model.file_row(1) == 1
+        assert "click to expand" in self._texts(model)[0]
+
+    def test_folds_survive_reload(self):
+        model = self._model()
+        model.toggle(0)
+
+        model.set_files(parse_diff(SAMPLE))
+
+        assert not model.is_expanded(0)
+        assert model.is_expanded(1)
+
+    def test_forget_folds(self):
+        model = self._model()
+        model.toggle(0)
+
+        model.forget_folds()
+        model.set_files(parse_diff(SAMPLE))
+
+        assert model.is_expanded(0)
+
+    def test_append_keeps_earlier_rows(self):
+        from levelup.gui.diff_model import DiffModel
+
+        files = parse_diff(SAMPLE)
+        model = DiffModel()
+        inserted: list[tuple[int, int]] = []
+        model.rowsInserted.connect(lambda _p, first, last: inserted.append((first, last)))
+
+        model.append_files(files[:1])
+        model.append_files(files[1:])
+
+        assert inserted == [(0, 8), (9, 18)]
+        assert model.file_row(2) == 16
+
+    def test_append_signals_before_changing_rows(self):
+        from levelup.gui.diff_model import DiffModel
+
+        files = parse_diff(SAMPLE)
+        model = DiffModel()
+        model.append_files(files[:1])
+        seen: list[tuple[int, int]] = []
+        model.rowsAboutToBeInserted.connect(
+            lambda *_: seen.append((model.rowCount(), len(model.files)))
+        )
+
+        model.append_files(files[1:])
+
+        assert seen == [(9, 1)]
+
+
+class TestDiffLoadThread:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _run(self, thread) -> tuple[list, list, list]:
+        batches: list = []
+        finished: list = []
+        failed: list = []
+        thread.files_loaded.connect(batches.append)
+        thread.load_finished.connect(lambda: finished.append(True))
+        thread.load_failed.connect(failed.append)
+        thread.start()
+        _process_until(lambda: finished or failed)
+        thread.wait(5000)
+        return batches, finished, failed
+
+    def test_streams_parsed_files(self, tmp_path):
+        from levelup.gui.diff_model import DiffLoadThread
+
+        repo = _init_git_repo(tmp_path)
+        start = repo.head.commit.hexsha
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text(f"print('{name}')\n")
+        repo.index.add(["a.py", "b.py", "c.py"])
+        end = repo.index.commit("add files").hexsha
+
+        batches, finished, failed = self._run(DiffLoadThread(str(tmp_path), start, end))
+
+        assert finished and not failed
+        files = [f for batch in batches for f in batch]
+        assert [f.path for f in files] == ["a.py", "b.py", "c.py"]
+        assert diff_totals(files)["insertions"] == 3
+
+    def test_bad_sha_fails(self, tmp_path):
+        from levelup.gui.diff_model import DiffLoadThread
+
+        repo = _init_git_repo(tmp_path)
+        thread = DiffLoadThread(str(tmp_path), repo.head.commit.hexsha, "0" * 40)
+
+        batches, finished, failed = self._run(thread)
+
+        assert failed and not finished and not batches
+
+
+class TestDiffViewWidgetLoading:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _widget(self, tmp_path: Path):
+        from levelup.core.context import PipelineContext, TaskInput
+        from levelup.gui.diff_view_widget import DiffViewWidget
+        from levelup.state.manager import StateManager
+
+        repo = _init_git_repo(tmp_path)
+        start = repo.head.commit.hexsha
+        (tmp_path / "feature.py").write_text("x = 1\n")
+        repo.index.add(["feature.py"])
+        repo.index.commit("add feature")
+
+        sm = StateManager(db_path=tmp_path / "state.db")
+        sm.register_run(
+            PipelineContext(
+                run_id="run1",
+                task=TaskInput(title="Task"),
+                project_path=tmp_path,
+                pre_run_sha=start,
+            )
+        )
+        widget = DiffViewWidget(run_id="run1", state_manager=sm, project_path=str(tmp_path))
+        _process_until(lambda: not widget.is_loading)
+        return widget, repo
+
+    def test_lines_shown_in_list_view(self, tmp_path):
+        from levelup.gui.diff_view_widget import DiffListView
+
+        widget, _ = self._widget(tmp_path)
+
+        view = widget.findChild(DiffListView)
+        model = view.model()
+        texts = [model.data(model.index(r)) for r in range(model.rowCount())]
+        assert texts[0].startswith("▾ feature.py")
+        assert "+x = 1" in texts
+        assert "1 file(s) changed" in widget._browser.toPlainText()
+
+    def test_refresh_of_same_commits_keeps_lines(self, tmp_path):
+        widget, _ = self._widget(tmp_path)
+        model = widget._model
+        model.toggle(0)
+        resets: list[bool] = []
+        model.modelReset.connect(lambda: resets.append(True))
+
+        widget.refresh()
+
+        assert not widget.is_loading
+        assert resets == []
+        assert not model.is_expanded(0)
+
+    def test_refresh_after_new_commit_reloads(self, tmp_path):
+        widget, repo = self._widget(tmp_path)
+        (tmp_path / "more.py").write_text("y = 2\n")
+        repo.index.add(["more.py"])
+        repo.index.commit("more")
+
+        widget.refresh()
+        assert widget.is_loading
+        _process_until(lambda: not widget.is_loading)
+
+        assert [f.path for f in widget._model.files] == ["feature.py", "more.py"]
+
+    def test_folds_are_per_diff(self, tmp_path):
+        widget, repo = self._widget(tmp_path)
+        first = widget._diff_key
+        widget._model.toggle(0)
+        (tmp_path / "feature.py").write_text("x = 2\n")
+        repo.index.add(["feature.py"])
+        repo.index.commit("change feature")
+
+        widget.refresh()
+        _process_until(lambda: not widget.is_loading)
+        assert widget._model.is_expanded(0)
+
+        widget._model.toggle(0)
+        widget._start_load(first[1], first[2], ["<h2>All Changes</h2>"], "No changes to display.")
+        assert widget._model.is_expanded(0)
+
+    def test_folds_survive_reloading_the_same_diff(self, tmp_path):
+        widget, _ = self._widget(tmp_path)
+        widget._model.toggle(0)
+
+        widget._show_error("git busy")  # drops the lines and the diff key
+        widget.refresh()
+        _process_until(lambda: not widget.is_loading)
+
+        assert not widget._model.is_expanded(0)
+
+    def test_header_link_scrolls_to_file(self, tmp_path):
+        from PyQt6.QtCore import QUrl
+
+        widget, _ = self._widget(tmp_path)
+        widget._model.toggle(0)
+
+        widget._on_anchor_clicked(QUrl("diff-file:0"))
+
+        assert widget._model.is_expanded(0)
+        assert widget._view.currentIndex().row() == 0
+
+    def test_copy_selected_lines(self, tmp_path):
+        from PyQt6.QtCore import QItemSelectionModel, Qt
+        from PyQt6.QtGui import QKeyEvent
+        from PyQt6.QtWidgets import QApplication
+
+        widget, _ = self._widget(tmp_path)
+        view = widget._view
+        model = widget._model
+        last = model.rowCount() - 1
+        view.selectionModel().select(model.index(last), QItemSelectionModel.SelectionFlag.Select)
+
+        view.keyPressEvent(
+            QKeyEvent(QKeyEvent.Type.KeyPress, Qt.Key.Key_C, Qt.KeyboardModifier.ControlModifier)
+        )
+
+        assert QApplication.clipboard().text() == "+x = 1"
+
+    def test_error_replaces_lines(self, tmp_path):
+        widget, _ = self._widget(tmp_path)
+
+        widget._show_error("boom")
+
+        assert widget._model.rowCount() == 0
+        assert widget._view.isHidden()
+        assert "boom" in widget._browser.toPlainText()
@@ -46,6 +46,17 @@ def _ensure_qapp():
     return QApplication.instance() or QApplication([])
 
 
+def _wait_for_diff(widget, timeout: float = 10.0) -> None:
+    """Process events until the widget's background diff generation is done."""
+    import time
+    from PyQt6.QtWidgets import QApplication
+
+    deadline = time.monotonic() + timeout
+    while widget.is_loading and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+
+
 def _make_state_manager(tmp_path: Path):
     """Create a StateManager with a test database."""
     from levelup.state.manager import StateManager
@@ -491,6 +502,7 @@ class TestDiffViewWidgetPerStepDiff:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should contain diff markers
@@ -564,6 +576,7 @@ class TestDiffViewWidgetPerStepDiff:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should contain commit message
@@ -596,6 +609,7 @@ class TestDiffViewWidgetPerStepDiff:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show appropriate error message
@@ -641,6 +655,7 @@ class TestDiffViewWidgetWholeBranchDiff:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show all changes
@@ -676,6 +691,7 @@ class TestDiffViewWidgetWholeBranchDiff:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show statistics
@@ -739,6 +755,7 @@ class TestDiffViewWidgetEdgeCases:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show "no changes" message
@@ -770,6 +787,7 @@ class TestDiffViewWidgetEdgeCases:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show error message
@@ -791,6 +809,7 @@ class TestDiffViewWidgetEdgeCases:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should show error message
@@ -835,6 +854,7 @@ class TestDiffViewWidgetEdgeCases:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should still show diff
@@ -952,6 +972,7 @@ class TestDiffViewWidgetLiveUpdates:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         initial_html = browser.toHtml()
 
         # Add new changes
@@ -965,6 +986,7 @@ class TestDiffViewWidgetLiveUpdates:
         elif hasattr(widget, "update_diff"):
             widget.update_diff()
 
+        _wait_for_diff(widget)
         updated_html = browser.toHtml()
 
         # Content should have changed
@@ -1005,6 +1027,7 @@ class TestDiffViewWidgetDiffFormatting:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         assert "myfile.py" in html
@@ -1039,6 +1062,7 @@ class TestDiffViewWidgetDiffFormatting:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Unified diff format includes @@ line markers
@@ -1074,6 +1098,7 @@ class TestDiffViewWidgetDiffFormatting:
 
         from PyQt6.QtWidgets import QTextBrowser
         browser = widget.findChild(QTextBrowser)
+        _wait_for_diff(widget)
         html = browser.toHtml()
 
         # Should have + or - indicators
@@ -0,0 +1,250 @@
+"""Unit tests for the per-run JSONL event log (src/levelup/core/events.py)."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from levelup.core.context import (
+    PipelineContext,
+    PipelineStatus,
+    Requirements,
+    StepUsage,
+    TaskInput,
+)
+from levelup.core.events import EventLog, events_path, read_events
+from levelup.core.journal import RunJournal, render_markdown
+
+
+def _make_ctx(tmp_path: Path) -> PipelineContext:
+    return PipelineContext(
+        task=TaskInput(title="Add auth", description="Add login", source="jira", source_id="PROJ-1"),
+        project_path=tmp_path,
+        started_at=datetime(2026, 2, 6, 14, 30, 0, tzinfo=timezone.utc),
+        run_id="a1b2c3d4e5f6",
+        status=PipelineStatus.RUNNING,
+    )
+
+
+class TestEventLog:
+    def test_events_path(self, tmp_path: Path):
+        assert events_path("abc", tmp_path) == tmp_path / "abc" / "events.jsonl"
+
+    def test_emit_writes_one_json_line_per_event(self, tmp_path: Path):
+        log = EventLog(tmp_path / "events.jsonl", "run1")
+        log.emit("step_start", step="requirements")
+        log.emit("step_end", step="requirements", duration_ms=12.5)
+        log.close()
+
+        lines = (tmp_path / "events.jsonl").read_text().splitlines()
+        events = [json.loads(line) for line in lines]
+        assert [e["type"] for e in events] == ["step_start", "step_end"]
+        assert events[1]["run_id"] == "run1"
+        assert events[1]["duration_ms"] == 12.5
+        assert all(e["v"] == 1 and e["ts"] for e in events)
+
+    def test_non_boundary_events_are_buffered(self, tmp_path: Path):
+        path = tmp_path / "events.jsonl"
+        log = EventLog(path, "run1", flush_interval=3600, fsync_interval=3600)
+        with patch("levelup.core.events.os.fsync") as fsync:
+            log.emit("tool_call", tool="file_read")
+            assert path.read_text() == ""
+            assert fsync.call_count == 0
+
+            log.emit("step_end", step="coding")
+            assert len(path.read_text().splitlines()) == 2
+            assert fsync.call_count == 1
+        log.close()
+
+    def test_periodic_fsync(self, tmp_path: Path):
+        log = EventLog(tmp_path / "events.jsonl", "run1", fsync_interval=0)
+        with patch("levelup.core.events.os.fsync") as fsync:
+            log.emit("tool_call", tool="a")
+            log.emit("tool_call", tool="b")
+        assert fsync.call_count == 2
+        log.close()
+
+    def test_write_failure_disables_log(self, tmp_path: Path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        log = EventLog(blocker / "events.jsonl", "run1")
+        event = log.emit("run_start")
+        assert event["type"] == "run_start"
+        log.emit("outcome")
+        log.close()
+
+
+class TestReadEvents:
+    def test_tails_from_offset(self, tmp_path: Path):
+        path = tmp_path / "events.jsonl"
+        log = EventLog(path, "run1")
+        log.emit("run_start")
+        log.sync()
+
+        events, offset = read_events(path)
+        assert [e["type"] for e in events] == ["run_start"]
+
+        log.emit("outcome")
+        log.close()
+        events, offset = read_events(path, offset)
+        assert [e["type"] for e in events] == ["outcome"]
+        assert read_events(path, offset) == ([], offset)
+
+    def test_partial_and_malformed_lines(self, tmp_path: Path):
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"type": "a"}\nnot json\n{"type": "b"}\n{"type": "c"')
+
+        events, offset = read_events(path)
+        assert [e["type"] for e in events] == ["a", "b"]
+        assert offset == len(path.read_bytes()) - len('{"type": "c"')
+
+    def test_missing_file(self, tmp_path: Path):
+        assert read_events(tmp_path / "nope.jsonl", 7) == ([], 7)
+
+
+class TestJournalEvents:
+    def _run(self, tmp_path: Path) -> tuple[RunJournal, PipelineContext]:
+        ctx = _make_ctx(tmp_path)
+        journal = RunJournal(ctx, events_dir=tmp_path / "runs")
+        journal.write_header(ctx)
+        journal.log_step_start("requirements")
+        journal.log_tool_call("file_read", {"path": "a.py"}, duration_ms=3.21, result_chars=40)
+        ctx.requirements = Requirements(summary="Login flow")
+        ctx.step_usage["requirements"] = StepUsage(cost_usd=0.01, input_tokens=100, output_tokens=20)
+        journal.log_step("requirements", ctx)
+        journal.log_checkpoint("requirements", "approve", "")
+        journal.log_instruct("Use type hints")
+        journal.log_resume("planning")
+        ctx.status = PipelineStatus.COMPLETED
+        journal.log_outcome(ctx)
+        journal.close()
+        return journal, ctx
+
+    def test_events_are_outside_the_project(self, tmp_path: Path):
+        journal, ctx = self._run(tmp_path)
+        assert journal.events_path == tmp_path / "runs" / ctx.run_id / "events.jsonl"
+        assert not list((tmp_path / "levelup").glob("*.jsonl"))
+
+    def test_records_every_event(self, tmp_path: Path):
+        journal, _ = self._run(tmp_path)
+        events, _ = read_events(journal.events_path)
+
+        assert [e["type"] for e in events] == [
+            "run_start",
+            "step_start",
+            "tool_call",
+            "step_end",
+            "checkpoint",
+            "instruct",
+            "resume",
+            "outcome",
+        ]
+        tool = events[2]
+        assert (tool["step"], tool["tool"], tool["duration_ms"]) == ("requirements", "file_read", 3.2)
+        step_end = events[3]
+        assert step_end["usage"]["input_tokens"] == 100
+        assert step_end["duration_ms"] is not None
+
+    def test_markdown_is_rendered_from_events(self, tmp_path: Path):
+        journal, _ = self._run(tmp_path)
+        events, _ = read_events(journal.events_path)
+
+        markdown = journal.path.read_text(encoding="utf-8")
+        assert render_markdown(events) == markdown
+        assert "## Resumed from step: planning" in markdown
+        assert "file_read" not in markdown
+
+    def test_long_tool_input_is_truncated(self, tmp_path: Path):
+        ctx = _make_ctx(tmp_path)
+        journal = RunJournal(ctx, events_dir=tmp_path / "runs")
+        journal.log_tool_call("file_write", {"content": "x" * 5000}, duration_ms=1, result_chars=2)
+        journal.close()
+
+        events, _ = read_events(journal.events_path)
+        assert events[0]["input"]["content"].endswith("(5000 chars)")
+        assert len(events[0]["input"]["content"]) < 300
+
+    def test_llm_turns_are_events_only(self, tmp_path: Path):
+        ctx = _make_ctx(tmp_path)
+        journal = RunJournal(ctx, events_dir=tmp_path / "runs")
+        journal.log_llm_turn(
+            2,
+            ttft_ms=412.345,
+            duration_ms=1500.04,
+            input_tokens=900,
+            output_tokens=40,
+            stop_reason="tool_use",
+        )
+        journal.close()
+
+        events, _ = read_events(journal.events_path)
+        assert events[0]["type"] == "llm_turn"
+        assert (events[0]["turn"], events[0]["ttft_ms"], events[0]["duration_ms"]) == (
+            2,
+            412.3,
+            1500.0,
+        )
+        assert events[0]["stop_reason"] == "tool_use"
+        assert "llm_turn" not in render_markdown(events)
+
+
+class TestToolEvents:
+    def test_tool_loop_reports_tool_events(self, sdk_stream):
+        from levelup.agents.llm_client import LLMClient
+        from levelup.tools.base import ToolRegistry
+
+        registry = MagicMock(spec=ToolRegistry)
+        registry.get.return_value.execute.return_value = "contents"
+
+        with patch("anthropic.Anthropic") as anthropic_cls:
+            anthropic_cls.return_value.messages.stream.side_effect = sdk_stream.replay(
+                sdk_stream.message(sdk_stream.tool_use("file_read", {"path": "a.py"}, "t1")),
+                sdk_stream.message("done"),
+            )
+            client = LLMClient(api_key="k")
+            events: list[dict] = []
+            client.run_tool_loop("s", [], [], registry, on_tool_event=events.append)
+
+        assert len(events) == 1
+        assert events[0]["tool"] == "file_read"
+        assert events[0]["result_chars"] == len("contents")
+        assert events[0]["error"] is False
+        assert events[0]["duration_ms"] >= 0
+
+    def test_orchestrator_forwards_to_journal(self, tmp_path: Path):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        orch = Orchestrator(LevelUpSettings(), headless=True)
+        orch._journal = MagicMock(spec=RunJournal)
+        orch._on_tool_event(
+            {"tool": "shell", "input": {}, "duration_ms": 5.0, "result_chars": 3, "error": True}
+        )
+        orch._journal.log_tool_call.assert_called_once_with(
+            "shell", {}, duration_ms=5.0, result_chars=3, error=True
+        )
+
+    def test_orchestrator_forwards_llm_turns(self):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        orch = Orchestrator(LevelUpSettings(), headless=True)
+        orch._journal = MagicMock(spec=RunJournal)
+        orch._on_llm_turn({
+            "turn": 1,
+            "ttft_ms": 250.0,
+            "duration_ms": 900.0,
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "stop_reason": "end_turn",
+        })
+        orch._journal.log_llm_turn.assert_called_once_with(
+            1,
+            ttft_ms=250.0,
+            duration_ms=900.0,
+            input_tokens=10,
+            output_tokens=5,
+            stop_reason="end_turn",
+        )
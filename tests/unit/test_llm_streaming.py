@@ -0,0 +1,214 @@
+"""Tests for streamed LLMClient calls: delta callbacks, time to first token and cancellation."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from levelup.agents.backend import AgentResult, AnthropicSDKBackend
+from levelup.agents.llm_client import STREAM_IDLE_TIMEOUT, LLMCancelled, LLMClient
+from levelup.config.settings import LevelUpSettings
+from levelup.core.context import PipelineContext, PipelineStatus, TaskInput
+from levelup.core.orchestrator import Orchestrator, PipelinePaused
+from levelup.tools.base import ToolRegistry
+
+
+def _registry() -> MagicMock:
+    registry = MagicMock(spec=ToolRegistry)
+    registry.get.return_value.execute.return_value = "contents"
+    return registry
+
+
+class _BlockingStream:
+    """A response stream that sends one text chunk, then waits until it is closed."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.closed = threading.Event()
+
+    def __enter__(self) -> _BlockingStream:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def __iter__(self):
+        from anthropic.types import RawContentBlockDeltaEvent, TextDelta
+
+        delta = TextDelta(type="text_delta", text="Thinking")
+        yield RawContentBlockDeltaEvent(type="content_block_delta", index=0, delta=delta)
+        self.started.set()
+        if not self.closed.wait(5):
+            raise AssertionError("stream was never closed")
+        raise RuntimeError("Attempted to read or stream content, but the stream has been closed")
+
+    def get_final_message(self):
+        raise AssertionError("a closed stream has no final message")
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+class TestStreamingCallbacks:
+    @patch("anthropic.Anthropic")
+    def test_text_and_tool_starts_are_reported(self, MockAnthropic, sdk_stream):
+        mock_client = MockAnthropic.return_value
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message("Reading", sdk_stream.tool_use("file_read", {"path": "a.py"}, "t1")),
+            sdk_stream.message("done"),
+        )
+        texts: list[str] = []
+        tools: list[tuple[str, str]] = []
+
+        result = LLMClient(api_key="k").run_tool_loop(
+            "sys",
+            [{"role": "user", "content": "hi"}],
+            [],
+            _registry(),
+            on_text_delta=texts.append,
+            on_tool_use_start=lambda name, tool_id: tools.append((name, tool_id)),
+        )
+
+        assert result.text == "done"
+        assert len(texts) == 4  # each text block arrives in two deltas
+        assert "".join(texts) == "Readingdone"
+        assert tools == [("file_read", "t1")]
+        assistant_turn = mock_client.messages.stream.call_args.kwargs["messages"][-2]
+        assert assistant_turn["content"][1]["input"] == {"path": "a.py"}
+
+    @patch("anthropic.Anthropic")
+    def test_time_to_first_token_per_turn(self, MockAnthropic, sdk_stream):
+        mock_client = MockAnthropic.return_value
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(sdk_stream.tool_use("file_read"), input_tokens=100, output_tokens=20),
+            sdk_stream.message("done", input_tokens=100, output_tokens=20),
+        )
+        turns: list[dict] = []
+
+        result = LLMClient(api_key="k").run_tool_loop(
+            "sys", [], [], _registry(), on_turn=turns.append
+        )
+
+        assert len(result.ttft_ms) == result.num_turns == 2
+        assert all(ttft >= 0 for ttft in result.ttft_ms)
+        assert [t["turn"] for t in turns] == [1, 2]
+        assert [t["stop_reason"] for t in turns] == ["tool_use", "end_turn"]
+        assert turns[0]["ttft_ms"] == result.ttft_ms[0]
+        assert turns[0]["duration_ms"] >= turns[0]["ttft_ms"]
+        assert (turns[1]["input_tokens"], turns[1]["output_tokens"]) == (100, 20)
+
+    @patch("anthropic.Anthropic")
+    def test_structured_call_streams_text(self, MockAnthropic, sdk_stream):
+        mock_client = MockAnthropic.return_value
+        mock_client.messages.stream.side_effect = sdk_stream.replay(sdk_stream.message("{}"))
+        texts: list[str] = []
+
+        result = LLMClient(api_key="k").structured_call(
+            "sys", [{"role": "user", "content": "hi"}], on_text_delta=texts.append
+        )
+
+        assert result == "{}"
+        assert texts == ["{", "}"]
+        kwargs = mock_client.messages.stream.call_args.kwargs
+        assert kwargs["timeout"] == STREAM_IDLE_TIMEOUT
+        assert kwargs["system"] == "sys"
+
+
+class TestCancel:
+    @patch("anthropic.Anthropic")
+    def test_cancel_closes_the_stream(self, MockAnthropic):
+        stream = _BlockingStream()
+        MockAnthropic.return_value.messages.stream.return_value = stream
+        client = LLMClient(api_key="k")
+
+        def cancel_when_streaming() -> None:
+            stream.started.wait(5)
+            client.cancel()
+
+        canceller = threading.Thread(target=cancel_when_streaming)
+        canceller.start()
+        with pytest.raises(LLMCancelled):
+            client.run_tool_loop("sys", [], [], _registry())
+        canceller.join()
+
+        assert stream.closed.is_set()
+
+    @patch("anthropic.Anthropic")
+    def test_cancel_stops_before_the_next_tool(self, MockAnthropic, sdk_stream):
+        mock_client = MockAnthropic.return_value
+        mock_client.messages.stream.side_effect = sdk_stream.replay(
+            sdk_stream.message(sdk_stream.tool_use("shell"))
+        )
+        registry = _registry()
+        client = LLMClient(api_key="k")
+
+        with pytest.raises(LLMCancelled):
+            client.run_tool_loop(
+                "sys", [], [], registry, on_tool_use_start=lambda name, tool_id: client.cancel()
+            )
+
+        registry.get.return_value.execute.assert_not_called()
+        assert mock_client.messages.stream.call_count == 1
+
+    @patch("anthropic.Anthropic")
+    def test_next_call_is_not_cancelled(self, MockAnthropic, sdk_stream):
+        mock_client = MockAnthropic.return_value
+        mock_client.messages.stream.side_effect = sdk_stream.replay(sdk_stream.message("ok"))
+        client = LLMClient(api_key="k")
+
+        client.cancel()
+
+        assert client.structured_call("sys", []) == "ok"
+
+
+class TestOrchestratorPause:
+    def _orchestrator(self, tmp_path: Path, agent: MagicMock):
+        from levelup.state.manager import StateManager
+
+        sm = StateManager(db_path=tmp_path / "state.db")
+        ctx = PipelineContext(
+            run_id="run1",
+            task=TaskInput(title="Task"),
+            project_path=tmp_path,
+            status=PipelineStatus.RUNNING,
+        )
+        sm.register_run(ctx)
+        orch = Orchestrator(LevelUpSettings(), state_manager=sm, headless=True)
+        orch._backend = AnthropicSDKBackend(MagicMock(spec=LLMClient), MagicMock(spec=ToolRegistry))
+        orch._agents = {"coding": agent}
+        return orch, sm, ctx
+
+    @patch("levelup.core.orchestrator.CHECKPOINT_POLL_INTERVAL", 0.01)
+    def test_pause_request_cancels_the_running_agent(self, tmp_path):
+        agent = MagicMock()
+        orch, sm, ctx = self._orchestrator(tmp_path, agent)
+        cancelled = threading.Event()
+        orch._backend.llm_client.cancel.side_effect = cancelled.set
+
+        def run(ctx):
+            if not cancelled.wait(5):
+                return ctx, AgentResult(text="finished")
+            raise LLMCancelled("Cancelled while the response was streaming")
+
+        agent.run.side_effect = run
+        sm.request_pause("run1")
+
+        with pytest.raises(PipelinePaused):
+            orch._run_agent_with_retry("coding", ctx)
+
+        assert agent.run.call_count == 1
+        assert ctx.status == PipelineStatus.PAUSED
+        assert not sm.is_pause_requested("run1")
+
+    def test_cancel_without_pause_request_is_raised(self, tmp_path):
+        agent = MagicMock()
+        agent.run.side_effect = LLMCancelled("cancelled")
+        orch, _, ctx = self._orchestrator(tmp_path, agent)
+
+        with pytest.raises(LLMCancelled):
+            orch._run_agent_with_retry("coding", ctx)
+
+        assert agent.run.call_count == 1
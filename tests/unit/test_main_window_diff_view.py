@@ -290,8 +290,8 @@ class TestRunsTableContextMenu:
         sm = _make_state_manager(tmp_path)
         win = _make_main_window(sm, project_path=tmp_path)
 
-        from PyQt6.QtWidgets import QTableWidget
-        table = win.findChild(QTableWidget)
+        from PyQt6.QtWidgets import QTableView
+        table = win.findChild(QTableView)
 
         # Table should have context menu policy set
         # (Actual menu testing is complex, we verify structure)
@@ -0,0 +1,151 @@
+"""Unit tests for the Prometheus metrics exporter (src/levelup/state/metrics.py)."""
+
+from __future__ import annotations
+
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from levelup.core.context import PipelineContext, PipelineStatus, StepUsage, TaskInput
+from levelup.state.manager import StateManager
+from levelup.state.metrics import MetricsCollector, make_server
+
+
+def _samples(text: str) -> dict[str, float]:
+    """Map 'name{labels}' -> value for every sample line."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = float(value)
+    return samples
+
+
+def _run(mgr: StateManager, tmp_path: Path, status: PipelineStatus, **usage: StepUsage) -> str:
+    ctx = PipelineContext(task=TaskInput(title="t"), project_path=tmp_path, status=status)
+    mgr.register_run(ctx)
+    ctx.step_usage.update(usage)
+    ctx.total_cost_usd = sum(u.cost_usd for u in usage.values())
+    mgr.update_run(ctx)
+    return ctx.run_id
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "state.db"
+
+
+@pytest.fixture()
+def populated(db_path: Path, tmp_path: Path) -> StateManager:
+    mgr = StateManager(db_path)
+    run_id = _run(
+        mgr,
+        tmp_path,
+        PipelineStatus.COMPLETED,
+        coder=StepUsage(cost_usd=0.5, input_tokens=1000, output_tokens=200, duration_ms=42_000),
+        reviewer=StepUsage(cost_usd=0.25, input_tokens=500, output_tokens=100, duration_ms=3_000),
+    )
+    _run(mgr, tmp_path, PipelineStatus.FAILED)
+    _run(mgr, tmp_path, PipelineStatus.RUNNING)
+
+    decided = mgr.create_checkpoint_request(run_id, "requirements")
+    mgr.submit_checkpoint_decision(decided, "revise", "more detail")
+    mgr.create_checkpoint_request(run_id, "review")
+
+    mgr.add_ticket(str(tmp_path), "queued one")
+    mgr.add_ticket(str(tmp_path), "queued two")
+    return mgr
+
+
+class TestMetricsCollector:
+    def test_run_counters(self, populated, db_path):
+        samples = _samples(MetricsCollector(db_path).collect())
+
+        assert samples['levelup_runs{status="completed"}'] == 1
+        assert samples['levelup_runs{status="running"}'] == 1
+        assert samples['levelup_runs_finished_total{status="failed"}'] == 1
+        assert 'levelup_runs_finished_total{status="running"}' not in samples
+        assert samples["levelup_cost_usd_total"] == 0.75
+        assert samples['levelup_tokens_total{direction="input"}'] == 1500
+        assert samples['levelup_tokens_total{direction="output"}'] == 300
+
+    def test_queue_and_checkpoints(self, populated, db_path):
+        samples = _samples(MetricsCollector(db_path).collect())
+
+        assert samples['levelup_tickets{status="pending"}'] == 2
+        assert samples["levelup_checkpoints_pending"] == 1
+        assert samples['levelup_checkpoint_decisions_total{decision="revise",step="requirements"}'] == 1
+        assert samples['levelup_checkpoint_wait_seconds_count{step="requirements"}'] == 1
+
+    def test_step_duration_histogram(self, populated, db_path):
+        samples = _samples(MetricsCollector(db_path).collect())
+
+        assert samples['levelup_step_duration_seconds_bucket{le="30",step="coder"}'] == 0
+        assert samples['levelup_step_duration_seconds_bucket{le="60",step="coder"}'] == 1
+        assert samples['levelup_step_duration_seconds_bucket{le="+Inf",step="coder"}'] == 1
+        assert samples['levelup_step_duration_seconds_sum{step="coder"}'] == 42
+        assert samples['levelup_step_duration_seconds_count{step="reviewer"}'] == 1
+
+    def test_run_duration_only_for_finished_runs(self, populated, db_path):
+        samples = _samples(MetricsCollector(db_path).collect())
+        assert samples['levelup_run_duration_seconds_count{status="completed"}'] == 1
+        assert 'levelup_run_duration_seconds_count{status="running"}' not in samples
+
+    def test_step_usage_is_only_reparsed_for_updated_runs(self, populated, db_path, tmp_path):
+        collector = MetricsCollector(db_path)
+        collector.collect()
+        cached = dict(collector._step_cache)
+
+        _run(populated, tmp_path, PipelineStatus.COMPLETED, coder=StepUsage(duration_ms=1_000))
+        text = collector.collect()
+
+        assert len(collector._step_cache) == len(cached) + 1
+        for run_id, entry in cached.items():
+            assert collector._step_cache[run_id] is entry
+        assert _samples(text)['levelup_step_duration_seconds_count{step="coder"}'] == 2
+
+    def test_deleted_runs_leave_the_cache(self, populated, db_path):
+        collector = MetricsCollector(db_path)
+        collector.collect()
+        run_id = next(iter(collector._step_cache))
+        populated.delete_run(run_id)
+        collector.collect()
+        assert run_id not in collector._step_cache
+
+    def test_empty_db(self, db_path):
+        text = MetricsCollector(db_path).collect()
+        assert "# TYPE levelup_runs gauge" in text
+        assert _samples(text)["levelup_cost_usd_total"] == 0
+
+    def test_label_values_are_escaped(self, db_path, tmp_path):
+        mgr = StateManager(db_path)
+        run_id = _run(mgr, tmp_path, PipelineStatus.RUNNING)
+        mgr.create_checkpoint_request(run_id, 'we"ird\nstep')
+        request = mgr.get_pending_checkpoints()[0]
+        mgr.submit_checkpoint_decision(request.id, "approve")
+
+        text = MetricsCollector(db_path).collect()
+        assert 'step="we\\"ird\\nstep"' in text
+
+
+class TestMetricsServer:
+    def test_serves_metrics(self, populated, db_path):
+        server = make_server(MetricsCollector(db_path), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as resp:
+                body = resp.read().decode()
+                assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert 'levelup_runs{status="completed"} 1' in body
+
+            with pytest.raises(urllib.error.HTTPError) as exc:
+                urllib.request.urlopen(f"{base}/other", timeout=5)
+            assert exc.value.code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
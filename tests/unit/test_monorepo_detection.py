@@ -0,0 +1,181 @@
+"""Unit tests for monorepo package detection and package-scoped test runs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from levelup.core.context import FileChange, PipelineContext, ProjectPackage, TaskInput
+from levelup.core.test_selection import scoped_test_command
+from levelup.detection.cache import DetectionCache
+from levelup.detection.detector import (
+    PackageInfo,
+    ProjectDetector,
+    ProjectInfo,
+    combined_test_command,
+)
+
+
+def _write(root: Path, rel: str, content: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture()
+def monorepo(tmp_path: Path) -> Path:
+    """Two Python services and a JS web app, with no root manifest."""
+    root = tmp_path / "repo"
+    for svc in ("api", "worker"):
+        _write(root, f"services/{svc}/pyproject.toml", '[project]\ndependencies = ["fastapi"]\n')
+        _write(root, f"services/{svc}/{svc}/__init__.py")
+        _write(root, f"services/{svc}/{svc}/core.py", "def run(): pass\n")
+        _write(root, f"services/{svc}/{svc}/other.py", "def other(): pass\n")
+        _write(root, f"services/{svc}/tests/test_core.py", f"from {svc}.core import run\n")
+        _write(root, f"services/{svc}/tests/test_other.py", f"from {svc}.other import other\n")
+    _write(root, "web/package.json", '{"dependencies":{"react":"18"},"devDependencies":{"jest":"29"}}')
+    _write(root, "web/src/app.js", "export const x = 1;\n")
+    _write(root, "README.md", "# mono\n")
+    return root
+
+
+def _ctx(root: Path, packages: list[ProjectPackage], changed: list[str]) -> PipelineContext:
+    return PipelineContext(
+        task=TaskInput(title="t"),
+        project_path=root,
+        test_command="pytest",
+        test_runner="pytest",
+        packages=packages,
+        code_files=[FileChange(path=p, content="") for p in changed],
+    )
+
+
+def _packages(root: Path) -> list[ProjectPackage]:
+    info = ProjectDetector().detect(root)
+    return [ProjectPackage(**p.__dict__) for p in info.packages]
+
+
+class TestPackageDetection:
+    def test_discovers_packages(self, monorepo):
+        info = ProjectDetector().detect(monorepo)
+
+        assert [p.path for p in info.packages] == ["services/api", "services/worker", "web"]
+        api, _, web = info.packages
+        assert (api.language, api.framework, api.test_command) == ("python", "fastapi", "pytest")
+        assert (web.language, web.framework, web.test_command) == ("javascript", "react", "npx jest")
+
+    def test_root_without_manifest_runs_every_package(self, monorepo):
+        info = ProjectDetector().detect(monorepo)
+
+        assert info.test_runner is None
+        assert info.test_command == (
+            "(cd services/api && pytest) && (cd services/worker && pytest) && (cd web && npx jest)"
+        )
+
+    def test_root_manifest_keeps_root_command(self, monorepo):
+        _write(monorepo, "pyproject.toml", "[tool.pytest.ini_options]\n")
+        info = ProjectDetector().detect(monorepo)
+
+        assert info.test_command == "pytest"
+        assert len(info.packages) == 3
+
+    def test_single_project_has_no_packages(self, tmp_path):
+        _write(tmp_path, "pyproject.toml", "[project]\n")
+        _write(tmp_path, "src/app/main.py")
+        assert ProjectDetector().detect(tmp_path).packages == []
+
+    def test_fixture_manifests_are_not_packages(self, tmp_path):
+        _write(tmp_path, "pyproject.toml", "[project]\n")
+        _write(tmp_path, "tests/fixtures/demo/package.json", "{}")
+        assert ProjectDetector().detect(tmp_path).packages == []
+
+    def test_combined_command_skips_packages_without_tests(self):
+        packages = [PackageInfo(path="a", language="c"), PackageInfo(path="b", test_command="make test")]
+        assert combined_test_command(packages) == "(cd b && make test)"
+
+    def test_round_trips_through_cache(self, monorepo, tmp_path):
+        cache = DetectionCache(cache_dir=tmp_path / "cache")
+        info = ProjectDetector().detect(monorepo)
+        cache.put(monorepo, info)
+
+        cached = cache.get(monorepo)
+
+        assert cached == info
+        assert isinstance(cached.packages[0], PackageInfo)
+
+    def test_new_sibling_package_invalidates_cache(self, monorepo, tmp_path):
+        cache = DetectionCache(cache_dir=tmp_path / "cache")
+        cache.put(monorepo, ProjectDetector().detect(monorepo))
+        _write(monorepo, "services/billing/pyproject.toml", "[project]\n")
+        _write(monorepo, "services/billing/billing.py")
+
+        assert cache.get(monorepo) is None
+
+    def test_root_language_guessed_from_file_counts_is_not_stored(self, monorepo, tmp_path):
+        cache = DetectionCache(cache_dir=tmp_path / "cache")
+        cache.detect(monorepo)
+        cache.detect(monorepo)
+
+        assert cache.last_hit is False
+
+    def test_from_dict_without_packages(self):
+        assert ProjectInfo.from_dict({"language": "go"}) == ProjectInfo(language="go")
+
+
+class TestPackageScopedTests:
+    def test_scopes_to_touched_package_and_tests(self, monorepo):
+        ctx = _ctx(monorepo, _packages(monorepo), ["services/api/api/core.py"])
+        assert scoped_test_command(ctx, monorepo) == "(cd services/api && pytest tests/test_core.py)"
+
+    def test_multiple_packages(self, monorepo):
+        ctx = _ctx(
+            monorepo, _packages(monorepo), ["services/worker/worker/other.py", "web/src/app.js"]
+        )
+        assert scoped_test_command(ctx, monorepo) == (
+            "(cd services/worker && pytest tests/test_other.py) && (cd web && npx jest)"
+        )
+
+    def test_docs_changes_are_ignored(self, monorepo):
+        ctx = _ctx(monorepo, _packages(monorepo), ["README.md", "services/api/api/core.py"])
+        assert scoped_test_command(ctx, monorepo).startswith("(cd services/api && ")
+
+    def test_change_outside_packages_uses_root_command(self, monorepo):
+        _write(monorepo, "scripts/tool.py")
+        ctx = _ctx(monorepo, _packages(monorepo), ["scripts/tool.py", "web/src/app.js"])
+        assert not scoped_test_command(ctx, monorepo).startswith("(cd ")
+
+    def test_innermost_package_wins(self, tmp_path):
+        packages = [
+            ProjectPackage(path="libs", test_command="make test"),
+            ProjectPackage(path="libs/core", test_command="cargo test", test_runner="cargo_test"),
+        ]
+        _write(tmp_path, "libs/core/src/lib.rs")
+        ctx = _ctx(tmp_path, packages, ["libs/core/src/lib.rs"])
+        assert scoped_test_command(ctx, tmp_path) == "(cd libs/core && cargo test)"
+
+
+class TestOrchestratorPackages:
+    def _orchestrator(self, tmp_path: Path, **settings):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        orch = Orchestrator(LevelUpSettings(**settings), headless=True)
+        orch._detection_cache = None
+        return orch
+
+    def test_detection_populates_ctx_packages(self, monorepo, tmp_path):
+        orch = self._orchestrator(tmp_path)
+        ctx = PipelineContext(task=TaskInput(title="t"), project_path=monorepo)
+        with patch("levelup.core.orchestrator.write_project_context_preserving"):
+            orch._run_detection(monorepo, ctx)
+        assert [p.path for p in ctx.packages] == ["services/api", "services/worker", "web"]
+
+    def test_explicit_test_command_disables_packages(self, monorepo, tmp_path):
+        orch = self._orchestrator(tmp_path, project={"test_command": "make test"})
+        ctx = PipelineContext(task=TaskInput(title="t"), project_path=monorepo)
+        with patch("levelup.core.orchestrator.write_project_context_preserving"):
+            orch._run_detection(monorepo, ctx)
+        assert ctx.test_command == "make test"
+        assert ctx.packages == []
@@ -302,7 +302,7 @@ class TestOrchestrator:
         # Should only be called once (no retries)
         assert mock_agent.run.call_count == 1
 
-    @patch("levelup.agents.llm_client.anthropic.Anthropic")
+    @patch("anthropic.Anthropic")
     def test_create_backend_anthropic_sdk(self, MockAnthropic, tmp_path):
         """Verify anthropic_sdk backend creates AnthropicSDKBackend."""
         from levelup.agents.backend import AnthropicSDKBackend
@@ -0,0 +1,102 @@
+"""Unit tests for ``--profile`` support (src/levelup/core/profiling.py)."""
+
+from __future__ import annotations
+
+import pstats
+import sqlite3
+from pathlib import Path
+
+from benchmarks.fake_backend import FakeBackend
+from benchmarks.repos import fake_test_command, make_repo
+from levelup.config.settings import LevelUpSettings, PipelineSettings, ProjectSettings
+from levelup.core.context import PipelineStatus, TaskInput
+from levelup.core.events import events_path, read_events
+from levelup.core.journal import render_markdown
+from levelup.core.orchestrator import Orchestrator
+from levelup.core.profiling import RunProfiler, profile_path
+
+
+def _busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+class TestRunProfiler:
+    def test_top_functions_sorted_by_self_time(self):
+        profiler = RunProfiler()
+        profiler.start()
+        _busy(200_000)
+        profiler.stop()
+        top = profiler.top_functions(5)
+        assert top
+        assert [e.self_ms for e in top] == sorted((e.self_ms for e in top), reverse=True)
+        assert any("_busy" in e.function or "genexpr" in e.function for e in top)
+
+    def test_area_totals_attribute_sqlite(self):
+        profiler = RunProfiler()
+        conn = sqlite3.connect(":memory:")
+        profiler.start()
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(1000)])
+        conn.commit()
+        profiler.stop()
+        areas = profiler.area_totals()
+        assert set(areas) == {"model", "git", "sqlite", "tests"}
+        assert areas["sqlite"] > 0
+        assert areas["git"] == 0
+
+    def test_summary_and_dump(self, tmp_path: Path):
+        profiler = RunProfiler()
+        profiler.start()
+        _busy(10_000)
+        profiler.stop()
+        path = profiler.dump(tmp_path / "run" / "profile.prof")
+        assert path is not None and path.exists()
+        assert pstats.Stats(str(path)).total_calls > 0  # type: ignore[attr-defined]
+        summary = profiler.summary(path, limit=3)
+        assert summary["path"] == str(path)
+        assert len(summary["top"]) <= 3
+        assert summary["total_ms"] >= 0
+
+    def test_stop_without_start_is_noop(self):
+        RunProfiler().stop()
+
+
+def test_profile_path_does_not_overwrite(tmp_path: Path):
+    first = profile_path(tmp_path)
+    assert first.name == "profile.prof"
+    first.write_bytes(b"")
+    assert profile_path(tmp_path).name == "profile-1.prof"
+
+
+class _Orchestrator(Orchestrator):
+    def _create_backend(self, project_path, ctx=None, **kwargs):  # type: ignore[no-untyped-def]
+        return FakeBackend()
+
+
+def _settings(repo: Path) -> LevelUpSettings:
+    return LevelUpSettings(
+        project=ProjectSettings(path=repo, test_command=fake_test_command()),
+        pipeline=PipelineSettings(require_checkpoints=False, create_git_branch=False),
+    )
+
+
+def test_orchestrator_writes_profile_next_to_event_log(tmp_path: Path, capsys):
+    repo = make_repo(tmp_path / "repo", 1)
+    orchestrator = _Orchestrator(_settings(repo), profile=True)
+    ctx = orchestrator.run(TaskInput(title="Profiled"))
+
+    assert ctx.status == PipelineStatus.COMPLETED
+    events, _ = read_events(events_path(ctx.run_id))
+    profile_events = [e for e in events if e["type"] == "profile"]
+    assert len(profile_events) == 1
+    assert Path(profile_events[0]["path"]).parent == events_path(ctx.run_id).parent
+    assert Path(profile_events[0]["path"]).exists()
+    assert "## Profile" in render_markdown(events)
+    assert "Profile (" in capsys.readouterr().out
+
+
+def test_orchestrator_without_profile_writes_nothing(tmp_path: Path):
+    repo = make_repo(tmp_path / "repo", 1)
+    ctx = _Orchestrator(_settings(repo)).run(TaskInput(title="Plain"))
+    run_dir = events_path(ctx.run_id).parent
+    assert not list(run_dir.glob("*.prof"))
@@ -0,0 +1,197 @@
+"""Tests for the dashboard's incremental runs table model."""
+
+from __future__ import annotations
+
+import pytest
+
+from levelup.state.models import RunRecord
+
+
+def _can_import_pyqt6() -> bool:
+    try:
+        import PyQt6  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _can_import_pyqt6(), reason="PyQt6 not available")
+
+
+def _run(run_id: str, updated: int = 0, **kwargs: object) -> RunRecord:
+    fields: dict[str, object] = {
+        "task_title": f"task {run_id}",
+        "project_path": "/proj",
+        "status": "running",
+        "started_at": "2025-01-01T00:00:00",
+        "updated_at": f"2025-01-01T00:00:{updated:02d}",
+    }
+    fields.update(kwargs)
+    return RunRecord(run_id=run_id, **fields)  # type: ignore[arg-type]
+
+
+class _Signals:
+    """Records the model's structural and data signals."""
+
+    def __init__(self, model: object) -> None:
+        self.events: list[tuple] = []
+        model.modelReset.connect(lambda: self.events.append(("reset",)))
+        model.rowsInserted.connect(lambda _p, a, b: self.events.append(("insert", a, b)))
+        model.rowsRemoved.connect(lambda _p, a, b: self.events.append(("remove", a, b)))
+        model.rowsMoved.connect(
+            lambda _p, a, b, _d, row: self.events.append(("move", a, row))
+        )
+        model.dataChanged.connect(
+            lambda tl, br, _roles=None: self.events.append(("changed", tl.row(), br.row()))
+        )
+
+
+class TestRunTableModel:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _model(self, runs: list[RunRecord] | None = None):
+        from PyQt6.QtTest import QAbstractItemModelTester
+
+        from levelup.gui.run_table_model import RunTableModel
+
+        model = RunTableModel()
+        # Checks every signal the model emits for consistency
+        self._tester = QAbstractItemModelTester(
+            model, QAbstractItemModelTester.FailureReportingMode.Fatal
+        )
+        if runs:
+            model.set_runs(runs)
+        return model
+
+    def _ids(self, model) -> list[str]:
+        return [model.run_at(row).run_id for row in range(model.rowCount())]
+
+    def test_display_columns(self):
+        from PyQt6.QtCore import Qt
+
+        from levelup.gui.resources import status_display
+
+        model = self._model(
+            [_run("abcdefghijklmnop", input_tokens=1500, output_tokens=800, current_step="plan")]
+        )
+
+        texts = [model.data(model.index(0, col)) for col in range(model.columnCount())]
+        assert texts == [
+            "abcdefghijkl",
+            "task abcdefghijklmnop",
+            "/proj",
+            status_display("running"),
+            "2,300 (1,500 / 800)",
+            "plan",
+            "2025-01-01T00:00:00",
+        ]
+        assert model.headerData(4, Qt.Orientation.Horizontal) == "Tokens"
+
+    def test_tokens_na_when_zero(self):
+        model = self._model([_run("a")])
+        assert model.data(model.index(0, 4)) == "N/A"
+
+    def test_status_foreground_follows_theme(self):
+        from PyQt6.QtCore import Qt
+
+        from levelup.gui.resources import get_status_color
+
+        model = self._model([_run("a", status="failed")])
+        role = Qt.ItemDataRole.ForegroundRole
+        assert model.data(model.index(0, 3), role).name() == get_status_color("failed").lower()
+        assert model.data(model.index(0, 1), role) is None
+
+        signals = _Signals(model)
+        model.set_theme("light")
+        assert signals.events == [("changed", 0, 0)]
+        expected = get_status_color("failed", theme="light").lower()
+        assert model.data(model.index(0, 3), role).name() == expected
+
+    def test_unchanged_refresh_emits_nothing(self):
+        runs = [_run("a", 3), _run("b", 2), _run("c", 1)]
+        model = self._model(runs)
+        signals = _Signals(model)
+
+        model.set_runs([r.model_copy() for r in runs])
+
+        assert signals.events == []
+
+    def test_updated_run_moves_to_top_and_changes_only_its_row(self):
+        model = self._model([_run("a", 3), _run("b", 2), _run("c", 1)])
+        signals = _Signals(model)
+
+        model.set_runs([_run("c", 4, current_step="test"), _run("a", 3), _run("b", 2)])
+
+        assert self._ids(model) == ["c", "a", "b"]
+        assert signals.events == [("move", 2, 0), ("changed", 0, 0)]
+        assert model.data(model.index(0, 5)) == "test"
+
+    def test_changed_in_place(self):
+        model = self._model([_run("a", 3), _run("b", 2)])
+        signals = _Signals(model)
+
+        model.set_runs([_run("a", 3), _run("b", 5, status="completed")])
+
+        assert signals.events == [("changed", 1, 1)]
+        assert model.data(model.index(1, 3)).endswith("Completed")
+
+    def test_same_updated_at_is_not_a_change(self):
+        model = self._model([_run("a", 3)])
+        signals = _Signals(model)
+
+        model.set_runs([_run("a", 3, current_step="ignored")])
+
+        assert signals.events == []
+
+    def test_insert_and_remove(self):
+        model = self._model([_run("a", 3), _run("b", 2), _run("c", 1)])
+        signals = _Signals(model)
+
+        model.set_runs([_run("new", 9), _run("a", 3), _run("c", 1)])
+
+        assert self._ids(model) == ["new", "a", "c"]
+        assert signals.events == [("remove", 1, 1), ("insert", 0, 0)]
+        assert model.row_of("c") == 2
+        assert model.row_of("b") is None
+
+    def test_first_load_and_clear_reset(self):
+        model = self._model()
+        signals = _Signals(model)
+
+        model.set_runs([_run("a"), _run("b")])
+        model.set_runs([])
+        model.set_runs([])
+
+        assert signals.events == [("reset",), ("reset",)]
+        assert model.rowCount() == 0
+
+    def test_reordering_many_rows(self):
+        runs = [_run(f"r{n}", n) for n in range(20)]
+        model = self._model(runs)
+
+        shuffled = runs[::3] + runs[1::3] + runs[2::3]
+        model.set_runs(shuffled)
+
+        assert self._ids(model) == [r.run_id for r in shuffled]
+        assert all(model.row_of(r.run_id) == row for row, r in enumerate(shuffled))
+
+    def test_selection_survives_refresh(self):
+        from PyQt6.QtCore import QItemSelectionModel
+        from PyQt6.QtWidgets import QTableView
+
+        model = self._model([_run("a", 3), _run("b", 2), _run("c", 1)])
+        view = QTableView()
+        view.setModel(model)
+        view.selectionModel().select(
+            model.index(2, 0),
+            QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows,
+        )
+
+        model.set_runs([_run("b", 7), _run("a", 3), _run("c", 1)])
+
+        selected = {index.row() for index in view.selectionModel().selectedRows()}
+        assert [model.run_at(row).run_id for row in selected] == ["c"]
@@ -0,0 +1,164 @@
+"""Unit tests for the persistent shell session (src/levelup/tools/shell_session.py)."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from levelup.tools.shell import ShellTool
+from levelup.tools.shell_session import ShellSession
+from levelup.tools.test_runner import TestRunnerTool
+
+pytestmark = pytest.mark.skipif(
+    not ShellSession.is_supported(), reason="persistent shell needs bash on POSIX"
+)
+
+
+@pytest.fixture()
+def session(tmp_path: Path):
+    s = ShellSession(tmp_path)
+    yield s
+    s.close()
+
+
+class TestShellSession:
+    def test_captures_stdout_stderr_and_exit_code(self, session):
+        result = session.run("echo out; echo err >&2; exit_code() { return 3; }; exit_code", 10)
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert result.returncode == 3
+
+    def test_state_persists_between_commands(self, session, tmp_path):
+        (tmp_path / "sub").mkdir()
+        session.run("cd sub && export LEVELUP_TEST_VAR=42", 10)
+        result = session.run('pwd; echo "$LEVELUP_TEST_VAR"', 10)
+        assert result.stdout.splitlines() == [str((tmp_path / "sub").resolve()), "42"]
+
+    def test_reuses_one_process(self, session):
+        first = session.run("echo $$", 10).stdout
+        second = session.run("echo $$", 10).stdout
+        assert first == second
+
+    def test_stderr_is_reset_per_command(self, session):
+        session.run("echo boom >&2", 10)
+        assert session.run("true", 10).stderr == ""
+
+    def test_output_without_trailing_newline(self, session):
+        assert session.run("printf abc", 10).stdout == "abc"
+
+    def test_commands_cannot_read_session_input(self, session):
+        result = session.run("read line; echo \"[$line]\"", 10)
+        assert result.stdout == "[]\n"
+        assert session.run("echo still-alive", 10).stdout == "still-alive\n"
+
+    def test_large_output(self, session):
+        result = session.run("seq 1 200000", 30)
+        assert result.returncode == 0
+        assert result.stdout.startswith("1\n2\n")
+        assert result.stdout.rstrip().endswith("200000")
+
+    def test_timeout_restarts_session(self, session):
+        session.run("export LEVELUP_TEST_VAR=1", 10)
+        with pytest.raises(subprocess.TimeoutExpired):
+            session.run("sleep 5", 0.5)
+        assert not session.alive
+        assert session.run('echo "[$LEVELUP_TEST_VAR]"', 10).stdout == "[]\n"
+
+    def test_exit_in_command_restarts_session(self, session):
+        with pytest.raises(Exception):
+            session.run("exit 0", 5)
+        assert session.run("echo back", 10).stdout == "back\n"
+
+    def test_close(self, session):
+        session.run("true", 10)
+        session.close()
+        assert not session.alive
+
+
+class TestToolsWithSession:
+    def test_shell_tool_uses_session(self, session, tmp_path):
+        (tmp_path / "sub").mkdir()
+        tool = ShellTool(tmp_path, session=session)
+        tool.execute(command="cd sub")
+        assert str((tmp_path / "sub").resolve()) in tool.execute(command="pwd")
+        assert "persists" in tool.description
+
+    def test_shell_tool_timeout(self, session, tmp_path):
+        tool = ShellTool(tmp_path, session=session)
+        assert "timed out" in tool.execute(command="sleep 5", timeout=0.5)
+
+    def test_test_runner_uses_session_environment(self, session, tmp_path):
+        session.run("export LEVELUP_TEST_VAR=ok", 10)
+        tool = TestRunnerTool(tmp_path, test_command='echo "3 passed $LEVELUP_TEST_VAR"', session=session)
+        result = tool.run_and_parse()
+        assert result.passed is True
+        assert result.total == 3
+        assert "ok" in result.output
+
+    def test_test_runner_runs_in_project_root_after_cd(self, session, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "marker.txt").write_text("root")
+        ShellTool(tmp_path, session=session).execute(command="cd sub")
+        tool = TestRunnerTool(
+            tmp_path, test_command="test -f marker.txt && echo '1 passed'", session=session
+        )
+
+        result = tool.run_and_parse()
+
+        assert result.passed is True
+        assert session.run("pwd", 10).stdout.strip() == str((tmp_path / "sub").resolve())
+
+
+def test_orchestrator_shares_and_closes_session(tmp_path):
+    from levelup.config.settings import LevelUpSettings
+    from levelup.core.orchestrator import Orchestrator
+
+    settings = LevelUpSettings(pipeline={"persistent_shell": True})
+    orch = Orchestrator(settings, headless=True)
+
+    first = orch._create_tool_registry(tmp_path)
+    second = orch._create_tool_registry(tmp_path)
+    session = orch._shell_session
+    assert session is not None
+    assert first.get("shell")._session is session
+    assert second.get("test_runner")._session is session
+
+    orch._close_shell_session()
+    assert orch._shell_session is None
+
+
+def test_orchestrator_closes_session_when_interrupted(tmp_path):
+    from unittest.mock import patch
+
+    from levelup.config.settings import LevelUpSettings
+    from levelup.core.context import PipelineContext, TaskInput
+    from levelup.core.orchestrator import Orchestrator
+
+    settings = LevelUpSettings(pipeline={"persistent_shell": True})
+    orch = Orchestrator(settings, headless=True)
+
+    def start_shell_then_interrupt(*args):
+        orch._create_tool_registry(tmp_path).get("shell").execute(command="true")
+        raise KeyboardInterrupt
+
+    with patch.object(orch, "_run", side_effect=start_shell_then_interrupt):
+        with pytest.raises(KeyboardInterrupt):
+            orch.run(TaskInput(title="Task"))
+    assert orch._shell_session is None
+
+    ctx = PipelineContext(task=TaskInput(title="Task"), project_path=tmp_path)
+    with patch.object(orch, "_resume", side_effect=start_shell_then_interrupt):
+        with pytest.raises(KeyboardInterrupt):
+            orch.resume(ctx, "coding")
+    assert orch._shell_session is None
+
+
+def test_orchestrator_session_disabled_by_default(tmp_path):
+    from levelup.config.settings import LevelUpSettings
+    from levelup.core.orchestrator import Orchestrator
+
+    orch = Orchestrator(LevelUpSettings(), headless=True)
+    registry = orch._create_tool_registry(tmp_path)
+    assert registry.get("shell")._session is None
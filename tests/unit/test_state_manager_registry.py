@@ -0,0 +1,132 @@
+"""Tests for the shared StateManager registry and one-time schema initialization."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from levelup.config.settings import LevelUpSettings, LLMSettings, ProjectSettings
+from levelup.core.context import PipelineContext, TaskInput
+from levelup.core.orchestrator import Orchestrator
+from levelup.core.tickets import (
+    TicketStatus,
+    add_ticket,
+    get_ticket,
+    read_tickets,
+    set_ticket_status,
+)
+from levelup.state import db
+from levelup.state.db import ensure_db, get_connection
+from levelup.state.manager import StateManager, get_state_manager
+
+
+@pytest.fixture()
+def statements() -> Iterator[list[str]]:
+    """Every SQL statement run through state connections while the fixture is active."""
+    executed: list[str] = []
+
+    def traced(db_path: Path | str = db.DEFAULT_DB_PATH) -> sqlite3.Connection:
+        conn = get_connection(db_path)
+        conn.set_trace_callback(executed.append)
+        return conn
+
+    with patch("levelup.state.db.get_connection", traced), \
+         patch("levelup.state.manager.get_connection", traced):
+        yield executed
+
+
+def _ddl(statements: list[str]) -> list[str]:
+    keywords = ("CREATE", "ALTER", "SELECT VERSION FROM SCHEMA_VERSION")
+    return [s for s in statements if s.strip().upper().startswith(keywords)]
+
+
+class TestEnsureDb:
+    def test_initializes_once(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        with patch("levelup.state.db.init_db", wraps=db.init_db) as init:
+            ensure_db(db_path)
+            ensure_db(db_path)
+            ensure_db(str(db_path))
+        init.assert_called_once()
+
+    def test_reinitializes_deleted_file(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        ensure_db(db_path)
+        db_path.unlink()
+
+        ensure_db(db_path)
+
+        assert StateManager(db_path).list_runs() == []
+
+    def test_state_manager_construction_skips_ddl(self, tmp_path, statements):
+        db_path = tmp_path / "state.db"
+        StateManager(db_path)
+        assert _ddl(statements)
+
+        statements.clear()
+        StateManager(db_path)
+        assert statements == []
+
+
+class TestGetStateManager:
+    def test_same_instance_per_path(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        manager = get_state_manager(db_path)
+        assert get_state_manager(str(db_path)) is manager
+        assert get_state_manager(tmp_path / "sub" / ".." / "state.db") is manager
+
+    def test_separate_instance_per_path(self, tmp_path):
+        assert get_state_manager(tmp_path / "a.db") is not get_state_manager(tmp_path / "b.db")
+
+    def test_default_path(self, tmp_path):
+        with patch("levelup.state.manager.DEFAULT_DB_PATH", tmp_path / "default.db"):
+            manager = get_state_manager()
+        assert manager._db_path == (tmp_path / "default.db").resolve()
+
+    def test_recreates_schema_for_deleted_file(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        get_state_manager(db_path)
+        db_path.unlink()
+
+        assert get_state_manager(db_path).list_runs() == []
+
+
+class TestHotPathsSkipSchema:
+    def test_ticket_functions(self, tmp_path, statements):
+        db_path = tmp_path / "state.db"
+        add_ticket(tmp_path, "First", db_path=db_path)
+
+        statements.clear()
+        for _ in range(3):
+            read_tickets(tmp_path, db_path=db_path)
+            get_ticket(tmp_path, 1, db_path=db_path)
+        set_ticket_status(tmp_path, 1, TicketStatus.IN_PROGRESS, db_path=db_path)
+
+        assert statements
+        assert _ddl(statements) == []
+
+    def test_auto_approve_lookup_per_checkpoint(self, tmp_path, statements):
+        db_path = tmp_path / "state.db"
+        add_ticket(tmp_path, "First", metadata={"auto_approve": True}, db_path=db_path)
+        settings = LevelUpSettings(
+            llm=LLMSettings(api_key="test-key", model="test-model"),
+            project=ProjectSettings(path=tmp_path),
+        )
+        orch = Orchestrator(settings=settings)
+        ctx = PipelineContext(
+            task=TaskInput(title="First", source="ticket", source_id="ticket:1"),
+            project_path=tmp_path,
+        )
+
+        with patch("levelup.state.manager.DEFAULT_DB_PATH", db_path):
+            assert orch._should_auto_approve(ctx) is True
+            statements.clear()
+            for _ in range(3):
+                assert orch._should_auto_approve(ctx) is True
+
+        assert statements
+        assert _ddl(statements) == []
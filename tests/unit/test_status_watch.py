@@ -0,0 +1,158 @@
+"""Unit tests for ``levelup status`` --watch/--json/--ndjson and RunWatcher."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from levelup.cli.app import app
+from levelup.core.context import PipelineContext, PipelineStatus, TaskInput
+from levelup.state.manager import StateManager
+from levelup.state.watch import STATUS_COLUMNS, RunWatcher
+
+runner = CliRunner()
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "state.db"
+
+
+@pytest.fixture()
+def mgr(db_path: Path) -> StateManager:
+    return StateManager(db_path)
+
+
+def _register(mgr: StateManager, tmp_path: Path, title: str = "Task") -> PipelineContext:
+    ctx = PipelineContext(task=TaskInput(title=title), project_path=tmp_path)
+    mgr.register_run(ctx)
+    return ctx
+
+
+class TestRunWatcher:
+    def test_first_poll_adds_existing_runs(self, mgr, db_path, tmp_path):
+        ctx = _register(mgr, tmp_path)
+        with RunWatcher(db_path) as watcher:
+            changes = watcher.poll()
+        assert [(c.kind, c.run["run_id"]) for c in changes] == [("added", ctx.run_id)]
+        assert set(changes[0].run) == set(STATUS_COLUMNS)
+
+    def test_idle_poll_skips_query(self, mgr, db_path, tmp_path):
+        _register(mgr, tmp_path)
+        with RunWatcher(db_path) as watcher:
+            watcher.poll()
+            with patch.object(watcher, "_query") as query:
+                assert watcher.poll() == []
+            query.assert_not_called()
+
+    def test_reports_changed_and_removed(self, mgr, db_path, tmp_path):
+        first = _register(mgr, tmp_path, "first")
+        second = _register(mgr, tmp_path, "second")
+        with RunWatcher(db_path) as watcher:
+            watcher.poll()
+            first.status = PipelineStatus.COMPLETED
+            mgr.update_run(first)
+            mgr.delete_run(second.run_id)
+            changes = {c.run["run_id"]: c for c in watcher.poll()}
+        assert changes[first.run_id].kind == "changed"
+        assert changes[first.run_id].run["status"] == "completed"
+        assert changes[second.run_id].kind == "removed"
+
+    def test_rows_most_recent_first_and_limited(self, mgr, db_path, tmp_path):
+        runs = [_register(mgr, tmp_path, f"t{i}") for i in range(3)]
+        mgr.update_run(runs[0])
+        with RunWatcher(db_path, limit=2) as watcher:
+            watcher.poll()
+            rows = watcher.rows
+        assert len(rows) == 2
+        assert rows[0]["run_id"] == runs[0].run_id
+
+    def test_wait_runs_maintenance_when_due(self, mgr, db_path):
+        calls = []
+        with RunWatcher(
+            db_path, maintenance=lambda: calls.append(1), maintenance_interval=0
+        ) as watcher:
+            watcher.wait(0)
+            watcher.wait(0)
+        assert len(calls) == 2
+
+
+class TestStatusCommand:
+    def test_json_snapshot(self, mgr, db_path, tmp_path):
+        ctx = _register(mgr, tmp_path)
+        result = runner.invoke(app, ["status", "--db-path", str(db_path), "--json"])
+        assert result.exit_code == 0
+        runs = json.loads(result.output)
+        assert [r["run_id"] for r in runs] == [ctx.run_id]
+        assert "context_json" not in runs[0]
+
+    def test_ndjson_snapshot(self, mgr, db_path, tmp_path):
+        for i in range(3):
+            _register(mgr, tmp_path, f"t{i}")
+        result = runner.invoke(app, ["status", "--db-path", str(db_path), "--ndjson"])
+        lines = result.output.strip().splitlines()
+        assert len(lines) == 3
+        assert all(json.loads(line)["task_title"].startswith("t") for line in lines)
+
+    def test_table(self, mgr, db_path, tmp_path):
+        _register(mgr, tmp_path, "Visible task")
+        result = runner.invoke(app, ["status", "--db-path", str(db_path)])
+        assert result.exit_code == 0
+        assert "LevelUp Runs" in result.output
+        assert "1 active" in result.output
+
+    def test_empty(self, db_path):
+        result = runner.invoke(app, ["status", "--db-path", str(db_path)])
+        assert "No runs found" in result.output
+
+    def test_json_with_watch_is_rejected(self, db_path):
+        result = runner.invoke(app, ["status", "--db-path", str(db_path), "--json", "--watch"])
+        assert result.exit_code == 2
+
+    def test_watch_ndjson_streams_changes(self, mgr, db_path, tmp_path):
+        ctx = _register(mgr, tmp_path)
+        sleeps = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                ctx.status = PipelineStatus.FAILED
+                mgr.update_run(ctx)
+            elif len(sleeps) == 2:
+                _register(mgr, tmp_path, "late")
+            else:
+                raise KeyboardInterrupt
+
+        with patch("levelup.state.watch.time.sleep", side_effect=fake_sleep):
+            result = runner.invoke(
+                app, ["status", "--db-path", str(db_path), "--watch", "--ndjson", "--interval", "5"]
+            )
+        assert result.exit_code == 0
+        events = [json.loads(line) for line in result.output.strip().splitlines()]
+        assert [e["event"] for e in events] == ["added", "changed", "added"]
+        assert events[1]["run"]["status"] == "failed"
+        assert events[2]["run"]["task_title"] == "late"
+        assert sleeps[0] == 5
+
+    def test_watch_table_repaints_on_change(self, mgr, db_path, tmp_path):
+        ctx = _register(mgr, tmp_path, "Watched")
+        sleeps = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                ctx.current_step = "coding"
+                mgr.update_run(ctx)
+            elif len(sleeps) > 2:
+                raise KeyboardInterrupt
+
+        with patch("levelup.state.watch.time.sleep", side_effect=fake_sleep):
+            result = runner.invoke(
+            app, ["status", "--db-path", str(db_path), "--watch"], env={"COLUMNS": "200"}
+        )
+        assert result.exit_code == 0
+        assert "coding" in result.output
@@ -17,6 +17,12 @@ def _can_import_pyqt6() -> bool:
         return False
 
 
+def _feed(widget, data: bytes) -> None:
+    """Feed PTY output the way the reader thread does, then take the next frame."""
+    widget._state.feed_pty(data)
+    widget._take_snapshot()
+
+
 # ---------------------------------------------------------------------------
 # CatppuccinMochaColors
 # ---------------------------------------------------------------------------
@@ -336,17 +342,17 @@ class TestTerminalEmulatorWidget:
         widget = self._make_widget()
         assert widget.focusPolicy() == Qt.FocusPolicy.StrongFocus
 
-    # 1b: _on_pty_data feeds pyte screen
-    def test_on_pty_data_feeds_text(self):
+    # 1b: PTY output feeds the pyte screen
+    def test_pty_output_feeds_text(self):
         widget = self._make_widget()
-        widget._on_pty_data(b"Hello World")
+        _feed(widget, b"Hello World")
         line = widget._screen.buffer[0]
         text = "".join(line[i].data for i in range(11))
         assert text == "Hello World"
 
-    def test_on_pty_data_ansi_color(self):
+    def test_pty_output_ansi_color(self):
         widget = self._make_widget()
-        widget._on_pty_data(b"\x1b[31mRed\x1b[0m")
+        _feed(widget, b"\x1b[31mRed\x1b[0m")
         char = widget._screen.buffer[0][0]
         assert char.data == "R"
         assert char.fg == "red"
@@ -483,7 +489,7 @@ class TestTerminalEmulatorWidget:
     # 1i: _get_selected_text
     def test_get_selected_text(self):
         widget = self._make_widget()
-        widget._on_pty_data(b"Hello World\r\nSecond Line")
+        _feed(widget, b"Hello World\r\nSecond Line")
 
         # Select "World" on first line (cols 6-10, row 0)
         widget._selection_start = (6, 0)
@@ -494,7 +500,7 @@ class TestTerminalEmulatorWidget:
 
     def test_get_selected_text_multiline(self):
         widget = self._make_widget()
-        widget._on_pty_data(b"AAABBB\r\nCCCDDD")
+        _feed(widget, b"AAABBB\r\nCCCDDD")
 
         # Select from col 3 row 0 to col 2 row 1 -> "BBB\nCCC"
         widget._selection_start = (3, 0)
@@ -556,3 +562,149 @@ class TestTerminalEmulatorWidget:
 
         assert widget.is_shell_running is False
         widget._pty.close.assert_called_once()
+
+    # 1l: dirty-row repaint scheduling
+    def test_pty_data_marks_only_changed_rows(self):
+        widget = self._make_widget()
+        _feed(widget, b"one\r\ntwo\r\n")
+        widget._full_repaint = False
+        widget._dirty_lines.clear()
+
+        _feed(widget, b"\rprogress 50%")
+
+        assert widget._dirty_lines == {2}
+        assert widget._screen.dirty == set()
+        assert widget._full_repaint is False
+
+    def test_cursor_move_marks_old_and_new_rows(self):
+        widget = self._make_widget()
+        _feed(widget, b"a\r\nb")
+        widget._full_repaint = False
+        widget._dirty_lines.clear()
+
+        _feed(widget, b"\x1b[5;1H")
+
+        assert widget._dirty_lines == {1, 4}
+
+    def test_scrolling_marks_every_row(self):
+        widget = self._make_widget()
+        _feed(widget, b"x\r\n" * widget._rows)
+        widget._full_repaint = False
+        widget._dirty_lines.clear()
+
+        _feed(widget, b"more\r\n")
+
+        assert widget._dirty_lines == set(range(widget._rows))
+
+    def test_new_output_while_scrolled_back_repaints_everything(self):
+        widget = self._make_widget()
+        _feed(widget, b"x\r\n" * (widget._rows * 2))
+        widget._scroll_offset = 3
+        widget._full_repaint = False
+
+        _feed(widget, b"more")
+
+        assert widget._full_repaint is True
+
+    # 1m: glyph runs
+    def test_line_runs_batch_cells_of_same_style(self):
+        widget = self._make_widget()
+        _feed(widget, b"\x1b[31mRed\x1b[0m plain")
+
+        runs = widget._line_runs(widget._screen.buffer[0], 0, 0, 9, None, None)
+
+        assert [(start, text) for start, text, _fg, _bg in runs] == [(0, "Red"), (3, " plain ")]
+        assert runs[0][2] == CatppuccinMochaColors.resolve("red")
+        assert runs[1][2] == CatppuccinMochaColors.FG
+
+    def test_line_runs_isolate_non_ascii_cells(self):
+        widget = self._make_widget()
+        _feed(widget, "ab─cd".encode())
+
+        runs = widget._line_runs(widget._screen.buffer[0], 0, 0, 4, None, None)
+
+        assert [(start, text) for start, text, _fg, _bg in runs] == [
+            (0, "ab"), (2, "─"), (3, "cd"),
+        ]
+
+    def test_line_runs_split_on_selection(self):
+        widget = self._make_widget()
+        _feed(widget, b"Hello World")
+
+        runs = widget._line_runs(widget._screen.buffer[0], 0, 0, 10, (6, 0), (10, 0))
+
+        assert [(start, text) for start, text, _fg, _bg in runs] == [(0, "Hello "), (6, "World")]
+        assert runs[1][3] == CatppuccinMochaColors.SELECTION
+
+    def test_style_cache_follows_color_scheme(self):
+        from levelup.gui.terminal_emulator import LightTerminalColors
+
+        widget = self._make_widget()
+        _feed(widget, b"text")
+        widget._line_runs(widget._screen.buffer[0], 0, 0, 3, None, None)
+        assert widget._style_cache
+
+        widget.set_color_scheme(LightTerminalColors)
+
+        assert widget._style_cache == {}
+        runs = widget._line_runs(widget._screen.buffer[0], 0, 0, 3, None, None)
+        assert runs[0][2] == LightTerminalColors.FG
+
+    def test_paint_draws_background_runs(self):
+        widget = self._make_widget()
+        widget.resize(400, 200)
+        _feed(widget, b"\x1b[42m   \x1b[0m")
+
+        image = widget.grab().toImage()
+
+        x = int(widget._cell_width * 1.5)
+        y = int(widget._cell_height * 0.5)
+        assert image.pixelColor(x, y) == CatppuccinMochaColors.resolve("green", is_fg=False)
+
+    # 1n: snapshots taken once per frame, only while visible
+    def test_pty_data_updates_snapshot(self):
+        widget = self._make_widget()
+        _feed(widget, b"Hello\r\n\x1b[32mWorld")
+
+        snap = widget._snapshot
+        assert "".join(c.data for c in snap.lines[1][:5]) == "World"
+        assert snap.lines[1][0].fg == "green"
+        assert snap.cursor == (5, 1)
+
+    def test_ready_signal_on_hidden_terminal_does_nothing(self):
+        widget = self._make_widget()
+        assert not widget.isVisible()
+
+        widget._on_pty_ready()
+
+        assert not widget._frame_timer.isActive()
+
+    def test_ready_signal_schedules_a_single_snapshot(self):
+        widget = self._make_widget()
+        widget.show()
+        widget._frame_timer.stop()
+        widget._last_flush = 0.0
+
+        widget._on_pty_ready()
+        assert widget._frame_timer.isActive()
+        assert widget._frame_timer.interval() == 0  # idle: no added latency
+
+        timer = widget._frame_timer
+        with patch.object(timer, "start") as start:
+            widget._on_pty_ready()
+        start.assert_not_called()
+        timer.stop()
+        widget.hide()
+
+    def test_show_event_catches_up_on_output_parsed_while_hidden(self):
+        widget = self._make_widget()
+        # As the reader thread would: parse without touching the widget
+        assert widget._state.feed_pty(b"while hidden") is True
+        assert widget._state.feed_pty(b"!") is False  # no second signal
+        assert widget._snapshot.lines[0][0].data == " "
+
+        widget.show()
+
+        assert "".join(c.data for c in widget._snapshot.lines[0][:13]) == "while hidden!"
+        assert widget._state.changed is False
+        widget.hide()
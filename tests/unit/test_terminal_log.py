@@ -0,0 +1,375 @@
+"""Tests for on-disk terminal logs and the Ctrl+F log search."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from levelup.gui.terminal_log import (
+    TerminalLog,
+    export_log,
+    index_path,
+    line_count,
+    log_segments,
+    plain_line,
+    read_lines,
+    search_log,
+    terminal_log_path,
+)
+
+
+def _can_import_pyqt6() -> bool:
+    try:
+        import PyQt6  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _feed(widget, data: bytes) -> None:
+    """Feed PTY output the way the reader thread does, then take the next frame."""
+    widget._state.feed_pty(data)
+    widget._take_snapshot()
+
+
+class TestPlainLine:
+    def test_strips_colors(self):
+        assert plain_line("\x1b[1;31mERROR\x1b[0m boom") == "ERROR boom"
+
+    def test_strips_osc_title(self):
+        assert plain_line("\x1b]0;title\x07prompt $") == "prompt $"
+
+    def test_carriage_return_keeps_final_redraw(self):
+        assert plain_line("[#   ] 10%\r[### ] 70%\r[####] 100%\r") == "[####] 100%"
+
+    def test_drops_control_characters_but_keeps_tabs(self):
+        assert plain_line("a\x07b\tc\x08") == "ab\tc"
+
+
+class TestTerminalLog:
+    def test_writes_only_complete_lines(self, tmp_path: Path):
+        log = TerminalLog(tmp_path / "t.log")
+        log.write("first\r\nsec")
+        assert (tmp_path / "t.log").read_text() == "first\n"
+
+        log.write("ond\r\n")
+        assert (tmp_path / "t.log").read_text() == "first\nsecond\n"
+        assert log.line_count == 2
+        log.close()
+
+    def test_escape_sequence_split_across_writes(self, tmp_path: Path):
+        log = TerminalLog(tmp_path / "t.log")
+        log.write("\x1b[3")
+        log.write("2mok\x1b[0m\r\n")
+        log.close()
+        assert (tmp_path / "t.log").read_text() == "ok\n"
+
+    def test_close_flushes_unterminated_line(self, tmp_path: Path):
+        log = TerminalLog(tmp_path / "t.log")
+        log.write("$ ")
+        log.write("prompt")
+        log.close()
+        assert (tmp_path / "t.log").read_text() == "$ prompt\n"
+
+        log.write("after close\n")  # ignored
+        assert (tmp_path / "t.log").read_text() == "$ prompt\n"
+
+    def test_index_holds_line_offsets(self, tmp_path: Path):
+        path = tmp_path / "t.log"
+        log = TerminalLog(path)
+        log.write("a\nbb\nccc\n")
+        log.close()
+
+        assert line_count(path) == 3
+        assert read_lines(path, 1, 2) == ["bb", "ccc"]
+        assert read_lines(path, 2, 10) == ["ccc"]
+        assert read_lines(path, 3, 1) == []
+
+    def test_reopen_appends_and_continues_index(self, tmp_path: Path):
+        path = tmp_path / "t.log"
+        log = TerminalLog(path)
+        log.write("one\n")
+        log.close()
+
+        log = TerminalLog(path)
+        log.write("two\n")
+        log.close()
+
+        assert read_lines(path, 0, 5) == ["one", "two"]
+
+    def test_stale_index_is_rebuilt(self, tmp_path: Path):
+        path = tmp_path / "t.log"
+        log = TerminalLog(path)
+        log.write("one\ntwo\n")
+        log.close()
+        with open(path, "ab") as f:
+            f.write(b"three\n")  # e.g. a crash before the index write
+
+        log = TerminalLog(path)
+        assert log.line_count == 3
+        log.close()
+        assert read_lines(path, 2, 1) == ["three"]
+
+    def test_missing_index_is_rebuilt(self, tmp_path: Path):
+        path = tmp_path / "t.log"
+        path.write_bytes(b"x\ny\n")
+
+        assert read_lines(path, 1, 1) == ["y"]
+        assert index_path(path).exists()
+
+    def test_rotation_keeps_backups(self, tmp_path: Path):
+        path = tmp_path / "t.log"
+        log = TerminalLog(path, max_bytes=20, backups=2)
+        for n in range(12):
+            log.write(f"line {n:02d}\n")  # 8 bytes each: rotates every 3 lines
+        log.close()
+
+        segments = log_segments(path)
+        assert [p.name for p in segments] == ["t.log.2", "t.log.1", "t.log"]
+        assert read_lines(segments[0], 0, 3) == ["line 06", "line 07", "line 08"]
+        assert read_lines(path, 0, 3) == []  # rotated right after line 11
+        assert read_lines(segments[-2], 0, 3) == ["line 09", "line 10", "line 11"]
+        assert not (tmp_path / "t.log.3").exists()
+
+    def test_export_concatenates_segments(self, tmp_path: Path):
+        path = tmp_path / "t.log"
+        log = TerminalLog(path, max_bytes=20, backups=5)
+        for n in range(5):
+            log.write(f"line {n:02d}\n")
+        log.close()
+
+        export_log(path, tmp_path / "out.log")
+        assert (tmp_path / "out.log").read_text().splitlines() == [
+            f"line {n:02d}" for n in range(5)
+        ]
+
+    def test_path_per_project_and_ticket(self, tmp_path: Path):
+        a = terminal_log_path(tmp_path / "proj", 3, log_dir=tmp_path / "logs")
+        b = terminal_log_path(tmp_path / "other" / "proj", 3, log_dir=tmp_path / "logs")
+
+        assert a.name == "ticket-3.log"
+        assert a.parent.name.startswith("proj-")
+        assert a.parent != b.parent
+        assert terminal_log_path(tmp_path, None, log_dir=tmp_path).name == "shell.log"
+
+
+class TestSearchLog:
+    def _log(self, tmp_path: Path, lines: list[str], **kwargs: int) -> Path:
+        path = tmp_path / "t.log"
+        log = TerminalLog(path, **kwargs)
+        log.write("".join(f"{line}\n" for line in lines))
+        log.close()
+        return path
+
+    def test_finds_matches_across_segments_in_order(self, tmp_path: Path):
+        lines = [f"step {n} {'ERROR' if n % 4 == 0 else 'ok'}" for n in range(20)]
+        path = self._log(tmp_path, lines, max_bytes=40, backups=10)
+        assert len(log_segments(path)) > 2
+
+        matches = list(search_log(path, "error"))
+
+        assert [m.line for m in matches] == [0, 4, 8, 12, 16]
+        assert [m.text for m in matches] == [lines[n] for n in (0, 4, 8, 12, 16)]
+        for m in matches:
+            assert read_lines(m.segment, m.segment_line, 1) == [m.text]
+            assert m.text[m.column:m.column + m.length] == "ERROR"
+
+    def test_case_sensitive_and_regex(self, tmp_path: Path):
+        path = self._log(tmp_path, ["Error 1", "error 22", "warning"])
+
+        assert [m.line for m in search_log(path, "Error", case_sensitive=True)] == [0]
+        assert [m.text for m in search_log(path, r"error \d\d", regex=True)] == ["error 22"]
+        assert [m.line for m in search_log(path, "a.n")] == []  # literal by default
+
+    def test_invalid_regex_raises(self, tmp_path: Path):
+        import re
+
+        path = self._log(tmp_path, ["x"])
+        with pytest.raises(re.error):
+            list(search_log(path, "(", regex=True))
+
+    def test_cancel_stops_the_scan(self, tmp_path: Path):
+        path = self._log(tmp_path, ["hit"] * 100)
+        cancel = threading.Event()
+
+        found = []
+        for match in search_log(path, "hit", cancel=cancel):
+            found.append(match)
+            if len(found) == 3:
+                cancel.set()
+
+        assert len(found) == 3
+
+
+@pytest.mark.skipif(not _can_import_pyqt6(), reason="PyQt6 not available")
+class TestTerminalLogWidgets:
+    """The log tee, reveal_line, and the search bar, with PtyBackend mocked out."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        from PyQt6.QtWidgets import QApplication
+
+        self._app = QApplication.instance() or QApplication([])
+
+    def _make_terminal(self):
+        with patch("levelup.gui.terminal_emulator.PtyBackend") as MockPty:
+            MockPty.return_value = MagicMock()
+            from levelup.gui.terminal_emulator import TerminalEmulatorWidget
+
+            return TerminalEmulatorWidget()
+
+    def test_fed_output_is_teed_to_the_log(self, tmp_path: Path):
+        widget = self._make_terminal()
+        widget.set_log(TerminalLog(tmp_path / "t.log"))
+
+        _feed(widget, b"\x1b[32mhello\x1b[0m\r\nworld\r\n")
+        widget.close_shell()
+
+        assert widget.log is None
+        assert (tmp_path / "t.log").read_text() == "hello\nworld\n"
+
+    def test_ctrl_f_requests_search_only_with_a_log(self, tmp_path: Path):
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QKeyEvent
+
+        widget = self._make_terminal()
+        requested = MagicMock()
+        widget.search_requested.connect(requested)
+        event = QKeyEvent(
+            QKeyEvent.Type.KeyPress, Qt.Key.Key_F, Qt.KeyboardModifier.ControlModifier, "\x06"
+        )
+
+        widget.keyPressEvent(event)
+        requested.assert_not_called()
+        widget._pty.write.assert_called_with(b"\x06")  # reaches the shell
+
+        widget.set_log(TerminalLog(tmp_path / "t.log"))
+        widget._pty.write.reset_mock()
+        widget.keyPressEvent(event)
+        requested.assert_called_once()
+        widget._pty.write.assert_not_called()
+        widget.close_shell()
+
+    def test_reveal_line_scrolls_into_history_and_selects(self):
+        widget = self._make_terminal()
+        rows = widget._rows
+        _feed(widget, b"".join(f"row {n}\r\n".encode() for n in range(rows * 3)))
+
+        assert widget.reveal_line("row 5", column=4, length=1)
+
+        history_len = len(widget._screen.history.top)
+        view_row = widget._selection_start[1]
+        assert widget._scroll_offset > 0
+        with widget._state.lock:
+            shown = widget._display_line(view_row)
+        assert "".join(shown[c].data for c in range(5)) == "row 5"
+        assert widget._selection_start == (4, view_row)
+        assert widget._selection_end == (4, view_row)
+        assert view_row == 5 - history_len + widget._scroll_offset
+
+    def test_reveal_line_on_screen_resets_scroll(self):
+        widget = self._make_terminal()
+        _feed(widget, b"alpha\r\nbeta\r\n")
+        widget._scroll_offset = 2
+
+        assert widget.reveal_line("beta")
+        assert widget._scroll_offset == 0
+        assert widget._selection_start == (0, 1)
+
+    def test_reveal_line_prefers_the_nearest_duplicate(self):
+        widget = self._make_terminal()
+        _feed(widget, b"same\r\nother\r\nsame\r\n")
+
+        assert widget.reveal_line("same", rows_from_bottom=widget._rows - 1)
+        assert widget._selection_start[1] == 0
+        assert widget.reveal_line("same", rows_from_bottom=widget._rows - 3)
+        assert widget._selection_start[1] == 2
+
+    def test_reveal_line_missing(self):
+        widget = self._make_terminal()
+        _feed(widget, b"present\r\n")
+        assert not widget.reveal_line("absent")
+        assert not widget.reveal_line("   ")
+
+    def _run_search(self, bar, query: str) -> None:
+        bar._query_edit.setText(query)
+        bar.search()
+        thread = bar._thread
+        assert thread is not None
+        assert thread.wait(5000)
+        self._app.processEvents()
+
+    def test_search_bar_jumps_to_newest_match_and_steps(self, tmp_path: Path):
+        from levelup.gui.terminal_search import TerminalSearchBar
+
+        widget = self._make_terminal()
+        widget.set_log(TerminalLog(tmp_path / "t.log"))
+        _feed(widget, b"build ok\r\ntest FAILED a\r\nmore\r\ntest FAILED b\r\n$ ")
+        bar = TerminalSearchBar(widget)
+
+        self._run_search(bar, "failed")
+
+        assert [m.text for m in bar.matches] == ["test FAILED a", "test FAILED b"]
+        assert bar.current_match.text == "test FAILED b"
+        assert bar._status_label.text() == "2/2"
+        assert widget._selection_start == (5, 3)
+
+        bar._step(-1)
+        assert bar.current_match.text == "test FAILED a"
+        assert widget._selection_start == (5, 1)
+        widget.close_shell()
+
+    def test_search_bar_reports_matches_older_than_the_scrollback(self, tmp_path: Path):
+        from levelup.gui.terminal_search import TerminalSearchBar
+
+        widget = self._make_terminal()
+        widget.set_log(TerminalLog(tmp_path / "t.log"))
+        _feed(widget, b"before\r\nancient needle\r\nafter\r\n")
+        _feed(widget, b"\x1b[2J\x1b[H")  # cleared from the screen, still in the log
+        bar = TerminalSearchBar(widget)
+
+        self._run_search(bar, "needle")
+
+        assert "(older than the scrollback): ancient needle" in bar._status_label.text()
+        assert bar._status_label.toolTip() == "before\nancient needle\nafter"
+        widget.close_shell()
+
+    def test_search_bar_invalid_regex_and_no_matches(self, tmp_path: Path):
+        from levelup.gui.terminal_search import TerminalSearchBar
+
+        widget = self._make_terminal()
+        widget.set_log(TerminalLog(tmp_path / "t.log"))
+        _feed(widget, b"text\r\n")
+        bar = TerminalSearchBar(widget)
+
+        self._run_search(bar, "nothing here")
+        assert bar._status_label.text() == "No matches"
+
+        bar._regex_checkbox.setChecked(True)
+        self._run_search(bar, "(")
+        assert bar._status_label.text().startswith("Invalid pattern")
+        widget.close_shell()
+
+    def test_run_terminal_opens_ticket_log_with_the_shell(self):
+        from levelup.gui import terminal_log
+
+        with patch("levelup.gui.terminal_emulator.PtyBackend") as MockPty:
+            MockPty.return_value = MagicMock()
+            from levelup.gui.run_terminal import RunTerminalWidget
+
+            widget = RunTerminalWidget()
+        widget.set_context("/some/project", "/tmp/state.db")
+        widget._ticket_number = 7
+
+        widget._ensure_shell()
+
+        log = widget._terminal.log
+        assert log is not None
+        assert log.path == terminal_log_path("/some/project", 7)
+        assert log.path.is_relative_to(terminal_log.DEFAULT_TERMINAL_LOG_DIR)
+        widget._terminal.search_requested.emit()
+        assert not widget._search_bar.isHidden()
+        widget._terminal.close_shell()
@@ -23,6 +23,12 @@ def _can_import_pyqt6() -> bool:
         return False
 
 
+def _feed(widget, data: bytes) -> None:
+    """Feed PTY output the way the reader thread does, then take the next frame."""
+    widget._state.feed_pty(data)
+    widget._take_snapshot()
+
+
 @pytest.mark.skipif(
     not _can_import_pyqt6(),
     reason="PyQt6 not available",
@@ -50,7 +56,7 @@ class TestTerminalScrollbackCopy:
         """Helper to fill terminal with enough lines to push some into history."""
         # Write more lines than the screen height to push into history
         for i in range(num_lines):
-            widget._on_pty_data(f"Line {i}\r\n".encode())
+            _feed(widget, f"Line {i}\r\n".encode())
 
     # -------------------------------------------------------------------------
     # Core Requirement: Copy from composite view when scrolled up
@@ -61,9 +67,9 @@ class TestTerminalScrollbackCopy:
         widget = self._make_widget()
 
         # Write identifiable text to buffer
-        widget._on_pty_data(b"Current line 1\r\n")
-        widget._on_pty_data(b"Current line 2\r\n")
-        widget._on_pty_data(b"Current line 3\r\n")
+        _feed(widget, b"Current line 1\r\n")
+        _feed(widget, b"Current line 2\r\n")
+        _feed(widget, b"Current line 3\r\n")
 
         # At bottom (no scroll)
         widget._scroll_offset = 0
@@ -82,11 +88,11 @@ class TestTerminalScrollbackCopy:
 
         # Create identifiable history lines
         for i in range(30):
-            widget._on_pty_data(f"History {i:02d}\r\n".encode())
+            _feed(widget, f"History {i:02d}\r\n".encode())
 
         # Write current buffer lines (these will be at the bottom)
-        widget._on_pty_data(b"Current 0\r\n")
-        widget._on_pty_data(b"Current 1\r\n")
+        _feed(widget, b"Current 0\r\n")
+        _feed(widget, b"Current 1\r\n")
 
         # Scroll up by 5 lines
         widget._scroll_offset = 5
@@ -112,11 +118,11 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(40):
-            widget._on_pty_data(f"Hist{i:03d}\r\n".encode())
+            _feed(widget, f"Hist{i:03d}\r\n".encode())
 
         # Write current buffer
         for i in range(5):
-            widget._on_pty_data(f"Buff{i}\r\n".encode())
+            _feed(widget, f"Buff{i}\r\n".encode())
 
         # Scroll up by 3 lines
         # Top 3 rows show history, remaining rows show buffer
@@ -166,7 +172,7 @@ class TestTerminalScrollbackCopy:
 
         # Create identifiable history
         for i in range(50):
-            widget._on_pty_data(f"H{i:04d}\r\n".encode())
+            _feed(widget, f"H{i:04d}\r\n".encode())
 
         # Test at different scroll offsets
         for offset in [1, 5, 10, 15]:
@@ -192,12 +198,12 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(30):
-            widget._on_pty_data(f"Old{i:02d}\r\n".encode())
+            _feed(widget, f"Old{i:02d}\r\n".encode())
 
         # Write identifiable buffer lines
-        widget._on_pty_data(b"Buffer_0\r\n")
-        widget._on_pty_data(b"Buffer_1\r\n")
-        widget._on_pty_data(b"Buffer_2\r\n")
+        _feed(widget, b"Buffer_0\r\n")
+        _feed(widget, b"Buffer_1\r\n")
+        _feed(widget, b"Buffer_2\r\n")
 
         # Scroll up by 2 lines
         # Rows 0-1 show history, rows 2+ show buffer
@@ -224,8 +230,8 @@ class TestTerminalScrollbackCopy:
         widget = self._make_widget()
 
         # Write only a few lines (not enough to create history)
-        widget._on_pty_data(b"Line 1\r\n")
-        widget._on_pty_data(b"Line 2\r\n")
+        _feed(widget, b"Line 1\r\n")
+        _feed(widget, b"Line 2\r\n")
 
         # Verify no history
         assert len(widget._screen.history.top) == 0
@@ -248,7 +254,7 @@ class TestTerminalScrollbackCopy:
 
         # Create small history
         for i in range(10):
-            widget._on_pty_data(f"Short{i}\r\n".encode())
+            _feed(widget, f"Short{i}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -269,7 +275,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history with identifiable content
         for i in range(35):
-            widget._on_pty_data(f"Line_{i:03d}_content\r\n".encode())
+            _feed(widget, f"Line_{i:03d}_content\r\n".encode())
 
         # Scroll up by 8 lines
         widget._scroll_offset = 8
@@ -294,7 +300,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(40):
-            widget._on_pty_data(f"ABCDEFGHIJ{i:02d}\r\n".encode())
+            _feed(widget, f"ABCDEFGHIJ{i:02d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 5
@@ -319,11 +325,11 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(60):
-            widget._on_pty_data(f"HistLine{i:03d}\r\n".encode())
+            _feed(widget, f"HistLine{i:03d}\r\n".encode())
 
         # Write buffer
         for i in range(5):
-            widget._on_pty_data(f"BuffLine{i}\r\n".encode())
+            _feed(widget, f"BuffLine{i}\r\n".encode())
 
         rows = widget._rows
         cols = widget._cols
@@ -362,11 +368,11 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(35):
-            widget._on_pty_data(f"H{i:03d}\r\n".encode())
+            _feed(widget, f"H{i:03d}\r\n".encode())
 
         # Write buffer
-        widget._on_pty_data(b"B000\r\n")
-        widget._on_pty_data(b"B001\r\n")
+        _feed(widget, b"B000\r\n")
+        _feed(widget, b"B001\r\n")
 
         # Scroll up by 3 lines
         # Rows 0-2: history
@@ -406,7 +412,7 @@ class TestTerminalScrollbackCopy:
 
         # Create identifiable history
         for i in range(40):
-            widget._on_pty_data(f"ClipHist{i:03d}\r\n".encode())
+            _feed(widget, f"ClipHist{i:03d}\r\n".encode())
 
         # Scroll up by 7 lines
         widget._scroll_offset = 7
@@ -438,11 +444,11 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(30):
-            widget._on_pty_data(f"Hist{i}\r\n".encode())
+            _feed(widget, f"Hist{i}\r\n".encode())
 
         # Write buffer
-        widget._on_pty_data(b"ClipBuffer0\r\n")
-        widget._on_pty_data(b"ClipBuffer1\r\n")
+        _feed(widget, b"ClipBuffer0\r\n")
+        _feed(widget, b"ClipBuffer1\r\n")
 
         # At bottom
         widget._scroll_offset = 0
@@ -472,11 +478,11 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(45):
-            widget._on_pty_data(f"H{i:02d}\r\n".encode())
+            _feed(widget, f"H{i:02d}\r\n".encode())
 
         # Write buffer
-        widget._on_pty_data(b"B00\r\n")
-        widget._on_pty_data(b"B01\r\n")
+        _feed(widget, b"B00\r\n")
+        _feed(widget, b"B01\r\n")
 
         # Scroll up by 2 lines
         widget._scroll_offset = 2
@@ -525,7 +531,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(50):
-            widget._on_pty_data(f"Line{i}\r\n".encode())
+            _feed(widget, f"Line{i}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 10
@@ -550,7 +556,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(40):
-            widget._on_pty_data(f"Rev{i:03d}\r\n".encode())
+            _feed(widget, f"Rev{i:03d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 5
@@ -574,7 +580,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history with spaces
         for i in range(35):
-            widget._on_pty_data(f"A  B  C  {i:02d}\r\n".encode())
+            _feed(widget, f"A  B  C  {i:02d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 8
@@ -599,7 +605,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(40):
-            widget._on_pty_data(f"Text{i:02d}\r\n".encode())
+            _feed(widget, f"Text{i:02d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 5
@@ -623,8 +629,8 @@ class TestTerminalScrollbackCopy:
 
         # Write current buffer WITHOUT filling history first
         # (so "Hello World" is at row 0 of the buffer)
-        widget._on_pty_data(b"Hello World\r\n")
-        widget._on_pty_data(b"Second Line\r\n")
+        _feed(widget, b"Hello World\r\n")
+        _feed(widget, b"Second Line\r\n")
 
         # At bottom
         widget._scroll_offset = 0
@@ -642,8 +648,8 @@ class TestTerminalScrollbackCopy:
 
         # Write buffer WITHOUT filling history first
         # (so "AAABBB" is at row 0 of the buffer)
-        widget._on_pty_data(b"AAABBB\r\n")
-        widget._on_pty_data(b"CCCDDD\r\n")
+        _feed(widget, b"AAABBB\r\n")
+        _feed(widget, b"CCCDDD\r\n")
 
         # At bottom
         widget._scroll_offset = 0
@@ -661,7 +667,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(30):
-            widget._on_pty_data(f"Text{i}\r\n".encode())
+            _feed(widget, f"Text{i}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 5
@@ -683,11 +689,11 @@ class TestTerminalScrollbackCopy:
 
         # Create history with unique identifiers
         for i in range(50):
-            widget._on_pty_data(f"UniqueHist{i:04d}\r\n".encode())
+            _feed(widget, f"UniqueHist{i:04d}\r\n".encode())
 
         # Write buffer
         for i in range(5):
-            widget._on_pty_data(f"UniqueBuff{i}\r\n".encode())
+            _feed(widget, f"UniqueBuff{i}\r\n".encode())
 
         # Scroll up by 6 lines
         widget._scroll_offset = 6
@@ -722,7 +728,7 @@ class TestTerminalScrollbackCopy:
 
         # Create history
         for i in range(45):
-            widget._on_pty_data(f"VisLine{i:03d}\r\n".encode())
+            _feed(widget, f"VisLine{i:03d}\r\n".encode())
 
         # Scroll up by 10 lines
         widget._scroll_offset = 10
@@ -21,6 +21,12 @@ def _can_import_pyqt6() -> bool:
         return False
 
 
+def _feed(widget, data: bytes) -> None:
+    """Feed PTY output the way the reader thread does, then take the next frame."""
+    widget._state.feed_pty(data)
+    widget._take_snapshot()
+
+
 @pytest.mark.skipif(
     not _can_import_pyqt6(),
     reason="PyQt6 not available",
@@ -48,7 +54,7 @@ class TestTerminalScrollbackDisplay:
         """Helper to fill terminal with enough lines to push some into history."""
         # Write more lines than the screen height to push into history
         for i in range(num_lines):
-            widget._on_pty_data(f"Line {i}\r\n".encode())
+            _feed(widget, f"Line {i}\r\n".encode())
 
     def _get_displayed_lines(self, widget) -> list[str]:
         """Extract the current buffer lines that would be displayed.
@@ -142,11 +148,11 @@ class TestTerminalScrollbackDisplay:
 
         # Write specific lines to create identifiable history
         for i in range(30):
-            widget._on_pty_data(f"History{i:02d}\r\n".encode())
+            _feed(widget, f"History{i:02d}\r\n".encode())
 
         # Now write current buffer lines
         for i in range(10):
-            widget._on_pty_data(f"Current{i}\r\n".encode())
+            _feed(widget, f"Current{i}\r\n".encode())
 
         # Scroll up by 5 lines
         widget._scroll_offset = 5
@@ -175,7 +181,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create identifiable history
         for i in range(40):
-            widget._on_pty_data(f"Hist{i:03d}\r\n".encode())
+            _feed(widget, f"Hist{i:03d}\r\n".encode())
 
         # Scroll up to show some history
         widget._scroll_offset = 3
@@ -196,7 +202,7 @@ class TestTerminalScrollbackDisplay:
 
         # Fill with history
         for i in range(50):
-            widget._on_pty_data(f"Line{i:03d}\r\n".encode())
+            _feed(widget, f"Line{i:03d}\r\n".encode())
 
         # Scroll up by 10 lines (less than total viewport height)
         rows = widget._rows
@@ -217,7 +223,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create history
         for i in range(100):
-            widget._on_pty_data(f"H{i:04d}\r\n".encode())
+            _feed(widget, f"H{i:04d}\r\n".encode())
 
         # Test various scroll offsets
         for offset in [1, 3, 5, 10, 15]:
@@ -236,7 +242,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write identifiable lines
         for i in range(50):
-            widget._on_pty_data(f"Line{i:03d}\r\n".encode())
+            _feed(widget, f"Line{i:03d}\r\n".encode())
 
         # Scroll up by 10
         widget._scroll_offset = 10
@@ -259,7 +265,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create small amount of history
         for i in range(15):
-            widget._on_pty_data(f"Line{i}\r\n".encode())
+            _feed(widget, f"Line{i}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -294,7 +300,7 @@ class TestTerminalScrollbackDisplay:
         # Create very few history lines (less than viewport height)
         rows = widget._rows
         for i in range(5):  # Much less than typical 24 rows
-            widget._on_pty_data(f"Line{i}\r\n".encode())
+            _feed(widget, f"Line{i}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
         assert history_len < rows
@@ -311,7 +317,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create history
         for i in range(100):
-            widget._on_pty_data(f"Line{i:04d}\r\n".encode())
+            _feed(widget, f"Line{i:04d}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -370,7 +376,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write colored text that will go into history
         for i in range(30):
-            widget._on_pty_data(f"\x1b[31mRed{i}\x1b[0m\r\n".encode())  # Red text
+            _feed(widget, f"\x1b[31mRed{i}\x1b[0m\r\n".encode())  # Red text
 
         # Scroll up to show history
         widget._scroll_offset = 5
@@ -391,7 +397,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write bold text that will go into history
         for i in range(30):
-            widget._on_pty_data(f"\x1b[1mBold{i}\x1b[0m\r\n".encode())  # Bold text
+            _feed(widget, f"\x1b[1mBold{i}\x1b[0m\r\n".encode())  # Bold text
 
         # Scroll up to show history
         widget._scroll_offset = 3
@@ -410,7 +416,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write reverse video text
         for i in range(30):
-            widget._on_pty_data(f"\x1b[7mReverse{i}\x1b[0m\r\n".encode())
+            _feed(widget, f"\x1b[7mReverse{i}\x1b[0m\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 2
@@ -429,7 +435,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create history with colors
         for i in range(30):
-            widget._on_pty_data(f"\x1b[32mGreen{i}\x1b[0m\r\n".encode())
+            _feed(widget, f"\x1b[32mGreen{i}\x1b[0m\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 5
@@ -556,7 +562,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write specific identifiable lines
         for i in range(50):
-            widget._on_pty_data(f"HistLine{i:03d}\r\n".encode())
+            _feed(widget, f"HistLine{i:03d}\r\n".encode())
 
         # Scroll up to show history
         widget._scroll_offset = 5
@@ -581,7 +587,7 @@ class TestTerminalScrollbackDisplay:
         # New output arrives while scrolled up
         # Note: Current behavior does NOT auto-scroll
         # This test verifies existing behavior is preserved
-        widget._on_pty_data(b"New output\r\n")
+        _feed(widget, b"New output\r\n")
 
         # Scroll position should remain unchanged (current behavior)
         assert widget._scroll_offset == 10
@@ -609,7 +615,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create small history
         for i in range(3):
-            widget._on_pty_data(f"Line{i}\r\n".encode())
+            _feed(widget, f"Line{i}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -641,7 +647,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write unicode characters that will go into history
         for i in range(30):
-            widget._on_pty_data(f"Unicode→{i}←\r\n".encode())
+            _feed(widget, f"Unicode→{i}←\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 5
@@ -656,7 +662,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write complex ANSI sequences
         for i in range(30):
-            widget._on_pty_data(
+            _feed(widget, 
                 f"\x1b[1;31;42mComplex{i}\x1b[0m\r\n".encode()
             )  # Bold red on green background
 
@@ -679,7 +685,7 @@ class TestTerminalScrollbackDisplay:
 
         # Write a moderate amount (full 10k would be slow in tests)
         for i in range(100):
-            widget._on_pty_data(f"Line{i:04d}\r\n".encode())
+            _feed(widget, f"Line{i:04d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 50
@@ -698,7 +704,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create history
         for i in range(50):
-            widget._on_pty_data(f"TestLine{i:03d}\r\n".encode())
+            _feed(widget, f"TestLine{i:03d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 10
@@ -770,7 +776,7 @@ class TestTerminalScrollbackDisplay:
         widget._scroll_offset = initial_offset
 
         # New output arrives
-        widget._on_pty_data(b"New line while scrolled\r\n")
+        _feed(widget, b"New line while scrolled\r\n")
 
         # Offset should be preserved (current behavior)
         assert widget._scroll_offset == initial_offset
@@ -802,7 +808,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create colored history
         for i in range(40):
-            widget._on_pty_data(f"\x1b[34mBlue{i}\x1b[0m\r\n".encode())
+            _feed(widget, f"\x1b[34mBlue{i}\x1b[0m\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 8
@@ -922,7 +928,7 @@ class TestTerminalScrollbackDisplay:
 
         # Create large history
         for i in range(200):
-            widget._on_pty_data(f"Line{i:04d}\r\n".encode())
+            _feed(widget, f"Line{i:04d}\r\n".encode())
 
         # Scroll up by small amount
         widget._scroll_offset = 5
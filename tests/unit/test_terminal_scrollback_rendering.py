@@ -21,6 +21,12 @@ def _can_import_pyqt6() -> bool:
         return False
 
 
+def _feed(widget, data: bytes) -> None:
+    """Feed PTY output the way the reader thread does, then take the next frame."""
+    widget._state.feed_pty(data)
+    widget._take_snapshot()
+
+
 @pytest.mark.skipif(
     not _can_import_pyqt6(),
     reason="PyQt6 not available",
@@ -54,7 +60,7 @@ class TestTerminalScrollbackRendering:
 
         # Write data to create history and buffer
         for i in range(40):
-            widget._on_pty_data(f"Line{i:03d}\r\n".encode())
+            _feed(widget, f"Line{i:03d}\r\n".encode())
 
         # At bottom
         widget._scroll_offset = 0
@@ -70,7 +76,7 @@ class TestTerminalScrollbackRendering:
 
         # Create history
         for i in range(50):
-            widget._on_pty_data(f"H{i:04d}\r\n".encode())
+            _feed(widget, f"H{i:04d}\r\n".encode())
 
         # Scroll up by 10
         widget._scroll_offset = 10
@@ -93,7 +99,7 @@ class TestTerminalScrollbackRendering:
 
         # Create history
         for i in range(60):
-            widget._on_pty_data(f"Line{i:04d}\r\n".encode())
+            _feed(widget, f"Line{i:04d}\r\n".encode())
 
         # Scroll up by 5
         offset = 5
@@ -119,7 +125,7 @@ class TestTerminalScrollbackRendering:
 
         # Create history
         for i in range(100):
-            widget._on_pty_data(f"Line{i:04d}\r\n".encode())
+            _feed(widget, f"Line{i:04d}\r\n".encode())
 
         # Scroll up by full viewport height
         rows = widget._rows
@@ -140,7 +146,7 @@ class TestTerminalScrollbackRendering:
 
         # Create substantial history
         for i in range(150):
-            widget._on_pty_data(f"Line{i:04d}\r\n".encode())
+            _feed(widget, f"Line{i:04d}\r\n".encode())
 
         # Scroll up by more than viewport height
         rows = widget._rows
@@ -166,7 +172,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(80):
-            widget._on_pty_data(f"L{i:04d}\r\n".encode())
+            _feed(widget, f"L{i:04d}\r\n".encode())
 
         offset = 15
         widget._scroll_offset = offset
@@ -182,7 +188,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(80):
-            widget._on_pty_data(f"L{i:04d}\r\n".encode())
+            _feed(widget, f"L{i:04d}\r\n".encode())
 
         offset = 7
         widget._scroll_offset = offset
@@ -199,7 +205,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(100):
-            widget._on_pty_data(f"L{i:05d}\r\n".encode())
+            _feed(widget, f"L{i:05d}\r\n".encode())
 
         offset = 20
         widget._scroll_offset = offset
@@ -225,7 +231,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         offset = 8
         widget._scroll_offset = offset
@@ -243,7 +249,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         offset = 12
         widget._scroll_offset = offset
@@ -258,7 +264,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         offset = 5
         widget._scroll_offset = offset
@@ -283,7 +289,7 @@ class TestTerminalScrollbackRendering:
 
         # Create small history
         for i in range(10):
-            widget._on_pty_data(f"L{i:02d}\r\n".encode())
+            _feed(widget, f"L{i:02d}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -299,8 +305,8 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         # Don't create any history (write less than screen height)
-        widget._on_pty_data(b"Line 1\r\n")
-        widget._on_pty_data(b"Line 2\r\n")
+        _feed(widget, b"Line 1\r\n")
+        _feed(widget, b"Line 2\r\n")
 
         history_len = len(widget._screen.history.top)
         assert history_len == 0
@@ -317,7 +323,7 @@ class TestTerminalScrollbackRendering:
         # Write exactly enough to push one line to history
         rows = widget._rows
         for i in range(rows + 1):
-            widget._on_pty_data(f"L{i:02d}\r\n".encode())
+            _feed(widget, f"L{i:02d}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
         assert history_len >= 1
@@ -335,7 +341,7 @@ class TestTerminalScrollbackRendering:
 
         # Create substantial history
         for i in range(200):
-            widget._on_pty_data(f"L{i:04d}\r\n".encode())
+            _feed(widget, f"L{i:04d}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -356,7 +362,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 10
 
@@ -369,7 +375,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         # Various scroll offsets
         for offset in [0, 1, 5, 10, 20]:
@@ -384,7 +390,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 5
 
@@ -404,7 +410,7 @@ class TestTerminalScrollbackRendering:
 
         # Write specific content
         for i in range(50):
-            widget._on_pty_data(f"ABCD{i:03d}\r\n".encode())
+            _feed(widget, f"ABCD{i:03d}\r\n".encode())
 
         widget._scroll_offset = 10
 
@@ -421,7 +427,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"XYZ{i:03d}\r\n".encode())
+            _feed(widget, f"XYZ{i:03d}\r\n".encode())
 
         widget._scroll_offset = 3
 
@@ -437,7 +443,7 @@ class TestTerminalScrollbackRendering:
 
         # Write bold red text
         for i in range(50):
-            widget._on_pty_data(f"\x1b[1;31mBOLD{i}\x1b[0m\r\n".encode())
+            _feed(widget, f"\x1b[1;31mBOLD{i}\x1b[0m\r\n".encode())
 
         widget._scroll_offset = 5
 
@@ -454,10 +460,10 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(30):
-            widget._on_pty_data(f"Plain{i}\r\n".encode())
+            _feed(widget, f"Plain{i}\r\n".encode())
 
         # Write one line with color to current buffer
-        widget._on_pty_data(b"\x1b[32mGreen\x1b[0m\r\n")
+        _feed(widget, b"\x1b[32mGreen\x1b[0m\r\n")
 
         widget._scroll_offset = 0
 
@@ -484,7 +490,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 5
 
@@ -497,7 +503,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 7
 
@@ -508,7 +514,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 3
 
@@ -526,7 +532,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 10
 
@@ -545,7 +551,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 5
 
@@ -595,7 +601,7 @@ class TestTerminalScrollbackRendering:
 
         # Create identifiable lines
         for i in range(60):
-            widget._on_pty_data(f"ID{i:04d}\r\n".encode())
+            _feed(widget, f"ID{i:04d}\r\n".encode())
 
         # At bottom: buffer shows recent lines
         widget._scroll_offset = 0
@@ -615,7 +621,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(60):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 15
@@ -632,7 +638,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(100):
-            widget._on_pty_data(f"L{i:04d}\r\n".encode())
+            _feed(widget, f"L{i:04d}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -658,9 +664,9 @@ class TestTerminalScrollbackRendering:
         # Write lines with varying content
         for i in range(50):
             if i % 5 == 0:
-                widget._on_pty_data(b"\r\n")  # Empty line
+                _feed(widget, b"\r\n")  # Empty line
             else:
-                widget._on_pty_data(f"Line{i:03d}\r\n".encode())
+                _feed(widget, f"Line{i:03d}\r\n".encode())
 
         widget._scroll_offset = 10
 
@@ -671,7 +677,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"X{i}\r\n".encode())  # Short lines
+            _feed(widget, f"X{i}\r\n".encode())  # Short lines
 
         widget._scroll_offset = 5
 
@@ -685,7 +691,7 @@ class TestTerminalScrollbackRendering:
         cols = widget._cols
         for i in range(50):
             line = "X" * (cols - 1) + "\r\n"
-            widget._on_pty_data(line.encode())
+            _feed(widget, line.encode())
 
         widget._scroll_offset = 8
 
@@ -700,7 +706,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 10
 
@@ -713,7 +719,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         cursor_pos_before = (widget._screen.cursor.x, widget._screen.cursor.y)
 
@@ -730,7 +736,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         # Scroll up
         widget._scroll_offset = 10
@@ -751,7 +757,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 10
 
@@ -766,7 +772,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 5
 
@@ -781,7 +787,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 5
 
@@ -800,7 +806,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())  # No bg color
+            _feed(widget, f"L{i:03d}\r\n".encode())  # No bg color
 
         widget._scroll_offset = 8
 
@@ -816,7 +822,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         widget._scroll_offset = 6
 
@@ -832,7 +838,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"\x1b[42mGreenBG{i}\x1b[0m\r\n".encode())  # Green bg
+            _feed(widget, f"\x1b[42mGreenBG{i}\x1b[0m\r\n".encode())  # Green bg
 
         widget._scroll_offset = 5
 
@@ -848,7 +854,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"\x1b[33mYellowFG{i}\x1b[0m\r\n".encode())
+            _feed(widget, f"\x1b[33mYellowFG{i}\x1b[0m\r\n".encode())
 
         widget._scroll_offset = 4
 
@@ -867,7 +873,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(30):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         history_len = len(widget._screen.history.top)
 
@@ -887,7 +893,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         # Try various scroll offsets
         for offset in [0, 3, 7, 15]:
@@ -904,7 +910,7 @@ class TestTerminalScrollbackRendering:
         widget = self._make_widget()
 
         for i in range(50):
-            widget._on_pty_data(f"L{i:03d}\r\n".encode())
+            _feed(widget, f"L{i:03d}\r\n".encode())
 
         # Set scroll position
         widget._scroll_offset = 12
@@ -0,0 +1,163 @@
+"""Tests for the headless terminal state (levelup.gui.terminal_state)."""
+
+from __future__ import annotations
+
+import threading
+
+import pyte
+from pyte.screens import Char
+
+from levelup.gui.terminal_state import CompactScrollback, TerminalState
+
+
+def _text(row) -> str:
+    return "".join(c.data for c in row).rstrip()
+
+
+class TestFeed:
+    def test_first_change_since_snapshot_is_reported_once(self):
+        state = TerminalState()
+        assert state.feed_pty(b"one") is True
+        assert state.feed_pty(b"two") is False
+        state.snapshot()
+        assert state.feed_pty(b"three") is True
+
+    def test_multibyte_character_split_across_reads(self):
+        state = TerminalState()
+        data = "✔ ok".encode()
+        assert state.feed_pty(data[:2]) is False  # incomplete sequence, nothing parsed yet
+        state.feed_pty(data[2:])
+        assert _text(state.snapshot().lines[0]) == "✔ ok"
+
+    def test_invalid_bytes_are_replaced(self):
+        state = TerminalState()
+        state.feed_pty(b"a\xffb")
+        assert _text(state.snapshot().lines[0]) == "a�b"
+
+    def test_str_input_is_fed_as_is(self):
+        state = TerminalState()
+        state.feed_pty("windows ✔")
+        assert _text(state.snapshot().lines[0]) == "windows ✔"
+
+    def test_concurrent_feed_and_snapshot(self):
+        state = TerminalState(cols=40, rows=10)
+
+        def reader():
+            for i in range(500):
+                state.feed_pty(f"line {i}\r\n".encode())
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        while thread.is_alive():
+            snap = state.snapshot()
+            assert len(snap.lines) == 10
+            assert all(len(row) == 40 for row in snap.lines)
+        thread.join()
+        assert _text(state.snapshot().lines[-2]) == "line 499"
+
+
+class TestSnapshot:
+    def test_first_snapshot_is_all_dirty(self):
+        snap = TerminalState(cols=20, rows=5).snapshot()
+        assert snap.dirty == frozenset(range(5))
+        assert (snap.cols, snap.rows) == (20, 5)
+        assert len(snap.lines) == 5
+
+    def test_unchanged_rows_are_shared(self):
+        state = TerminalState()
+        state.feed_pty(b"a\r\nb\r\nc")
+        first = state.snapshot()
+        state.feed_pty(b"\rC")
+
+        second = state.snapshot()
+
+        assert second.dirty == frozenset({2})
+        assert second.lines[0] is first.lines[0]
+        assert second.lines[2] is not first.lines[2]
+        assert _text(first.lines[2]) == "c"  # older snapshot is untouched
+        assert _text(second.lines[2]) == "C"
+
+    def test_cursor_movement_dirties_both_rows(self):
+        state = TerminalState()
+        state.snapshot()
+        state.feed_pty(b"\x1b[4;3H")
+
+        snap = state.snapshot()
+
+        assert snap.cursor == (2, 3)
+        assert snap.dirty == frozenset({0, 3})
+
+    def test_history_length_and_resize(self):
+        state = TerminalState(cols=20, rows=5)
+        state.feed_pty(b"x\r\n" * 12)
+        assert state.snapshot().history_len == 8
+
+        state.resize(30, 8)
+        snap = state.snapshot()
+
+        assert (snap.cols, snap.rows) == (30, 8)
+        assert snap.dirty == frozenset(range(8))
+
+
+class TestCompactScrollback:
+    def _line(self, text: str, **style) -> dict[int, Char]:
+        screen = pyte.Screen(40, 2)
+        stream = pyte.Stream(screen)
+        stream.feed(text)
+        return screen.buffer[0]
+
+    def test_round_trip_preserves_text_and_styles(self):
+        line = self._line("plain \x1b[1;31mbold red\x1b[0m \x1b[44mbg \x1b[0m")
+        store = CompactScrollback(10)
+        store.append(line)
+
+        restored = store[0]
+
+        assert {col: restored[col] for col in range(40)} == {col: line[col] for col in range(40)}
+        assert store.text(0) == "plain bold red bg "  # trailing space has a background
+
+    def test_wide_and_combining_characters(self):
+        line = self._line("a界b x\u0301")
+        store = CompactScrollback(10)
+        store.append(line)
+
+        restored = store[0]
+
+        assert [restored[col].data for col in range(6)] == ["a", "界", "", "b", " ", "x\u0301"]
+
+    def test_default_lines_store_no_spans(self):
+        store = CompactScrollback(10)
+        store.append(self._line("just text"))
+        store.append(self._line(""))
+        assert store._lines[0][1] is None
+        assert store._lines[1] == ("", None)
+        assert store[1][0] == Char(" ")
+
+    def test_deque_semantics(self):
+        store = CompactScrollback(3)
+        store.extend(self._line(f"line {i}") for i in range(5))
+
+        assert len(store) == 3
+        assert store.maxlen == 3
+        assert [store.text(i) for i in range(3)] == ["line 2", "line 3", "line 4"]
+        assert store[-1][5].data == "4"
+        assert store.pop()[5].data == "4"
+        assert len(store) == 2
+        store.clear()
+        assert not store
+
+    def test_styles_are_interned(self):
+        store = CompactScrollback(100)
+        for i in range(50):
+            store.append(self._line(f"\x1b[32mok\x1b[0m {i}"))
+        assert len(store._styles) == 2  # default + green
+
+    def test_history_screen_uses_compact_store(self):
+        state = TerminalState(cols=20, rows=3, history=50)
+        state.feed_pty(b"\x1b[33mfirst\x1b[0m\r\n" + b"x\r\n" * 5)
+
+        top = state.screen.history.top
+        assert isinstance(top, CompactScrollback)
+        assert top[0][0] == Char("f", fg="brown")
+        state.feed_pty(b"\x1b[3J")  # erase scrollback
+        assert len(top) == 0
@@ -0,0 +1,226 @@
+"""Unit tests for the tree-hash keyed test result cache (src/levelup/core/test_cache.py)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import git
+import pytest
+
+from levelup.agents.backend import Backend
+from levelup.agents.test_verifier import TestVerifierAgent
+from levelup.core.context import PipelineContext, StepUsage, TaskInput
+from levelup.core.journal import RunJournal
+from levelup.core.test_cache import (
+    TestResultCache,
+    _version_probe,
+    environment_fingerprint,
+    worktree_hash,
+)
+from levelup.tools.test_runner import TestRunnerTool
+
+# A test command that counts its own executions in runs.txt
+COUNTING_CMD = f'"{sys.executable}" -c "open(\'runs.txt\', \'a\').write(\'x\')"'
+
+
+@pytest.fixture()
+def repo_path(tmp_path: Path) -> Path:
+    path = tmp_path / "repo"
+    path.mkdir()
+    repo = git.Repo.init(path)
+    (path / ".gitignore").write_text("runs.txt\n")
+    (path / "app.py").write_text("x = 1\n")
+    repo.index.add([".gitignore", "app.py"])
+    repo.index.commit("init")
+    return path
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> TestResultCache:
+    return TestResultCache(cache_dir=tmp_path / "cache")
+
+
+def _runs(repo_path: Path) -> int:
+    runs = repo_path / "runs.txt"
+    return len(runs.read_text()) if runs.exists() else 0
+
+
+class TestWorktreeHash:
+    def test_stable_for_unchanged_tree(self, repo_path):
+        assert worktree_hash(repo_path) == worktree_hash(repo_path)
+
+    def test_changes_with_modified_file(self, repo_path):
+        before = worktree_hash(repo_path)
+        (repo_path / "app.py").write_text("x = 2\n")
+        assert worktree_hash(repo_path) != before
+
+    def test_changes_with_untracked_file(self, repo_path):
+        before = worktree_hash(repo_path)
+        (repo_path / "new.py").write_text("y = 1\n")
+        assert worktree_hash(repo_path) != before
+
+    def test_ignored_files_do_not_change_hash(self, repo_path):
+        before = worktree_hash(repo_path)
+        (repo_path / "runs.txt").write_text("x")
+        assert worktree_hash(repo_path) == before
+
+    def test_changes_with_deleted_file(self, repo_path):
+        before = worktree_hash(repo_path)
+        (repo_path / "app.py").unlink()
+        assert worktree_hash(repo_path) != before
+
+    def test_real_index_untouched(self, repo_path):
+        (repo_path / "new.py").write_text("y = 1\n")
+        worktree_hash(repo_path)
+        assert "new.py" in git.Repo(repo_path).untracked_files
+
+    def test_no_objects_written(self, repo_path):
+        objects = repo_path / ".git" / "objects"
+        before = sorted(objects.rglob("*"))
+        (repo_path / "new.py").write_text("y = 1\n")
+        (repo_path / "app.py").write_text("x = 2\n")
+
+        worktree_hash(repo_path)
+
+        assert sorted(objects.rglob("*")) == before
+
+    def test_not_a_repo(self, tmp_path):
+        assert worktree_hash(tmp_path) is None
+
+
+class TestEnvironmentFingerprint:
+    def test_changes_with_virtualenv(self, repo_path, monkeypatch):
+        monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+        before = environment_fingerprint(repo_path)
+        monkeypatch.setenv("VIRTUAL_ENV", str(repo_path / ".venv"))
+        assert environment_fingerprint(repo_path) != before
+
+    def test_changes_when_dependencies_are_installed(self, repo_path):
+        site = repo_path / ".venv" / "lib" / "python3.11" / "site-packages"
+        site.mkdir(parents=True)
+        before = environment_fingerprint(repo_path)
+
+        (site / "newpkg").mkdir()
+        os.utime(site, ns=(site.stat().st_atime_ns, site.stat().st_mtime_ns + 10**9))
+
+        assert environment_fingerprint(repo_path) != before
+
+
+class TestVersionProbe:
+    @pytest.mark.parametrize(
+        "command,probe",
+        [
+            ("pytest -x", ("pytest", "--version")),
+            ("python -m pytest tests/", ("python", "-m", "pytest", "--version")),
+            ("npx jest", ("npx", "jest", "--version")),
+            ("bundle exec rspec", ("bundle", "exec", "rspec", "--version")),
+        ],
+    )
+    def test_probe(self, command, probe):
+        assert _version_probe(command) == probe
+
+
+class TestTestResultCache:
+    def test_second_run_on_same_tree_is_a_hit(self, repo_path, cache):
+        first = cache.run(COUNTING_CMD, repo_path, timeout=30)
+        second = cache.run(COUNTING_CMD, repo_path, timeout=30)
+
+        assert _runs(repo_path) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.returncode == first.returncode
+        assert second.stdout == first.stdout
+
+    def test_changed_tree_is_a_miss(self, repo_path, cache):
+        cache.run(COUNTING_CMD, repo_path, timeout=30)
+        (repo_path / "app.py").write_text("x = 3\n")
+        cache.run(COUNTING_CMD, repo_path, timeout=30)
+
+        assert _runs(repo_path) == 2
+        assert cache.misses == 2
+
+    def test_failures_are_cached_too(self, repo_path, cache):
+        cmd = f'"{sys.executable}" -c "import sys; sys.exit(3)"'
+        cache.run(cmd, repo_path, timeout=30)
+        assert cache.run(cmd, repo_path, timeout=30).returncode == 3
+        assert cache.hits == 1
+
+    def test_non_git_directory_is_not_cached(self, tmp_path, cache):
+        cache.run(COUNTING_CMD, tmp_path, timeout=30)
+        cache.run(COUNTING_CMD, tmp_path, timeout=30)
+        assert _runs(tmp_path) == 2
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_counters_are_thread_safe(self, repo_path, cache):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cmd = f'"{sys.executable}" -c "pass"'
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: cache.run(cmd, repo_path, timeout=30), range(16)))
+
+        assert cache.hits + cache.misses == 16
+
+    def test_prunes_oldest_entries(self, tmp_path):
+        cache = TestResultCache(cache_dir=tmp_path, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, subprocess.CompletedProcess(args="t", returncode=0, stdout="", stderr=""))
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        cache = TestResultCache(cache_dir=tmp_path)
+        (tmp_path / "bad.json").write_text("{not json")
+        assert cache.get("bad") is None
+
+
+class TestCacheConsumers:
+    def test_test_runner_tool_uses_cache(self, repo_path, cache):
+        tool = TestRunnerTool(repo_path, test_command=COUNTING_CMD, test_cache=cache)
+        tool.run_and_parse()
+        tool.run_and_parse()
+        assert _runs(repo_path) == 1
+        assert cache.hits == 1
+
+    def test_verifier_uses_cache(self, repo_path, cache):
+        ctx = PipelineContext(
+            task=TaskInput(title="t"), project_path=repo_path, test_command=COUNTING_CMD
+        )
+        agent = TestVerifierAgent(MagicMock(spec=Backend), repo_path, test_cache=cache)
+        agent.run(ctx)
+        agent.run(ctx)
+        assert _runs(repo_path) == 1
+
+    def test_journal_reports_cache_hits(self, tmp_path):
+        ctx = PipelineContext(task=TaskInput(title="t"), project_path=tmp_path)
+        ctx.step_usage["coding"] = StepUsage(test_cache_hits=2, test_cache_misses=1)
+        journal = RunJournal(ctx)
+        journal.write_header(ctx)
+        journal.log_step("coding", ctx)
+        assert "test cache 2 hit(s) / 1 miss(es)" in journal.path.read_text()
+
+
+def test_orchestrator_records_cache_deltas_in_step_usage(tmp_path):
+    from levelup.agents.backend import AgentResult
+    from levelup.config.settings import LevelUpSettings
+    from levelup.core.orchestrator import Orchestrator
+
+    settings = LevelUpSettings()
+    orch = Orchestrator(settings, headless=True)
+    orch._test_cache = TestResultCache(cache_dir=tmp_path)
+
+    def fake_run(ctx):
+        orch._test_cache.hits += 2
+        orch._test_cache.misses += 1
+        return ctx, AgentResult()
+
+    agent = MagicMock()
+    agent.run.side_effect = fake_run
+    orch._agents = {"coder": agent}
+    ctx = PipelineContext(task=TaskInput(title="t"), project_path=tmp_path)
+
+    ctx = orch._run_agent_with_retry("coder", ctx)
+
+    assert ctx.step_usage["coder"].test_cache_hits == 2
+    assert ctx.step_usage["coder"].test_cache_misses == 1
@@ -0,0 +1,207 @@
+"""Unit tests for parallel test execution in TestRunnerTool."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from levelup.core.context import TestResult
+from levelup.tools.test_runner import TestRunnerTool, _merge_results
+
+
+def _completed(stdout: str, returncode: int = 0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args="", returncode=returncode, stdout=stdout, stderr="")
+
+
+def _write_tests(root: Path, count: int) -> None:
+    (root / "tests").mkdir()
+    for i in range(count):
+        (root / "tests" / f"test_{i}.py").write_text("def test_x(): pass\n" * (i + 1))
+
+
+def _sharded_tool(root: Path) -> TestRunnerTool:
+    return TestRunnerTool(
+        root, test_command="pytest", test_runner="pytest", workers=2, shard_files=True
+    )
+
+
+class TestPlanCommands:
+    def test_unknown_runner_runs_as_is(self, tmp_path: Path):
+        tool = TestRunnerTool(tmp_path, workers=8)
+        assert tool._plan_commands("make test") == ["make test"]
+
+    def test_single_worker_runs_as_is(self, tmp_path: Path):
+        tool = TestRunnerTool(tmp_path, test_runner="jest", workers=1)
+        assert tool._plan_commands("npx jest") == ["npx jest"]
+
+    @pytest.mark.parametrize(
+        "runner,command,expected",
+        [
+            ("jest", "npx jest", "npx jest --maxWorkers=4"),
+            ("jest", "npx jest --runInBand", "npx jest --runInBand"),
+            ("mocha", "npx mocha", "npx mocha --parallel --jobs 4"),
+            ("go_test", "go test ./...", "go test -p 4 ./..."),
+            ("cargo_test", "cargo test", "cargo test -- --test-threads=4"),
+            ("cargo_test", "cargo test -- --nocapture", "cargo test -- --nocapture --test-threads=4"),
+            ("maven", "mvn test", "mvn test"),
+        ],
+    )
+    def test_runner_flags(self, tmp_path: Path, runner, command, expected):
+        tool = TestRunnerTool(tmp_path, test_runner=runner, workers=4)
+        assert tool._plan_commands(command) == [expected]
+
+    def test_pytest_uses_xdist_when_declared(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text('[project]\ndependencies = ["pytest-xdist"]\n')
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=4)
+        assert tool._plan_commands("pytest -q") == ["pytest -q -n 4"]
+
+    def test_pytest_respects_existing_n_flag(self, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text("pytest-xdist\n")
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=4)
+        assert tool._plan_commands("pytest -n 2") == ["pytest -n 2"]
+
+    def test_pytest_shards_files_without_xdist(self, tmp_path: Path):
+        _write_tests(tmp_path, 5)
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=2, shard_files=True)
+        shards = tool._plan_commands("pytest")
+        assert len(shards) == 2
+        files = [f for s in shards for f in s.split()[1:]]
+        assert sorted(files) == [f"tests/test_{i}.py" for i in range(5)]
+
+    def test_pytest_not_sharded_by_default(self, tmp_path: Path):
+        _write_tests(tmp_path, 5)
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=4)
+        assert tool._plan_commands("pytest") == ["pytest"]
+
+    @pytest.mark.parametrize(
+        "name,config",
+        [
+            ("pytest.ini", "[pytest]\ntestpaths = tests\n"),
+            ("pyproject.toml", '[tool.pytest.ini_options]\npython_files = ["check_*.py"]\n'),
+            ("setup.cfg", "[tool:pytest]\nnorecursedirs = build\n"),
+        ],
+    )
+    def test_pytest_collection_config_disables_sharding(self, tmp_path: Path, name, config):
+        _write_tests(tmp_path, 5)
+        (tmp_path / name).write_text(config)
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=4, shard_files=True)
+        assert tool._plan_commands("pytest") == ["pytest"]
+
+    def test_pytest_shard_count_capped_by_files(self, tmp_path: Path):
+        _write_tests(tmp_path, 2)
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=16, shard_files=True)
+        assert len(tool._plan_commands("pytest")) == 2
+
+    def test_pytest_with_explicit_paths_is_not_sharded(self, tmp_path: Path):
+        _write_tests(tmp_path, 5)
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=4, shard_files=True)
+        assert tool._plan_commands("pytest tests/") == ["pytest tests/"]
+
+    def test_pytest_large_tree_is_not_sharded(self, tmp_path: Path):
+        from levelup.detection.scanner import ProjectScan
+
+        _write_tests(tmp_path, 5)
+        tool = TestRunnerTool(tmp_path, test_runner="pytest", workers=4, shard_files=True)
+        with patch(
+            "levelup.detection.scanner.ProjectScan", lambda root: ProjectScan(root, max_files=3)
+        ):
+            assert tool._plan_commands("pytest") == ["pytest"]
+
+
+class TestShardedExecution:
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_results_are_merged(self, mock_run: MagicMock, tmp_path: Path):
+        _write_tests(tmp_path, 4)
+        mock_run.side_effect = [
+            _completed("===== 3 passed in 0.1s ====="),
+            _completed("===== 2 passed, 1 failed in 0.1s =====", returncode=1),
+        ]
+        tool = _sharded_tool(tmp_path)
+        result = tool.run_and_parse()
+
+        assert mock_run.call_count == 2
+        assert result.passed is False
+        assert result.total == 6
+        assert result.failures == 1
+        assert result.command == "pytest"
+        assert "shard 1/2" in result.output and "shard 2/2" in result.output
+
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_empty_shard_counts_as_passed(self, mock_run: MagicMock, tmp_path: Path):
+        _write_tests(tmp_path, 2)
+        mock_run.side_effect = [
+            _completed("===== 1 passed in 0.1s ====="),
+            _completed("no tests ran", returncode=5),
+        ]
+        tool = _sharded_tool(tmp_path)
+        assert tool.run_and_parse().passed is True
+
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_all_shards_empty_fails(self, mock_run: MagicMock, tmp_path: Path):
+        _write_tests(tmp_path, 2)
+        mock_run.return_value = _completed("no tests ran", returncode=5)
+        assert _sharded_tool(tmp_path).run_and_parse().passed is False
+
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_execute_reports_merged_summary(self, mock_run: MagicMock, tmp_path: Path):
+        _write_tests(tmp_path, 2)
+        mock_run.return_value = _completed("===== 2 passed in 0.1s =====")
+        tool = _sharded_tool(tmp_path)
+        assert tool.execute().startswith("Tests PASSED: 4 total, 0 failures")
+
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_shard_timeout_is_reported(self, mock_run: MagicMock, tmp_path: Path):
+        _write_tests(tmp_path, 2)
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="pytest", timeout=120)
+        tool = _sharded_tool(tmp_path)
+        assert "timed out" in tool.execute()
+
+
+class TestXdistFallback:
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_reruns_without_n_when_xdist_is_not_installed(
+        self, mock_run: MagicMock, tmp_path: Path
+    ):
+        (tmp_path / "pyproject.toml").write_text(
+            '[project.optional-dependencies]\ndev = ["pytest-xdist"]\n'
+        )
+        mock_run.side_effect = [
+            subprocess.CompletedProcess(
+                args="",
+                returncode=4,
+                stdout="",
+                stderr="ERROR: usage: pytest [options]\npytest: error: unrecognized arguments: -n 4\n",
+            ),
+            _completed("===== 3 passed in 0.1s ====="),
+        ]
+        tool = TestRunnerTool(tmp_path, test_command="pytest", test_runner="pytest", workers=4)
+
+        result = tool.run_and_parse()
+        tool.run_and_parse()
+
+        assert result.passed is True
+        assert result.command == "pytest"
+        assert [c.args[0] for c in mock_run.call_args_list] == ["pytest -n 4", "pytest", "pytest"]
+
+    @patch("levelup.tools.test_runner.subprocess.run")
+    def test_other_usage_errors_are_reported(self, mock_run: MagicMock, tmp_path: Path):
+        (tmp_path / "pyproject.toml").write_text('[project]\ndependencies = ["pytest-xdist"]\n')
+        mock_run.return_value = subprocess.CompletedProcess(
+            args="", returncode=4, stdout="", stderr="pytest: error: unrecognized arguments: --foo\n"
+        )
+        tool = TestRunnerTool(tmp_path, test_command="pytest", test_runner="pytest", workers=4)
+
+        assert tool.run_and_parse().passed is False
+        assert mock_run.call_count == 1
+
+
+def test_merge_results_all_passing():
+    merged = _merge_results(
+        [TestResult(passed=True, total=2, output="a"), TestResult(passed=True, total=3, output="b")],
+        "pytest",
+    )
+    assert merged.passed is True
+    assert merged.total == 5
@@ -0,0 +1,187 @@
+"""Unit tests for test impact analysis (src/levelup/core/test_selection.py)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import git
+import pytest
+
+from levelup.agents.backend import AgentResult, Backend
+from levelup.agents.coder import CodeAgent
+from levelup.agents.test_verifier import TestVerifierAgent
+from levelup.core.context import FileChange, PipelineContext, TaskInput
+from levelup.core.test_selection import (
+    build_scoped_command,
+    get_changed_files,
+    is_test_file,
+    scoped_test_command,
+    select_test_files,
+)
+
+
+def _write(root: Path, rel: str, content: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture()
+def py_project(tmp_path: Path) -> Path:
+    """A src-layout Python project with two independent modules."""
+    _write(tmp_path, "src/app/__init__.py")
+    _write(tmp_path, "src/app/auth.py", "from app.util import helper\n")
+    _write(tmp_path, "src/app/util.py", "def helper(): pass\n")
+    _write(tmp_path, "src/app/billing.py", "def charge(): pass\n")
+    _write(tmp_path, "tests/test_auth.py", "from app.auth import login\n")
+    _write(tmp_path, "tests/test_billing.py", "from app import billing\n")
+    _write(tmp_path, "tests/test_util.py", "import app.util\n")
+    return tmp_path
+
+
+@pytest.fixture()
+def ctx(py_project: Path) -> PipelineContext:
+    return PipelineContext(
+        task=TaskInput(title="Add login"),
+        project_path=py_project,
+        test_runner="pytest",
+        test_command="pytest",
+    )
+
+
+class TestIsTestFile:
+    @pytest.mark.parametrize(
+        "path",
+        ["tests/test_a.py", "pkg/a_test.py", "web/a.test.ts", "web/a.spec.js", "web/__tests__/a.js"],
+    )
+    def test_recognises_test_files(self, path):
+        assert is_test_file(path)
+
+    @pytest.mark.parametrize("path", ["src/app.py", "web/app.ts", "tests/helpers.py", "a_test.go"])
+    def test_rejects_non_test_files(self, path):
+        assert not is_test_file(path)
+
+
+class TestSelectTestFiles:
+    def test_changed_test_file_selects_itself(self, py_project):
+        assert select_test_files(py_project, ["tests/test_billing.py"]) == ["tests/test_billing.py"]
+
+    def test_direct_import(self, py_project):
+        assert select_test_files(py_project, ["src/app/billing.py"]) == ["tests/test_billing.py"]
+
+    def test_transitive_import(self, py_project):
+        selected = select_test_files(py_project, ["src/app/util.py"])
+        assert selected == ["tests/test_auth.py", "tests/test_util.py"]
+
+    def test_relative_imports_are_resolved(self, py_project):
+        _write(py_project, "src/app/api.py", "from .billing import charge\n")
+        _write(py_project, "tests/test_api.py", "from app.api import x\n")
+        assert "tests/test_api.py" in select_test_files(py_project, ["src/app/billing.py"])
+
+    def test_docs_only_change_selects_nothing(self, py_project):
+        assert select_test_files(py_project, ["README.md", "levelup/run.md"]) == []
+
+    def test_conftest_change_requires_full_suite(self, py_project):
+        assert select_test_files(py_project, ["tests/conftest.py"]) is None
+
+    def test_config_change_requires_full_suite(self, py_project):
+        assert select_test_files(py_project, ["pyproject.toml"]) is None
+
+    def test_skip_dirs_are_not_scanned(self, py_project):
+        _write(py_project, "node_modules/pkg/test_x.py", "import app.billing\n")
+        assert select_test_files(py_project, ["src/app/billing.py"]) == ["tests/test_billing.py"]
+
+    def test_js_relative_imports(self, tmp_path):
+        _write(tmp_path, "web/src/cart.ts", "export const x = 1\n")
+        _write(tmp_path, "web/src/other.ts", "export const y = 1\n")
+        _write(tmp_path, "web/tests/cart.test.ts", "import { x } from '../src/cart'\n")
+        _write(tmp_path, "web/tests/other.test.ts", "const y = require('../src/other')\n")
+        assert select_test_files(tmp_path, ["web/src/cart.ts"]) == ["web/tests/cart.test.ts"]
+
+    def test_too_many_files_falls_back(self, py_project):
+        with patch("levelup.core.test_selection.MAX_SCAN_FILES", 2):
+            assert select_test_files(py_project, ["src/app/billing.py"]) is None
+
+
+class TestBuildScopedCommand:
+    def test_pytest_appends_paths(self):
+        cmd = build_scoped_command("pytest -q", "pytest", ["tests/test_a.py", "tests/b c.py"])
+        assert cmd == "pytest -q tests/test_a.py 'tests/b c.py'"
+
+    def test_unsupported_runner(self):
+        assert build_scoped_command("cargo test", "cargo_test", ["tests/a.rs"]) is None
+
+    def test_command_with_explicit_paths_is_left_alone(self):
+        assert build_scoped_command("pytest tests/unit", "pytest", ["tests/unit/test_a.py"]) is None
+
+    def test_no_files(self):
+        assert build_scoped_command("pytest", "pytest", []) is None
+
+
+class TestChangedFiles:
+    def test_includes_committed_uncommitted_and_untracked(self, tmp_path):
+        repo = git.Repo.init(tmp_path)
+        _write(tmp_path, "a.py", "a = 1\n")
+        _write(tmp_path, "b.py", "b = 1\n")
+        repo.index.add(["a.py", "b.py"])
+        base = repo.index.commit("base").hexsha
+
+        _write(tmp_path, "a.py", "a = 2\n")
+        repo.index.add(["a.py"])
+        repo.index.commit("step")
+        _write(tmp_path, "b.py", "b = 2\n")
+        _write(tmp_path, "c.py", "c = 1\n")
+
+        assert get_changed_files(tmp_path, base) == ["a.py", "b.py", "c.py"]
+
+    def test_no_base_sha(self, tmp_path):
+        assert get_changed_files(tmp_path, None) == []
+
+
+class TestScopedTestCommand:
+    def test_uses_test_files_and_plan(self, ctx, py_project):
+        ctx.test_files = [FileChange(path="tests/test_billing.py", content="", is_new=True)]
+        assert scoped_test_command(ctx, py_project) == "pytest tests/test_billing.py"
+
+    def test_falls_back_to_full_command(self, ctx, py_project):
+        assert scoped_test_command(ctx, py_project) == "pytest"
+        ctx.test_files = [FileChange(path="tests/conftest.py", content="")]
+        assert scoped_test_command(ctx, py_project) == "pytest"
+
+
+class TestAgentIntegration:
+    @patch("subprocess.run")
+    def test_verifier_runs_only_selected_tests(self, mock_run, ctx, py_project):
+        mock_run.return_value = MagicMock(returncode=1, stdout="1 failed", stderr="")
+        ctx.test_files = [FileChange(path="tests/test_billing.py", content="", is_new=True)]
+
+        agent = TestVerifierAgent(MagicMock(spec=Backend), py_project, test_selection=True)
+        agent.run(ctx)
+
+        assert mock_run.call_args.args[0] == "pytest tests/test_billing.py"
+
+    @patch("subprocess.run")
+    def test_verifier_without_selection_runs_full_command(self, mock_run, ctx, py_project):
+        mock_run.return_value = MagicMock(returncode=1, stdout="1 failed", stderr="")
+        ctx.test_files = [FileChange(path="tests/test_billing.py", content="", is_new=True)]
+
+        agent = TestVerifierAgent(MagicMock(spec=Backend), py_project)
+        agent.run(ctx)
+
+        assert mock_run.call_args.args[0] == "pytest"
+
+    @patch("subprocess.run")
+    def test_coder_iterates_on_subset_and_finishes_with_full_suite(self, mock_run, ctx, py_project):
+        mock_run.return_value = MagicMock(returncode=0, stdout="1 passed", stderr="")
+        ctx.test_files = [FileChange(path="tests/test_billing.py", content="", is_new=True)]
+        backend = MagicMock(spec=Backend)
+        backend.run_agent.return_value = AgentResult(text="{}")
+
+        agent = CodeAgent(backend, py_project, test_selection=True)
+        prompt = agent.get_system_prompt(ctx)
+        assert "`pytest tests/test_billing.py`" in prompt
+        assert "run the full suite with `pytest`" in prompt
+
+        agent.run(ctx)
+        assert mock_run.call_args.args[0] == "pytest"
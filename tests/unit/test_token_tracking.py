@@ -412,14 +412,14 @@ class TestGUITokensColumn:
     """GUI main window should display token information in runs table."""
 
     def test_columns_include_tokens(self):
-        """AC: Add 'Tokens' column to COLUMNS list in src/levelup/gui/main_window.py"""
-        from levelup.gui.main_window import COLUMNS
+        """AC: Add 'Tokens' column to COLUMNS list in src/levelup/gui/run_table_model.py"""
+        from levelup.gui.run_table_model import COLUMNS
 
         assert "Tokens" in COLUMNS
 
     def test_tokens_column_position(self):
         """AC: Column shows between 'Status' and 'Started' columns"""
-        from levelup.gui.main_window import COLUMNS
+        from levelup.gui.run_table_model import COLUMNS
 
         status_idx = COLUMNS.index("Status")
         started_idx = COLUMNS.index("Started")
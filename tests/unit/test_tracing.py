@@ -0,0 +1,203 @@
+"""Unit tests for span tracing (src/levelup/core/tracing.py)."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from levelup.core.context import PipelineContext, PipelineStatus, TaskInput
+from levelup.core.events import read_events
+from levelup.core.journal import RunJournal
+from levelup.core.tracing import (
+    Span,
+    Tracer,
+    spans_from_events,
+    to_chrome_trace,
+    to_otel_json,
+    traced,
+)
+
+
+def _ctx(tmp_path: Path) -> PipelineContext:
+    return PipelineContext(
+        task=TaskInput(title="t"),
+        project_path=tmp_path,
+        started_at=datetime(2026, 2, 6, 14, 30, 0, tzinfo=timezone.utc),
+        run_id="a1b2c3d4e5f6",
+        status=PipelineStatus.RUNNING,
+    )
+
+
+class TestTracer:
+    def test_records_wall_cpu_and_rss(self):
+        tracer = Tracer()
+        with tracer.span("work", step="coding") as span:
+            sum(range(200_000))
+            time.sleep(0.01)
+
+        assert tracer.spans == [span]
+        assert span.duration_ms >= 10
+        assert span.cpu_ms >= 0
+        assert span.attributes == {"step": "coding"}
+        assert span.start_ns > 0
+        if span.peak_rss_kb is not None:
+            assert span.peak_rss_kb > 0
+
+    def test_nesting(self):
+        tracer = Tracer()
+        with tracer.span("outer") as outer:
+            with tracer.span("inner") as inner:
+                pass
+        assert outer.parent_id is None
+        assert inner.parent_id == outer.span_id
+        assert [s.name for s in tracer.spans] == ["inner", "outer"]
+
+    def test_error_is_recorded_and_reraised(self):
+        tracer = Tracer()
+        with pytest.raises(ValueError):
+            with tracer.span("boom"):
+                raise ValueError("x")
+        assert tracer.spans[0].error == "ValueError"
+
+    def test_sink_receives_finished_spans(self):
+        received: list[Span] = []
+        tracer = Tracer(on_span_end=received.append)
+        with tracer.span("a"):
+            pass
+        tracer.set_sink(None)
+        with tracer.span("b"):
+            pass
+        assert [s.name for s in received] == ["a"]
+
+    def test_traced_decorator_records_arguments(self):
+        class Worker:
+            def __init__(self):
+                self._tracer = Tracer()
+
+            @traced("commit", "step_name", "revised")
+            def commit(self, path, step_name, revised=False):
+                return step_name
+
+        worker = Worker()
+        assert worker.commit("/p", "coding", revised=True) == "coding"
+        assert worker._tracer.spans[0].attributes == {"step_name": "coding", "revised": True}
+
+    def test_traced_without_tracer(self):
+        class Bare:
+            @traced("x")
+            def run(self):
+                return 1
+
+        assert Bare().run() == 1
+
+
+class TestExport:
+    def _spans(self) -> list[Span]:
+        tracer = Tracer()
+        with tracer.span("step", step="coding"):
+            with tracer.span("agent", agent_name="coder"):
+                pass
+        return tracer.spans
+
+    def test_chrome_trace(self):
+        trace = to_chrome_trace(self._spans(), "run1")
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+
+        assert [e["name"] for e in complete] == ["step", "agent"]
+        assert complete[0]["args"]["step"] == "coding"
+        assert "cpu_ms" in complete[1]["args"]
+        assert complete[0]["dur"] >= complete[1]["dur"]
+        json.dumps(trace)
+
+    def test_otel_json(self):
+        data = to_otel_json(self._spans(), "run1")
+        scope = data["resourceSpans"][0]["scopeSpans"][0]
+        step, agent = scope["spans"]
+
+        assert len(step["traceId"]) == 32 and step["traceId"] == agent["traceId"]
+        assert agent["parentSpanId"] == step["spanId"]
+        assert "parentSpanId" not in step
+        assert int(step["endTimeUnixNano"]) >= int(step["startTimeUnixNano"])
+        attrs = {a["key"]: a["value"] for a in agent["attributes"]}
+        assert attrs["levelup.agent_name"] == {"stringValue": "coder"}
+        assert "doubleValue" in attrs["levelup.cpu_ms"]
+
+    def test_spans_round_trip_through_event_log(self, tmp_path: Path):
+        ctx = _ctx(tmp_path)
+        journal = RunJournal(ctx, events_dir=tmp_path / "runs")
+        tracer = Tracer(on_span_end=journal.log_span)
+        journal.write_header(ctx)
+        with tracer.span("step", step="requirements"):
+            pass
+        journal.log_resume("planning")
+        resumed = Tracer(on_span_end=journal.log_span)
+        with resumed.span("step", step="planning"):
+            pass
+        journal.close()
+
+        events, _ = read_events(journal.events_path)
+        spans = spans_from_events(events)
+        assert [s.attributes["step"] for s in spans] == ["requirements", "planning"]
+        assert len({s.span_id for s in spans}) == 2
+
+
+class TestOrchestratorTracing:
+    def test_phases_are_traced(self, tmp_path: Path):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        orch = Orchestrator(LevelUpSettings(), headless=True)
+        ctx = _ctx(tmp_path)
+        orch._persist_state(ctx)
+        orch._git_step_commit(tmp_path, ctx, "coding", revised=True)
+
+        names = [(s.name, s.attributes) for s in orch._tracer.spans]
+        assert names == [
+            ("persist_state", {}),
+            ("git_commit", {"step_name": "coding", "revised": True}),
+        ]
+
+
+    def test_final_persist_is_recorded_in_the_event_log(self, tmp_path: Path):
+        from levelup.config.settings import LevelUpSettings
+        from levelup.core.orchestrator import Orchestrator
+
+        settings = LevelUpSettings(
+            project={"path": tmp_path}, pipeline={"create_git_branch": False}
+        )
+        orch = Orchestrator(settings, headless=True)
+        with patch.object(orch, "_execute_steps", side_effect=lambda ctx, *args: ctx):
+            ctx = orch.run(TaskInput(title="Task"))
+
+        events, _ = read_events(RunJournal(ctx, base_path=tmp_path).events_path)
+        spans = spans_from_events(events)
+        assert spans[-1].name == "persist_state"
+
+def test_cli_trace_export(tmp_path: Path):
+    from levelup.cli.app import app
+
+    ctx = _ctx(tmp_path)
+    runs_dir = tmp_path / "runs"
+    journal = RunJournal(ctx, events_dir=runs_dir)
+    with Tracer(on_span_end=journal.log_span).span("step", step="coding"):
+        pass
+    journal.close()
+
+    out = tmp_path / "trace.json"
+    runner = CliRunner()
+    with patch("levelup.core.events.DEFAULT_RUNS_DIR", runs_dir):
+        summary = runner.invoke(app, ["trace", ctx.run_id])
+        exported = runner.invoke(app, ["trace", ctx.run_id, "--format", "chrome", "-o", str(out)])
+        missing = runner.invoke(app, ["trace", "nope"])
+
+    assert summary.exit_code == 0, summary.output
+    assert "step (coding)" in summary.output
+    assert exported.exit_code == 0, exported.output
+    assert json.loads(out.read_text())["traceEvents"][1]["name"] == "step"
+    assert missing.exit_code == 1